@@ -1,5 +1,8 @@
 """
 Argopy library
+
+Facades, stores and submodules are imported on first use (:pep:`562`), so that ``import argopy`` stays fast and
+optional dependencies (matplotlib, cartopy, seaborn, numba, boto3, ...) are only imported when needed.
 """
 
 try:
@@ -21,29 +24,83 @@
 log = logging.getLogger(__name__)
 log.addHandler(logging.NullHandler())
 
-# Import facades:
-from .fetchers import ArgoDataFetcher as DataFetcher  # noqa: E402
-from .fetchers import ArgoIndexFetcher as IndexFetcher  # noqa: E402
-
-from .xarray import ArgoAccessor  # noqa: E402
+import importlib  # noqa: E402
+import xarray as _xr  # noqa: E402
 
-# Other Import
-# from . import utils  # noqa: E402
-from . import stores  # noqa: E402
 from . import errors  # noqa: E402
-from . import plot  # noqa: E402
-from . import tutorial  # noqa: E402
-from .plot import dashboard, ArgoColors  # noqa: E402
 from .options import set_options, reset_options  # noqa: E402
-from .data_fetchers import CTDRefDataFetcher  # noqa: E402
-from .stores import ArgoIndex, ArgoFloat, gdacfs, NVS  # noqa: E402
-from .utils import show_versions, show_options  # noqa: E402
-from .utils import clear_cache, lscache  # noqa: E402
-from .utils import MonitoredThreadPoolExecutor  # noqa: E402, F401
-from .utils import monitor_status as status  # noqa: E402
-from .related import TopoFetcher, OceanOPSDeployments, ArgoDocs, ArgoDOI  # noqa: E402
-from .extensions import CanyonMED  # noqa: E402
-from .reference import ArgoReferenceTable, ArgoReferenceValue, ArgoReferenceMapping # noqa: E402
+
+
+# Lazy imports, name: (module, attribute or None for a submodule):
+_LAZY_IMPORTS = {
+    # Import facades:
+    "DataFetcher": ("argopy.fetchers", "ArgoDataFetcher"),
+    "IndexFetcher": ("argopy.fetchers", "ArgoIndexFetcher"),
+    "ArgoAccessor": ("argopy.xarray", "ArgoAccessor"),
+    # Other Import
+    "utils": ("argopy.utils", None),
+    "stores": ("argopy.stores", None),
+    "plot": ("argopy.plot", None),
+    "tutorial": ("argopy.tutorial", None),
+    "related": ("argopy.related", None),
+    "extensions": ("argopy.extensions", None),
+    "reference": ("argopy.reference", None),
+    "data_fetchers": ("argopy.data_fetchers", None),
+    "fetchers": ("argopy.fetchers", None),
+    "xarray": ("argopy.xarray", None),
+    "dashboard": ("argopy.plot", "dashboard"),
+    "ArgoColors": ("argopy.plot", "ArgoColors"),
+    "CTDRefDataFetcher": ("argopy.data_fetchers", "CTDRefDataFetcher"),
+    "ArgoIndex": ("argopy.stores", "ArgoIndex"),
+    "ArgoFloat": ("argopy.stores", "ArgoFloat"),
+    "gdacfs": ("argopy.stores", "gdacfs"),
+    "NVS": ("argopy.stores", "NVS"),
+    "show_versions": ("argopy.utils", "show_versions"),
+    "show_options": ("argopy.utils", "show_options"),
+    "clear_cache": ("argopy.utils", "clear_cache"),
+    "lscache": ("argopy.utils", "lscache"),
+    "MonitoredThreadPoolExecutor": ("argopy.utils", "MonitoredThreadPoolExecutor"),
+    "instrument": ("argopy.utils", "instrument"),
+    "status": ("argopy.utils", "monitor_status"),
+    "TopoFetcher": ("argopy.related", "TopoFetcher"),
+    "OceanOPSDeployments": ("argopy.related", "OceanOPSDeployments"),
+    "ArgoDocs": ("argopy.related", "ArgoDocs"),
+    "ArgoDOI": ("argopy.related", "ArgoDOI"),
+    "CanyonMED": ("argopy.extensions", "CanyonMED"),
+    "ArgoReferenceTable": ("argopy.reference", "ArgoReferenceTable"),
+    "ArgoReferenceValue": ("argopy.reference", "ArgoReferenceValue"),
+    "ArgoReferenceMapping": ("argopy.reference", "ArgoReferenceMapping"),
+}
+
+
+def __getattr__(name):
+    if name in _LAZY_IMPORTS:
+        module, attr = _LAZY_IMPORTS[name]
+        obj = importlib.import_module(module)
+        if attr is not None:
+            obj = getattr(obj, attr)
+        globals()[name] = obj
+        return obj
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_IMPORTS))
+
+
+class _LazyArgoAccessor:
+    """Placeholder for the ``argo`` accessor of :class:`xarray.Dataset`
+
+    The accessor and its extensions are imported on first access, and then replace this placeholder.
+    """
+
+    def __get__(self, obj, cls):
+        importlib.import_module("argopy.xarray")
+        return getattr(cls if obj is None else obj, "argo")
+
+
+if "argo" not in vars(_xr.Dataset):
+    _xr.Dataset.argo = _LazyArgoAccessor()
 
 #
 __all__ = (
@@ -61,6 +118,7 @@
     "status",
     "clear_cache",
     "lscache",
+    "instrument",
 
     # Meta-data and other related dataset helpers class:
     "OceanOPSDeployments",  # Class
@@ -3,13 +3,19 @@
 import xarray as xr
 import getpass
 import logging
+import threading
+import time
+import concurrent.futures
 from abc import abstractmethod
 import warnings
 
 from ..stores import httpstore
+from ..stores.filesystems import tqdm
+from ..stores.index import indexstore_pd as ArgoIndex
 from ..options import OPTIONS, DEFAULT, PARALLEL_SETUP
 from ..utils.chunking import Chunker
 from ..errors import DataNotFound
+from ..utils.instrumentation import ContextThreadPoolExecutor
 from .. import __version__
 from .proto import ArgoDataFetcherProto
 from .argovis_data_processors import pre_process, add_attributes
@@ -23,6 +29,28 @@
 log = logging.getLogger("argopy.argovis.data")
 
 
+class _RateLimiter:
+    """Thread-safe limiter of the number of requests per second"""
+
+    def __init__(self, rate: float):
+        self.rate = rate
+        self._next = 0.0
+        self._lock = threading.Lock()
+
+    def wait(self):
+        """Block until the next request is allowed"""
+        with self._lock:
+            now = time.monotonic()
+            t = max(now, self._next)
+            self._next = t + 1.0 / self.rate
+        if t > now:
+            time.sleep(t - now)
+
+
+_rate_limiters = {}
+"""Rate limiters of Argovis API requests, shared by all fetchers using the same API key"""
+
+
 class ArgovisDataFetcher(ArgoDataFetcherProto):
     data_source = "argovis"
 
@@ -53,6 +81,8 @@ def __init__(
         chunks: str = "auto",
         chunks_maxsize: dict = {},
         api_timeout: int = 0,
+        rate_limit: float = 0,
+        max_workers: int = 6,
         **kwargs,
     ):
         """Instantiate an Argovis Argo data loader
@@ -74,15 +104,23 @@ def __init__(
                     - any other values accepted by the ``parallel_default_method`` option
         progress: bool (optional)
             Show a progress bar or not when ``parallel`` is set to True.
-        chunks: 'auto' or dict of integers (optional)
+        chunks: 'auto', 'balanced' or dict of integers (optional)
             Dictionary with request access point as keys and number of chunks to create as values.
             Eg: {'wmo': 10} will create a maximum of 10 chunks along WMOs when used with ``Fetch_wmo``.
+            With 'balanced', chunks are defined to hold about ``chunks_maxsize['profiles']`` profiles each,
+            according to the Argo profile index (see :class:`argopy.utils.Chunker`).
         chunks_maxsize: dict (optional)
             Dictionary with request access point as keys and chunk size as values (used as maximum values in
             'auto' chunking).
             Eg: {'wmo': 5} will create chunks with as many as 5 WMOs each.
         api_timeout: int (optional)
             Argovis API request time out in seconds. Set to OPTIONS['api_timeout'] by default.
+        rate_limit: float (optional)
+            Maximum number of Argovis API requests per second. This limit is shared by all fetchers using the same
+            API key. Set to 0 (default) for no limit.
+        max_workers: int (optional)
+            Maximum number of threads downloading and pre-processing request chunks, if ``parallel`` is set to
+            ``thread``, default: 6. A single thread is used if ``parallel`` is not set.
         """
         self.definition = "Argovis Argo data fetcher"
         self.dataset_id = OPTIONS["ds"] if ds == "" else ds
@@ -103,6 +141,8 @@ def __init__(
         self.progress = progress
         self.chunks = chunks
         self.chunks_maxsize = chunks_maxsize
+        self.rate_limit = rate_limit
+        self.max_workers = max_workers
 
         self.init(**kwargs)
         self.key_map = {
@@ -143,6 +183,18 @@ def _add_history(self, this, txt):
             this.attrs["history"] = txt
         return this
 
+    @property
+    def _chunks_index(self):
+        """ArgoIndex instance used to define 'balanced' chunks"""
+        if not hasattr(self, "_chunks_indexfs"):
+            self._chunks_indexfs = ArgoIndex(
+                index_file="core",
+                cache=True,
+                cachedir=self.store_opts["cachedir"],
+                timeout=self.store_opts["timeout"],
+            )
+        return self._chunks_indexfs
+
     @property
     def cachepath(self):
         """Return path to cache file for this request"""
@@ -163,53 +215,89 @@ def safe_for_fsspec_cache(url):
 
         return [safe_for_fsspec_cache(url) for url in urls]
 
+    @property
+    def _rate_limiter(self):
+        """Rate limiter of requests with the API key of this fetcher, None if requests are not limited"""
+        if self.rate_limit <= 0:
+            return None
+        api_key = self.fs.fs.client_kwargs["headers"]["x-argokey"]
+        if api_key not in _rate_limiters:
+            _rate_limiters[api_key] = _RateLimiter(self.rate_limit)
+        _rate_limiters[api_key].rate = self.rate_limit
+        return _rate_limiters[api_key]
+
+    def _open_chunk(self, url: str, errors: str = "ignore") -> pd.DataFrame:
+        """Download and pre-process the json response of a single url, according to the rate limit"""
+        limiter = self._rate_limiter
+        if limiter is not None:
+            limiter.wait()
+        data = self.fs.open_json(url, errors=errors, dwn_opts={"errors": errors})
+        return pre_process(data, key_map=self.key_map)
+
+    def _open_chunks(self, urls: list, errors: str = "ignore", max_workers: int = None) -> list:
+        """Download and pre-process the json responses of a list of urls, concurrently with a pool of threads
+
+        The pool holds ``max_workers`` threads, set to the fetcher ``max_workers`` option by default.
+
+        Returns
+        -------
+        list(:class:`pandas.DataFrame`)
+            List of pre-processed responses, in the order of ``urls``, with None for failed urls.
+        """
+        results = [None] * len(urls)
+        max_workers = self.max_workers if max_workers is None else max_workers
+        if self.parallel_method == "sequential":
+            max_workers = 1
+        with ContextThreadPoolExecutor(max_workers=max_workers) as executor:
+            future_to_i = {
+                executor.submit(self._open_chunk, url, errors): i
+                for i, url in enumerate(urls)
+            }
+            futures = concurrent.futures.as_completed(future_to_i)
+            if self.progress:
+                futures = tqdm(futures, total=len(urls))
+            for future in futures:
+                try:
+                    results[future_to_i[future]] = future.result()
+                except Exception:
+                    if errors == "raise":
+                        raise
+                    elif errors == "ignore":
+                        log.debug("Ignored error with this url: %s" % urls[future_to_i[future]])
+        return results
+
     def to_dataframe(self, errors: str = "ignore") -> pd.DataFrame:
-        """Load Argo data and return a Pandas dataframe"""
-        URI = self.uri  # Call it once
+        """Load Argo data and return a Pandas dataframe
 
-        # Download data:
-        preprocess_opts = {"key_map": self.key_map}
+        Json responses are downloaded and pre-processed concurrently with a pool of threads, or with the
+        parallelization method of the fetcher if it is not ``thread``.
+        """
+        URI = self.uri  # Call it once
 
-        if not self.parallelize:
-            if len(URI) == 1:
-                data = self.fs.open_json(
-                    URI[0],
-                    errors=errors,
-                    dwn_opts={'errors': errors},
-                )
-                df = pre_process(data, **preprocess_opts)
+        if len(URI) == 1:
+            df_list = [self._open_chunk(URI[0], errors=errors)]
 
-            else:
-                df_list = self.fs.open_mfjson(
-                    URI,
-                    method=self.parallel_method,
-                    preprocess=pre_process,
-                    preprocess_opts=preprocess_opts,
-                    open_json_opts={'errors': 'ignore',
-                                    "download_url_opts": {"errors": "ignore"}
-                                    },
-                    progress=self.progress,
-                    errors=errors,
-                )
-                df = pd.concat(df_list, ignore_index=True)
+        elif self.parallel_method in ["thread", "sequential"]:
+            df_list = self._open_chunks(URI, errors=errors, max_workers=self.max_workers)
 
         else:
             df_list = self.fs.open_mfjson(
                 URI,
                 method=self.parallel_method,
                 preprocess=pre_process,
-                preprocess_opts=preprocess_opts,
+                preprocess_opts={"key_map": self.key_map},
                 open_json_opts={'errors': 'ignore',
                                 "download_url_opts": {"errors": "ignore"}
                                 },
                 progress=self.progress,
                 errors=errors,
             )
-            df = pd.concat(df_list, ignore_index=True)
 
         # Merge results (list of dataframe):
-        if df.shape[0] == 0:
+        df_list = [df for df in df_list if df is not None and df.shape[0] > 0]
+        if len(df_list) == 0:
             raise DataNotFound("No data found for: %s" % self.cname())
+        df = pd.concat(df_list, ignore_index=True)
 
         df.sort_values(by=["TIME", "PRES"], inplace=True)
         df["N_POINTS"] = np.arange(0, len(df["N_POINTS"]))
@@ -433,7 +521,10 @@ def uri(self):
                 self.chunks["time"] = "auto"
 
             self.Chunker = Chunker(
-                {"box": self.BOX}, chunks=self.chunks, chunksize=self.chunks_maxsize
+                {"box": self.BOX},
+                chunks=self.chunks,
+                chunksize=self.chunks_maxsize,
+                index=self._chunks_index if self.chunks == "balanced" else None,
             )
             boxes = self.Chunker.fit_transform()
             for box in boxes:
@@ -1,11 +1,30 @@
+import numpy as np
 import pandas as pd
 import xarray as xr
 from typing import Any
 from ..utils import list_bgc_s_parameters
 
 
+_meta_keys = [
+    "date",
+    "date_qc",
+    "lat",
+    "lon",
+    "cycle_number",
+    "DATA_MODE",
+    "DIRECTION",
+    "platform_number",
+    "position_qc",
+]
+_level_keys = {"temp": "temperature", "pres": "pressure", "psal": "salinity"}
+
+
 def pre_process(profiles: Any, key_map: dict = None) -> pd.DataFrame:
-    """convert json data to Pandas DataFrame"""
+    """convert json data to Pandas DataFrame
+
+    Profiles metadata are collected once per profile and levels data are written into column arrays allocated
+    once for all profiles, metadata are then repeated along the levels of each profile.
+    """
 
     if profiles is None:
         return None
@@ -16,42 +35,42 @@ def pre_process(profiles: Any, key_map: dict = None) -> pd.DataFrame:
     else:
         data = [profiles]
 
-    # Transform
-    rows = []
-    for profile in data:
-        # construct metadata dictionary that will be repeated for each level
-        metadict = {
-            "date": profile["timestamp"],
-            "date_qc": profile["timestamp_argoqc"],
-            "lat": profile["geolocation"]["coordinates"][1],
-            "lon": profile["geolocation"]["coordinates"][0],
-            "cycle_number": profile["cycle_number"],
-            "DATA_MODE": profile["data_info"][2][0][1],
-            "DIRECTION": profile["profile_direction"],
-            "platform_number": profile["_id"].split("_")[0],
-            "position_qc": profile["geolocation_argoqc"],
-            "index": 0,
-        }
-        # construct a row for each level in the profile
-        for i in range(
-                len(profile["data"][profile["data_info"][0].index("pressure")])
-        ):
-            row = {
-                "temp": profile["data"][
-                    profile["data_info"][0].index("temperature")
-                ][i],
-                "pres": profile["data"][profile["data_info"][0].index("pressure")][
-                    i
-                ],
-                "psal": profile["data"][profile["data_info"][0].index("salinity")][
-                    i
-                ],
-                **metadict,
-            }
-            rows.append(row)
-    df = pd.DataFrame(rows)
-
-    df = df.reset_index()
+    # Profiles metadata and number of levels:
+    meta = {k: [] for k in _meta_keys}
+    levels = {k: [] for k in _level_keys}
+    n_levels = np.empty(len(data), dtype=int)
+    for i, profile in enumerate(data):
+        meta["date"].append(profile["timestamp"])
+        meta["date_qc"].append(profile["timestamp_argoqc"])
+        meta["lat"].append(profile["geolocation"]["coordinates"][1])
+        meta["lon"].append(profile["geolocation"]["coordinates"][0])
+        meta["cycle_number"].append(profile["cycle_number"])
+        meta["DATA_MODE"].append(profile["data_info"][2][0][1])
+        meta["DIRECTION"].append(profile["profile_direction"])
+        meta["platform_number"].append(profile["_id"].split("_")[0])
+        meta["position_qc"].append(profile["geolocation_argoqc"])
+        names = profile["data_info"][0]
+        for k, name in _level_keys.items():
+            levels[k].append(profile["data"][names.index(name)])
+        n_levels[i] = len(levels["pres"][-1])
+
+    # Fill levels data columns:
+    N = int(n_levels.sum())
+    columns = {}
+    for k in _level_keys:
+        values = np.empty(N, dtype=float)
+        i0 = 0
+        for n, v in zip(n_levels, levels[k]):
+            values[i0 : i0 + n] = v
+            i0 += n
+        columns[k] = values
+
+    # Repeat metadata along levels:
+    for k in _meta_keys:
+        columns[k] = np.repeat(np.array(meta[k]), n_levels)
+    columns["index"] = np.zeros(N, dtype=int)
+
+    df = pd.DataFrame(columns)
     if key_map is not None:
         df = df.rename(columns=key_map)
         df = df[[value for value in key_map.values() if value in df.columns]]
@@ -22,9 +22,10 @@
 from ..options import OPTIONS, PARALLEL_SETUP
 from ..utils.lists import list_bgc_s_variables, list_core_parameters
 from ..errors import ErddapServerError, DataNotFound
-from ..stores import httpstore, has_distributed, distributed
+from ..stores import httpstore, has_distributed, distributed, ArgoJobStore
 from ..stores.index import indexstore_pd as ArgoIndex
-from ..utils import is_list_of_strings, to_list, Chunker
+from ..utils import is_list_of_strings, to_list, Chunker, concat_datasets
+from ..utils.instrumentation import ContextThreadPoolExecutor
 from .proto import ArgoDataFetcherProto
 from .erddap_data_processors import pre_process, quote_string_constraints
 
@@ -86,6 +87,7 @@ def __init__(  # noqa: C901
         api_timeout: int = 0,
         params: Union[str, list] = "all",
         measured: Union[str, list] = None,
+        max_workers: int = 6,
         **kwargs,
     ):
         """Instantiate an ERDDAP Argo data fetcher
@@ -107,9 +109,11 @@ def __init__(  # noqa: C901
                     - any other values accepted by the ``parallel_default_method`` option
         progress: bool (optional)
             Show a progress bar or not when ``parallel`` is set to True.
-        chunks: 'auto' or dict of integers (optional)
+        chunks: 'auto', 'balanced' or dict of integers (optional)
             Dictionary with request access point as keys and number of chunks to create as values.
             Eg: {'wmo': 10} will create a maximum of 10 chunks along WMOs when used with ``Fetch_wmo``.
+            With 'balanced', chunks are defined to hold about ``chunks_maxsize['profiles']`` profiles each,
+            according to the Argo profile index (see :class:`argopy.utils.Chunker`).
         chunks_maxsize: dict (optional)
             Dictionary with request access point as keys and chunk size as values (used as maximum values in
             'auto' chunking).
@@ -124,12 +128,28 @@ def __init__(  # noqa: C901
             List of BGC essential variables that can't be NaN. If set to 'all', this is an easy way to reduce the size of the
             :class:`xr.DataSet`` to points where all variables have been measured. Otherwise, provide a simple list of
             variables.
+        max_workers: int (optional)
+            Maximum number of threads fetching request chunks, or the headers of request URLs with the
+            ``max_rows`` option, if ``parallel`` is set, default: 6. A single thread is used otherwise.
 
         Other parameters
         ----------------
         server: str, default = OPTIONS['erddap']
             URL to erddap server
         mode: str, default = OPTIONS['mode']
+        max_rows: int, default = None
+            Maximum number of rows (measurements) to request from the server at once. If set, the headers of all
+            request URLs are fetched concurrently before the download: empty requests are dropped and requests
+            with more rows are split again, until they fit the budget. This prevents requests from exceeding
+            the server payload limit.
+        checkpoint: bool, default = False
+            Save the processed result of each request chunk in a local job store (see
+            :class:`argopy.stores.ArgoJobStore`), so that an interrupted or partially failed fetch can be resumed
+            by fetching only the missing chunks. The job store is removed once all chunks have been fetched.
+        response: str, default = 'nc'
+            Format of the erddap responses: 'nc' (default), 'parquet' or 'csv'. The two last are tabular
+            formats parsed by pyarrow directly into columnar arrays, which is faster and lighter than
+            netcdf decoding for large requests (see :meth:`argopy.stores.httpstore.open_table`).
 
         """
         timeout = OPTIONS["api_timeout"] if api_timeout == 0 else api_timeout
@@ -137,6 +157,14 @@ def __init__(  # noqa: C901
         self.dataset_id = OPTIONS["ds"] if ds == "" else ds
         self.user_mode = kwargs["mode"] if "mode" in kwargs else OPTIONS["mode"]
         self.server = kwargs["server"] if "server" in kwargs else OPTIONS["erddap"]
+        self.response = kwargs["response"] if "response" in kwargs else "nc"
+        self.max_rows = kwargs["max_rows"] if "max_rows" in kwargs else None
+        self.checkpoint = kwargs["checkpoint"] if "checkpoint" in kwargs else False
+        if self.response not in ["nc", "parquet", "csv"]:
+            raise ValueError(
+                "Invalid erddap response format '%s', must be one of 'nc', 'parquet' or 'csv'"
+                % self.response
+            )
         self.store_opts = {
             "cache": cache,
             "cachedir": cachedir,
@@ -151,6 +179,7 @@ def __init__(  # noqa: C901
         self.progress = progress
         self.chunks = chunks
         self.chunks_maxsize = chunks_maxsize
+        self.max_workers = max_workers
 
         self.init(**kwargs)
         self._init_erddapy()
@@ -262,12 +291,30 @@ def server(self, value):
             log.debug("The erddap server has been modified, updating internal data")
             self._init_erddapy()
 
+    @property
+    def _chunks_index(self):
+        """ArgoIndex instance used to define 'balanced' chunks"""
+        if self.dataset_id in ["bgc", "bgc-s"]:
+            return self.indexfs
+        if not hasattr(self, "_chunks_indexfs"):
+            self._chunks_indexfs = ArgoIndex(
+                index_file="core",
+                cache=True,
+                cachedir=self.store_opts["cachedir"],
+                timeout=self.store_opts["timeout"],
+            )
+        return self._chunks_indexfs
+
     def _init_erddapy(self):
         # Init erddapy
         self.erddap = ERDDAP(server=str(self.server), protocol="tabledap")
         self.erddap.response = (
             "nc"  # This is a major change in v0.4, we used to work with csv files
         )
+        if self.response == "parquet":
+            self.erddap.response = "parquet"
+        elif self.response == "csv":
+            self.erddap.response = "csvp"  # Units in the header line, not in a 2nd line
 
         if self.dataset_id == "phy":
             self.erddap.dataset_id = "ArgoFloats"
@@ -512,25 +559,91 @@ def N_POINTS(self) -> int:
 
         This is an estimate that could be inaccurate with the synthetic BGC dataset
         """
+        return int(np.sum(self._n_rows(self.uri)))
+
+    def _n_row(self, url: str) -> int:
+        """Number of rows returned by an url, read from its ncHeader response"""
+        if url in self._n_rows_cache:
+            return self._n_rows_cache[url]
+        url_header = url.replace("." + self.erddap.response + "?", ".ncHeader?")
+        try:
+            ncHeader = str(self.fs.download_url(url_header))
+            if "Your query produced no matching results. (nRows = 0)" in ncHeader:
+                N = 0
+            else:
+                lines = [line for line in ncHeader.splitlines() if "row = " in line][0]
+                N = int(lines.split("=")[1].split(";")[0])
+        except FileNotFoundError:
+            # The erddap server returns a 404 error for requests without data
+            N = 0
+        except Exception:
+            raise ErddapServerError(
+                "Erddap server can't return ncHeader for url: %s " % url_header
+            )
+        self._n_rows_cache[url] = N
+        return N
 
-        def getNfromncHeader(url):
-            url = url.replace("." + self.erddap.response, ".ncHeader")
-            try:
-                ncHeader = str(self.fs.download_url(url))
-                if "Your query produced no matching results. (nRows = 0)" in ncHeader:
-                    return 0
-                else:
-                    lines = [line for line in ncHeader.splitlines() if "row = " in line][0]
-                    return int(lines.split("=")[1].split(";")[0])
-            except Exception:
-                raise ErddapServerError(
-                    "Erddap server can't return ncHeader for url: %s " % url
-                )
+    def _n_rows(self, urls: list) -> list:
+        """Number of rows returned by a list of urls, with ncHeader responses fetched by ``max_workers`` threads"""
+        if not hasattr(self, "_n_rows_cache"):
+            self._n_rows_cache = {}
+        max_workers = self.max_workers if self.parallelize else 1
+        if len(urls) <= 1 or max_workers == 1:
+            return [self._n_row(url) for url in urls]
+        with ContextThreadPoolExecutor(
+            max_workers=min(max_workers, len(urls))
+        ) as executor:
+            return list(executor.map(self._n_row, urls))
 
-        N = 0
-        for url in self.uri:
-            N += getNfromncHeader(url)
-        return N
+    @property
+    def _chunk_opts(self) -> dict:
+        """Options to create fetchers for chunks of this request"""
+        opts = {
+            "ds": self.dataset_id,
+            "mode": self.user_mode,
+            "fs": self.fs,
+            "server": self.server,
+            "response": self.response,
+            "parallel": False,
+        }
+        if self.dataset_id in ["bgc", "bgc-s"]:
+            opts["params"] = self._bgc_params
+            opts["measured"] = self._bgc_measured
+            opts["indexfs"] = self.indexfs
+        return opts
+
+    def _split(self, n: int) -> list:
+        """Split this request into at most n smaller requests, return a list of fetchers"""
+        return [self]
+
+    def _plan(self, fetchers: list, max_depth: int = 8) -> list:
+        """Return the list of URLs to load for a list of fetchers, within the ``max_rows`` budget
+
+        Number of rows of all requests are prefetched concurrently. Empty requests are dropped and requests above
+        the budget are split again with :meth:`_split`, up to ``max_depth`` times. URLs are returned in the order
+        of the fetchers.
+        """
+        todo = [((i,), f) for i, f in enumerate(fetchers)]
+        planned = []
+        for depth in range(max_depth + 1):
+            if len(todo) == 0:
+                break
+            urls = [f.get_url() for _, f in todo]
+            N = self._n_rows(urls)
+            next_todo = []
+            for (key, f), url, n in zip(todo, urls, N):
+                if n == 0:
+                    log.debug("Dropping empty request: %s" % url)
+                    continue
+                if n > self.max_rows and depth < max_depth:
+                    parts = f._split(int(np.ceil(n / self.max_rows)))
+                    if len(parts) > 1:
+                        next_todo.extend([(key + (j,), p) for j, p in enumerate(parts)])
+                        continue
+                    log.debug("Can't split request with %i rows: %s" % (n, url))
+                planned.append((key, url))
+            todo = next_todo
+        return [url for _, url in sorted(planned)]
 
     def pre_process(self, this_ds, *args, **kwargs):
         return pre_process(this_ds, *args, **kwargs)
@@ -540,7 +653,7 @@ def to_xarray(  # noqa: C901
         errors: str = "ignore",
         add_dm: bool = None,
         concat: bool = True,
-        max_workers: int = 6,
+        max_workers: int = None,
     ):
         """Load Argo data and return a xarray.DataSet
 
@@ -558,6 +671,7 @@ def to_xarray(  # noqa: C901
         :class:`xarray.Dataset`
         """
         URI = self.uri  # Call it once
+        max_workers = self.max_workers if max_workers is None else max_workers
 
         # Pre-processor options:
         preprocess_opts = {
@@ -575,7 +689,11 @@ def to_xarray(  # noqa: C901
 
         # Download and pre-process data:
         results = []
-        if not self.parallelize:
+        if self.checkpoint:
+            results = self._to_xarray_checkpoint(
+                URI, preprocess_opts, errors=errors, concat=concat, max_workers=max_workers
+            )
+        elif not self.parallelize:
             if len(URI) == 1:
                 try:
                     # log_argopy_callerstack()
@@ -693,6 +811,50 @@ def to_xarray(  # noqa: C901
 
         return results
 
+    @property
+    def job(self) -> ArgoJobStore:
+        """Job store used with the ``checkpoint`` option"""
+        return ArgoJobStore(self.sha, cachedir=self.store_opts["cachedir"])
+
+    def _to_xarray_checkpoint(
+        self, URI: list, preprocess_opts: dict, errors: str = "ignore", concat: bool = True, max_workers: int = 6
+    ):
+        """Download and pre-process data chunk by chunk, with results saved in the job store"""
+        job = self.job
+
+        def task(url):
+            return pre_process(self.fs.open_dataset(url), **preprocess_opts)
+
+        failed = job.run(
+            URI,
+            task,
+            max_workers=max_workers if self.parallelize else 1,
+            progress=self.progress,
+        )
+        if len(failed) > 0:
+            msg = (
+                "%i/%i request chunks failed, results of other chunks are saved in %s. "
+                "Run this request again to only fetch missing chunks." % (len(failed), len(URI), job.path)
+            )
+            if errors == "raise":
+                raise ErddapServerError(msg) from list(failed.values())[0]
+            elif errors == "ignore":
+                log.error(msg)
+
+        # Chunk files are opened lazily, so that each chunk is read only once, while merged into the final dataset:
+        ds_list = job.open_dataset(URI, concat=False)
+        if concat:
+            results = concat_datasets(ds_list, concat_dim="N_POINTS").load()
+            if self.progress:
+                print("Final post-processing of the merged dataset ...")
+            results = pre_process(results, **preprocess_opts)
+        else:
+            results = [ds.load() for ds in ds_list]
+        [ds.close() for ds in ds_list]
+        if len(failed) == 0:
+            job.clear()
+        return results
+
     def transform_data_mode(self, ds: xr.Dataset, **kwargs):
         """Apply xarray argo accessor transform_data_mode method"""
         ds = ds.argo.datamode.merge(**kwargs)
@@ -831,31 +993,25 @@ def uri(self):
             if self.dataset_id in ["bgc", "bgc-s"]:
                 chunks_maxsize["wmo"] = 1
         self.Chunker = Chunker(
-            {"wmo": self.WMO}, chunks=chunks, chunksize=chunks_maxsize
+            {"wmo": self.WMO},
+            chunks=chunks,
+            chunksize=chunks_maxsize,
+            index=self._chunks_index if chunks == "balanced" else None,
         )
         wmo_grps = self.Chunker.fit_transform()
-        urls = []
-        opts = {
-            "ds": self.dataset_id,
-            "mode": self.user_mode,
-            "fs": self.fs,
-            "server": self.server,
-            "parallel": False,
-            "CYC": self.CYC,
-        }
-        if self.dataset_id in ["bgc", "bgc-s"]:
-            opts["params"] = self._bgc_params
-            opts["measured"] = self._bgc_measured
-            opts["indexfs"] = self.indexfs
+        fetchers = [Fetch_wmo(WMO=wmos, CYC=self.CYC, **self._chunk_opts) for wmos in wmo_grps]
+        if self.max_rows is not None:
+            return self._plan(fetchers)
+        return [f.get_url() for f in fetchers]
 
-        for wmos in wmo_grps:
-            urls.append(
-                Fetch_wmo(
-                    WMO=wmos,
-                    **opts,
-                ).get_url()
-            )
-        return urls
+    def _split(self, n: int) -> list:
+        """Split the list of floats into at most n groups, return a list of fetchers"""
+        if len(self.WMO) == 1:
+            return [self]
+        return [
+            Fetch_wmo(WMO=list(wmos), CYC=self.CYC, **self._chunk_opts)
+            for wmos in np.array_split(self.WMO, min(n, len(self.WMO)))
+        ]
 
 
 class Fetch_box(ErddapArgoDataFetcher):
@@ -916,33 +1072,39 @@ def uri(self):
         list(str)
         """
         if not self.parallelize:
-            return [self.get_url()]
+            fetchers = [self]
         else:
             self.Chunker = Chunker(
-                {"box": self.BOX}, chunks=self.chunks, chunksize=self.chunks_maxsize
+                {"box": self.BOX},
+                chunks=self.chunks,
+                chunksize=self.chunks_maxsize,
+                index=self._chunks_index if self.chunks == "balanced" else None,
             )
             boxes = self.Chunker.fit_transform()
-            urls = []
-            opts = {
-                "ds": self.dataset_id,
-                "mode": self.user_mode,
-                "fs": self.fs,
-                "server": self.server,
-            }
-            if self.dataset_id in ["bgc", "bgc-s"]:
-                opts["params"] = self._bgc_params
-                opts["measured"] = self._bgc_measured
-                opts["indexfs"] = self.indexfs
-            for box in boxes:
-                try:
-                    fb = Fetch_box(
-                        box=box,
-                        **opts,
-                    )
-                    urls.append(fb.get_url())
-                except DataNotFound:
-                    log.debug("This box fetcher will contain no data")
-                except ValueError as e:
-                    if 'not available for this access point' in str(e):
-                        log.debug("This box fetcher does not contained required data")
-            return urls
+            fetchers = self._box_fetchers(boxes)
+        if self.max_rows is not None:
+            return self._plan(fetchers)
+        return [f.get_url() for f in fetchers]
+
+    def _box_fetchers(self, boxes: list) -> list:
+        """Return the list of fetchers for a list of boxes, ignoring boxes without data"""
+        fetchers = []
+        for box in boxes:
+            try:
+                fetchers.append(Fetch_box(box=box, **self._chunk_opts))
+            except DataNotFound:
+                log.debug("This box fetcher will contain no data")
+            except ValueError as e:
+                if 'not available for this access point' in str(e):
+                    log.debug("This box fetcher does not contained required data")
+        return fetchers
+
+    def _split(self, n: int) -> list:
+        """Split the box into at most n boxes along time (or longitude for a box without time), return a list of fetchers"""
+        chunks = {"lon": 1, "lat": 1, "dpt": 1}
+        if len(self.BOX) == 8:
+            chunks["time"] = n
+        else:
+            chunks["lon"] = n
+        boxes = Chunker({"box": self.BOX}, chunks=chunks).fit_transform()
+        return self._box_fetchers(boxes) if len(boxes) > 1 else [self]
@@ -74,8 +74,11 @@ def pre_process(
     # "history" is an attribute return by the erddap
     if 'Fetched_uri' in this_ds.attrs:
         Fetched_url = this_ds.attrs.get("Fetched_uri")
-    else:
+    elif 'history' in this_ds.attrs:
         Fetched_url = this_ds.attrs.get("history", "").split('\n')[-1].split(' ')[-1]
+    else:
+        # Tabular (csv/parquet) responses have no erddap attributes
+        Fetched_url = this_ds.encoding.get("source", "")
 
     # Finally overwrite erddap attributes with those from argopy:
     raw_attrs = this_ds.attrs.copy()
@@ -20,6 +20,7 @@
 from ..utils.format import format_oneline
 from ..related import load_dict, mapp_dict
 from ..stores import httpstore
+from ..stores.index.spec import check_engine, dataframe_to_engine
 from ..options import OPTIONS
 from .erddap_data_processors import quote_string_constraints
 
@@ -168,8 +169,15 @@ def url(self, response=None):
         # return _check_url_response(url, **self.requests_kwargs)
         return url
 
-    def to_dataframe(self):
-        """Load Argo index and return a pandas dataframe"""
+    def to_dataframe(self, engine: str = "pandas"):
+        """Load Argo index and return a pandas dataframe
+
+        Parameters
+        ----------
+        engine: str, default: "pandas"
+            Output type of the dataframe, see :meth:`argopy.ArgoIndex.to_dataframe`
+        """
+        check_engine(engine)
 
         # Download data: get a csv, open it as pandas dataframe, create wmo field
         df = self.fs.read_csv(self.url, parse_dates=True, skiprows=[1])
@@ -196,7 +204,7 @@ def to_dataframe(self):
         )
         df = df.rename(columns={"profiler_type": "profiler_code"})
 
-        return df
+        return dataframe_to_engine(df, engine=engine)
 
     def to_xarray(self):
         """Load Argo index and return a xarray Dataset"""
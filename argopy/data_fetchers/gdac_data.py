@@ -12,9 +12,13 @@
 import warnings
 import getpass
 import logging
-from typing import Literal
+import itertools
+import threading
+from typing import Literal, Iterable, Iterator
 
 from ..utils.format import argo_split_path
+from ..utils.transformers import concat_datasets
+from ..utils.instrumentation import span, ContextThreadPoolExecutor
 from ..options import OPTIONS, check_gdac_option, PARALLEL_SETUP
 from ..errors import DataNotFound
 from ..stores import ArgoIndex, has_distributed, distributed
@@ -64,6 +68,8 @@ def __init__(
         dimension: Literal["point", "profile"] = "point",
         errors: str = "raise",
         api_timeout: int = 0,
+        pipeline: bool = False,
+        max_workers: int = 6,
         **kwargs
     ):
         """Init fetcher
@@ -94,6 +100,15 @@ def __init__(
             Show a progress bar or not when fetching data.
         api_timeout: int (optional)
             Server request time out in seconds. Set to OPTIONS['api_timeout'] by default.
+        pipeline: bool (optional)
+            If True, files are downloaded and decoded by a pool of threads as soon as they are resolved from the
+            index search results, and are pre-processed by another thread as soon as they are decoded. The number
+            of files downloaded but not pre-processed yet is bounded to twice the number of download threads, so
+            that downloads wait for pre-processing when it is the slowest stage. The index search itself is
+            completed before the first download starts, it is not overlapped with downloads. Files are downloaded
+            by ``max_workers`` threads if ``parallel`` is set, by a single thread otherwise.
+        max_workers: int (optional)
+            Maximum number of threads downloading files with the ``pipeline`` option, default: 6.
 
         Other parameters
         ----------------
@@ -135,6 +150,8 @@ def __init__(
         # Set method to download data:
         self.parallelize, self.parallel_method = PARALLEL_SETUP(parallel)
         self.progress = progress
+        self.pipeline = pipeline
+        self.max_workers = max_workers
 
         self.init(**kwargs)
 
@@ -178,6 +195,44 @@ def uri(self):
         """
         raise NotImplementedError("Not implemented")
 
+    def _mono2multi(self, mono_path: str) -> str:
+        """Convert a mono-profile file path to the multi-profile file path of its float"""
+        meta = argo_split_path(mono_path)
+
+        if self.dataset_id == "phy":
+            return self.indexfs.fs["src"].fs.sep.join(
+                [
+                    meta["origin"],
+                    "dac",
+                    meta["dac"],
+                    meta["wmo"],
+                    "%s_prof.nc" % meta["wmo"],
+                ]
+            )
+
+        elif self.dataset_id in ["bgc", "bgc-s"]:
+            return self.indexfs.fs["src"].fs.sep.join(
+                [
+                    meta["origin"],
+                    "dac",
+                    meta["dac"],
+                    meta["wmo"],
+                    "%s_Sprof.nc" % meta["wmo"],
+                ]
+            )
+
+        else:
+            raise ValueError("Dataset '%s' not supported !" % self.dataset_id)
+
+    def _iter_mono2multi(self, URIs: Iterable[str]) -> Iterator[str]:
+        """Yield unique multi-profile file paths of mono-profile files, as soon as they are found"""
+        found = set()
+        for uri in URIs:
+            multi = self._mono2multi(uri)
+            if multi not in found:
+                found.add(multi)
+                yield multi
+
     def uri_mono2multi(self, URIs: list):
         """Convert mono-profile URI files to multi-profile files
 
@@ -194,38 +249,16 @@ def uri_mono2multi(self, URIs: list):
         -------
         list(str)
         """
+        return list(self._iter_mono2multi(URIs))
 
-        def mono2multi(mono_path):
-            meta = argo_split_path(mono_path)
-
-            if self.dataset_id == "phy":
-                return self.indexfs.fs["src"].fs.sep.join(
-                    [
-                        meta["origin"],
-                        "dac",
-                        meta["dac"],
-                        meta["wmo"],
-                        "%s_prof.nc" % meta["wmo"],
-                    ]
-                )
-
-            elif self.dataset_id in ["bgc", "bgc-s"]:
-                return self.indexfs.fs["src"].fs.sep.join(
-                    [
-                        meta["origin"],
-                        "dac",
-                        meta["dac"],
-                        meta["wmo"],
-                        "%s_Sprof.nc" % meta["wmo"],
-                    ]
-                )
-
-            else:
-                raise ValueError("Dataset '%s' not supported !" % self.dataset_id)
+    def _iter_uri(self) -> Iterator[str]:
+        """Yield files to load for a request, as soon as they are resolved
 
-        new_uri = [mono2multi(uri) for uri in URIs]
-        new_uri = list(set(new_uri))
-        return new_uri
+        The index search is completed before the first file is yielded, only the conversion of search results
+        into files to load is incremental. Once all files are resolved, the list is registered so that :attr:`uri`
+        does not search the index again.
+        """
+        yield from self.uri
 
     @property
     def cachepath(self):
@@ -268,9 +301,19 @@ def to_xarray(
         -------
         :class:`xarray.Dataset`
         """
-        URI = self.uri  # Call it once
         dimension = self.dimension if dimension == "" else dimension
 
+        if self.pipeline:
+            results, URI = self._open_pipeline(
+                dimension=dimension,
+                errors=errors,
+                concat=concat,
+                max_workers=self.max_workers if self.parallelize else 1,
+            )
+            return self._finalize(results, URI, concat=concat, concat_method=concat_method)
+
+        URI = self.uri  # Call it once
+
         if (
             len(URI) > 50
             and not self.parallelize
@@ -284,21 +327,7 @@ def to_xarray(
             raise DataNotFound("No data found for: %s" % self.indexfs.cname)
 
         # Pre-processor options:
-        if hasattr(self, "BOX"):
-            access_point = "BOX"
-            access_point_opts = {"BOX": self.BOX}
-        elif hasattr(self, "CYC"):
-            access_point = "CYC"
-            access_point_opts = {"CYC": self.CYC}
-        elif hasattr(self, "WMO"):
-            access_point = "WMO"
-            access_point_opts = {"WMO": self.WMO}
-        preprocess_opts = {
-            "access_point": access_point,
-            "access_point_opts": access_point_opts,
-            "pre_filter_points": self._post_filter_points,
-            "dimension": dimension,
-        }
+        preprocess_opts = self._preprocess_opts(dimension)
 
         # Download and pre-process data:
         opts = {
@@ -325,7 +354,97 @@ def to_xarray(
             opts["progress"] = False
 
         results = self.fs.open_mfdataset(URI, **opts)
+        return self._finalize(results, URI, concat=concat, concat_method=concat_method)
+
+    def _preprocess_opts(self, dimension: str) -> dict:
+        """Options of the :func:`pre_process_multiprof` pre-processor for this request"""
+        if hasattr(self, "BOX"):
+            access_point = "BOX"
+            access_point_opts = {"BOX": self.BOX}
+        elif hasattr(self, "CYC"):
+            access_point = "CYC"
+            access_point_opts = {"CYC": self.CYC}
+        elif hasattr(self, "WMO"):
+            access_point = "WMO"
+            access_point_opts = {"WMO": self.WMO}
+        return {
+            "access_point": access_point,
+            "access_point_opts": access_point_opts,
+            "pre_filter_points": self._post_filter_points,
+            "dimension": dimension,
+        }
+
+    def _open_pipeline(
+        self,
+        dimension: str = "point",
+        errors: str = "ignore",
+        concat: bool = True,
+        max_workers: int = 6,
+    ):
+        """Download, decode and pre-process files of the request as concurrent stages
+
+        Files are resolved from the index search results by the calling thread, and submitted to a pool of
+        ``max_workers`` threads downloading and decoding them as soon as they are resolved. Each decoded dataset
+        is then submitted to a single thread pre-processing it. A file takes one of ``2 * max_workers`` slots from
+        its submission until it is pre-processed, so that resolution and downloads wait for the slowest stage.
+        The index search is run before the first file is resolved, it is not overlapped with downloads.
+
+        Returns
+        -------
+        results: :class:`xarray.Dataset` or list(:class:`xarray.Dataset`)
+        URI: list(str)
+            List of files resolved for the request
+        """
+        uris = self._iter_uri()
+        first = next(uris, None)
+        if first is None:
+            raise DataNotFound("No data found for: %s" % self.indexfs.cname)
+        # Resolving the first file sets the pre-processing options:
+        preprocess_opts = self._preprocess_opts(dimension)
+        open_dataset_opts = {"errors": "raise", "xr_opts": {"engine": "argo"}}
+
+        slots = threading.BoundedSemaphore(2 * max_workers)
+        tasks, URI = [], []
+
+        def process(download):
+            try:
+                ds = download.result()
+                with span("preprocess", ds.encoding.get("source", "")):
+                    return pre_process_multiprof(ds, **preprocess_opts)
+            finally:
+                slots.release()
+
+        with ContextThreadPoolExecutor(max_workers=1) as processor, \
+                ContextThreadPoolExecutor(max_workers=max_workers) as downloader:
+            for i, uri in enumerate(itertools.chain([first], uris)):
+                URI.append(uri)
+                slots.acquire()
+                download = downloader.submit(self.fs.open_dataset, uri, **open_dataset_opts)
+                download.add_done_callback(
+                    lambda f, i=i, uri=uri: tasks.append((i, uri, processor.submit(process, f)))
+                )
 
+        results = []
+        for i, uri, task in sorted(tasks, key=lambda t: t[0]):
+            try:
+                ds = task.result()
+                if ds is not None:
+                    results.append(ds)
+            except Exception as e:
+                if errors == "raise":
+                    raise
+                elif errors == "ignore":
+                    log.debug("Ignored error with this file: %s\nException raised: %s" % (uri, str(e.args)))
+
+        if len(results) == 0:
+            raise DataNotFound("No data found for: %s" % self.indexfs.cname)
+        if concat:
+            with span("concat", "%i datasets" % len(results)):
+                results = concat_datasets(results, concat_dim="N_POINTS")
+        return results, URI
+
+    def _finalize(self, results, URI: list, concat: bool = True, concat_method: str = "fill"):
+        """Post-process merged results and set dataset attributes, given the list of files loaded"""
         if concat and results is not None:
             if self.progress:
                 print("Final post-processing of the merged dataset ...")
@@ -366,10 +485,10 @@ def to_xarray(
                 ).strftime("%Y/%m/%d")
 
             results.attrs["Fetched_constraints"] = self.cname()
-            if len(self.uri) == 1:
-                results.attrs["Fetched_uri"] = self.uri[0]
+            if len(URI) == 1:
+                results.attrs["Fetched_uri"] = URI[0]
             else:
-                results.attrs["Fetched_uri"] = ";".join(self.uri)
+                results.attrs["Fetched_uri"] = ";".join(URI)
 
         if concat:
             results.attrs = dict(sorted(results.attrs.items()))
@@ -456,17 +575,28 @@ def uri(self):
         """
         # Get list of files to load:
         if not hasattr(self, "_list_of_argo_files"):
-            if self.CYC is None:
-                URIs = self.indexfs.query.wmo(self.WMO, nrows=self._nrows).uri
-                self._list_of_argo_files = self.uri_mono2multi(URIs)
-            else:
-                self._list_of_argo_files = self.indexfs.query.wmo_cyc(
-                    self.WMO, self.CYC, nrows=self._nrows
-                ).uri
+            for _ in self._iter_uri():
+                pass
 
         self.N_FILES = len(self._list_of_argo_files)
         return self._list_of_argo_files
 
+    def _iter_uri(self) -> Iterator[str]:
+        if hasattr(self, "_list_of_argo_files"):
+            yield from self._list_of_argo_files
+            return
+
+        files = []
+        if self.CYC is None:
+            URIs = self.indexfs.query.wmo(self.WMO, nrows=self._nrows).uri
+            for uri in self._iter_mono2multi(URIs):
+                files.append(uri)
+                yield uri
+        else:
+            files = self.indexfs.query.wmo_cyc(self.WMO, self.CYC, nrows=self._nrows).uri
+            yield from files
+        self._list_of_argo_files = files
+
 
 class Fetch_box(GDACArgoDataFetcher):
     """Manage access to GDAC Argo data for: a rectangular space/time domain.
@@ -513,16 +643,29 @@ def uri(self):
         """
         # Get list of files to load:
         if not hasattr(self, "_list_of_argo_files"):
-            if len(self.indexBOX) == 4:
-                URIs = self.indexfs.query.lon_lat(self.indexBOX, nrows=self._nrows).uri
-            else:
-                URIs = self.indexfs.query.box(self.indexBOX, nrows=self._nrows).uri
-
-            if len(URIs) > 25:
-                self._list_of_argo_files = self.uri_mono2multi(URIs)
-                self._post_filter_points = True
-            else:
-                self._list_of_argo_files = URIs
+            for _ in self._iter_uri():
+                pass
 
         self.N_FILES = len(self._list_of_argo_files)
         return self._list_of_argo_files
+
+    def _iter_uri(self) -> Iterator[str]:
+        if hasattr(self, "_list_of_argo_files"):
+            yield from self._list_of_argo_files
+            return
+
+        if len(self.indexBOX) == 4:
+            URIs = self.indexfs.query.lon_lat(self.indexBOX, nrows=self._nrows).uri
+        else:
+            URIs = self.indexfs.query.box(self.indexBOX, nrows=self._nrows).uri
+
+        files = []
+        if len(URIs) > 25:
+            self._post_filter_points = True
+            for uri in self._iter_mono2multi(URIs):
+                files.append(uri)
+                yield uri
+        else:
+            files = URIs
+            yield from files
+        self._list_of_argo_files = files
@@ -157,9 +157,15 @@ def clear_cache(self):
         self.fs.clear_cache()
         return self
 
-    def to_dataframe(self):
-        """Filter index file and return a pandas dataframe"""
-        df = self.indexfs.run().to_dataframe()
+    def to_dataframe(self, engine: str = "pandas"):
+        """Filter index file and return a pandas dataframe
+
+        Parameters
+        ----------
+        engine: str, default: "pandas"
+            Output type of the dataframe, see :meth:`argopy.ArgoIndex.to_dataframe`
+        """
+        df = self.indexfs.run().to_dataframe(engine=engine)
         return df
 
     def to_xarray(self):
@@ -1,4 +1,5 @@
 from pathlib import Path
+import logging
 from typing import Union, List, Optional
 import pandas as pd
 import numpy as np
@@ -40,6 +41,29 @@ def decorator(func):
 from ..errors import InvalidDatasetStructure, DataNotFound
 from ..utils import path2assets, to_list, point_in_polygon
 from . import register_argo_accessor, ArgoAccessorExtension
+from .utils import predict_by_chunks, load_cached_arrays
+
+
+log = logging.getLogger("argopy.extensions.canyon_b")
+
+_weights = {}
+"""In memory cache of CANYON-B neural network weights, indexed by weights file name"""
+
+
+def _load_weights(wfile: Path) -> np.ndarray:
+    """Load a CANYON-B weights file as a float64 array, parsing the text asset only once
+
+    Weights are cached in memory and as a numpy ``.npz`` archive in the argopy cache folder, to be re-used by
+    later sessions.
+    """
+    wfile = Path(wfile)
+    return load_cached_arrays(
+        _weights,
+        wfile.name,
+        {"weights": wfile},
+        "canyon-b/%s" % wfile.with_suffix(".npz").name,
+        lambda f: pd.read_csv(f, header=None, sep="\t").to_numpy(dtype=np.float64),
+    )["weights"]
 
 
 @register_argo_accessor("canyon_b")
@@ -432,6 +456,10 @@ def load_weights(self, param: str) -> pd.DataFrame:
         """
         Load CANYON-B neural network weights for a specific parameter.
 
+        Text assets are parsed only once: weights are then cached in memory and as a numpy ``.npz``
+        archive in the argopy cache folder, to be re-used by later sessions. The returned DataFrame holds
+        a copy of the cached weights and can be safely modified.
+
         Parameters
         ----------
         param : str
@@ -450,21 +478,16 @@ def load_weights(self, param: str) -> pd.DataFrame:
         pd.DataFrame
             DataFrame containing the neural network weights for the specified parameter.
         """
+        return pd.DataFrame(_load_weights(self._weights_file(param)), copy=True)
 
+    def _weights_file(self, param: str) -> Path:
+        """Path to the CANYON-B neural network weights asset file of a parameter"""
         if param in ["AT", "pCO2", "NO3", "PO4", "SiOH4"]:
-            weights = pd.read_csv(
-                self.path2coef.joinpath(f"wgts_{param}.txt"), header=None, sep="\t"
-            )
+            return self.path2coef.joinpath(f"wgts_{param}.txt")
         elif param == "DIC":
-            weights = pd.read_csv(
-                self.path2coef.joinpath("wgts_CT.txt"), header=None, sep="\t"
-            )
+            return self.path2coef.joinpath("wgts_CT.txt")
         else:
-            weights = pd.read_csv(
-                self.path2coef.joinpath("wgts_pH.txt"), header=None, sep="\t"
-            )
-
-        return weights
+            return self.path2coef.joinpath("wgts_pH.txt")
 
     @staticmethod
     @jit(nopython=True, parallel=True, cache=True, fastmath=True)
@@ -643,9 +666,8 @@ def _predict(
         # Get index depending on parameter (mostly important to decipher between nutrients and carbonate systems)
         i = i_idx[param]
 
-        # Load weights and convert them to numpy array
-        inwgts = self.load_weights(param)
-        inwgts = inwgts.to_numpy()
+        # Load weights as a numpy array
+        inwgts = _load_weights(self._weights_file(param))
 
         # Number of networks in committee
         noparsets = inwgts.shape[1] - 1
@@ -807,6 +829,36 @@ def _predict(
 
         return out
 
+    @staticmethod
+    def warmup(params: Union[str, List[str]] = None):
+        """
+        Load neural network weights and compile numba functions ahead of predictions.
+
+        This makes a prediction on a small synthetic dataset, so that later predictions in the same session do not
+        pay for weights parsing and numba just-in-time compilation. This is useful for services making many small
+        predictions, e.g. one float at a time.
+
+        Parameters
+        ----------
+        params : str or list of str, optional
+            Parameter(s) to warm up predictions for. Default is all parameters.
+        """
+        ds = xr.Dataset(
+            {
+                "PRES": ("N_POINTS", [10.0, 1000.0]),
+                "TEMP": ("N_POINTS", [15.0, 4.0]),
+                "PSAL": ("N_POINTS", [35.0, 34.8]),
+                "DOXY": ("N_POINTS", [250.0, 180.0]),
+            },
+            coords={
+                "N_POINTS": [0, 1],
+                "LATITUDE": ("N_POINTS", [30.0, 30.0]),
+                "LONGITUDE": ("N_POINTS", [-30.0, -30.0]),
+                "TIME": ("N_POINTS", pd.to_datetime(["2020-01-01", "2020-01-01"])),
+            },
+        )
+        ds.argo.canyon_b.predict(params=params, n_jobs=1)
+
     def predict(
         self,
         params: Union[str, List[str]] = None,
@@ -816,6 +868,7 @@ def predict(
         edoxy: Optional[Union[float, np.ndarray]] = None,
         include_uncertainties: Optional[bool] = False,
         n_jobs: Optional[int] = -1,
+        chunksize: Optional[int] = None,
     ) -> xr.Dataset:
         """
         Make predictions using the CANYON-B method.
@@ -851,8 +904,13 @@ def predict(
         include_uncertainties : bool, optional
             If True, include uncertainty estimates for each predicted parameter
         n_jobs : int, optional
-            Number of parallel jobs used for prediction (only used when there is more than one parameter to predict).
+            Number of parallel jobs used for prediction (only used when there is more than one parameter to predict,
+            or with ``chunksize``).
             Default is -1 (use all available CPUs). This option is directly passed to :class:`joblib.Parallel`.
+        chunksize : int, optional
+            If set, points are processed by chunks of at most ``chunksize`` points, possibly in parallel with
+            ``n_jobs`` workers, and predictions are written into output arrays in place. This bounds the memory used
+            by the neural network input matrices and forward passes on large datasets.
 
         Returns
         -------
@@ -873,6 +931,29 @@ def predict(
                     % (p, ",".join(params_list))
                 )
 
+        if chunksize is not None and self._argo.N_POINTS > chunksize:
+            predict_by_chunks(
+                self._obj,
+                "canyon_b",
+                self._input_list + [self._argo._TNAME],
+                chunksize,
+                n_jobs=n_jobs,
+                predict_kwargs=dict(
+                    params=params,
+                    epres=epres,
+                    etemp=etemp,
+                    epsal=epsal,
+                    edoxy=edoxy,
+                    include_uncertainties=include_uncertainties,
+                    n_jobs=1,
+                ),
+            )
+            if self._argo:
+                self._argo.add_history(
+                    "Added CANYON-B predictions for [%s]" % (",".join(params))
+                )
+            return self._obj
+
         # Compute input matrix once for all parameters (optimization)
         data = self.create_canyonb_input_matrix()
 
@@ -1,4 +1,5 @@
 from pathlib import Path
+import logging
 import numpy as np
 import pandas as pd
 import xarray as xr
@@ -7,10 +8,16 @@
 from ..errors import InvalidDatasetStructure, DataNotFound
 from ..utils import path2assets, to_list
 from . import register_argo_accessor, ArgoAccessorExtension
+from .utils import load_cached_arrays
 
 
+log = logging.getLogger("argopy.extensions.canyon_med")
+
 nan_value = np.nan if not hasattr(np, 'NaN') else np.NaN
 
+_coefficients = {}
+"""In memory cache of CANYON-MED coefficients, indexed by parameter file suffix and subset"""
+
 
 @register_argo_accessor("canyon_med")
 class CanyonMED(ArgoAccessorExtension):
@@ -67,6 +74,9 @@ class CanyonMED(ArgoAccessorExtension):
     _input_list = ["LATITUDE", "LONGITUDE", "PRES", "TEMP", "PSAL", "DOXY"]
     """List of parameters required to make predictions"""
 
+    batch_size = 100_000
+    """Maximum number of points processed at once by the neural networks"""
+
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
 
@@ -152,92 +162,59 @@ def param2suff(self, param):
             suff = "ph"
         return suff
 
+    def isin_medsea(self, lat: np.ndarray, lon: np.ndarray) -> np.ndarray:
+        """Boolean mask of points in the Mediterranean Sea"""
+        return (
+            ((lat > 34) & (lat < 44) & (lon > -6) & (lon < 10))
+            | ((lat > 30) & (lat < 46) & (lon >= 10) & (lon < 23))
+            | ((lat > 30) & (lat < 41) & (lon >= 23) & (lon < 36))
+        )
+
     def mask_medsea(self, df):
         """Mask points not in the Mediterranean Sea"""
-
-        def isin_medsea(row):
-            isin = False
-            if (
-                row["lat"] > 34
-                and row["lat"] < 44
-                and row["lon"] > -6
-                and row["lon"] < 10
-            ):
-                isin = True
-            if (
-                row["lat"] > 30
-                and row["lat"] < 46
-                and row["lon"] >= 10
-                and row["lon"] < 23
-            ):
-                isin = True
-            if (
-                row["lat"] > 30
-                and row["lat"] < 41
-                and row["lon"] >= 23
-                and row["lon"] < 36
-            ):
-                isin = True
-            return isin
-
-        df[~df.apply(isin_medsea, axis=1)] = nan_value
+        isin = self.isin_medsea(df["lat"].to_numpy(), df["lon"].to_numpy())
+        df.loc[~isin, :] = nan_value
         return df
 
-    def load_normalisation_factors(self, param, subset="F"):
-        suff = self.param2suff(param)
+    def _coef_files(self, suff: str, subset: str) -> dict:
+        """Dictionary of coefficient names and asset files for a given parameter file suffix and subset"""
+        files = {
+            "moy": "moy_%s_%s.txt" % (suff, subset),
+            "std": "std_%s_%s.txt" % (suff, subset),
+        }
+        for i in range(1, self.n_list + 1):
+            for w in ["b1", "b2", "b3", "IW", "LW1", "LW2"]:
+                files["%s_%i" % (w, i)] = "poids_%s_%s_%s_%i.txt" % (suff, w, subset, i)
+        return {k: self.path2coef.joinpath(f) for k, f in files.items()}
 
-        moy_sub = pd.read_table(
-            self.path2coef.joinpath("moy_%s_%s.txt" % (suff, subset)),
-            sep=" {3}",
-            header=None,
-            engine="python",
-        ).values
-        std_sub = pd.read_table(
-            self.path2coef.joinpath("std_%s_%s.txt" % (suff, subset)),
-            sep=" {3}",
-            header=None,
-            engine="python",
-        ).values
-        return moy_sub, std_sub
+    def load_coefficients(self, param: str, subset: str = "F") -> dict:
+        """Load normalisation factors and weights of all networks for a given parameter and subset
 
-    def load_weights(self, param, subset, i):
-        suff = self.param2suff(param)
+        Text assets are parsed only once: coefficients are then cached in memory and as a numpy ``.npz``
+        archive in the argopy cache folder, to be re-used by later sessions.
 
-        b1 = pd.read_csv(
-            self.path2coef.joinpath("poids_%s_b1_%s_%i.txt" % (suff, subset, i)),
-            header=None,
-        )
-        b2 = pd.read_csv(
-            self.path2coef.joinpath("poids_%s_b2_%s_%i.txt" % (suff, subset, i)),
-            header=None,
-        )
-        b3 = pd.read_csv(
-            self.path2coef.joinpath("poids_%s_b3_%s_%i.txt" % (suff, subset, i)),
-            header=None,
-        )
-        IW = pd.read_csv(
-            self.path2coef.joinpath("poids_%s_IW_%s_%i.txt" % (suff, subset, i)),
-            sep=r"\s+",
-            header=None,
-        )
-        LW1 = pd.read_csv(
-            self.path2coef.joinpath("poids_%s_LW1_%s_%i.txt" % (suff, subset, i)),
-            sep=r"\s+",
-            header=None,
-        )
-        LW2 = pd.read_csv(
-            self.path2coef.joinpath("poids_%s_LW2_%s_%i.txt" % (suff, subset, i)),
-            sep=r"\s+",
-            header=None,
+        Returns
+        -------
+        dict
+            Dictionary of :class:`numpy.ndarray`, with keys ``moy``, ``std`` and ``<weights>_<i>`` for each of the
+            ``b1``, ``b2``, ``b3``, ``IW``, ``LW1``, ``LW2`` weights of the i-th network.
+        """
+        suff = self.param2suff(param)
+        return load_cached_arrays(
+            _coefficients,
+            (suff, subset),
+            self._coef_files(suff, subset),
+            "canyon-med/canyon-med_%s_%s.npz" % (suff, subset),
+            lambda f: np.loadtxt(f, ndmin=2),
         )
 
-        # Using float128 arrays avoid the error or warning "overflow encountered in exp" raised by the
-        # activation function
-        b1 = np.array(b1, dtype=np.float64)
-        b2 = np.array(b2, dtype=np.float64)
-        b3 = np.array(b3, dtype=np.float64)
+    def load_normalisation_factors(self, param, subset="F"):
+        coefs = self.load_coefficients(param, subset)
+        return coefs["moy"], coefs["std"]
 
-        return b1, b2, b3, IW, LW1, LW2
+    def load_weights(self, param, subset, i):
+        coefs = self.load_coefficients(param, subset)
+        return tuple(coefs["%s_%i" % (w, i)] for w in ["b1", "b2", "b3", "IW", "LW1", "LW2"])
 
     @property
     def decimal_year(self):
@@ -285,9 +262,8 @@ def ds2df(self) -> pd.DataFrame:
         # surface to 4000 m depth) and a non-homogeneous distribution of data
         # within this range
         # See Eq. 3 in 10.3389/fmars.2020.00620
-        df["pres"] = df["pres"].apply(
-            lambda x: (x / 2e4) + (1 / ((1 + np.exp(-x / 300)) ** 3))
-        )
+        pres = df["pres"].to_numpy(dtype=np.float64)
+        df["pres"] = (pres / 2e4) + (1 / ((1 + np.exp(-pres / 300)) ** 3))
 
         # Mask points not in the Mediterranean Sea:
         df = self.mask_medsea(df)
@@ -310,86 +286,57 @@ def input(self) -> pd.DataFrame:
         return self._input
         # return self.ds2df()
 
-    def _predict(self, param: str):
-        """Private predictor to be used for a single parameter"""
+    def _forward(self, data_N: np.ndarray, param: str, subset: str) -> np.ndarray:
+        """Outputs of all the networks of a subset, for a batch of normalised inputs
+
+        Returns
+        -------
+        :class:`numpy.ndarray`
+            Array of shape (n_points, n_list)
+        """
 
         # Define the activation function between the neurons,
         # See Eq. 1 in 10.3389/fmars.2020.00620
         def custom_MF(x: np.ndarray):
-            tmp = 1.7159 * ((np.exp((4 / 3) * x) - 1) / (np.exp((4 / 3) * x) + 1))
-            return tmp
-
-        # Read/create NN input as a dataframe:
-        df = self.input
-
-        # Load normalisation factors
-        moy_F, std_F = self.load_normalisation_factors(param, "F")
-
-        # Normalisation
-        # See Eq. 2 in 10.3389/fmars.2020.00620
-        # (The factor 2/3 brings at least 80% of the data in the range [-1;1])
-        data_N = df.iloc[:, : self.ne].copy()
-        for i in range(self.ne):
-            data_N.iloc[:, i] = (2 / 3) * ((df.iloc[:, i] - moy_F[:, i]) / std_F[:, i])
-        data_N = np.array(data_N)
-
-        # rx = data_N.shape[0]  # Not used
-        param_outputs_s = []
+            e = np.exp((4 / 3) * x)
+            return 1.7159 * ((e - 1) / (e + 1))
 
+        moy, std = self.load_normalisation_factors(param, subset)
+        outputs = np.empty((data_N.shape[0], self.n_list))
         for i in range(1, self.n_list + 1):
-            b1, b2, b3, IW, LW1, LW2 = self.load_weights(param, "F", i)
-
-            # Calculate a
+            b1, b2, b3, IW, LW1, LW2 = self.load_weights(param, subset, i)
             a = custom_MF(np.dot(data_N, IW.T).T + b1)
-
-            # Calculate b
             b = custom_MF(np.dot(LW1, a) + b2)
-
-            # Calculate y
             y = np.dot(LW2, b) + b3
-            y = y.T
-
-            # Calculate phos_outputs
-            param_outputs = 1.5 * y * std_F[0][self.ne] + moy_F[0][self.ne]
-            param_outputs_s.append(param_outputs)
-
-        # reshape array
-        param_outputs_s1 = np.array(param_outputs_s).T
+            outputs[:, i - 1] = 1.5 * y[0] * std[0][self.ne] + moy[0][self.ne]
+        return outputs
 
-        # Load normalisation factors
-        moy_G, std_G = self.load_normalisation_factors(param, "G")
+    def _predict(self, param: str):
+        """Private predictor to be used for a single parameter"""
 
-        # Normalisation
-        data_N = df.iloc[:, : self.ne].copy()
-        for i in range(self.ne):
-            data_N.iloc[:, i] = (2 / 3) * ((df.iloc[:, i] - moy_G[:, i]) / std_G[:, i])
-        data_N = np.array(data_N)
+        # NN input as an array, shared by all parameters:
+        data = self.input.iloc[:, : self.ne].to_numpy(dtype=np.float64)
 
         param_outputs_s = []
-        for i in range(1, self.n_list + 1):
-            b1, b2, b3, IW, LW1, LW2 = self.load_weights(param, "G", i)
-
-            # Calculate a
-            a = custom_MF(np.dot(data_N, IW.T).T + b1)
-
-            # Calculate b
-            b = custom_MF(np.dot(LW1, a) + b2)
-
-            # Calculate y
-            y = np.dot(LW2, b) + b3
-            y = y.T
-
-            # Calculate phos_outputs
-            param_outputs = 1.5 * y * std_G[0][self.ne] + moy_G[0][self.ne]
-            param_outputs_s.append(param_outputs)
-
-        # flatten array because it's nice #2
-        param_outputs_s2 = np.array(param_outputs_s).T
+        for subset in ["F", "G"]:
+            # Normalisation
+            # See Eq. 2 in 10.3389/fmars.2020.00620
+            # (The factor 2/3 brings at least 80% of the data in the range [-1;1])
+            moy, std = self.load_normalisation_factors(param, subset)
+            data_N = (2 / 3) * ((data - moy[:, : self.ne]) / std[:, : self.ne])
+
+            # Forward pass by batches of points, to limit memory usage with large datasets:
+            param_outputs_s.append(
+                np.concatenate(
+                    [
+                        self._forward(data_N[i0: i0 + self.batch_size], param, subset)
+                        for i0 in range(0, data_N.shape[0], self.batch_size)
+                    ]
+                )
+            )
 
         # concat F and G data
-        param_outputs_s = np.hstack(
-            (np.squeeze(param_outputs_s1, axis=0), np.squeeze(param_outputs_s2, axis=0))
-        )
+        param_outputs_s = np.hstack(param_outputs_s)
 
         # neural network
         mean_nn = np.mean(param_outputs_s, axis=1)
@@ -399,11 +346,12 @@ def custom_MF(x: np.ndarray):
         lim_inf = mean_nn - std_nn
         lim_sup = mean_nn + std_nn
 
-        param_t = param_outputs_s.copy()
-
-        for i in range(param_outputs_s.shape[0]):
-            param_t[i, :] = np.where(param_t[i, :] < lim_inf[i], nan_value, param_t[i, :])
-            param_t[i, :] = np.where(param_t[i, :] > lim_sup[i], nan_value, param_t[i, :])
+        param_t = np.where(
+            (param_outputs_s < lim_inf[:, np.newaxis])
+            | (param_outputs_s > lim_sup[:, np.newaxis]),
+            nan_value,
+            param_outputs_s,
+        )
 
         param_mean = np.nanmean(param_t, axis=1)
         param_std = np.nanstd(param_t, axis=1)
@@ -21,6 +21,7 @@
 
 from ..errors import InvalidDatasetStructure, DataNotFound
 from . import register_argo_accessor, ArgoAccessorExtension
+from .utils import predict_by_chunks
 
 # import carbonate utilities
 from ..utils.carbonate import (
@@ -933,6 +934,8 @@ def predict(
         epsal: Optional[float] = None,
         edoxy: Optional[Union[float, np.ndarray]] = None,
         include_uncertainties: Optional[bool] = False,
+        chunksize: Optional[int] = None,
+        n_jobs: Optional[int] = -1,
     ) -> xr.Dataset:
         """
         Make predictions using the CONTENT method.
@@ -945,6 +948,12 @@ def predict(
             Oxygen input error (default: 1% of doxy)
         include_uncertainties : bool, optional
             If True, include uncertainty estimates for each predicted parameter
+        chunksize : int, optional
+            If set, points are processed by chunks of at most ``chunksize`` points, in parallel with ``n_jobs``
+            workers, and predictions are written into output arrays in place.
+        n_jobs : int, optional
+            Number of parallel jobs used to process chunks of points, only used with ``chunksize``.
+            Default is -1 (use all available CPUs). This option is directly passed to :class:`joblib.Parallel`.
 
         Returns
         -------
@@ -952,6 +961,31 @@ def predict(
             Input dataset augmented with predicted parameters
         """
 
+        if chunksize is not None and self._argo.N_POINTS > chunksize:
+            predict_by_chunks(
+                self._obj,
+                "content",
+                self._input_list + [self._argo._TNAME],
+                chunksize,
+                n_jobs=n_jobs,
+                predict_kwargs=dict(
+                    epres=epres,
+                    etemp=etemp,
+                    epsal=epsal,
+                    edoxy=edoxy,
+                    include_uncertainties=include_uncertainties,
+                ),
+            )
+            if self._argo:
+                self._argo.add_history(
+                    "Added CANYON-B predictions for [%s]"
+                    % (",".join(["NO3", "PO4", "SiOH4"]))
+                )
+                self._argo.add_history(
+                    "Added CONTENT predictions for [%s]" % (",".join(self._parameters))
+                )
+            return self._obj
+
         # Get predictions for all 4 carbonate parameters (CONTENT method) and nutrients (CANYON-B method)
         prediction = self._predict(epres=epres, etemp=etemp, epsal=epsal, edoxy=edoxy)
 
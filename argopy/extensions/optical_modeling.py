@@ -41,6 +41,29 @@ class OpticalModeling(ArgoAccessorExtension):
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
 
+    def _reduce(self, func, func_numba, params, engine, chunks, scheduler, **kwargs) -> xr.DataArray:
+        """Reduce profiles with the numpy per-profile function or its numba counterpart"""
+        if engine == "numpy":
+            return self._argo.reduce_profile(
+                func, params=params, output_dtype=float, chunks=chunks, scheduler=scheduler, **kwargs
+            )
+        elif engine == "numba":
+            if not om.with_numba:
+                raise ImportError(
+                    "numba is required for the 'numba' engine. Install it with: pip install numba"
+                )
+            return self._argo.reduce_profile(
+                func_numba,
+                params=params,
+                vectorize=False,
+                output_dtype=float,
+                chunks=chunks,
+                scheduler=scheduler,
+                **kwargs,
+            )
+        else:
+            raise ValueError("Unknown engine '%s', must be 'numpy' or 'numba'" % engine)
+
     def Zeu(
         self,
         axis: str = "PRES",
@@ -50,6 +73,9 @@ def Zeu(
         layer_min: float = 10.0,
         layer_max: float = 50.0,
         inplace: bool = True,
+        engine: Literal["numpy", "numba"] = "numpy",
+        chunks=None,
+        scheduler=None,
     ):
         """Depth of the euphotic zone from PAR
 
@@ -81,6 +107,13 @@ def Zeu(
 
         inplace: bool, optional, default: True
             Should we return the new variable (False) or the dataset with the new variable added to it (True).
+        engine: str, optional, default: 'numpy'
+            Use 'numba' to process all profiles at once with a compiled loop, instead of calling the numpy
+            function on each profile.
+        chunks: int, optional, default: None
+            Chunk size along ``N_PROF`` for a parallel computation with dask, see :meth:`Dataset.argo.reduce_profile`.
+        scheduler: str, optional, default: None
+            Dask scheduler to compute the result with (eg: 'processes'), see :meth:`Dataset.argo.reduce_profile`.
 
         Returns
         -------
@@ -155,7 +188,7 @@ def Zeu(
                 "layer_min": layer_min,
                 "layer_max": layer_max,
             }
-        da = self._argo.reduce_profile(om.Z_euphotic, params=[axis, par], **kw)
+        da = self._reduce(om.Z_euphotic, om.Z_euphotic_numba, [axis, par], engine, chunks, scheduler, **kw)
 
         # Attributes
         da.name = "Zeu"
@@ -261,6 +294,9 @@ def Z_iPAR_threshold(
         threshold: float = 15.0,
         tolerance: float = 5.0,
         inplace: bool = True,
+        engine: Literal["numpy", "numba"] = "numpy",
+        chunks=None,
+        scheduler=None,
     ) -> Union[xr.DataArray, xr.Dataset]:
         """Depth where PAR reaches some threshold value (closest point)
 
@@ -276,6 +312,13 @@ def Z_iPAR_threshold(
             PAR value tolerance with regard to the target threshold. If the closest PAR value to ``threshold`` is distant by more than ``tolerance``, consider result invalid and return NaN.
         inplace: bool, optional, default: True
             Should we return the new variable (False) or the dataset with the new variable added to it (True).
+        engine: str, optional, default: 'numpy'
+            Use 'numba' to process all profiles at once with a compiled loop, instead of calling the numpy
+            function on each profile.
+        chunks: int, optional, default: None
+            Chunk size along ``N_PROF`` for a parallel computation with dask, see :meth:`Dataset.argo.reduce_profile`.
+        scheduler: str, optional, default: None
+            Dask scheduler to compute the result with (eg: 'processes'), see :meth:`Dataset.argo.reduce_profile`.
 
         Returns
         -------
@@ -302,7 +345,9 @@ def Z_iPAR_threshold(
         if par not in self._obj:
             raise ValueError(f"Missing '{par}' in this dataset")
         kw = {"threshold": threshold, "tolerance": tolerance}
-        da = self._argo.reduce_profile(om.Z_iPAR_threshold, params=[axis, par], **kw)
+        da = self._reduce(
+            om.Z_iPAR_threshold, om.Z_iPAR_threshold_numba, [axis, par], engine, chunks, scheduler, **kw
+        )
 
         # Attributes
         da.name = "Z_iPAR"
@@ -331,6 +376,8 @@ def DCM(
         surface_layer: float = 15.0,
         inplace: bool = True,
         axis_bbp: str = "PRES",
+        chunks=None,
+        scheduler=None,
     ) -> Union[xr.DataArray, xr.Dataset]:
         """Search and qualify Deep Chlorophyll Maxima
 
@@ -346,6 +393,10 @@ def DCM(
             Name of the particulate backscattering coefficient variable to use.
         inplace: bool, optional, default: True
             Should we return the new variable (False) or the dataset with the new variable added to it (True).
+        chunks: int, optional, default: None
+            Chunk size along ``N_PROF`` for a parallel computation with dask, see :meth:`Dataset.argo.reduce_profile`.
+        scheduler: str, optional, default: None
+            Dask scheduler to compute the result with (eg: 'processes'), see :meth:`Dataset.argo.reduce_profile`.
 
         Returns
         -------
@@ -403,7 +454,14 @@ def f(*args, **kwargs):
             "median_filter_size": median_filter_size,
             "surface_layer": surface_layer,
         }
-        da = self._argo.reduce_profile(f, params=[chla, axis, bbp, axis_bbp], **kw)
+        da = self._argo.reduce_profile(
+            f,
+            params=[chla, axis, bbp, axis_bbp],
+            output_dtype=object,
+            chunks=chunks,
+            scheduler=scheduler,
+            **kw,
+        ).astype("<U3")
 
         # Attributes
         da.name = "DCM"
@@ -438,6 +496,8 @@ def DCM_depth(
         surface_layer: float = 15.0,
         inplace: bool = True,
         axis_bbp: str = "PRES",
+        chunks=None,
+        scheduler=None,
     ) -> Union[xr.DataArray, xr.Dataset]:
         """Depth of the Deep Chlorophyll Maxima
 
@@ -453,6 +513,10 @@ def DCM_depth(
             Name of the particulate backscattering coefficient variable to use.
         inplace: bool, optional, default: True
             Should we return the new variable (False) or the dataset with the new variable added to it (True).
+        chunks: int, optional, default: None
+            Chunk size along ``N_PROF`` for a parallel computation with dask, see :meth:`Dataset.argo.reduce_profile`.
+        scheduler: str, optional, default: None
+            Dask scheduler to compute the result with (eg: 'processes'), see :meth:`Dataset.argo.reduce_profile`.
 
         Returns
         -------
@@ -510,7 +574,14 @@ def f(*args, **kwargs):
             "median_filter_size": median_filter_size,
             "surface_layer": surface_layer,
         }
-        da = self._argo.reduce_profile(f, params=[chla, axis, bbp, axis_bbp], **kw)
+        da = self._argo.reduce_profile(
+            f,
+            params=[chla, axis, bbp, axis_bbp],
+            output_dtype=float,
+            chunks=chunks,
+            scheduler=scheduler,
+            **kw,
+        )
 
         # Attributes
         da.name = "DCM_depth"
@@ -1,7 +1,7 @@
 import numpy as np
+import pandas as pd
 import xarray as xr
 import logging
-import time
 from typing import Union, List
 
 from ..utils import to_list, list_core_parameters
@@ -63,48 +63,50 @@ def _compute_from_ArgoIndex(
         idx = indexfs.copy(deep=True) if isinstance(indexfs, ArgoIndexStoreProto) else ArgoIndex()
 
         def complete_df(this_df, params):
-            """Add 'wmo', 'cyc' and '<param>_data_mode' columns to this dataframe"""
-            this_df["wmo"] = this_df["file"].apply(lambda x: int(x.split("/")[1]))
-            this_df["cyc"] = this_df["file"].apply(
-                lambda x: int(x.split("_")[-1].split(".nc")[0].replace("D", ""))
+            """Return a table with 'wmo', 'cyc' and one '<param>' data mode column per parameter
+
+            There is one row per (wmo, cyc) profile. If a profile is listed more than once in the index, we keep the
+            last entry.
+            """
+            this_df = this_df.reset_index(drop=True)
+            table = pd.DataFrame(
+                {
+                    "wmo": this_df["file"].str.split("/").str[1].astype(int),
+                    "cyc": this_df["file"]
+                    .str.split("_")
+                    .str[-1]
+                    .str.split(".nc")
+                    .str[0]
+                    .str.replace("D", "")
+                    .astype(int),
+                }
             )
-            this_df["variables"] = this_df["parameters"].apply(lambda x: x.split())
+
+            # Long table with one row per profile parameter:
+            variables = this_df["parameters"].str.split().explode()
+            variables = variables.to_frame("param").assign(
+                pos=variables.groupby(level=0).cumcount()
+            )
+            data_modes = this_df["parameter_data_mode"].map(list).explode()
+            data_modes = data_modes.to_frame("dm").assign(
+                pos=data_modes.groupby(level=0).cumcount()
+            )
+            long = (
+                variables[variables["param"].isin(params)]
+                .reset_index()
+                .merge(data_modes.reset_index(), on=["index", "pos"], how="left")
+            )
+
+            # Scatter data modes into one column per parameter:
             for param in params:
-                this_df["%s_data_mode" % param] = this_df.apply(
-                    lambda x: (
-                        x["parameter_data_mode"][x["variables"].index(param)]
-                        if param in x["variables"]
-                        else ""
-                    ),
-                    axis=1,
-                )
-            return this_df
-
-        def read_DM(this_df, wmo, cyc, param):
-            """Return one parameter data mode for a given wmo/cyc and index dataframe"""
-            filt = []
-            filt.append(this_df["wmo"].isin([wmo]))
-            filt.append(this_df["cyc"].isin([cyc]))
-            sub_df = this_df[np.logical_and.reduce(filt)]
-            if sub_df.shape[0] == 0:
-                log.debug(
-                    "Found a profile in the dataset, but not in the index ! wmo=%i, cyc=%i"
-                    % (wmo, cyc)
+                this_param = long[long["param"] == param]
+                table[param] = ""
+                table.loc[this_param["index"].values, param] = (
+                    this_param["dm"].fillna("").values
                 )
-                # This can happen if a Synthetic netcdf file was generated from a non-BGC float.
-                # The file exists, but it doesn't have BGC variables. Float is usually not listed in the index.
-                return ""
-            else:
-                return sub_df["%s_data_mode" % param].values[-1]
 
-        def print_etime(txt, t0):
-            now = time.process_time()
-            print("⏰ %s: %0.2f seconds" % (txt, now - t0))
-            return now
+            return table.drop_duplicates(subset=["wmo", "cyc"], keep="last")
 
-        # timer = time.process_time()
-
-        profiles = self._argo.list_WMO_CYC
         idx.query.wmo(self._argo.list_WMO)
 
         params = [
@@ -112,61 +114,31 @@ def print_etime(txt, t0):
             for p in idx.read_params()
             if p in self._obj or "%s_ADJUSTED" % p in self._obj
         ]
-        # timer = print_etime('Read profiles and params from ds', timer)
 
         df = idx.to_dataframe(completed=False)
         df = complete_df(df, params)
-        # timer = print_etime('Index search wmo and export to dataframe', timer)
 
-        CYCLE_NUMBER = self._obj["CYCLE_NUMBER"].values
-        PLATFORM_NUMBER = self._obj["PLATFORM_NUMBER"].values
-        N_POINTS = self._obj["N_POINTS"].values
+        # Join dataset (wmo, cyc) keys with the index table, preserving the dataset points order:
+        # (Profiles in the dataset but not in the index get an empty data mode. This can happen if a Synthetic netcdf
+        # file was generated from a non-BGC float. The file exists, but it doesn't have BGC variables. Float is
+        # usually not listed in the index.)
+        keys = pd.DataFrame(
+            {
+                "wmo": self._obj["PLATFORM_NUMBER"].values.astype(int),
+                "cyc": self._obj["CYCLE_NUMBER"].values.astype(int),
+            }
+        )
+        data_modes = keys.merge(df, on=["wmo", "cyc"], how="left")
+        if data_modes[params].isnull().any(axis=None):
+            log.debug(
+                "Found %i profile(s) in the dataset, but not in the index !"
+                % keys[data_modes[params].isnull().any(axis=1)].drop_duplicates().shape[0]
+            )
 
         for param in params:
-            # print("=" * 50)
-            # print("Filling DATA MODE for %s ..." % param)
-            # tims = {'init': 0, 'read_DM': 0, 'isin': 0, 'where': 0, 'fill': 0}
-
-            for iprof, prof in enumerate(profiles):
-                wmo, cyc = prof
-                # t0 = time.process_time()
-
-                if "%s_DATA_MODE" % param not in self._obj:
-                    self._obj["%s_DATA_MODE" % param] = xr.full_like(
-                        self._obj["CYCLE_NUMBER"], dtype=str, fill_value=""
-                    )
-                # now = time.process_time()
-                # tims['init'] += now - t0
-                # t0 = now
-
-                param_data_mode = read_DM(df, wmo, cyc, param)
-                # log.debug("data mode='%s' for %s/%i/%i" % (param_data_mode, param, wmo, cyc))
-                # now = time.process_time()
-                # tims['read_DM'] += now - t0
-                # t0 = now
-
-                i_cyc = CYCLE_NUMBER == cyc
-                i_wmo = PLATFORM_NUMBER == wmo
-                # now = time.process_time()
-                # tims['isin'] += now - t0
-                # t0 = now
-
-                i_points = N_POINTS[np.logical_and(i_cyc, i_wmo)]
-                # now = time.process_time()
-                # tims['where'] += now - t0
-                # t0 = now
-
-                # self._obj["%s_DATA_MODE" % param][i_points] = param_data_mode
-                self._obj["%s_DATA_MODE" % param].loc[dict(N_POINTS=i_points)] = (
-                    param_data_mode
-                )
-                # now = time.process_time()
-                # tims['fill'] += now - t0
-
-            self._obj["%s_DATA_MODE" % param] = self._obj[
-                "%s_DATA_MODE" % param
-            ].astype("<U1")
-            # timer = print_etime('Processed %s (%i profiles)' % (param, len(profiles)), timer)
+            self._obj["%s_DATA_MODE" % param] = self._obj["CYCLE_NUMBER"].copy(
+                data=data_modes[param].fillna("").values.astype("<U1")
+            )
 
         # Finalise:
         self._obj = self._obj[np.sort(self._obj.data_vars)]
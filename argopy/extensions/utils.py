@@ -1,7 +1,17 @@
+import logging
+from pathlib import Path
+from typing import Callable
+
+import numpy as np
+
+from ..options import OPTIONS
 from ..xarray import xr, ArgoAccessor
 from ..utils import register_accessor
 
 
+log = logging.getLogger("argopy.extensions.utils")
+
+
 def register_argo_accessor(name):
     """A decorator to register an accessor as a custom property on :class:`xarray.Dataset.argo` objects.
 
@@ -66,3 +76,121 @@ def __init__(self, obj):
         else:
             self._obj = obj._obj  # Xarray object from ArgoAccessor
             self._argo = obj
+
+
+def load_cached_arrays(cache: dict, key, files: dict, npz: str, reader: Callable) -> dict:
+    """Load text assets as numpy arrays, parsing them only once
+
+    Arrays are cached in memory and as a numpy ``.npz`` archive in the argopy cache folder, to be re-used by later
+    sessions. The archive is used only if it is more recent than all text assets.
+
+    Parameters
+    ----------
+    cache: dict
+        In memory cache, where arrays are stored under ``key``
+    key:
+        Key of the arrays in the in memory cache
+    files: dict
+        Dictionary of array names and text asset files
+    npz: str
+        Path of the ``.npz`` archive, relative to the argopy cache folder
+    reader: Callable
+        Function parsing a text asset file into a :class:`numpy.ndarray`
+
+    Returns
+    -------
+    dict
+        Dictionary of array names and :class:`numpy.ndarray`
+    """
+    if key not in cache:
+        npz = Path(OPTIONS["cachedir"]).joinpath(npz)
+        arrays = None
+        try:
+            if npz.stat().st_mtime >= max([Path(f).stat().st_mtime for f in files.values()]):
+                with np.load(npz) as data:
+                    arrays = {k: data[k] for k in files}
+        except (OSError, KeyError, ValueError):
+            pass
+
+        if arrays is None:
+            arrays = {k: reader(f) for k, f in files.items()}
+            try:
+                npz.parent.mkdir(parents=True, exist_ok=True)
+                np.savez(npz, **arrays)
+            except OSError as e:
+                log.debug("Could not cache arrays in '%s': %s" % (npz, str(e)))
+
+        cache[key] = arrays
+
+    return cache[key]
+
+
+def _predict_chunk(ds: xr.Dataset, extension: str, kwargs: dict) -> dict:
+    """Make predictions with an extension on a chunk of points, return new variables values and attributes"""
+    before = list(ds.variables)
+    ds = getattr(ds.argo, extension).predict(**kwargs)
+    return {v: (ds[v].values, ds[v].attrs) for v in ds.data_vars if v not in before}
+
+
+def predict_by_chunks(
+    obj: xr.Dataset,
+    extension: str,
+    inputs: list,
+    chunksize: int,
+    n_jobs: int = -1,
+    predict_kwargs: dict = None,
+) -> xr.Dataset:
+    """Make predictions with an extension ``predict`` method on chunks of points
+
+    The ``N_POINTS`` dimension of the ``inputs`` variables is split into chunks of at most ``chunksize`` points.
+    Chunks are sent to :class:`joblib.Parallel` workers as they are consumed, so that only a few chunks of input
+    and output data are in memory at once, and predicted values are written in place into output arrays
+    allocated once.
+
+    Parameters
+    ----------
+    obj: :class:`xarray.Dataset`
+        Dataset of points to make predictions for, predicted variables are added to it
+    extension: str
+        Name of the extension with the ``predict`` method, e.g. 'canyon_b'
+    inputs: list
+        List of variables needed by the extension to make predictions
+    chunksize: int
+        Maximum number of points per chunk
+    n_jobs: int, default=-1
+        Number of parallel jobs, passed to :class:`joblib.Parallel`
+    predict_kwargs: dict, optional
+        Arguments passed to the extension ``predict`` method. Array of input errors (e.g. ``edoxy``) with one value per
+        point are split in chunks too.
+
+    Returns
+    -------
+    :class:`xarray.Dataset`
+    """
+    from joblib import Parallel, delayed
+
+    N = obj.sizes["N_POINTS"]
+    data = obj[inputs]
+    kwargs = {} if predict_kwargs is None else predict_kwargs
+
+    def tasks():
+        for i0 in range(0, N, chunksize):
+            i1 = min(i0 + chunksize, N)
+            kw = {
+                k: v[i0:i1] if isinstance(v, np.ndarray) and v.size == N else v
+                for k, v in kwargs.items()
+            }
+            yield delayed(_predict_chunk)(data.isel(N_POINTS=slice(i0, i1)), extension, kw)
+
+    outputs = {}
+    with Parallel(n_jobs=n_jobs, return_as="generator") as parallel:
+        for i0, result in zip(range(0, N, chunksize), parallel(tasks())):
+            for v, (values, attrs) in result.items():
+                values = np.asarray(values).flatten()
+                if v not in outputs:
+                    outputs[v] = (np.empty(N, dtype=values.dtype), attrs)
+                outputs[v][0][i0: i0 + values.size] = values
+
+    for v, (values, attrs) in outputs.items():
+        obj[v] = xr.DataArray(values, dims="N_POINTS", attrs=attrs)
+    return obj
@@ -10,7 +10,15 @@
 """
 
 import os
+import time
+import json
+import uuid
+import shutil
+import hashlib
+import inspect
 import warnings
+import importlib
+from pathlib import Path
 
 import netCDF4
 
@@ -30,6 +38,7 @@
     get_coriolis_profile_id,
 )
 from .utils.checkers import is_box, is_indexbox, check_wmo, check_cyc
+from .utils.instrumentation import profile_fetch
 from .utils.lists import (
     list_available_data_src,
     list_available_index_src,
@@ -40,11 +49,32 @@
 from .plot import plot_trajectory, bar_plot, open_sat_altim_report, scatter_plot
 
 
+has_zarr = importlib.util.find_spec("zarr") is not None
+
 AVAILABLE_DATA_SOURCES = list_available_data_src()
 AVAILABLE_INDEX_SOURCES = list_available_index_src()
 
 log = logging.getLogger("argopy.fetchers.facade")
 
+_performance_options = [
+    "cache",
+    "cachedir",
+    "cache_results",
+    "parallel",
+    "progress",
+    "chunks",
+    "chunks_maxsize",
+    "api_timeout",
+    "max_workers",
+    "max_rows",
+    "checkpoint",
+    "response",
+    "rate_limit",
+    "fs",
+    "profile",
+]
+"""Data fetcher options that do not change the content of fetched data"""
+
 
 def checkAccessPoint(AccessPoint):
     """Decorator to validate fetcher access points of a given data source.
@@ -83,6 +113,16 @@ class ArgoDataFetcher:
          Source of the data to use. Eg: ``erddap``. Set to OPTIONS['src'] by default if empty.
     ds: str, optional
         Name of the dataset to load. Eg: ``phy``. Set to OPTIONS['ds'] by default if empty.
+    cache_results: bool, optional, default: False
+        Cache post-processed data on disk, as compressed zarr stores in the ``results`` folder of the cache folder.
+        Identical requests, with the same data source, dataset, user mode, access point and options, then load data
+        from this cache instead of fetching and processing data again, until the result is older than
+        OPTIONS['cache_expiration']. This requires the `zarr <https://zarr.dev>`_ library.
+    profile: bool, optional, default: False
+        Profile the execution of data fetches. A :class:`utils.instrumentation.FetchProfile` report, with url
+        latencies, a breakdown of time spent in download, decode, pre-processing, concatenation and casting stages,
+        throughput, slowest and failed urls and the maximum resident memory of the process, is then available in the
+        ``fetch_profile`` attribute, and as a json string in the ``Fetched_profile`` attribute of the dataset.
     **fetcher_kwargs: optional
         Additional arguments passed on data source fetcher creation of each access points.
 
@@ -147,6 +187,17 @@ def __init__(self, mode: str = "", src: str = "", ds: str = "", **fetcher_kwargs
         self._parallel = VALIDATE(
             "parallel", self.fetcher_kwargs.get("parallel", OPTIONS["parallel"])
         )
+        self._cache_results = self.fetcher_kwargs.get("cache_results", False)
+        self._profile = self.fetcher_kwargs.get("profile", False)
+        if not isinstance(self._profile, bool):
+            raise OptionValueError(
+                f"option 'profile' given an invalid value: {self._profile}"
+            )
+        self.fetch_profile = None
+        if self._cache_results and not has_zarr:
+            raise ModuleNotFoundError(
+                "The 'zarr' library is required to cache fetcher results"
+            )
 
         # Init sub-methods:
         self.fetcher = None
@@ -157,7 +208,7 @@ def __init__(self, mode: str = "", src: str = "", ds: str = "", **fetcher_kwargs
             )
         [
             fetcher_kwargs.pop(k, None)
-            for k in ["ds", "mode", "cache", "cachedir", "parallel"]
+            for k in ["ds", "mode", "cache", "cachedir", "parallel", "cache_results", "profile"]
         ]
         self.fetcher_options = {
             **{
@@ -280,8 +331,11 @@ def __getattr__(self, key):
             "_request",
             "_cache",
             "_cachedir",
+            "_cache_results",
+            "_profile",
             "_parallel",
             "fetcher_kwargs",
+            "fetch_profile",
         ]
         if key not in self.valid_access_points and key not in valid_attrs:
             raise InvalidFetcherAccessPoint("'%s' is not a valid access point" % key)
@@ -675,6 +729,13 @@ def _to_xarray(self, **kwargs) -> xr.Dataset:
 
         return xds
 
+    def _fetch(self, **kwargs) -> xr.Dataset:
+        """Fetch and post-process data, possibly from the cache of post-processed results"""
+        if self._cache_results:
+            return self._to_xarray_cached(**kwargs)
+        else:
+            return self._to_xarray(**kwargs)
+
     def to_xarray(self, **kwargs) -> xr.Dataset:
         """Fetch and return data as :class:`xarray.DataSet`
 
@@ -856,6 +917,77 @@ def fc(row):
 
         return df
 
+    @property
+    def _results_key(self) -> str:
+        """Hash of the normalized request definition, used as key of the post-processed results cache"""
+        options = {
+            k: str(v)
+            for k, v in self.fetcher_options.items()
+            if k not in _performance_options
+        }
+        definition = {
+            "src": self._src,
+            "ds": self._dataset_id,
+            "mode": self._mode,
+            "access_point": self._AccessPoint,
+            "request": self.fetcher.sha,
+            "server": str(getattr(self.fetcher, "server", "")),
+            "options": options,
+        }
+        return hashlib.sha256(
+            json.dumps(definition, sort_keys=True).encode()
+        ).hexdigest()
+
+    @property
+    def _results_path(self) -> Path:
+        """Path to the folder with the zarr stores of the post-processed results of this request"""
+        return Path(self._cachedir).joinpath("results", self._results_key[0:32])
+
+    def _results_store(self, **kwargs) -> Path:
+        """Path to the zarr store of the post-processed results of this request for some ``to_xarray`` arguments
+
+        Arguments are normalized with the defaults of the data source ``to_xarray`` method, so that omitted and
+        explicit default arguments share the same store.
+        """
+        try:
+            arguments = inspect.signature(self.fetcher.to_xarray).bind(**kwargs)
+            arguments.apply_defaults()
+            kwargs = arguments.arguments
+        except (TypeError, ValueError):
+            pass
+        key = hashlib.sha256(json.dumps(kwargs, sort_keys=True, default=str).encode()).hexdigest()
+        return self._results_path.joinpath("%s.zarr" % key[0:16])
+
+    def _to_xarray_cached(self, **kwargs) -> xr.Dataset:
+        """Fetch and post-process data, or load them from the results cache
+
+        Results older than OPTIONS['cache_expiration'] are fetched again. A new result is first written under a
+        temporary name and then moved, so that concurrent requests never read a partial zarr store.
+        """
+        path = self._results_store(**kwargs)
+        try:
+            if time.time() - path.stat().st_mtime < OPTIONS["cache_expiration"]:
+                with xr.open_zarr(path, chunks=None) as ds:
+                    xds = ds.load()
+                log.debug("Loaded results from cache: %s" % path)
+                return xds
+        except (OSError, KeyError, ValueError):
+            pass
+
+        xds = self._to_xarray(**kwargs)
+
+        tmp = path.with_name("%s.%s.tmp" % (path.stem, uuid.uuid4().hex[0:8]))
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            xds.argo.to_zarr(tmp, mode="w")
+            if path.exists():
+                shutil.rmtree(path, ignore_errors=True)
+            os.replace(tmp, path)
+        except Exception as e:
+            log.debug("Could not cache results in %s: %s" % (path, str(e)))
+            shutil.rmtree(tmp, ignore_errors=True)
+        return xds
+
     def load(self, force: bool = False, **kwargs):
         """Fetch data (and compute a profile index) if not already in memory
 
@@ -883,7 +1015,12 @@ def load(self, force: bool = False, **kwargs):
 
         if not self._loaded or force:
             # Fetch measurements:
-            self._data = self._to_xarray(**kwargs)
+            if self._profile:
+                with profile_fetch() as self.fetch_profile:
+                    self._data = self._fetch(**kwargs)
+                self._data.attrs["Fetched_profile"] = self.fetch_profile.to_json()
+            else:
+                self._data = self._fetch(**kwargs)
             # Next 2 lines must come before ._index because to_index(full=False) calls back on .load() to read .data
             self._request = self.__repr__()  # Save definition of loaded data
             self._loaded = True
@@ -892,12 +1029,14 @@ def load(self, force: bool = False, **kwargs):
         return self
 
     def clear_cache(self):
-        """Clear data cached by fetcher"""
+        """Clear data cached by fetcher, including post-processed results"""
         if not self.fetcher:
             raise InvalidFetcher(
                 " Initialize an access point (%s) first."
                 % ",".join(self.Fetchers.keys())
             )
+        if self._results_path.exists():
+            shutil.rmtree(self._results_path, ignore_errors=True)
         return self.fetcher.clear_cache()
 
     def plot(self, ptype: str = "trajectory", **kwargs):
@@ -1158,9 +1297,16 @@ def region(self, box):
     def to_dataframe(self, **kwargs):
         """Fetch and return index data as pandas Dataframe
 
+        Parameters
+        ----------
+        engine: str, default: "pandas"
+            Output type of the dataframe: ``pandas``, ``arrow`` (:class:`pandas.DataFrame` with
+            :class:`pandas.ArrowDtype` columns), ``pyarrow`` (:class:`pyarrow.Table`) or ``polars``
+            (:class:`polars.DataFrame`). See :meth:`argopy.ArgoIndex.to_dataframe`.
+
         Returns
         -------
-        :class:`pandas.DataFrame`
+        :class:`pandas.DataFrame`, :class:`pyarrow.Table` or :class:`polars.DataFrame`
         """
         if not self.fetcher:
             raise InvalidFetcher(
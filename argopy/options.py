@@ -51,6 +51,7 @@
 PARALLEL_DEFAULT_METHOD = "parallel_default_method"
 LON = "longitude_convention"
 NVS = "nvs"
+INSTRUMENT = "instrument"
 
 # Define the list of available options and default values:
 OPTIONS = {
@@ -71,6 +72,7 @@
     PARALLEL_DEFAULT_METHOD: "thread",
     LON: "180",
     NVS: "https://vocab.nerc.ac.uk",
+    INSTRUMENT: False,
 }
 DEFAULT = OPTIONS.copy()
 
@@ -137,6 +139,7 @@ def validate_parallel_method(method):
     PARALLEL_DEFAULT_METHOD: validate_parallel_method,
     LON: lambda x: x in ['180', '360'],
     NVS: lambda x: (isinstance(x, str) and x.startswith('http')) or x is None,
+    INSTRUMENT: lambda x: isinstance(x, bool),
 }
 
 
@@ -235,6 +238,11 @@ class set_options:
     nvs: str, default: 'https://vocab.nerc.ac.uk/collection'
         URL to use for the NVS Argo reference vocabulary server.
 
+    instrument: bool, default: False
+        Record a span for every data access stage (download, decode, preprocess, concat and cast), with timing and
+        byte counts. The last 100000 spans are retrieved with :func:`argopy.utils.global_instrument`. Use the
+        :class:`argopy.instrument` context manager to record spans of a single block of code.
+
     Other Parameters
     ----------------
     server: : str, default: None
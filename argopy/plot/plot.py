@@ -8,22 +8,19 @@
 #
 import warnings
 import logging
-import os
-import json
 from copy import copy
 
 import xarray as xr
 import pandas as pd
 import numpy as np
 from typing import Union
-import importlib
 
 from ..options import OPTIONS
 from ..utils.loggers import warnUnless
 from ..utils.checkers import check_wmo
 from ..utils.geo import conv_lon
 from ..utils.lists import subsample_list
-from ..utils.casting import to_list
+from ..utils.casting import to_list, DATA_TYPES
 from ..errors import InvalidDatasetStructure
 
 from .utils import STYLE, has_seaborn, has_mpl, has_cartopy, has_ipython, has_ipywidgets
@@ -50,13 +47,6 @@
 
 log = logging.getLogger("argopy.plot.plot")
 
-path2assets = importlib.util.find_spec(
-    "argopy.static.assets"
-).submodule_search_locations[0]
-
-with open(os.path.join(path2assets, "data_types.json"), "r") as f:
-    DATA_TYPES = json.load(f)
-
 
 def guess_cmap(hue: str) -> str | None:
     """Try to guess the ArgoColors colormap name to use as a function of the variable to plot
@@ -1,5 +1,6 @@
 import importlib
 import logging
+from functools import lru_cache
 from argopy.reference import ArgoReferenceTable
 
 log = logging.getLogger("argopy.related.utils")
@@ -8,7 +9,8 @@
 ).submodule_search_locations[0]
 
 
-def load_dict(ptype):
+@lru_cache
+def _load_dict(ptype):
     if ptype == "profilers":
         art = ArgoReferenceTable('ARGO_WMO_INST_TYPE')
         profilers = {}
@@ -23,6 +25,11 @@ def load_dict(ptype):
         raise ValueError("Invalid dictionary name")
 
 
+def load_dict(ptype):
+    """Return a reference table as a dictionary, tables are built once per session"""
+    return dict(_load_dict(ptype))
+
+
 def mapp_dict(Adictionnary, Avalue):
     if Avalue not in Adictionnary:
         return "Unknown"
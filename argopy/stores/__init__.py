@@ -7,16 +7,28 @@
 from .implementations.gdac import gdacfs
 
 from .index.argo_index import ArgoIndex
-from .float.argo_float import ArgoFloat
-from .nvs.nvs import NVS
 
 from .kerchunker import ArgoKerchunker
+from .jobstore import ArgoJobStore
 
 from .filesystems import has_distributed, distributed  # noqa: F401
 from .spec import ArgoStoreProto  # noqa: F401
 from .implementations.http_erddap import httpstore_erddap_auth  # noqa: F401
 
 
+def __getattr__(name):
+    # ArgoFloat and NVS implementations depend on an internet connection check, done on first use:
+    if name == "ArgoFloat":
+        from .float.argo_float import ArgoFloat
+
+        return ArgoFloat
+    if name == "NVS":
+        from .nvs.nvs import NVS
+
+        return NVS
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
 __all__ = (
     # Classes:
     "ArgoIndex",
@@ -28,6 +40,7 @@
     "memorystore",
     "s3store",
     "ArgoKerchunker",
+    "ArgoJobStore",
     "gdacfs",
     "NVS",
 )
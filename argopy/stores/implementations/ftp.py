@@ -10,7 +10,7 @@
 from netCDF4 import Dataset
 
 from ...errors import InvalidMethod, DataNotFound
-from ...utils.transformers import drop_variables_not_in_all_datasets
+from ...utils.transformers import drop_variables_not_in_all_datasets, concat_datasets
 from ..filesystems import has_distributed, distributed
 from ..filesystems import tqdm
 from .http import httpstore
@@ -413,14 +413,7 @@ def open_mfdataset(
             if concat:
                 # ds = xr.concat(results, dim=concat_dim, data_vars='all', coords='all', compat='override')
                 results = drop_variables_not_in_all_datasets(results)
-                ds = xr.concat(
-                    results,
-                    dim=concat_dim,
-                    data_vars="minimal",  # Only data variables in which the dimension already appears are included.
-                    coords="all",         # All coordinate variables will be concatenated, except those corresponding
-                                          # to other dimensions.
-                    compat="override",    # skip comparing and pick variable from first dataset,
-                )
+                ds = concat_datasets(results, concat_dim=concat_dim)
                 return ds
             else:
                 return results
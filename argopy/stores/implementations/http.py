@@ -18,14 +18,31 @@
 from netCDF4 import Dataset
 from urllib.parse import urlparse
 
-from ...errors import InvalidMethod, DataNotFound
+try:
+    import pyarrow as pa
+    import pyarrow.csv  # noqa: F401
+    import pyarrow.parquet  # noqa: F401
+
+    with_pyarrow = True
+except ModuleNotFoundError:
+    with_pyarrow = False
+
+try:
+    import orjson
+
+    with_orjson = True
+except ModuleNotFoundError:
+    with_orjson = False
+
+from ...errors import InvalidMethod, DataNotFound, CacheFileNotFound
 from ...utils import Registry, UriCName
 from ...utils import has_aws_credentials
 from ...utils import (
     drop_variables_not_in_all_datasets,
-    fill_variables_not_in_all_datasets,
+    concat_datasets,
 )
 from ...utils.monitored_threadpool import MyThreadPoolExecutor as MyExecutor
+from ...utils.instrumentation import span, is_instrumented, ContextThreadPoolExecutor
 from ..spec import ArgoStoreProto
 from ..filesystems import has_distributed, distributed
 from ..filesystems import tqdm
@@ -47,12 +64,16 @@ class httpstore(ArgoStoreProto):
     - :class:`httpstore.open_json`
     - :class:`httpstore.open_mfdataset`
     - :class:`httpstore.open_mfjson`
+    - :class:`httpstore.open_table`
     - :class:`httpstore.read_csv`
 
     """
 
     protocol = "http"
 
+    tabular_formats = {"csvp": "csv", "parquet": "parquet"}
+    """Url extensions of tabular responses that :meth:`httpstore.open_dataset` parses with pyarrow"""
+
     def __init__(self, *args, **kwargs):
         # Create a registry that will be used to keep track of all URLs accessed by this store
         self.urls_registry = Registry(name="Accessed URLs")
@@ -84,6 +105,16 @@ def curateurl(self, url) -> str:
         self.urls_registry.commit(url)
         return url
 
+    def _cache_status(self, url) -> Union[str, None]:
+        """Return ``hit`` or ``miss`` if url is in the cache or not, None if this store has no cache"""
+        if not self.cache:
+            return None
+        try:
+            self.cachepath(url)
+            return "hit"
+        except CacheFileNotFound:
+            return "miss"
+
     def download_url(
         self, url, max_attempt: int = 5, cat_opts: dict = {}, errors: str = "raise"
     ) -> Any:
@@ -119,12 +150,15 @@ def make_request(
             if n_attempt <= max_attempt:
                 try:
                     data = ffs.cat_file(url, **cat_opts)
+                    status[0] = 200
                 except FileNotFoundError as e:
+                    status[0] = 404
                     if errors == "raise":
                         raise e
                     elif errors == "ignore":
                         log.error("FileNotFoundError raised from: %s" % url)
                 except aiohttp.ClientResponseError as e:
+                    status[0] = e.status
                     if e.status == 413:
                         if errors == "raise":
                             raise e
@@ -141,7 +175,14 @@ def make_request(
                         )
                         time.sleep(retry_after)
                         n_attempt += 1
-                        make_request(ffs, url, n_attempt=n_attempt, cat_opts=cat_opts)
+                        data, n_attempt = make_request(
+                            ffs,
+                            url,
+                            n_attempt=n_attempt,
+                            max_attempt=max_attempt,
+                            cat_opts=cat_opts,
+                            errors=errors,
+                        )
                     else:
                         # Handle other client response errors
                         print(f"Error: {e}")
@@ -166,13 +207,24 @@ def make_request(
             return data, n_attempt
 
         url = self.curateurl(url)
-        data, n = make_request(
-            self.fs,
-            url,
-            max_attempt=max_attempt,
-            cat_opts=cat_opts,
-            errors=errors,
-        )
+        status = [None]
+        with span("download", url) as s:
+            if is_instrumented():
+                s.set(cache=self._cache_status(url))
+            try:
+                data, n = make_request(
+                    self.fs,
+                    url,
+                    max_attempt=max_attempt,
+                    cat_opts=cat_opts,
+                    errors=errors,
+                )
+            finally:
+                s.set(status=status[0])
+            s.set(bytes=0 if data is None else len(data), retries=n - 1)
+            if data is None:
+                # Errors may be ignored by make_request, mark the span as failed anyway
+                s.set(error="FileNotFoundError: %s (HTTP status %s)" % (url, status[0]))
 
         if data is None:
             if errors == "raise":
@@ -194,6 +246,10 @@ def open_dataset(
     ) -> xr.Dataset:
         """Create a :class:`xarray.Dataset` from an url pointing to a netcdf file
 
+        If the url path ends with one of the :attr:`httpstore.tabular_formats` extensions (e.g. an ERDDAP
+        ``.parquet`` or ``.csvp`` tabledap response), the table is parsed with :mod:`pyarrow` into a
+        :class:`xarray.Dataset` with a single ``row`` dimension, see :meth:`httpstore.open_table`.
+
         Parameters
         ----------
         url: str
@@ -338,6 +394,9 @@ def load_lazily(
                 )
 
         netCDF4 = kwargs.get("netCDF4", False)
+        if not lazy and not netCDF4 and self._tabular_format(url) is not None:
+            return self.open_table(url, errors=errors, dwn_opts=dwn_opts)
+
         if lazy and netCDF4:
             if errors == "raise":
                 raise ValueError("Cannot return a netCDF4.Dataset object in lazy mode")
@@ -359,16 +418,17 @@ def load_lazily(
             )
 
         if target is not None:
-            if not netCDF4:
-                ds = xr.open_dataset(target, **xr_opts)
+            with span("decode", url):
+                if not netCDF4:
+                    ds = xr.open_dataset(target, **xr_opts)
 
-                if "source" not in ds.encoding:
-                    if isinstance(url, str):
-                        ds.encoding["source"] = self.full_path(url)
+                    if "source" not in ds.encoding:
+                        if isinstance(url, str):
+                            ds.encoding["source"] = self.full_path(url)
 
-            else:
-                target = target if isinstance(target, bytes) else target.getbuffer()
-                ds = Dataset(None, memory=target, diskless=True, mode="r")
+                else:
+                    target = target if isinstance(target, bytes) else target.getbuffer()
+                    ds = Dataset(None, memory=target, diskless=True, mode="r")
 
             self.register(url)
             return ds
@@ -416,7 +476,128 @@ def _mfprocessor_dataset(
         if isinstance(preprocess, types.FunctionType) or isinstance(
             preprocess, types.MethodType
         ):
-            ds = preprocess(ds, **preprocess_opts)
+            with span("preprocess", url):
+                ds = preprocess(ds, **preprocess_opts)
+        return ds
+
+    def _tabular_format(self, url: str) -> Union[str, None]:
+        """Return the tabular format of an url response, None if this is not a tabular response"""
+        if not isinstance(url, str):
+            return None
+        ext = urlparse(url).path.rsplit(".", 1)[-1]
+        return self.tabular_formats.get(ext, None)
+
+    def _stream_csv(self, url: str) -> Union["pa.Table", None]:
+        """Read a csv response by blocks from the file handle, parsing each block while the next is downloaded
+
+        Returns None if the server returned no data.
+        """
+        url = self.curateurl(url)
+        with span("download", url) as s:
+            if is_instrumented():
+                s.set(cache=self._cache_status(url))
+            with self.fs.open(url, "rb") as f:
+                s.set(status=200)
+                f = io.BufferedReader(f)
+                if b"Your query produced no matching results" in f.peek(1024)[0:1024]:
+                    s.set(error="DataNotFound: %s" % url)
+                    return None
+                reader = pa.csv.open_csv(f)
+                table = reader.read_all()
+                s.set(bytes=f.tell())
+        return table
+
+    def open_table(
+        self,
+        url: str,
+        errors: Literal["raise", "ignore", "silent"] = "raise",
+        dwn_opts: dict = {},
+    ) -> xr.Dataset:
+        """Create a :class:`xarray.Dataset` from an url pointing to a csv or parquet table
+
+        Responses are parsed by :mod:`pyarrow` directly into columnar arrays, which is much faster and lighter
+        than decoding the equivalent netcdf response:
+
+        - csv responses are streamed: they are read from the file handle and parsed by blocks while the
+          response is downloaded, so the raw payload is never held in memory as a whole,
+        - parquet responses are downloaded with :meth:`httpstore.download_url` before being parsed, since the
+          parquet footer at the end of the payload is required to read it.
+
+        Each column becomes a variable along the ``row`` dimension:
+
+        - column names are stripped from any trailing units, e.g. ``pres (decibar)`` becomes ``pres``,
+        - string columns are returned as object arrays, with missing values as empty strings,
+        - integer columns with missing values are returned as floats, with missing values as NaN,
+        - timestamp columns are returned as timezone naive ``datetime64[ns]``.
+
+        Parameters
+        ----------
+        url: str
+            The remote URL of the table to open, with a ``.csvp`` or ``.parquet`` extension
+        errors: Literal, default: ``raise``
+            Define how to handle errors raised during data fetching:
+                - ``raise`` (default): Raise any error encountered
+                - ``ignore``: Do not stop processing, simply issue a debug message in logging console
+                - ``silent``:  Do not stop processing and do not issue log message
+        dwn_opts: dict, default={}
+             Options passed to :func:`httpstore.download_url`
+
+        Returns
+        -------
+        :class:`xarray.Dataset`
+
+        Raises
+        ------
+        :class:`DataNotFound`
+            Raised if ``errors`` is set to ``raise`` and url returns no data.
+        """
+        if not with_pyarrow:
+            raise ModuleNotFoundError("pyarrow is required to open csv or parquet responses")
+
+        table, streamed = None, False
+        if self._tabular_format(url) == "csv":
+            try:
+                table, streamed = self._stream_csv(url), True
+            except FileNotFoundError:
+                streamed = True
+            except aiohttp.ClientResponseError as e:
+                # Fall back on the resilient downloader, e.g. to retry after a 429 "Too many requests" error
+                log.debug("Cannot stream '%s' (%s), downloading it" % (url, e))
+
+        if not streamed:
+            data = self.download_url(url, **dwn_opts)
+            if data is not None and b"Your query produced no matching results" not in data[0:1024]:
+                with span("decode", url):
+                    if self._tabular_format(url) == "parquet":
+                        table = pa.parquet.read_table(pa.BufferReader(data))
+                    else:
+                        table = pa.csv.read_csv(pa.BufferReader(data))
+
+        if table is None or table.num_rows == 0:
+            if errors == "raise":
+                raise DataNotFound(url)
+            elif errors == "ignore":
+                log.error("DataNotFound from: %s" % url)
+            return None
+
+        with span("decode", url):
+            ds = xr.Dataset()
+            for name, col in zip(table.column_names, table.columns):
+                name = name.split(" (")[0]
+                typ = col.type
+                if pa.types.is_string(typ) or pa.types.is_large_string(typ):
+                    val = col.fill_null("").to_numpy(zero_copy_only=False)
+                elif pa.types.is_timestamp(typ):
+                    if typ.tz is not None:
+                        col = col.cast(pa.timestamp(typ.unit))
+                    val = col.cast(pa.timestamp("ns")).to_numpy(zero_copy_only=False)
+                else:
+                    # Integers with nulls are cast to floats, nulls to NaN
+                    val = col.to_numpy(zero_copy_only=False)
+                ds[name] = xr.DataArray(val, dims="row")
+        ds.encoding["source"] = self.full_path(url)
+
+        self.register(url)
         return ds
 
     def _open_mfdataset_from_erddap(
@@ -496,12 +677,7 @@ def finalize(obj_list, **kwargs):
                 ]
                 # log.debug(ds_list)
                 if len(ds_list) > 0:
-                    if "data_vars" in kwargs and kwargs["data_vars"] == "all":
-                        # log.info('fill_variables_not_in_all_datasets')
-                        ds_list = fill_variables_not_in_all_datasets(
-                            ds_list, concat_dim=concat_dim
-                        )
-                    else:
+                    if "data_vars" not in kwargs or kwargs["data_vars"] != "all":
                         # log.info('drop_variables_not_in_all_datasets')
                         ds_list = drop_variables_not_in_all_datasets(ds_list)
 
@@ -513,13 +689,8 @@ def finalize(obj_list, **kwargs):
                         "Dataset sizes before concat: %s"
                         % [len(ds[concat_dim]) for ds in ds_list]
                     )
-                    ds = xr.concat(
-                        ds_list,
-                        dim=concat_dim,
-                        data_vars="minimal",  # Only data variables in which the dimension already appears are included.
-                        coords="all",
-                        compat="override",    # skip comparing and pick variable from first dataset
-                    )
+                    # Variables not in all datasets are filled:
+                    ds = concat_datasets(ds_list, concat_dim=concat_dim)
                     log.info("Dataset size after concat: %i" % len(ds[concat_dim]))
                     return ds, True
                 else:
@@ -707,7 +878,7 @@ def open_mfdataset(
 
         ################################
         elif method == "thread":
-            ConcurrentExecutor = concurrent.futures.ThreadPoolExecutor(
+            ConcurrentExecutor = ContextThreadPoolExecutor(
                 max_workers=max_workers
             )
 
@@ -859,16 +1030,9 @@ def open_mfdataset(
                 # ds = xr.concat(results, dim=concat_dim, data_vars='all', coords='all', compat='override')
                 if concat_method == "drop":
                     results = drop_variables_not_in_all_datasets(results)
-                elif concat_method == "fill":
-                    results = fill_variables_not_in_all_datasets(results)
-                ds = xr.concat(
-                    results,
-                    dim=concat_dim,
-                    data_vars="minimal",  # Only data variables in which the dimension already appears are included.
-                    coords="all",         # All coordinate variables will be concatenated, except those corresponding
-                                          # to other dimensions.
-                    compat="override",    # skip comparing and pick variable from first dataset
-                )
+                # Variables not in all datasets are filled:
+                with span("concat", "%i datasets" % len(results)):
+                    ds = concat_datasets(results, concat_dim=concat_dim)
                 if not compute_details:
                     return ds
                 else:
@@ -911,7 +1075,7 @@ def open_json(
         Steps performed:
 
         1. Download from ``url`` raw data with :class:`httpstore.download_url` and then
-        2. Create a JSON with :func:`json.loads`.
+        2. Create a JSON with :func:`orjson.loads` if available, :func:`json.loads` otherwise.
 
         Each steps can be passed specifics arguments (see Parameters below).
 
@@ -928,7 +1092,7 @@ def open_json(
         kwargs: dict
 
             - ``dwn_opts`` key dictionary is passed to :class:`httpstore.download_url`
-            - ``js_opts`` key dictionary is passed to :func:`json.loads`
+            - ``js_opts`` key dictionary is passed to :func:`json.loads`, in which case :func:`orjson.loads` is not used
 
         Returns
         -------
@@ -957,7 +1121,14 @@ def open_json(
         js_opts = {}
         if "js_opts" in kwargs:
             js_opts.update(kwargs["js_opts"])
-        js = json.loads(data, **js_opts)
+        with span("decode", url):
+            if with_orjson and len(js_opts) == 0:
+                try:
+                    js = orjson.loads(data)
+                except orjson.JSONDecodeError:  # e.g. NaN literals, not valid json
+                    js = json.loads(data)
+            else:
+                js = json.loads(data, **js_opts)
         if len(js) == 0:
             if errors == "raise":
                 raise DataNotFound(
@@ -1015,10 +1186,11 @@ def _mfprocessor_json(
         if isinstance(preprocess, types.FunctionType) or isinstance(
             preprocess, types.MethodType
         ):
-            if url_follow:
-                data = preprocess(data, url=url, **preprocess_opts)
-            else:
-                data = preprocess(data, **preprocess_opts)
+            with span("preprocess", url):
+                if url_follow:
+                    data = preprocess(data, url=url, **preprocess_opts)
+                else:
+                    data = preprocess(data, **preprocess_opts)
         return data
 
     def open_mfjson(
@@ -1093,7 +1265,7 @@ def open_mfjson(
         failed = []
         ################################
         if method == "thread":
-            ConcurrentExecutor = concurrent.futures.ThreadPoolExecutor(
+            ConcurrentExecutor = ContextThreadPoolExecutor(
                 max_workers=max_workers
             )
 
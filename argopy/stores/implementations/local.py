@@ -14,6 +14,8 @@
 
 from ...options import OPTIONS
 from ...errors import InvalidMethod, DataNotFound
+from ...utils.transformers import concat_datasets
+from ...utils.instrumentation import span, ContextThreadPoolExecutor
 
 from ..spec import ArgoStoreProto
 from ..filesystems import has_distributed, distributed
@@ -121,7 +123,9 @@ def load_in_memory(path, errors="raise", xr_opts={}):
             tuple: (data, _) or (None, _) if errors == "ignore"
             """
             try:
-                data = self.fs.cat_file(path)
+                with span("download", path) as s:
+                    data = self.fs.cat_file(path)
+                    s.set(bytes=len(data))
 
                 if data[0:3] != b"CDF" and data[0:3] != b"\x89HD":
                     raise TypeError(
@@ -188,16 +192,17 @@ def load_lazily(path, errors="raise", xr_opts={}, akoverwrite: bool = False):
             )
 
         if target is not None:
-            if not netCDF4:
-                ds = xr.open_dataset(target, **xr_opts)
+            with span("decode", path):
+                if not netCDF4:
+                    ds = xr.open_dataset(target, **xr_opts)
 
-                if "source" not in ds.encoding:
-                    if isinstance(path, str):
-                        ds.encoding["source"] = path
+                    if "source" not in ds.encoding:
+                        if isinstance(path, str):
+                            ds.encoding["source"] = path
 
-            else:
-                target = target if isinstance(target, bytes) else target.getbuffer()
-                ds = Dataset(None, memory=target, diskless=True, mode='r')
+                else:
+                    target = target if isinstance(target, bytes) else target.getbuffer()
+                    ds = Dataset(None, memory=target, diskless=True, mode='r')
 
             self.register(path)
             return ds
@@ -224,7 +229,8 @@ def _mfprocessor(
         if isinstance(preprocess, types.FunctionType) or isinstance(
             preprocess, types.MethodType
         ):
-            ds = preprocess(ds, **preprocess_opts)
+            with span("preprocess", url):
+                ds = preprocess(ds, **preprocess_opts)
         return ds
 
     def open_mfdataset(
@@ -282,7 +288,7 @@ def open_mfdataset(
         results = []
         if method in ["thread", "process"]:
             if method == "thread":
-                ConcurrentExecutor = concurrent.futures.ThreadPoolExecutor(
+                ConcurrentExecutor = ContextThreadPoolExecutor(
                     max_workers=max_workers
                 )
             else:
@@ -391,14 +397,8 @@ def open_mfdataset(
         results = [r for r in results if r is not None]  # Only keep non-empty results
         if len(results) > 0:
             if concat:
-                ds = xr.concat(
-                    results,
-                    dim=concat_dim,
-                    data_vars="minimal",  # Only data variables in which the dimension already appears are included.
-                    coords="all",         # All coordinate variables will be concatenated, except those corresponding
-                                          # to other dimensions.
-                    compat="override",    # skip comparing and pick variable from first dataset,
-                )
+                with span("concat", "%i datasets" % len(results)):
+                    ds = concat_datasets(results, concat_dim=concat_dim)
                 return ds
             else:
                 return results
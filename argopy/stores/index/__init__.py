@@ -4,10 +4,14 @@
 from .implementations.pandas.index import (
     indexstore as indexstore_pd,
 )  # noqa: F401
+from .implementations.duckdb.index import (
+    indexstore as indexstore_duckdb,
+)  # noqa: F401
 
 
 __all__ = (
     # Classes:
     "indexstore_pa",
     "indexstore_pd",
+    "indexstore_duckdb",
 )
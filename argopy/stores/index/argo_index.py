@@ -1,11 +1,18 @@
 import importlib
 
+from argopy.errors import OptionValueError
 
 if importlib.util.find_spec("pyarrow") is not None:
     from .implementations.pyarrow.index import indexstore
 else:
     from .implementations.pandas.index import indexstore
 
+BACKENDS = {
+    "pandas": "argopy.stores.index.implementations.pandas",
+    "pyarrow": "argopy.stores.index.implementations.pyarrow",
+    "duckdb": "argopy.stores.index.implementations.duckdb",
+}
+
 
 class ArgoIndex(indexstore):
     """Argo GDAC index store
@@ -13,6 +20,12 @@ class ArgoIndex(indexstore):
     If Pyarrow is available, this class will use :class:`pyarrow.Table` as internal storage format; otherwise, a
     :class:`pandas.DataFrame` will be used.
 
+    Another store backend can be selected with the ``backend`` argument: ``pandas``, ``pyarrow`` or ``duckdb``. The
+    ``duckdb`` backend runs searches as SQL queries in an embedded `DuckDB <https://duckdb.org>`_ database, out-of-core
+    on the cached Parquet index with ``cache=True``, and provides a ``sql`` method, see
+    :class:`argopy.stores.index.indexstore_duckdb`. Note that with another backend than the default one, the returned
+    object is an instance of this backend store class, not of :class:`ArgoIndex`.
+
     Shortcuts for ``host`` argument:
 
     - ``http`` or ``https`` for ``https://data-argo.ifremer.fr``
@@ -39,6 +52,7 @@ class ArgoIndex(indexstore):
         idx = ArgoIndex(index_file="bgc-s")  # Use keywords instead of exact file names
         idx = ArgoIndex(host="https://data-argo.ifremer.fr", index_file="bgc-b", cache=True)  # Use cache for performances
         idx = ArgoIndex(host=".", index_file="dummy_index.txt", convention="core")  # Load your own index
+        idx = ArgoIndex(index_file="bgc-s", cache=True, backend="duckdb")  # Search with SQL queries in DuckDB
 
     .. code-block:: python
         :caption: Full index methods and properties
@@ -158,5 +172,12 @@ class ArgoIndex(indexstore):
 
     """
 
-    def __init__(self, **kwargs):
-        super().__init__(**kwargs)
+    def __new__(cls, *args, backend: str = None, **kwargs):
+        if backend is None or backend == indexstore.backend:
+            return super().__new__(cls)
+        if backend not in BACKENDS:
+            raise OptionValueError("Invalid backend '%s', must be one in: %s" % (backend, list(BACKENDS)))
+        return importlib.import_module(BACKENDS[backend]).indexstore(*args, **kwargs)
+
+    def __init__(self, *args, backend: str = None, **kwargs):
+        super().__init__(*args, **kwargs)
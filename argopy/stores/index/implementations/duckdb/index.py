@@ -0,0 +1,267 @@
+import logging
+import importlib
+import numpy as np
+
+try:
+    import pyarrow as pa  # noqa: F401
+    import pyarrow.parquet as pq
+except ModuleNotFoundError:
+    pass
+
+try:
+    import duckdb
+except ModuleNotFoundError:
+    pass
+
+from argopy.errors import DataNotFound
+from argopy.stores.index.spec import dataframe_to_engine
+from argopy.stores.index.implementations.pyarrow.index import (
+    indexstore as indexstore_pa,
+)
+
+has_duckdb = importlib.util.find_spec("duckdb") is not None
+
+log = logging.getLogger("argopy.stores.index.duckdb")
+
+
+class indexstore(indexstore_pa):
+    """Argo GDAC index store using an embedded DuckDB database as search engine
+
+    The index is registered in an in-memory DuckDB database as the ``argo_index`` table. Search methods are
+    translated into SQL predicates, that are executed by DuckDB with multiple threads.
+
+    With cache, the ``argo_index`` table is a view on the cached Parquet index file: DuckDB scans the file
+    out-of-core, with column and filter pushdown, and the full index is not loaded in memory. It is only read as a
+    :class:`pyarrow.Table` on first access to :attr:`index`, e.g. by ``read_*(index=True)`` methods or
+    ``to_dataframe(index=True)``. Without cache, or if ``nrows`` is used to load the index, the index is loaded in
+    memory like with the pyarrow store, and registered in DuckDB without copy.
+
+    Any SQL query can be run with the :meth:`sql` method.
+
+    Notes
+    -----
+    - Like with the pyarrow store, the ``params`` search is a case-insensitive pattern match, e.g. ``'DOXY'``
+      also matches ``'C1PHASE_DOXY'``.
+    - Search results (``self.search``) are always held in memory as a :class:`pyarrow.Table`.
+    - This store is selected with ``ArgoIndex(backend='duckdb')``, and requires the ``duckdb`` library.
+
+    Examples
+    --------
+    .. code-block:: python
+
+        from argopy import ArgoIndex
+
+        idx = ArgoIndex(index_file='bgc-s', cache=True, backend='duckdb')
+        idx.query.compose({'box': BOX, 'parameter_data_mode': {'DOXY': 'D'}})
+
+        idx.sql("SELECT institution, COUNT(*) AS n FROM argo_index GROUP BY institution ORDER BY n DESC")
+        idx.sql("SELECT * FROM argo_search WHERE latitude > ?", params=[45.])
+    """
+
+    backend = "duckdb"
+
+    ext = "pq"
+    """Storage file extension"""
+
+    table = "argo_index"
+    """Name of the SQL table with the full index"""
+
+    table_search = "argo_search"
+    """Name of the SQL table with search results"""
+
+    def __init__(self, **kwargs):
+        if not has_duckdb:
+            raise ModuleNotFoundError("The 'duckdb' index store requires the 'duckdb' library")
+        self._con = None
+        self._con_source = None
+        self._index = None
+        self._index_parquet = None  # Local path to the cached Parquet index file, when used out-of-core
+        self._index_nrecords = None
+        super().__init__(**kwargs)
+
+    @property
+    def index(self) -> "pa.Table":
+        """Full index, read from the cached Parquet index file on first access if not already in memory"""
+        if self._index is None:
+            if self._index_parquet is None:
+                raise AttributeError("'indexstore' object has no attribute 'index'")
+            log.debug("Reading Argo index in memory from '%s'" % self._index_parquet)
+            self._index = pq.read_table(self._index_parquet)
+        return self._index
+
+    @index.setter
+    def index(self, value: "pa.Table"):
+        self._index = value
+        self._index_parquet = None
+
+    @property
+    def in_memory(self) -> bool:
+        """Is the full index loaded in memory"""
+        return self._index is not None
+
+    def _repr_in_memory(self) -> str:
+        if self._index is None and self._index_parquet is not None:
+            return "In memory: False (%i records in a Parquet file, queried out-of-core)" % self.N_RECORDS
+        return super()._repr_in_memory()
+
+    @property
+    def shape(self):
+        """Shape of the index array"""
+        if self._index is None and self._index_parquet is not None:
+            return self._index_nrecords, len(pq.read_schema(self._index_parquet).names)
+        return super().shape
+
+    @property
+    def N_RECORDS(self):
+        """Number of rows in the full index"""
+        if self._index is None and self._index_parquet is not None:
+            return self._index_nrecords
+        return super().N_RECORDS
+
+    @property
+    def N_FILES(self):
+        """Number of rows in search result or index if search not triggered"""
+        if not hasattr(self, "search") and self._index is None and self._index_parquet is not None:
+            return self._index_nrecords
+        return super().N_FILES
+
+    def load(self, nrows=None, force=False):
+        """Load an Argo-index file content
+
+        With cache and without ``nrows``, the full index is not loaded in memory once its Parquet file is in cache.
+
+        Returns
+        -------
+        self
+        """
+        if not (self.cache and nrows is None and not force and self._use_parquet()):
+            self._index_parquet = None
+            super().load(nrows=nrows, force=force)
+            if self.cache and nrows is None:
+                # The index was just saved in cache, release memory and use the Parquet file:
+                self._use_parquet()
+
+        if self.N_RECORDS == 0:
+            raise DataNotFound("No data found in the index")
+        return self
+
+    def _use_parquet(self) -> bool:
+        """Use the cached Parquet index file out-of-core, if any, instead of an in-memory index"""
+        path_in_cache = self.index_path + "/local.%s" % self.ext
+        if not self.fs["client"].exists(path_in_cache):
+            return False
+        path = self.fs["client"].cachepath(path_in_cache, errors="ignore")
+        if path is None:
+            return False
+        if path != self._index_parquet:
+            log.debug("Argo index in cache as a Parquet file, using '%s' out-of-core" % path)
+            self._index = None
+            self._index_parquet = path
+            self._index_nrecords = pq.read_metadata(path).num_rows
+            self.index_path_cache = path_in_cache
+            self._nrows_index = None
+        return True
+
+    @property
+    def con(self) -> "duckdb.DuckDBPyConnection":
+        """Connection to the embedded DuckDB database, with the index registered as the ``argo_index`` table"""
+        if self._index is None and self._index_parquet is None:
+            self.load(nrows=self._nrows_index)
+        if self._con is None:
+            self._con = duckdb.connect(":memory:")
+
+        source = self._index_parquet if self._index_parquet is not None else id(self._index)
+        if source != self._con_source:
+            if isinstance(source, str):
+                self._con.execute(
+                    "CREATE OR REPLACE TEMP VIEW %s AS SELECT * FROM read_parquet('%s')"
+                    % (self.table, source.replace("'", "''"))
+                )
+                log.debug("Argo index registered in DuckDB from Parquet file '%s'" % source)
+            else:
+                self._con.register(self.table, self._index)
+                log.debug("Argo index registered in DuckDB from Pyarrow table")
+            self._con_source = source
+        return self._con
+
+    def run(self, nrows=None):
+        """Filter index with search criteria"""
+
+        def search2cache_path(path, nrows=None):
+            if nrows is not None:
+                cache_path = path + "/local" + "#%i.%s" % (nrows, self.ext)
+            else:
+                cache_path = path + "/local.%s" % self.ext
+            return cache_path
+
+        search_path_cache = search2cache_path(self.search_path, nrows=nrows)
+
+        if self.cache and self.fs["client"].exists(search_path_cache):
+            log.debug(
+                "Search results already in memory as a Pyarrow table, loading from '%s'"
+                % search_path_cache
+            )
+            self.search = self._read(
+                self.fs["client"].fs, search_path_cache, fmt=self.ext
+            )
+            self.search_path_cache.commit(search_path_cache)
+        else:
+            log.debug("Compute search from scratch with DuckDB (nrows=%s) ..." % nrows)
+            query = "SELECT * FROM %s WHERE %s" % (self.table, self.search_filter)
+            if nrows is not None:
+                query += " LIMIT %i" % nrows
+            log.debug(query)
+            self.search = self.con.execute(query).fetch_arrow_table()
+
+            log.debug(
+                "Found %i/%i matches" % (self.search.shape[0], self.N_RECORDS)
+            )
+            if self.cache and self.search.shape[0] > 0:
+                self._write(
+                    self.fs["client"], search_path_cache, self.search, fmt=self.ext
+                )
+                self.search = self._read(self.fs["client"].fs, search_path_cache)
+                self.search_path_cache.commit(search_path_cache)
+                log.debug(
+                    "Search results saved in cache as a Pyarrow table at '%s'"
+                    % search_path_cache
+                )
+        return self
+
+    def _reduce_a_filter_list(self, filters, op="or"):
+        if np.all([isinstance(f, str) for f in filters]):
+            return (" %s " % op.upper()).join(["(%s)" % f for f in filters])
+        return super()._reduce_a_filter_list(filters, op=op)
+
+    def sql(self, query: str, params: list = None, engine: str = "pandas"):
+        """Run a SQL query on the index with DuckDB
+
+        The full index is available as the ``argo_index`` table, and search results, if any, as the ``argo_search``
+        table. The internal ``longitude_360`` column holds longitudes in the [0-360] range.
+
+        Parameters
+        ----------
+        query: str
+            A SQL query in the `DuckDB dialect <https://duckdb.org/docs/sql/introduction>`_
+        params: list, optional
+            Values for prepared statement parameters (``?``) in the query
+        engine: str, default: "pandas"
+            Output type, one in "pandas", "arrow", "pyarrow" or "polars", see :meth:`ArgoIndex.to_dataframe`
+
+        Returns
+        -------
+        :class:`pandas.DataFrame`, :class:`pyarrow.Table` or :class:`polars.DataFrame`
+
+        Examples
+        --------
+        .. code-block:: python
+
+            idx.sql("SELECT COUNT(*) FROM argo_index WHERE date >= '2020-01-01'")
+            idx.sql("SELECT * FROM argo_index WHERE institution = ?", params=['IF'])
+            idx.sql("SELECT DISTINCT split_part(file, '/', 2)::INTEGER AS wmo FROM argo_search", engine="pyarrow")
+        """
+        con = self.con
+        if hasattr(self, "search"):
+            con.register(self.table_search, self.search)
+        table = con.execute(query, params).fetch_arrow_table()
+        return dataframe_to_engine(table, engine)
@@ -0,0 +1,512 @@
+import logging
+import warnings
+import pandas as pd
+import numpy as np
+from typing import List
+
+from argopy.options import OPTIONS
+from argopy.errors import InvalidDatasetStructure, OptionValueError
+from argopy.utils.checkers import is_indexbox, parse_indexbox, check_wmo, check_cyc
+from argopy.utils.casting import to_list
+from argopy.utils.geo import conv_lon
+from argopy.utils.decorators import AccessorRegistrationWarning
+from argopy.stores.index.extensions import (
+    register_ArgoIndex_accessor,
+    ArgoIndexSearchEngine,
+)
+from argopy.stores.index.implementations.index_s3 import search_s3
+from argopy.stores.index.implementations.duckdb.index import indexstore
+
+log = logging.getLogger("argopy.stores.index.duckdb")
+
+
+def sql_value(value) -> str:
+    """Return a SQL literal for a python value"""
+    if isinstance(value, str):
+        return "'%s'" % value.replace("'", "''")
+    elif isinstance(value, pd.Timestamp):
+        return "TIMESTAMP '%s'" % value.strftime("%Y-%m-%d %H:%M:%S")
+    elif isinstance(value, (int, np.integer)):
+        return str(int(value))
+    elif isinstance(value, (float, np.floating)):
+        return repr(float(value))
+    raise ValueError("Cannot convert %s to a SQL literal" % type(value))
+
+
+def sql_is_in(expr: str, values: list) -> str:
+    """Return a SQL predicate testing if an expression is in a list of values"""
+    if len(values) == 0:
+        return "FALSE"
+    return "%s IN (%s)" % (expr, ", ".join([sql_value(v) for v in values]))
+
+
+def sql_range(expr: str, vmin=None, vmax=None) -> str:
+    """Return a SQL predicate testing if an expression is in a closed interval"""
+    filt = []
+    if vmin is not None:
+        filt.append("%s >= %s" % (expr, sql_value(vmin)))
+    if vmax is not None:
+        filt.append("%s <= %s" % (expr, sql_value(vmax)))
+    return " AND ".join(filt) if len(filt) > 0 else "TRUE"
+
+
+# Typed columns derived from the index 'file' column:
+SQL_DAC = "split_part(file, '/', 1)"
+SQL_WMO = "TRY_CAST(split_part(file, '/', 2) AS BIGINT)"
+SQL_CYC = r"TRY_CAST(regexp_extract(file, '_([0-9]+)\.nc$', 1) AS BIGINT)"
+SQL_DATA_MODE = "left(regexp_extract(file, '[^/]*$'), 1)"
+
+
+def sql_lon(BOX) -> str:
+    if OPTIONS["longitude_convention"] == "360":
+        return sql_range(
+            "longitude_360",
+            conv_lon(BOX[0], "360") if BOX[0] is not None else None,
+            conv_lon(BOX[1], "360") if BOX[1] is not None else None,
+        )
+    else:  # OPTIONS['longitude_convention'] == '180':
+        return sql_range(
+            "longitude",
+            conv_lon(BOX[0], "180") if BOX[0] is not None else None,
+            conv_lon(BOX[1], "180") if BOX[1] is not None else None,
+        )
+
+
+def sql_lat(BOX) -> str:
+    return sql_range("latitude", BOX[2], BOX[3])
+
+
+def sql_date(BOX) -> str:
+    return sql_range('"date"', pd.to_datetime(BOX[4]), pd.to_datetime(BOX[5]))
+
+
+class SearchEngine(ArgoIndexSearchEngine):
+    """Search methods translated into SQL predicates executed by DuckDB
+
+    Composed filters are SQL predicates, joined with AND/OR by :meth:`indexstore._reduce_a_filter_list`.
+    """
+
+    @search_s3
+    def wmo(self, WMOs, nrows=None, composed=False):
+        def checker(WMOs):
+            WMOs = check_wmo(WMOs)  # Check and return a valid list of WMOs
+            log.debug(
+                "Argo index searching for WMOs=[%s] ..."
+                % ";".join([str(wmo) for wmo in WMOs])
+            )
+            return WMOs
+
+        def namer(WMOs):
+            return {"WMO": WMOs}
+
+        def composer(WMOs):
+            return sql_is_in(SQL_WMO, WMOs)
+
+        WMOs = checker(WMOs)
+        self._obj.load(nrows=self._obj._nrows_index)
+        search_filter = composer(WMOs)
+        if not composed:
+            self._obj.search_type = namer(WMOs)
+            self._obj.search_filter = search_filter
+            self._obj.run(nrows=nrows)
+            return self._obj
+        else:
+            self._obj.search_type.update(namer(WMOs))
+            return search_filter
+
+    @search_s3
+    def cyc(self, CYCs, nrows=None, composed=False):
+        def checker(CYCs):
+            if self._obj.convention in ["ar_index_global_meta"]:
+                raise InvalidDatasetStructure(
+                    "Cannot search for cycle number in this index)"
+                )
+            CYCs = check_cyc(CYCs)  # Check and return a valid list of CYCs
+            log.debug(
+                "Argo index searching for CYCs=[%s] ..."
+                % (";".join([str(cyc) for cyc in CYCs]))
+            )
+            return CYCs
+
+        def namer(CYCs):
+            return {"CYC": CYCs}
+
+        def composer(CYCs):
+            return sql_is_in(SQL_CYC, CYCs)
+
+        CYCs = checker(CYCs)
+        self._obj.load(nrows=self._obj._nrows_index)
+        search_filter = composer(CYCs)
+        if not composed:
+            self._obj.search_type = namer(CYCs)
+            self._obj.search_filter = search_filter
+            self._obj.run(nrows=nrows)
+            return self._obj
+        else:
+            self._obj.search_type.update(namer(CYCs))
+            return search_filter
+
+    @search_s3
+    def wmo_cyc(self, WMOs, CYCs, nrows=None, composed=False):
+        def checker(WMOs, CYCs):
+            if self._obj.convention in ["ar_index_global_meta"]:
+                raise InvalidDatasetStructure(
+                    "Cannot search for cycle number in this index)"
+                )
+            WMOs = check_wmo(WMOs)  # Check and return a valid list of WMOs
+            CYCs = check_cyc(CYCs)  # Check and return a valid list of CYCs
+            log.debug(
+                "Argo index searching for WMOs=[%s] and CYCs=[%s] ..."
+                % (
+                    ";".join([str(wmo) for wmo in WMOs]),
+                    ";".join([str(cyc) for cyc in CYCs]),
+                )
+            )
+            return WMOs, CYCs
+
+        def namer(WMOs, CYCs):
+            return {"WMO": WMOs, "CYC": CYCs}
+
+        def composer(obj, WMOs, CYCs):
+            return obj._reduce_a_filter_list(
+                [sql_is_in(SQL_WMO, WMOs), sql_is_in(SQL_CYC, CYCs)], op="and"
+            )
+
+        WMOs, CYCs = checker(WMOs, CYCs)
+        self._obj.load(nrows=self._obj._nrows_index)
+        search_filter = composer(self._obj, WMOs, CYCs)
+        if not composed:
+            self._obj.search_type = namer(WMOs, CYCs)
+            self._obj.search_filter = search_filter
+            self._obj.run(nrows=nrows)
+            return self._obj
+        else:
+            self._obj.search_type.update(namer(WMOs, CYCs))
+            return search_filter
+
+    def date(self, BOX=None, nrows=None, composed=False, **kwargs):
+        def checker(BOX, **kwargs):
+            BOX = parse_indexbox("date", BOX, **kwargs)
+            if "date" not in self._obj.convention_columns:
+                raise InvalidDatasetStructure("Cannot search for date in this index")
+            is_indexbox(BOX)
+            log.debug("Argo index searching for date in BOX=%s ..." % BOX)
+            return BOX
+
+        def namer(BOX):
+            return {"DATE": BOX[4:6]}
+
+        BOX = checker(BOX, **kwargs)
+        self._obj.load(nrows=self._obj._nrows_index)
+        search_filter = sql_date(BOX)
+        if not composed:
+            self._obj.search_type = namer(BOX)
+            self._obj.search_filter = search_filter
+            self._obj.run(nrows=nrows)
+            return self._obj
+        else:
+            self._obj.search_type.update(namer(BOX))
+            return search_filter
+
+    def lat(self, BOX=None, nrows=None, composed=False, **kwargs):
+        def checker(BOX, **kwargs):
+            BOX = parse_indexbox("lat", BOX, **kwargs)
+            if "latitude" not in self._obj.convention_columns:
+                raise InvalidDatasetStructure(
+                    "Cannot search for latitude in this index"
+                )
+            is_indexbox(BOX)
+            log.debug("Argo index searching for latitude in BOX=%s ..." % BOX)
+            return BOX
+
+        def namer(BOX):
+            return {"LAT": BOX[2:4]}
+
+        BOX = checker(BOX, **kwargs)
+        self._obj.load(nrows=self._obj._nrows_index)
+        search_filter = sql_lat(BOX)
+        if not composed:
+            self._obj.search_type = namer(BOX)
+            self._obj.search_filter = search_filter
+            self._obj.run(nrows=nrows)
+            return self._obj
+        else:
+            self._obj.search_type.update(namer(BOX))
+            return search_filter
+
+    def lon(self, BOX=None, nrows=None, composed=False, **kwargs):
+        def checker(BOX, **kwargs):
+            BOX = parse_indexbox("lon", BOX, **kwargs)
+            if "longitude" not in self._obj.convention_columns:
+                raise InvalidDatasetStructure(
+                    "Cannot search for longitude in this index"
+                )
+            is_indexbox(BOX)
+            log.debug("Argo index searching for longitude in BOX=%s ..." % BOX)
+            return BOX
+
+        def namer(BOX):
+            return {"LON": BOX[0:2]}
+
+        BOX = checker(BOX, **kwargs)
+        self._obj.load(nrows=self._obj._nrows_index)
+        search_filter = sql_lon(BOX)
+        if not composed:
+            self._obj.search_type = namer(BOX)
+            self._obj.search_filter = search_filter
+            self._obj.run(nrows=nrows)
+            return self._obj
+        else:
+            self._obj.search_type.update(namer(BOX))
+            return search_filter
+
+    def lon_lat(self, BOX, nrows=None, composed=False):
+        def checker(BOX):
+            if "longitude" not in self._obj.convention_columns:
+                raise InvalidDatasetStructure("Cannot search for lon/lat in this index")
+            is_indexbox(BOX)
+            log.debug("Argo index searching for lon/lat in BOX=%s ..." % BOX)
+
+        def namer(BOX):
+            return {"LON": BOX[0:2], "LAT": BOX[2:4]}
+
+        def composer(obj, BOX):
+            return obj._reduce_a_filter_list([sql_lon(BOX), sql_lat(BOX)], op="and")
+
+        checker(BOX)
+        self._obj.load(nrows=self._obj._nrows_index)
+        search_filter = composer(self._obj, BOX)
+        if not composed:
+            self._obj.search_type = namer(BOX)
+            self._obj.search_filter = search_filter
+            self._obj.run(nrows=nrows)
+            return self._obj
+        else:
+            self._obj.search_type.update(namer(BOX))
+            return search_filter
+
+    def box(self, BOX, nrows=None, composed=False):
+        def checker(BOX):
+            if "longitude" not in self._obj.convention_columns:
+                raise InvalidDatasetStructure(
+                    "Cannot search for coordinates in this index"
+                )
+            is_indexbox(BOX)
+            log.debug("Argo index searching for lat/lon/date in BOX=%s ..." % BOX)
+
+        def namer(BOX):
+            return {"BOX": BOX}
+
+        def composer(obj, BOX):
+            return obj._reduce_a_filter_list(
+                [sql_lon(BOX), sql_lat(BOX), sql_date(BOX)], op="and"
+            )
+
+        checker(BOX)
+        self._obj.load(nrows=self._obj._nrows_index)
+        search_filter = composer(self._obj, BOX)
+        if not composed:
+            self._obj.search_type = namer(BOX)
+            self._obj.search_filter = search_filter
+            self._obj.run(nrows=nrows)
+            return self._obj
+        else:
+            self._obj.search_type.update(namer(BOX))
+            return search_filter
+
+    def params(self, PARAMs, logical="and", nrows=None, composed=False):
+        def checker(PARAMs):
+            if "parameters" not in self._obj.convention_columns:
+                raise InvalidDatasetStructure(
+                    "Cannot search for parameters in this index (%s: %s)."
+                    % (self._obj.convention, self._obj.convention_title)
+                )
+            log.debug("Argo index searching for parameters in PARAM=%s." % PARAMs)
+            return to_list(PARAMs)  # Make sure we deal with a list
+
+        def namer(PARAMs, logical):
+            return {"PARAMS": (PARAMs, logical)}
+
+        def composer(obj, PARAMs, logical):
+            # Case-insensitive pattern match, like with the pyarrow store:
+            filt = [
+                "regexp_matches(parameters, %s, 'i')" % sql_value(param)
+                for param in PARAMs
+            ]
+            return obj._reduce_a_filter_list(filt, op=logical)
+
+        PARAMs = checker(PARAMs)
+        self._obj.load(nrows=self._obj._nrows_index)
+        search_filter = composer(self._obj, PARAMs, logical)
+        if not composed:
+            self._obj.search_type = namer(PARAMs, logical)
+            self._obj.search_filter = search_filter
+            self._obj.run(nrows=nrows)
+            return self._obj
+        else:
+            self._obj.search_type.update(namer(PARAMs, logical))
+            return search_filter
+
+    def parameter_data_mode(
+        self, PARAMs: dict, logical="and", nrows=None, composed=False
+    ):
+        def checker(PARAMs):
+            if self._obj.convention not in [
+                "ar_index_global_prof",
+                "argo_synthetic-profile_index",
+                "argo_bio-profile_index",
+            ]:
+                raise InvalidDatasetStructure(
+                    "Cannot search for parameter data mode in this index)"
+                )
+            log.debug(
+                "Argo index searching for parameter data modes such as PARAM=%s ..."
+                % PARAMs
+            )
+
+            # Validate PARAMs argument type
+            [PARAMs.update({p: to_list(PARAMs[p])}) for p in PARAMs]
+            if not np.all(
+                [
+                    v in ["R", "A", "D", "", " "]
+                    for vals in PARAMs.values()
+                    for v in vals
+                ]
+            ):
+                raise ValueError("Data mode must be a value in 'R', 'A', 'D', ' ', ''")
+            return PARAMs
+
+        def namer(PARAMs, logical):
+            return {"DMODE": (PARAMs, logical)}
+
+        def composer(obj, PARAMs, logical):
+            filt = []
+            for param in PARAMs:
+                data_mode = to_list(PARAMs[param])
+                if obj.convention in ["ar_index_global_prof"]:
+                    # Data mode is the 1st letter of the file name:
+                    filt.append(sql_is_in(SQL_DATA_MODE, data_mode))
+                else:
+                    # Data mode is the letter of 'parameter_data_mode' at the position of the parameter in
+                    # 'parameters', or an empty string if the parameter is not listed:
+                    position = "nullif(list_position(string_split(parameters, ' '), %s), 0)" % sql_value(param)
+                    filt.append(
+                        sql_is_in(
+                            "coalesce(substr(parameter_data_mode, %s, 1), '')" % position,
+                            data_mode,
+                        )
+                    )
+            return obj._reduce_a_filter_list(filt, op=logical)
+
+        PARAMs = checker(PARAMs)
+        self._obj.load(nrows=self._obj._nrows_index)
+        search_filter = composer(self._obj, PARAMs, logical)
+        if not composed:
+            self._obj.search_type = namer(PARAMs, logical)
+            self._obj.search_filter = search_filter
+            self._obj.run(nrows=nrows)
+            return self._obj
+        else:
+            self._obj.search_type.update(namer(PARAMs, logical))
+            return search_filter
+
+    def profiler_type(self, profiler_type: List[int], nrows=None, composed=False):
+        def checker(profiler_type):
+            if "profiler_type" not in self._obj.convention_columns:
+                raise InvalidDatasetStructure(
+                    "Cannot search for profiler types in this index)"
+                )
+            log.debug(
+                "Argo index searching for profiler type in %s ..." % profiler_type
+            )
+            return [int(p) for p in to_list(profiler_type)]
+
+        def namer(profiler_type):
+            return {"PTYPE": profiler_type}
+
+        def composer(profiler_type):
+            return sql_is_in("profiler_type", profiler_type)
+
+        profiler_type = checker(profiler_type)
+        self._obj.load(nrows=self._obj._nrows_index)
+        search_filter = composer(profiler_type)
+        if not composed:
+            self._obj.search_type = namer(profiler_type)
+            self._obj.search_filter = search_filter
+            self._obj.run(nrows=nrows)
+            return self._obj
+        else:
+            self._obj.search_type.update(namer(profiler_type))
+            return search_filter
+
+    @search_s3
+    def institution_code(self, institution_code: List[str], nrows=None, composed=False):
+        def checker(institution_code):
+            if "institution" not in self._obj.convention_columns:
+                raise InvalidDatasetStructure(
+                    "Cannot search for institution codes in this index)"
+                )
+            log.debug(
+                "Argo index searching for institution code in %s ..." % institution_code
+            )
+            institution_code = to_list(institution_code)
+            valid_codes = []
+            for code in institution_code:
+                if self._obj.valid("institution_code", code):
+                    valid_codes.append(code.upper())
+            if len(valid_codes) == 0:
+                raise OptionValueError(
+                    f"No valid codes found for institution in {institution_code}. Valid codes are: {self._obj.valid.institution_code}"
+                )
+            else:
+                return valid_codes
+
+        def namer(institution_code):
+            return {"INST_CODE": institution_code}
+
+        def composer(institution_code):
+            return sql_is_in("institution", institution_code)
+
+        institution_code = checker(institution_code)
+        self._obj.load(nrows=self._obj._nrows_index)
+        search_filter = composer(institution_code)
+        if not composed:
+            self._obj.search_type = namer(institution_code)
+            self._obj.search_filter = search_filter
+            self._obj.run(nrows=nrows)
+            return self._obj
+        else:
+            self._obj.search_type.update(namer(institution_code))
+            return search_filter
+
+    @search_s3
+    def dac(self, dac: list[str], nrows=None, composed=False):
+        def checker(dac):
+            if "file" not in self._obj.convention_columns:
+                raise InvalidDatasetStructure("Cannot search for DAC in this index)")
+            log.debug("Argo index searching for DAC in %s ..." % dac)
+            return to_list(dac)
+
+        def namer(dac):
+            return {"DAC": dac}
+
+        def composer(DACs):
+            return sql_is_in(SQL_DAC, DACs)
+
+        dac = checker(dac)
+        self._obj.load(nrows=self._obj._nrows_index)
+        search_filter = composer(dac)
+        if not composed:
+            self._obj.search_type = namer(dac)
+            self._obj.search_filter = search_filter
+            self._obj.run(nrows=nrows)
+            return self._obj
+        else:
+            self._obj.search_type.update(namer(dac))
+            return search_filter
+
+
+with warnings.catch_warnings():
+    # The duckdb store inherits the 'query' accessor of the pyarrow store, that we replace here:
+    warnings.simplefilter("ignore", AccessorRegistrationWarning)
+    register_ArgoIndex_accessor("query", indexstore)(SearchEngine)
@@ -13,6 +13,7 @@
     HAS_BOTO3,
 )
 from ....utils import redact, to_list
+from ....utils.instrumentation import span
 from ....errors import InvalidDatasetStructure, OptionValueError
 from ... import s3store
 
@@ -182,6 +183,17 @@ def _sio2pq(self, obj_io: io.StringIO) -> pa.Table:
 
     def query(self, sql_expression: str) -> str:
         # Use SelectObjectContent to filter CSV data before downloading it
+        with span("download", "s3://%s/%s" % (self.bucket_name, self.key)) as this:
+            records, stats = self._select(sql_expression)
+            this.set(bytes=stats.get("BytesReturned", None))
+
+        self.stats_last = stats
+        self.stats.update({sql_expression: stats})
+
+        return "".join(r for r in records)
+
+    def _select(self, sql_expression: str):
+        """Run an S3 Select query, return the list of record payloads and statistics of the query"""
         try:
             s3_object = self.fs.select_object_content(
                 Bucket=self.bucket_name,
@@ -207,17 +219,14 @@ def query(self, sql_expression: str) -> str:
             raise
 
         # Iterate over the filtered CSV data
-        records = []
+        records, stats = [], {}
         for event in s3_object["Payload"]:
             if "Records" in event:
                 records.append(event["Records"]["Payload"].decode("utf-8"))
             elif "Stats" in event:
                 stats = event["Stats"]["Details"]
 
-        self.stats_last = stats
-        self.stats.update({sql_expression: stats})
-
-        return "".join(r for r in records)
+        return records, stats
 
     def run(self):
         if not is_list_of_strings(self.sql_expression):
@@ -590,8 +599,8 @@ def search_s3(func, *args, **kwargs):
 
     if (
         func.__name__ == "wmo"
-        and not hasattr(idx, "index")
         and isinstance(idx.fs["src"], s3store)
+        and not hasattr(idx, "index")
     ):
         WMOs, nrows, composed = args[1], args[2], args[3]
         if not composed:
@@ -610,8 +619,8 @@ def search_s3(func, *args, **kwargs):
 
     if (
         func.__name__ == "cyc"
-        and not hasattr(idx, "index")
         and isinstance(idx.fs["src"], s3store)
+        and not hasattr(idx, "index")
     ):
         CYCs, nrows, composed = args[1], args[2], args[3]
         if not composed:
@@ -630,8 +639,8 @@ def search_s3(func, *args, **kwargs):
 
     if (
         func.__name__ == "wmo_cyc"
-        and not hasattr(idx, "index")
         and isinstance(idx.fs["src"], s3store)
+        and not hasattr(idx, "index")
     ):
         WMOs, CYCs, nrows, composed = args[1], args[2], args[3], args[4]
         if not composed:
@@ -654,8 +663,8 @@ def search_s3(func, *args, **kwargs):
 
     if (
         func.__name__ == "institution_code"
-        and not hasattr(idx, "index")
         and isinstance(idx.fs["src"], s3store)
+        and not hasattr(idx, "index")
     ):
         CODEs, nrows, composed = args[1], args[2], args[3]
         if not composed:
@@ -683,8 +692,8 @@ def search_s3(func, *args, **kwargs):
 
     if (
         func.__name__ == "institution_name"
-        and not hasattr(idx, "index")
         and isinstance(idx.fs["src"], s3store)
+        and not hasattr(idx, "index")
     ):
         NAMEs, nrows, composed = args[1], args[2], args[3]
         if not composed:
@@ -716,8 +725,8 @@ def search_s3(func, *args, **kwargs):
 
     if (
         func.__name__ == "dac"
-        and not hasattr(idx, "index")
         and isinstance(idx.fs["src"], s3store)
+        and not hasattr(idx, "index")
     ):
         DACs, nrows, composed = args[1], args[2], args[3]
         if not composed:
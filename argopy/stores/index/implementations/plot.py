@@ -1,6 +1,5 @@
 from typing import Any
 
-from ....plot import plot_trajectory, bar_plot
 from ..extensions import ArgoIndexPlotProto
 
 
@@ -98,6 +97,8 @@ def trajectory(self, index: bool = False, **kwargs) -> Any:
             default_opts["add_legend"] = False
             default_opts["palette"] = "Spectral_r"
             default_opts["cbar"] = True
+        from ....plot import plot_trajectory
+
         fig, ax = plot_trajectory(
             self._obj.to_dataframe(index=index), **{**default_opts, **kwargs}
         )
@@ -148,6 +149,8 @@ def bar(self, by: str = "dac", index: bool = False, **kwargs) -> Any:
             raise ValueError(
                 'Invalid value for "by", must be in "date", "latitude", "longitude", "ocean", "profiler_code"'
             )
+        from ....plot import bar_plot
+
         fig, ax = bar_plot(self._obj.to_dataframe(index=index), by=by, **kwargs)
         ax.set_title(self.get_title(index))
         return fig, ax
@@ -253,6 +253,96 @@ def _to_dataframe(self, nrows=None, index=False):  # noqa: C901
         df.drop("longitude_360", inplace=True, axis="columns")
         return df, src
 
+    def _to_table(self, nrows=None, index=False, completed=True) -> "pa.Table":
+        """Return index or search results as a completed :class:`pyarrow.Table`, without conversion to pandas"""
+        if hasattr(self, "search") and not index:
+            if self.N_MATCH == 0:
+                raise DataNotFound(
+                    "No data found in the index corresponding to your search criteria."
+                    " Search definition: %s" % self.cname
+                )
+            table = self.search
+        else:
+            if not hasattr(self, "index"):
+                self.load(nrows=nrows)
+            table = self.index
+
+        if "longitude_360" in table.column_names:
+            table = table.drop_columns(["longitude_360"])
+        if nrows is not None:
+            table = table.slice(0, nrows)
+        return self._complete_table(table, completed=completed)
+
+    def _map_dictionary(self, values: "pa.Array", mapping: dict) -> "pa.DictionaryArray":
+        """Map values with a dictionary into a dictionary array, unknown values are mapped to 'Unknown'"""
+        encoded = pc.dictionary_encode(values, null_encoding="encode")
+        labels = pa.array(
+            [mapping.get(v, "Unknown") for v in encoded.dictionary.to_pylist()], type=pa.string()
+        )
+        categories = pc.unique(labels)
+        indices = pc.take(pc.index_in(labels, value_set=categories), encoded.indices)
+        return pa.DictionaryArray.from_arrays(indices, categories)
+
+    def _complete_table(self, table: "pa.Table", completed: bool = True) -> "pa.Table":
+        """Add columns derived from file paths and reference tables to an index table
+
+        Columns are the same as with :meth:`_complete_dataframe`, computed with Arrow compute functions.
+        """
+        file = table["file"].combine_chunks()
+        parts = pc.split_pattern(file, pattern="/", max_splits=2)
+        table = table.append_column("wmo", pc.cast(pc.list_element(parts, 1), pa.int64()))
+        if self.convention not in [
+            "ar_index_global_meta",
+        ]:
+            cyc = pc.extract_regex(file, pattern=r"^[^_]*_(?P<cyc>[0-9]+)")
+            table = table.append_column("cyc", pc.cast(pc.struct_field(cyc, [0]), pa.int64()))
+
+        if 'profiler_type' in self.convention_columns:
+            i = table.schema.get_field_index("profiler_type")
+            profiler_type = pc.cast(pc.fill_null(table["profiler_type"], 9999), pa.int64())
+            table = table.set_column(i, "profiler_type", profiler_type)
+
+        if completed:
+            institution = pc.cast(table["institution"], pa.string()).combine_chunks()
+            table = table.append_column("institution_name", self._map_dictionary(institution, self._r4))
+            table = table.append_column("dac", pc.dictionary_encode(pc.list_element(parts, 0)))
+            profiler_type = table["profiler_type"].combine_chunks()
+            table = table.append_column("profiler", self._map_dictionary(profiler_type, self._r8))
+            table = table.rename_columns({"profiler_type": "profiler_code"})
+        return table
+
+    def _complete_dataframe(self, df: pd.DataFrame, completed: bool = True) -> pd.DataFrame:
+        """Add columns derived from file paths and reference tables to an index dataframe
+
+        Columns are computed with Arrow compute functions. Reference table labels are mapped on the dictionary
+        of encoded columns, and returned as categorical columns.
+        """
+
+        def to_array(values: pd.Series, type=None) -> pa.Array:
+            array = pa.array(values, type=type)
+            return array.combine_chunks() if isinstance(array, pa.ChunkedArray) else array
+
+        file = to_array(df["file"], type=pa.string())
+        parts = pc.split_pattern(file, pattern="/", max_splits=2)
+        df["wmo"] = pc.cast(pc.list_element(parts, 1), pa.int64()).to_numpy()
+        if self.convention not in [
+            "ar_index_global_meta",
+        ]:
+            cyc = pc.extract_regex(file, pattern=r"^[^_]*_(?P<cyc>[0-9]+)")
+            df["cyc"] = pc.cast(pc.struct_field(cyc, [0]), pa.int64()).to_numpy()
+
+        if 'profiler_type' in self.convention_columns:
+            df['profiler_type'] = df['profiler_type'].fillna(9999).astype(int)
+
+        if completed:
+            df["institution_name"] = self._map_dictionary(
+                to_array(df["institution"], type=pa.string()), self._r4
+            ).to_pandas()
+            df["dac"] = pc.dictionary_encode(pc.list_element(parts, 0)).to_pandas()
+            df["profiler"] = self._map_dictionary(to_array(df["profiler_type"]), self._r8).to_pandas()
+            df = df.rename(columns={"profiler_type": "profiler_code"})
+        return df
+
     def _reduce_a_filter_list(self, filters, op="or"):
         if version.parse(pa.__version__) < version.parse("7.0"):
             filters = [i.to_pylist() for i in filters]
@@ -1,4 +1,5 @@
 import copy
+import importlib
 import numpy as np
 import pandas as pd
 import xarray as xr
@@ -19,7 +20,7 @@
 
 from ...options import OPTIONS
 from ...errors import GdacPathError, S3PathError, InvalidDataset, OptionValueError
-from ...utils import isconnected, has_aws_credentials, Registry, Chunker, shortcut2gdac, deprecated
+from ...utils import isconnected, has_aws_credentials, Registry, Chunker, shortcut2gdac, deprecated, to_list
 
 from .. import httpstore, memorystore, filestore, ftpstore, s3store
 from .implementations.index_s3 import get_a_s3index
@@ -30,16 +31,99 @@
     import pyarrow.csv as csv  # noqa: F401
     import pyarrow as pa
     import pyarrow.parquet as pq  # noqa: F401
+    has_pyarrow = True
 except ModuleNotFoundError:
-    pass
+    has_pyarrow = False
 
 
 log = logging.getLogger("argopy.stores.index")
 
 
+def map_categorical(values: pd.Series, mapping: dict) -> pd.Categorical:
+    """Map values with a dictionary into a categorical, unknown values are mapped to 'Unknown'
+
+    The mapping is done on unique values only, which is much faster than a lookup per row.
+    """
+    codes, uniques = pd.factorize(values, use_na_sentinel=False)
+    inverse, labels = pd.factorize(pd.Index([mapping.get(v, "Unknown") for v in uniques], dtype=object))
+    return pd.Categorical.from_codes(inverse[codes], categories=labels)
+
+
+#: Output types of :meth:`ArgoIndex.to_dataframe`
+DATAFRAME_ENGINES = {
+    "pandas": "pandas.DataFrame with numpy and pandas default dtypes",
+    "arrow": "pandas.DataFrame with pandas.ArrowDtype columns",
+    "pyarrow": "pyarrow.Table",
+    "polars": "polars.DataFrame",
+}
+
+
+def check_engine(engine: str):
+    """Raise an error if a :meth:`ArgoIndex.to_dataframe` engine is not valid or not available"""
+    if engine not in DATAFRAME_ENGINES:
+        raise ValueError(
+            "Invalid engine '%s', must be one in: %s" % (engine, list(DATAFRAME_ENGINES))
+        )
+    if engine != "pandas" and not has_pyarrow:
+        raise ModuleNotFoundError("The '%s' engine requires the 'pyarrow' library" % engine)
+    if engine == "polars" and importlib.util.find_spec("polars") is None:
+        raise ModuleNotFoundError("The 'polars' engine requires the 'polars' library")
+
+
+def dataframe_to_engine(obj: "pd.DataFrame | pa.Table", engine: str = "pandas"):
+    """Convert an index :class:`pandas.DataFrame` or :class:`pyarrow.Table` to the output type of an engine
+
+    Parameters
+    ----------
+    obj: :class:`pandas.DataFrame` or :class:`pyarrow.Table`
+    engine: str, default: "pandas"
+        One key of :attr:`DATAFRAME_ENGINES`
+
+    Returns
+    -------
+    :class:`pandas.DataFrame`, :class:`pyarrow.Table` or :class:`polars.DataFrame`
+    """
+    check_engine(engine)
+    if engine == "pandas":
+        return obj if isinstance(obj, pd.DataFrame) else obj.to_pandas()
+
+    table = pa.Table.from_pandas(obj, preserve_index=False) if isinstance(obj, pd.DataFrame) else obj
+    if engine == "arrow":
+        return table.to_pandas(types_mapper=pd.ArrowDtype)
+    elif engine == "pyarrow":
+        return table
+    else:
+        import polars
+
+        return polars.from_arrow(table)
+
+
+def normalize_table(table: "pa.Table") -> "pa.Table":
+    """Cast an index :class:`pyarrow.Table` to the column types returned by Arrow based engines
+
+    Strings are cast to ``string``, timestamps to ``timestamp[ms]`` and dictionaries to ``dictionary<int32, string>``,
+    and schema metadata are dropped, so that the table does not depend on the pandas version or on whether it was
+    computed or read from cache.
+    """
+
+    def arrow_type(typ):
+        if pa.types.is_large_string(typ):
+            return pa.string()
+        elif pa.types.is_timestamp(typ):
+            return pa.timestamp("ms", tz=typ.tz)
+        elif pa.types.is_dictionary(typ):
+            return pa.dictionary(pa.int32(), arrow_type(typ.value_type))
+        return typ
+
+    schema = pa.schema([field.with_type(arrow_type(field.type)) for field in table.schema])
+    if not schema.equals(table.schema):
+        table = table.cast(schema)
+    return table.replace_schema_metadata(None)
+
+
 class ArgoIndexStoreProto(ABC):
     backend = "?"
-    """Name of store backend (pandas or pyarrow)"""  # Pandas or Pyarrow
+    """Name of store backend (pandas, pyarrow or duckdb)"""
 
     search_type : dict = {}
     """Dictionary with search meta-data"""
@@ -277,14 +361,7 @@ def __repr__(self):
         summary.append("Host: %s" % self.host)
         summary.append("Index: %s" % self.index_file)
         summary.append("Convention: %s (%s)" % (self.convention, self.convention_title))
-        if hasattr(self, "index"):
-            summary.append("In memory: True (%i records)" % self.N_RECORDS)
-        elif "s3" in self.host:
-            summary.append(
-                "In memory: False [But there's no need to load the full index with a S3 host]"
-            )
-        else:
-            summary.append("In memory: False")
+        summary.append(self._repr_in_memory())
 
         if hasattr(self, "search"):
             match = "matches" if self.N_MATCH > 1 else "match"
@@ -302,6 +379,15 @@ def __repr__(self):
             summary.append("Searched: False")
         return "\n".join(summary)
 
+    def _repr_in_memory(self) -> str:
+        """Summary line about the full index being loaded or not"""
+        if hasattr(self, "index"):
+            return "In memory: True (%i records)" % self.N_RECORDS
+        elif "s3" in self.host:
+            return "In memory: False [But there's no need to load the full index with a S3 host]"
+        else:
+            return "In memory: False"
+
     def _format(self, x, typ: str) -> str:
         """string formatting helper"""
         if typ == "lon":
@@ -577,12 +663,13 @@ def _write(self, fs, path, obj, fmt="pq"):
         fs: Union[filestore, memorystore]
         obj: :class:`pyarrow.Table` or :class:`pandas.DataFrame`
         fmt: str
-            File format to use. This is "pq" (default) or "pd"
+            File format to use. This is "pq" (default), "pd" or "pd-parquet"
         """
         this_path = path
         write_this = {
             "pq": lambda o, h: pa.parquet.write_table(o, h),
             "pd": lambda o, h: o.to_pickle(h),  # obj is a pandas dataframe
+            "pd-parquet": lambda o, h: o.to_parquet(h, engine="pyarrow", index=False),  # obj is a pandas dataframe
         }
         if fmt == "parquet":
             fmt = "pq"
@@ -604,7 +691,7 @@ def _write(self, fs, path, obj, fmt="pq"):
 
         return self
 
-    def _read(self, fs, path, fmt="pq"):
+    def _read(self, fs, path, fmt="pq", columns=None):
         """Read internal array object from file store
 
         Parameters
@@ -613,7 +700,9 @@ def _read(self, fs, path, fmt="pq"):
         path:
             Path to readable object
         fmt: str
-            File format to use. This is "pq" (default) or "pd"
+            File format to use. This is "pq" (default), "pd" or "pd-parquet"
+        columns: list(str), optional
+            List of columns to read, only used with the "pq" and "pd-parquet" formats
 
         Returns
         -------
@@ -621,8 +710,9 @@ def _read(self, fs, path, fmt="pq"):
         """
         this_path = path
         read_this = {
-            "pq": lambda h: pa.parquet.read_table(h),
+            "pq": lambda h: pa.parquet.read_table(h, columns=columns),
             "pd": lambda h: pd.read_pickle(h),
+            "pd-parquet": lambda h: pd.read_parquet(h, engine="pyarrow", columns=columns),
         }
         if fmt == "parquet":
             fmt = "pq"
@@ -667,7 +757,7 @@ def cachepath(self, path):
             path = [path]
         return [self.fs["client"].cachepath(p) for p in path]
 
-    def to_dataframe(self, nrows=None, index=False, completed=True):  # noqa: C901
+    def to_dataframe(self, nrows=None, index=False, completed=True, columns=None, engine="pandas"):  # noqa: C901
         """Return index or search results as a :class:`pandas.DataFrame`
 
         If search not triggered, fall back on full index by default. Using index=True force to return the full index.
@@ -679,18 +769,38 @@ def to_dataframe(self, nrows=None, index=False, completed=True):  # noqa: C901
         index: bool, default: False
             Force to return the index, even if a search was performed with this store instance.
         completed: bool, default: True
-            Complete the raw index columns with: Platform Number (WMO), Cycle Number, Institution name and Profiler labels.
-            This is adding an extra computation time, so if you care about performances, you may set this to False.
+            Complete the raw index columns with: Institution name, DAC and Profiler labels, as categorical columns.
+            Platform Number (WMO) and Cycle Number columns are always added.
+        columns: list(str), default: None
+            List of columns to return. None returns all. If the dataframe is in cache, only these columns are read.
+        engine: str, default: "pandas"
+            Output type of the dataframe:
+
+            - ``pandas``: a :class:`pandas.DataFrame` with numpy and pandas default dtypes,
+            - ``arrow``: a :class:`pandas.DataFrame` with :class:`pandas.ArrowDtype` columns,
+            - ``pyarrow``: a :class:`pyarrow.Table`,
+            - ``polars``: a :class:`polars.DataFrame`.
+
+            Arrow based engines require pyarrow. With the pyarrow and duckdb stores, or with a cached store, they
+            return the dataframe without conversion to numpy or python objects. Arrow outputs have the same column
+            types whatever the store and the cache, see :func:`normalize_table`.
 
         Returns
         -------
-        :class:`pandas.DataFrame`
+        :class:`pandas.DataFrame`, :class:`pyarrow.Table` or :class:`polars.DataFrame`
+
+        Notes
+        -----
+        With a cached store, dataframes are saved as Parquet files if pyarrow is available, otherwise with pickle.
         """
         warnings.warn(
             "Note that the long name for institution is now in 'institution_name' while the 'institution' column will hold the institution code -- Deprecated since version 1.4",
             category=FutureWarning,
             stacklevel=2,
         )
+        check_engine(engine)
+        fmt = "pd-parquet" if has_pyarrow else "pd"
+        columns = to_list(columns) if columns is not None else None
 
         def get_filename(s, index):
             if hasattr(self, "search") and not index:
@@ -703,80 +813,107 @@ def get_filename(s, index):
             else:
                 suff = ""
 
+            ext = ".parquet" if fmt == "pd-parquet" else ".pd"
             if nrows is not None:
-                fname = fname + "/export" + suff + "#%i.pd" % nrows
+                fname = fname + "/export" + suff + "#%i%s" % (nrows, ext)
             else:
-                fname = fname + "/export" + suff + ".pd"
+                fname = fname + "/export" + suff + ext
 
             return fname
 
-        df, src = self._to_dataframe(nrows=nrows, index=index)
+        def check_columns(available):
+            if columns is not None:
+                invalid = [c for c in columns if c not in available]
+                if len(invalid) > 0:
+                    raise ValueError(
+                        "Invalid column names: %s. Valid names are: %s" % (invalid, list(available))
+                    )
+
+        def read(fname):
+            if fmt == "pd-parquet" and engine != "pandas":
+                # Read as an Arrow table, without conversion to pandas:
+                return self._read(self.fs["client"].fs, fname, fmt="pq", columns=columns)
+            return self._read(self.fs["client"].fs, fname, fmt=fmt, columns=columns)
 
         fname = get_filename(self, index)
 
         if self.cache and self.fs["client"].exists(fname):
-            log.debug(
-                "[%s] already processed as a Dataframe, loading ... src='%s'"
-                % (src, fname)
-            )
-            df = self._read(self.fs["client"].fs, fname, fmt="pd")
+            log.debug("Dataframe already in cache, loading ... src='%s'" % fname)
+            if fmt == "pd-parquet":
+                with self.fs["client"].fs.open(fname, "rb") as handle:
+                    check_columns(pq.read_schema(handle).names)
+            df = read(fname)
         else:
-            log.debug("Converting [%s] to dataframe from scratch ..." % src)
-            # Post-processing for user:
-            from ...related import mapp_dict
-
-            if nrows is not None:
-                df = df.loc[0 : nrows - 1].copy()
-
-            if "index" in df:
-                df.drop("index", axis=1, inplace=True)
-
-            df.reset_index(drop=True, inplace=True)
-            if "date" in df:
-                df["date"] = pd.to_datetime(df["date"], format="%Y%m%d%H%M%S")
-            df["date_update"] = pd.to_datetime(df["date_update"], format="%Y%m%d%H%M%S")
-            df["wmo"] = df["file"].apply(lambda x: int(x.split("/")[1]))
-            if self.convention not in [
-                "ar_index_global_meta",
-            ]:
-                df["cyc"] = df["file"].apply(
-                    lambda x: int(x.split("_")[1].split(".nc")[0].replace("D", ""))
-                )
-
-            if 'profiler_type' in self.convention_columns:
-                df['profiler_type'] = df['profiler_type'].fillna(9999).astype(int)
-
-            if completed:
-                # institution & profiler mapping for all users
-                # todo: may be we need to separate this for standard and expert users
-                institution_dictionary = self._r4
-                df["institution_name"] = df["institution"].apply(
-                    lambda x: mapp_dict(institution_dictionary, x)
-                )
-                df["dac"] = df["file"].apply(lambda x: x.split("/")[0])
-
-                profiler_dictionary = self._r8
-
-                def ev(x):
-                    try:
-                        return int(x)
-                    except Exception:
-                        return x
-
-                df["profiler"] = df["profiler_type"].apply(
-                    lambda x: mapp_dict(profiler_dictionary, ev(x))
-                )
-                df = df.rename(columns={"profiler_type": "profiler_code"})
+            table = self._to_table(nrows=nrows, index=index, completed=completed) if engine != "pandas" else None
+            if table is not None:
+                log.debug("Converting to an Arrow table from scratch ...")
+                df = table
+                check_columns(df.column_names)
+            else:
+                df, src = self._to_dataframe(nrows=nrows, index=index)
+                log.debug("Converting [%s] to dataframe from scratch ..." % src)
+                # Post-processing for user:
+                if nrows is not None:
+                    df = df.loc[0 : nrows - 1].copy()
+
+                if "index" in df:
+                    df.drop("index", axis=1, inplace=True)
+
+                df.reset_index(drop=True, inplace=True)
+                if "date" in df:
+                    df["date"] = pd.to_datetime(df["date"], format="%Y%m%d%H%M%S")
+                df["date_update"] = pd.to_datetime(df["date_update"], format="%Y%m%d%H%M%S")
+                df = self._complete_dataframe(df, completed=completed)
+                check_columns(df.columns)
 
             if self.cache:
-                self._write(self.fs["client"], fname, df, fmt="pd")
-                df = self._read(self.fs["client"].fs, fname, fmt="pd")
+                self._write(self.fs["client"], fname, df, fmt="pq" if table is not None else fmt)
+                df = read(fname)
                 if not index:
                     self.search_path_cache.commit(
                         fname
                     )  # Keep track of files related to search results
                 log.debug("This dataframe saved in cache. dest='%s'" % fname)
 
+        if columns is not None:
+            df = df[columns] if isinstance(df, pd.DataFrame) else df.select(columns)
+        if engine != "pandas":
+            if isinstance(df, pd.DataFrame):
+                df = pa.Table.from_pandas(df, preserve_index=False)
+            df = normalize_table(df)
+        return dataframe_to_engine(df, engine=engine)
+
+    def _to_table(self, nrows=None, index=False, completed=True) -> "pa.Table | None":
+        """Return index or search results as a completed :class:`pyarrow.Table`, None if not supported
+
+        Stores with an Arrow internal storage override this method, to build Arrow outputs of
+        :meth:`to_dataframe` without conversion to pandas.
+        """
+        return None
+
+    def _complete_dataframe(self, df: pd.DataFrame, completed: bool = True) -> pd.DataFrame:
+        """Add columns derived from file paths and reference tables to an index dataframe
+
+        File paths are parsed with string methods over a list, which avoids the overhead of
+        :meth:`pandas.Series.apply`, and reference table labels are mapped on unique values only. Stores may override this method with a faster implementation.
+        """
+        files = df["file"].tolist()
+        df["wmo"] = np.array([int(f.split("/", 2)[1]) for f in files], dtype=np.int64)
+        if self.convention not in [
+            "ar_index_global_meta",
+        ]:
+            df["cyc"] = np.array(
+                [int(f.split("_", 2)[1].split(".nc")[0].replace("D", "")) for f in files], dtype=np.int64
+            )
+
+        if 'profiler_type' in self.convention_columns:
+            df['profiler_type'] = df['profiler_type'].fillna(9999).astype(int)
+
+        if completed:
+            df["institution_name"] = map_categorical(df["institution"], self._r4)
+            df["dac"] = pd.Categorical([f.split("/", 1)[0] for f in files])
+            df["profiler"] = map_categorical(df["profiler_type"], self._r8)
+            df = df.rename(columns={"profiler_type": "profiler_code"})
         return df
 
     def to_indexfile(self):
@@ -0,0 +1,187 @@
+import os
+import re
+import hashlib
+import logging
+import threading
+import concurrent.futures
+from pathlib import Path
+from typing import Union, List, Dict
+from collections.abc import Callable
+
+import xarray as xr
+
+from ..options import OPTIONS
+from ..errors import DataNotFound
+from ..utils import UriCName, concat_datasets
+from ..utils.instrumentation import ContextThreadPoolExecutor
+from .filesystems import tqdm
+
+log = logging.getLogger("argopy.stores.jobstore")
+
+_write_lock = threading.Lock()  # The netCDF library is not thread-safe
+
+
+class ArgoJobStore:
+    """Local store of the processed results of a chunked data fetcher job
+
+    Each chunk url result is saved as a netcdf file in a job folder, so that an interrupted or partially failed
+    fetch can be resumed by processing only the missing chunks. Chunks are keyed by their :class:`utils.UriCName`
+    and a hash of the url, the job folder is named after a hash of the fetcher definition.
+
+    Examples
+    --------
+    .. code-block:: python
+
+        job = ArgoJobStore(fetcher.sha)
+        failed = job.run(fetcher.uri, lambda url: fetcher.fs.open_dataset(url))
+        ds = job.open_dataset(fetcher.uri, lazy=False)
+        if len(failed) == 0:
+            job.clear()
+
+    """
+
+    def __init__(self, sha: str, cachedir: str = ""):
+        """Create a job store
+
+        Parameters
+        ----------
+        sha: str
+            Hash of the fetcher definition, used as the job identifier
+        cachedir: str, default: OPTIONS['cachedir']
+            Folder where to create the job folder
+        """
+        cachedir = OPTIONS["cachedir"] if cachedir == "" else cachedir
+        self.sha = sha
+        self.path = Path(cachedir).expanduser().joinpath("jobs", sha[0:16])
+
+    def __repr__(self):
+        summary = ["<argopy.jobstore>"]
+        summary.append("Job folder: %s" % self.path)
+        summary.append("Chunks done: %i" % len(self.done))
+        return "\n".join(summary)
+
+    def key(self, url: str) -> str:
+        """Return the key of a chunk url"""
+        try:
+            cname = UriCName(url).cname
+        except ValueError:
+            cname = "chunk"
+        cname = re.sub(r"[^\w.=-]+", "_", cname).strip("_")[0:100]
+        return "%s-%s" % (cname, hashlib.sha256(url.encode()).hexdigest()[0:12])
+
+    def _file(self, url: str, empty: bool = False) -> Path:
+        return self.path.joinpath(self.key(url) + (".empty" if empty else ".nc"))
+
+    @property
+    def done(self) -> List[str]:
+        """List of keys of the chunks already processed"""
+        if not self.path.exists():
+            return []
+        return sorted([p.stem for p in self.path.iterdir() if p.suffix in [".nc", ".empty"]])
+
+    def exists(self, url: str) -> bool:
+        """Check if a chunk url has already been processed"""
+        return self._file(url).exists() or self._file(url, empty=True).exists()
+
+    def missing(self, urls: List[str]) -> List[str]:
+        """Return the list of chunk urls not processed yet"""
+        return [url for url in urls if not self.exists(url)]
+
+    def save(self, url: str, ds: Union[xr.Dataset, None]) -> Path:
+        """Save the processed result of a chunk url, None for a chunk without data
+
+        The file is first written under a temporary name and then renamed, so that an interrupted write
+        never leaves a partial chunk in the store.
+        """
+        self.path.mkdir(parents=True, exist_ok=True)
+        target = self._file(url, empty=ds is None)
+        tmp = target.with_suffix(".tmp")
+        if ds is None:
+            tmp.write_text(url)
+        else:
+            with _write_lock:
+                ds.to_netcdf(tmp)
+        os.replace(tmp, target)
+        return target
+
+    def run(
+        self,
+        urls: List[str],
+        fct: Callable,
+        max_workers: int = 6,
+        progress: bool = False,
+    ) -> Dict[str, Exception]:
+        """Process missing chunk urls and save their results
+
+        Parameters
+        ----------
+        urls: list(str)
+            List of chunk urls of the job
+        fct: Callable
+            Function taking a chunk url and returning a :class:`xarray.Dataset`. Raising a :class:`DataNotFound`
+            or a :class:`FileNotFoundError` marks the chunk as processed without data.
+        max_workers: int, default: 6
+            Maximum number of threads
+        progress: bool, default: False
+            Display a progress bar
+
+        Returns
+        -------
+        dict
+            Dictionary with the urls of failed chunks as keys and exceptions raised as values. Failed chunks
+            are not saved, so that they are processed again by the next run.
+        """
+
+        def task(url):
+            try:
+                ds = fct(url)
+            except (DataNotFound, FileNotFoundError):
+                ds = None
+            self.save(url, ds)
+
+        todo = self.missing(urls)
+        log.debug("Job %s: %i/%i chunks to process" % (self.sha[0:16], len(todo), len(urls)))
+        failed = {}
+        with ContextThreadPoolExecutor(max_workers=max(1, max_workers)) as executor:
+            future_to_url = {executor.submit(task, url): url for url in todo}
+            futures = concurrent.futures.as_completed(future_to_url)
+            if progress:
+                futures = tqdm(futures, total=len(todo))
+            for future in futures:
+                try:
+                    future.result()
+                except Exception as e:
+                    log.debug("Job %s: chunk failed '%s': %s" % (self.sha[0:16], future_to_url[future], str(e)))
+                    failed[future_to_url[future]] = e
+        return failed
+
+    def open_dataset(
+        self, urls: List[str], concat: bool = True, concat_dim: str = "N_POINTS", lazy: bool = True
+    ) -> Union[xr.Dataset, List[xr.Dataset]]:
+        """Open the results of processed chunk urls
+
+        Chunk files are opened and, if ``concat`` is True, concatenated along ``concat_dim`` in the order
+        of ``urls``. Chunks not processed or without data are skipped.
+
+        With ``lazy=True`` (default), data are read from chunk files only when needed, otherwise chunk files
+        are loaded in memory and closed, so that the job can be cleared.
+
+        Raises
+        ------
+        :class:`DataNotFound`
+            If no chunk has data
+        """
+        opener = xr.open_dataset if lazy else xr.load_dataset
+        ds_list = [opener(self._file(url)) for url in urls if self._file(url).exists()]
+        if len(ds_list) == 0:
+            raise DataNotFound("No data in job %s" % self.sha[0:16])
+        if not concat:
+            return ds_list
+        return concat_datasets(ds_list, concat_dim=concat_dim)
+
+    def clear(self):
+        """Remove the job folder and all chunk results"""
+        if self.path.exists():
+            for p in self.path.iterdir():
+                p.unlink()
+            self.path.rmdir()
@@ -4,6 +4,7 @@
 - all variables and functions used by tests to determine if they should be run or not
 - test wrapper to make safe requests to web APIs
 - generic temporary folder creation function, safe for Windows
+- synthetic dataset factories
 
 """
 import importlib
@@ -30,6 +31,9 @@
 import tempfile
 import shutil
 from pathlib import Path
+import numpy as np
+import pandas as pd
+import xarray as xr
 
 from argopy.options import set_options
 from argopy.errors import ErddapServerError, ArgovisServerError, DataNotFound, GdacPathError
@@ -170,6 +174,7 @@ def _xfail(name, msg):
 # GDAC FTP #
 ############
 has_pyarrow, requires_pyarrow = _importorskip("pyarrow")
+has_zarr, requires_zarr = _importorskip("zarr")
 
 has_gdac, requires_gdac = _connectskip(
     "gdac" in AVAILABLE_SOURCES, "the gdac data fetcher"
@@ -431,6 +436,25 @@ def cleanup(self):
             shutil.rmtree(self.folder)
 
 
+def create_point_dataset(
+    N_POINTS: int = 50,
+    lat: tuple = (-60, 60),
+    lon: tuple = (-170, 170),
+    temp: tuple = (2, 25),
+    psal: tuple = (34, 36),
+) -> xr.Dataset:
+    """Create a collection of synthetic points, with variables linearly spread over the given ranges"""
+    return xr.Dataset({
+        "LATITUDE": ("N_POINTS", np.linspace(*lat, N_POINTS)),
+        "LONGITUDE": ("N_POINTS", np.linspace(*lon, N_POINTS)),
+        "TIME": ("N_POINTS", pd.date_range("2020-01-01", periods=N_POINTS, freq="D").values),
+        "PRES": ("N_POINTS", np.linspace(0, 2000, N_POINTS)),
+        "TEMP": ("N_POINTS", np.linspace(*temp, N_POINTS)),
+        "PSAL": ("N_POINTS", np.linspace(*psal, N_POINTS)),
+        "DOXY": ("N_POINTS", np.linspace(170, 250, N_POINTS)),
+    })
+
+
 def patch_ftp(ftp):
     """Patch Mocked FTP server keyword"""
     if ftp == "MOCKFTP":
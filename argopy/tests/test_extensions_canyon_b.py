@@ -0,0 +1,60 @@
+import pytest
+import numpy as np
+import pandas as pd
+
+import argopy
+from argopy.extensions import canyon_b
+from utils import requires_numba, requires_joblib, requires_pyco2sys, create_point_dataset
+
+
+def test_load_weights(tmp_path):
+    canyon_b._weights.clear()
+    wfile = canyon_b.Path(canyon_b.path2assets).joinpath("canyon-b", "wgts_NO3.txt")
+    expected = pd.read_csv(wfile, header=None, sep="\t").to_numpy()
+    with argopy.set_options(cachedir=str(tmp_path)):
+        weights = canyon_b._load_weights(wfile)
+        assert weights.dtype == np.float64
+        assert np.array_equal(weights, expected, equal_nan=True)
+        assert tmp_path.joinpath("canyon-b", "wgts_NO3.npz").exists()
+        assert canyon_b._load_weights(wfile) is weights
+
+        # Weights are re-loaded from the npz archive:
+        canyon_b._weights.clear()
+        assert np.array_equal(canyon_b._load_weights(wfile), expected, equal_nan=True)
+
+        df = create_point_dataset().argo.canyon_b.load_weights("NO3")
+        assert isinstance(df, pd.DataFrame)
+        assert np.array_equal(df.to_numpy(), expected, equal_nan=True)
+
+        # Modifying the returned weights does not corrupt the in-memory cache:
+        df.iloc[0, 0] = 12345.0
+        assert np.array_equal(canyon_b._load_weights(wfile), expected, equal_nan=True)
+        assert np.array_equal(
+            create_point_dataset().argo.canyon_b.load_weights("NO3").to_numpy(), expected, equal_nan=True
+        )
+
+
+@requires_numba
+@requires_joblib
+@requires_pyco2sys
+def test_warmup():
+    canyon_b._weights.clear()
+    canyon_b.CanyonB.warmup("NO3")
+    assert "wgts_NO3.txt" in canyon_b._weights
+
+
+@requires_numba
+@requires_joblib
+@requires_pyco2sys
+@pytest.mark.parametrize("n_jobs", [1, 2], ids=["sequential", "parallel"])
+def test_predict_chunksize(n_jobs):
+    params = ["NO3", "pHT"]
+    expected = create_point_dataset().argo.canyon_b.predict(params, include_uncertainties=True)
+    # 50 points by chunks of 7, so that the last chunk is smaller than chunksize:
+    result = create_point_dataset().argo.canyon_b.predict(
+        params, include_uncertainties=True, chunksize=7, n_jobs=n_jobs
+    )
+    assert list(result.data_vars) == list(expected.data_vars)
+    for v in expected.data_vars:
+        assert np.array_equal(expected[v].values, result[v].values, equal_nan=True)
+        assert expected[v].attrs == result[v].attrs
@@ -0,0 +1,47 @@
+import numpy as np
+
+import argopy
+from argopy.extensions import canyon_med
+from utils import create_point_dataset
+
+
+def create_medsea_dataset(N_POINTS=50):
+    """Create a collection of synthetic points in and around the Mediterranean Sea, the first one without position"""
+    ds = create_point_dataset(N_POINTS, lat=(30.5, 45.5), lon=(-8.0, 38.0), temp=(13, 25), psal=(38, 39))
+    ds["LATITUDE"][0] = np.nan
+    return ds
+
+
+def test_mask_medsea():
+    ds = create_medsea_dataset()
+    isin = ds.argo.canyon_med.isin_medsea(np.array([35., 40., 45., 45., np.nan]), np.array([0., 20., 20., -7., 0.]))
+    assert np.array_equal(isin, [True, True, True, False, False])
+
+    df = ds.argo.canyon_med.input
+    assert df.isnull().all(axis=1).iloc[0]
+    assert df.isnull().all(axis=1).sum() < ds.argo.N_POINTS
+
+
+def test_load_coefficients(tmp_path):
+    canyon_med._coefficients.clear()
+    with argopy.set_options(cachedir=str(tmp_path)):
+        ds = create_medsea_dataset()
+        moy, std = ds.argo.canyon_med.load_normalisation_factors("NO3", "F")
+        assert moy.shape == std.shape == (1, 8)
+        assert tmp_path.joinpath("canyon-med", "canyon-med_nit_F.npz").exists()
+
+        # Coefficients are re-loaded from the npz archive:
+        canyon_med._coefficients.clear()
+        b1, b2, b3, IW, LW1, LW2 = ds.argo.canyon_med.load_weights("NO3", "F", 1)
+        assert IW.shape == (b1.shape[0], ds.argo.canyon_med.ne)
+        assert LW1.shape == (b2.shape[0], b1.shape[0])
+        assert LW2.shape == (1, b2.shape[0])
+
+
+def test_predict_batch_size():
+    expected = create_medsea_dataset().argo.canyon_med.predict("NO3")
+    ds = create_medsea_dataset()
+    ds.argo.canyon_med.batch_size = 7
+    result = ds.argo.canyon_med.predict("NO3")
+    assert np.array_equal(expected["NO3"].values, result["NO3"].values, equal_nan=True)
+    assert np.array_equal(expected["NO3_ERROR"].values, result["NO3_ERROR"].values, equal_nan=True)
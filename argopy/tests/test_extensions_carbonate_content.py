@@ -0,0 +1,16 @@
+import numpy as np
+
+from utils import requires_numba, requires_joblib, requires_pyco2sys, create_point_dataset
+
+
+@requires_numba
+@requires_joblib
+@requires_pyco2sys
+def test_predict_chunksize():
+    expected = create_point_dataset(N_POINTS=3).argo.content.predict()
+    # 3 points by chunks of 2 in parallel, so that the last chunk is smaller than chunksize:
+    result = create_point_dataset(N_POINTS=3).argo.content.predict(chunksize=2, n_jobs=2)
+    assert list(result.data_vars) == list(expected.data_vars)
+    for v in expected.data_vars:
+        assert np.array_equal(expected[v].values, result[v].values, equal_nan=True)
+        assert expected[v].attrs == result[v].attrs
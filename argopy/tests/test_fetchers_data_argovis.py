@@ -3,8 +3,12 @@
 from argopy import DataFetcher as ArgoDataFetcher
 from argopy.utils.checkers import is_list_of_strings
 
+import time
 import pytest
+import numpy as np
 import xarray as xr
+from argopy.data_fetchers.argovis_data_processors import pre_process
+from argopy.data_fetchers.argovis_data import _RateLimiter
 from utils import (
     requires_argovis,
     create_temp_folder,
@@ -114,6 +118,29 @@ def assert_all(this_fetcher, cacheable):
         raise
 
 
+def create_profile(wmo, cyc, n_levels):
+    """Create the json document of a profile, as returned by the Argovis API"""
+    return {
+        "_id": "%i_%03d" % (wmo, cyc),
+        "timestamp": "2020-01-%02dT00:00:00.000Z" % cyc,
+        "timestamp_argoqc": 1,
+        "geolocation": {"type": "Point", "coordinates": [-20.0, 40.0 + cyc]},
+        "geolocation_argoqc": 1,
+        "cycle_number": cyc,
+        "profile_direction": "A",
+        "data_info": [
+            ["pressure", "salinity", "temperature"],
+            ["units", "data_keys_mode"],
+            [["decibar", "D"], ["psu", "D"], ["degC", "D"]],
+        ],
+        "data": [
+            list(np.arange(n_levels) * 10.0),
+            [35.0] * n_levels,
+            [10.0] * (n_levels - 1) + [None],
+        ],
+    }
+
+
 @requires_argovis
 class Test_Backend:
     """ Test ERDDAP data fetching backend """
@@ -199,3 +226,61 @@ def test_fetching_cached(self, mocked_argovisserver, cached_fetcher):
                              ids=VALID_PARALLEL_ACCESS_POINTS_IDS)
     def test_fetching_parallel_thread(self, mocked_argovisserver, parallel_fetcher):
         assert_fetcher(mocked_argovisserver, parallel_fetcher, cacheable=False)
+
+    def test_pre_process(self):
+        profiles = [create_profile(6902746, 1, 3), create_profile(6902746, 2, 0), create_profile(6902747, 3, 4)]
+        df = pre_process(profiles, key_map={"pres": "PRES", "temp": "TEMP", "lat": "LATITUDE",
+                                            "cycle_number": "CYCLE_NUMBER", "platform_number": "PLATFORM_NUMBER"})
+        assert list(df.columns) == ["PRES", "TEMP", "LATITUDE", "CYCLE_NUMBER", "PLATFORM_NUMBER"]
+        assert df.shape[0] == 7
+        assert np.array_equal(df["PRES"], [0, 10, 20, 0, 10, 20, 30])
+        assert df["TEMP"].isnull().sum() == 2
+        assert np.array_equal(df["CYCLE_NUMBER"], [1, 1, 1, 3, 3, 3, 3])
+        assert np.array_equal(df["LATITUDE"], [41, 41, 41, 43, 43, 43, 43])
+        assert list(df["PLATFORM_NUMBER"].unique()) == ["6902746", "6902747"]
+        assert pre_process(None) is None
+
+    def test_rate_limiter(self):
+        limiter = _RateLimiter(20)
+        t0 = time.monotonic()
+        for i in range(5):
+            limiter.wait()
+        assert time.monotonic() - t0 >= 4 / 20
+
+    def test_open_chunks_errors(self, mocked_argovisserver, monkeypatch):
+        from argopy.data_fetchers.argovis_data import Fetch_wmo
+
+        fetcher = Fetch_wmo(WMO=[6902746, 6902747], server=mocked_server_address, parallel="thread")
+
+        def open_json(url, errors="raise", **kwargs):
+            if url == "bad":
+                if errors == "raise":
+                    raise FileNotFoundError(url)
+                return None
+            return [create_profile(6902746, 1, 3)]
+
+        monkeypatch.setattr(fetcher.fs, "open_json", open_json)
+        results = fetcher._open_chunks(["good", "bad"], errors="ignore")
+        assert results[0].shape[0] == 3 and results[1] is None
+        with pytest.raises(FileNotFoundError):
+            fetcher._open_chunks(["good", "bad"], errors="raise")
+
+    def test_open_chunks_max_workers(self, mocked_argovisserver, monkeypatch):
+        from argopy.data_fetchers import argovis_data
+        from argopy.data_fetchers.argovis_data import Fetch_wmo
+
+        fetcher = Fetch_wmo(WMO=[6902746, 6902747], server=mocked_server_address, parallel="thread", max_workers=2)
+        assert fetcher.max_workers == 2
+
+        pools = []
+
+        class Executor(argovis_data.ContextThreadPoolExecutor):
+            def __init__(self, max_workers=None, **kwargs):
+                pools.append(max_workers)
+                super().__init__(max_workers=max_workers, **kwargs)
+
+        monkeypatch.setattr(argovis_data, "ContextThreadPoolExecutor", Executor)
+        monkeypatch.setattr(fetcher.fs, "open_json", lambda url, **kwargs: [create_profile(6902746, 1, 3)])
+        monkeypatch.setattr(type(fetcher), "uri", property(lambda self: ["url1", "url2", "url3"]))
+        assert fetcher.to_dataframe().shape[0] == 9
+        assert pools == [2]
@@ -14,7 +14,9 @@
 from mocked_http import mocked_httpserver as mocked_erddapserver
 
 import shutil
+import threading
 from collections import ChainMap
+from types import SimpleNamespace
 
 
 log = logging.getLogger("argopy.tests.data.erddap")
@@ -220,3 +222,78 @@ def test_fetching_cached(self, mocked_erddapserver, cached_fetcher):
                              ids=VALID_PARALLEL_ACCESS_POINTS_IDS)
     def test_fetching_parallel_thread(self, mocked_erddapserver, parallel_fetcher):
         assert_fetcher(mocked_erddapserver, parallel_fetcher, cacheable=False)
+
+    def test_fetching_checkpoint(self, mocked_erddapserver, monkeypatch):
+        """An interrupted fetch is resumed from the chunks saved in the job store"""
+        request = SimpleNamespace(param=VALID_PARALLEL_ACCESS_POINTS[0])
+        fetcher_args, access_point = self._setup_fetcher(request, parallel="thread")
+        expected = create_fetcher(fetcher_args, access_point).fetcher.to_xarray(errors="raise")
+
+        fetcher_args = ChainMap({"checkpoint": True, "cachedir": self.cachedir}, fetcher_args)
+        fetcher = create_fetcher(fetcher_args, access_point).fetcher
+        URI = fetcher.uri
+        assert len(URI) > 1
+        open_dataset = fetcher.fs.open_dataset
+
+        def interrupted(url, *args, **kwargs):
+            if url == URI[-1]:
+                raise KeyboardInterrupt
+            return open_dataset(url, *args, **kwargs)
+
+        monkeypatch.setattr(fetcher.fs, "open_dataset", interrupted)
+        with pytest.raises(KeyboardInterrupt):
+            fetcher.to_xarray(errors="raise")
+        assert fetcher.job.missing(URI) == [URI[-1]]
+
+        # Resume, only the missing chunk is fetched:
+        fetched = []
+
+        def resumed(url, *args, **kwargs):
+            fetched.append(url)
+            return open_dataset(url, *args, **kwargs)
+
+        monkeypatch.setattr(fetcher.fs, "open_dataset", resumed)
+        ds = fetcher.to_xarray(errors="raise")
+        assert fetched == [URI[-1]]
+        assert fetcher.job.done == []
+        xr.testing.assert_equal(ds, expected)
+
+    def test_max_rows(self, monkeypatch):
+        """Requests above the rows budget are split and empty requests are dropped"""
+        from urllib.parse import unquote
+        import re
+        from argopy.data_fetchers.erddap_data import ErddapArgoDataFetcher, Fetch_wmo, Fetch_box
+
+        threads = set()
+
+        def n_row(self, url):
+            threads.add(threading.current_thread().name)
+            url = unquote(url)
+            wmos = re.search(r'platform_number=~"([^"]+)"', url)
+            if wmos is not None:  # 1000 rows per float, but the fake 9999999
+                return 1000 * len([w for w in wmos.group(1).split("|") if w != "9999999"])
+            t0, t1 = [float(t) for t in re.findall(r"time[<>]=([\d.e+]+)", url)]
+            return int((t1 - t0) / 86400 * 100)  # 100 rows per day
+
+        monkeypatch.setattr(ErddapArgoDataFetcher, "_n_row", n_row)
+        server = "http://erddap.example.org/erddap"
+
+        f = Fetch_wmo(WMO=[6902746, 6902747, 6902748, 9999999, 6902750], server=server, max_rows=2500)
+        assert len(f.uri) == 3
+        assert f.N_POINTS == 4000
+        assert Fetch_wmo(WMO=[9999999], server=server, max_rows=2500).uri == []
+
+        box = [-60, -50, 0, 10, 0, 100, "2011-01-01", "2011-03-01"]
+        f = Fetch_box(box=box, server=server, max_rows=2000)
+        assert len(f.uri) == 3
+        assert f.N_POINTS <= 5900  # Rounding of chunks
+        assert len(Fetch_box(box=box, server=server).uri) == 1
+
+        # Headers are fetched by max_workers threads with the parallel option, by the calling thread otherwise:
+        threads.clear()
+        Fetch_box(box=box, server=server, max_rows=2000).uri
+        assert threads == {threading.current_thread().name}
+        threads.clear()
+        Fetch_box(box=box, server=server, max_rows=2000, parallel=True, max_workers=2).uri
+        threads.discard(threading.current_thread().name)  # The first request alone is not probed in the pool
+        assert 0 < len(threads) <= 2
@@ -148,6 +148,11 @@ def gdac_shortname(gdac):
                 % (gdac_shortname(host), "phy", mode, ap)
             )
 
+VALID_PIPELINE_ACCESS_POINTS = [p for p in VALID_ACCESS_POINTS if p["mode"] == "standard"]
+VALID_PIPELINE_ACCESS_POINTS_IDS = [
+    i for p, i in zip(VALID_ACCESS_POINTS, VALID_ACCESS_POINTS_IDS) if p["mode"] == "standard"
+]
+
 
 #todo The parallel fetching integration is not tested with the GDAC data fetcher
 # VALID_PARALLEL_ACCESS_POINTS, VALID_PARALLEL_ACCESS_POINTS_IDS = [], []
@@ -229,6 +234,13 @@ def cached_fetcher(self, request):
         fetcher_args, access_point = self._setup_fetcher(request, cached=True)
         yield create_fetcher(fetcher_args, access_point)
 
+    @pytest.fixture
+    def pipelined_fetcher(self, request, mocked_httpserver):
+        """Fixture to create a pipelined GDAC fetcher for a given host and access point"""
+        fetcher_args, access_point = self._setup_fetcher(request, cached=False)
+        fetcher_args["pipeline"] = True
+        yield create_fetcher(fetcher_args, access_point)
+
     def teardown_class(self):
         """Cleanup once we are finished."""
 
@@ -260,6 +272,30 @@ def test_fetching_cached(self, mocked_httpserver, cached_fetcher):
         with pytest.raises(CacheFileNotFound):
             cached_fetcher.fetcher.cachepath
 
+    @pytest.mark.parametrize(
+        "pipelined_fetcher",
+        VALID_PIPELINE_ACCESS_POINTS,
+        indirect=True,
+        ids=VALID_PIPELINE_ACCESS_POINTS_IDS,
+    )
+    def test_fetching_pipeline(self, mocked_httpserver, pipelined_fetcher):
+        assert_fetcher(mocked_httpserver, pipelined_fetcher, cacheable=False)
+
+    def test_fetching_pipeline_parallel(self, mocked_httpserver):
+        ap = [v for v in ACCESS_POINTS if "region" in v.keys()][0]
+        fetcher_args = {"src": self.src, "gdac": HOSTS[0]}
+        expected = create_fetcher(fetcher_args, ap).fetcher.to_xarray()
+
+        f = create_fetcher({**fetcher_args, "pipeline": True, "parallel": True, "max_workers": 2}, ap).fetcher
+        assert f.max_workers == 2
+        ds = f.to_xarray()
+        assert ds.attrs["Fetched_uri"] == ";".join(f.uri)
+        # Points with the same TIME may not be in the same order:
+        xr.testing.assert_equal(
+            ds.sortby(["TIME", "PRES"]).drop_vars("N_POINTS"),
+            expected.sortby(["TIME", "PRES"]).drop_vars("N_POINTS"),
+        )
+
     def test_uri_mono2multi(self, mocked_httpserver):
         ap = [v for v in ACCESS_POINTS if "region" in v.keys()][0]
         f = create_fetcher(
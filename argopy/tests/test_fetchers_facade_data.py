@@ -1,3 +1,5 @@
+import os
+import time
 import pandas as pd
 import xarray as xr
 
@@ -11,6 +13,7 @@
     OptionValueError,
 )
 from argopy.utils import is_list_of_strings
+from argopy.options import OPTIONS
 from argopy.tests.helpers.utils import (
     requires_fetcher,
     requires_connection,
@@ -21,6 +24,7 @@
     requires_ipython,
     safe_to_server_errors,
     requires_matplotlib,
+    requires_zarr,
     has_matplotlib,
     has_seaborn,
     has_cartopy,
@@ -173,6 +177,68 @@ def test_domain(self):
         f, fetcher = self.__get_fetcher(pt='float')
         fetcher.domain
 
+    @requires_zarr
+    def test_cache_results(self, tmp_path):
+        opts = {**self.src_opts, "cachedir": str(tmp_path), "cache_results": True}
+        fetcher = ArgoDataFetcher(src=self.src, **opts).float(2901623)
+        ds = fetcher.to_xarray()
+        assert fetcher._results_path.exists()
+
+        # An identical request is loaded from the results cache, without fetching data:
+        fetcher = ArgoDataFetcher(src=self.src, parallel=True, **opts).float(2901623)
+        fetcher._to_xarray = None
+        xr.testing.assert_identical(fetcher.to_xarray(), ds)
+
+        fetcher.clear_cache()
+        assert not fetcher._results_path.exists()
+
+    @requires_zarr
+    def test_cache_results_expiration(self, tmp_path):
+        opts = {**self.src_opts, "cachedir": str(tmp_path), "cache_results": True}
+        fetcher = ArgoDataFetcher(src=self.src, **opts).float(2901623)
+        ds = fetcher.to_xarray()
+        path = fetcher._results_store()
+
+        fetched = []
+
+        def to_xarray(**kwargs):
+            fetched.append(path)
+            return ds
+
+        fetcher = ArgoDataFetcher(src=self.src, **opts).float(2901623)
+        fetcher._to_xarray = to_xarray
+        fetcher.to_xarray()
+        assert len(fetched) == 0
+
+        # Results older than the cache expiration are fetched again, and cached again:
+        expired = time.time() - 2 * OPTIONS["cache_expiration"]
+        os.utime(path, (expired, expired))
+        xr.testing.assert_identical(fetcher.to_xarray(), ds)
+        assert len(fetched) == 1
+        assert path.stat().st_mtime > expired
+
+        fetcher.to_xarray()
+        assert len(fetched) == 1
+
+    @requires_zarr
+    def test_cache_results_arguments(self, tmp_path):
+        opts = {**self.src_opts, "cachedir": str(tmp_path), "cache_results": True}
+        fetcher = ArgoDataFetcher(src=self.src, **opts).float(2901623)
+        points = fetcher.to_xarray()
+        assert fetcher._results_store(errors="ignore") == fetcher._results_store()  # Defaults are normalized
+
+        # Other output shapes get their own store and are not served by the cached points:
+        assert fetcher._results_store(dimension="profile") != fetcher._results_store()
+        assert fetcher._results_store(concat=False) != fetcher._results_store()
+        overlap = fetcher.to_xarray(concat_method="overlap")
+        assert "'overlap'" in overlap.attrs["Processing_history"]
+        assert "'overlap'" not in points.attrs["Processing_history"]
+
+        # Each of them is cached on its own:
+        fetcher._to_xarray = None
+        xr.testing.assert_identical(fetcher.to_xarray(concat_method="overlap"), overlap)
+        xr.testing.assert_identical(fetcher.to_xarray(), points)
+
     def test_dashboard(self, mocked_httpserver):
         with argopy.set_options(server=MOCKHTTP):
             f, fetcher = self.__get_fetcher(pt='float')
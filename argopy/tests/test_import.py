@@ -0,0 +1,52 @@
+import subprocess
+import sys
+import pytest
+
+import argopy
+
+
+def run(code):
+    return subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    ).stdout.split()
+
+
+def test_lazy_import():
+    modules = [
+        "argopy.fetchers",
+        "argopy.stores",
+        "argopy.plot",
+        "matplotlib",
+        "cartopy",
+        "seaborn",
+        "numba",
+        "boto3",
+        "IPython",
+        "aiohttp",
+    ]
+    loaded = run(
+        "import sys, argopy; print(' '.join(m for m in %s if m in sys.modules))" % modules
+    )
+    assert loaded == []
+
+
+@pytest.mark.parametrize(
+    "name", ["DataFetcher", "ArgoIndex", "ArgoFloat", "CanyonMED", "utils", "tutorial"]
+)
+def test_lazy_attribute(name):
+    assert name in dir(argopy)
+    assert getattr(argopy, name) is not None
+
+
+def test_unknown_attribute():
+    with pytest.raises(AttributeError):
+        argopy.dummy
+
+
+def test_lazy_accessor():
+    code = (
+        "import argopy, numpy as np, xarray as xr; "
+        "ds = xr.Dataset({'PRES': ('N_POINTS', np.arange(3.))}); "
+        "print(type(ds.argo).__name__, hasattr(ds.argo, 'datamode'))"
+    )
+    assert run(code) == ["ArgoAccessor", "True"]
@@ -1,4 +1,5 @@
 import os
+import io
 
 import pytest
 import tempfile
@@ -368,6 +369,48 @@ def preprocess(ds):
         with pytest.raises(DataNotFound):
             self.fs.open_mfdataset(uri, preprocess=preprocess)
 
+    @skip_pyarrow
+    @pytest.mark.parametrize("ext", ["csvp", "parquet"], indirect=False)
+    def test_open_table(self, ext, monkeypatch):
+        import pyarrow as pa
+        import pyarrow.csv
+        import pyarrow.parquet
+
+        csv = (
+            b"platform_number,cycle_number,data_mode,time (UTC),pres (decibar),psal_qc\n"
+            b"6902746,1,D,2017-07-06T20:05:00Z,5.0,1\n"
+            b"6902746,2,,2017-07-16T20:05:00Z,NaN,\n"
+        )
+        data = csv
+        if ext == "parquet":
+            table = pa.csv.read_csv(pa.BufferReader(csv))
+            sink = pa.BufferOutputStream()
+            pa.parquet.write_table(table, sink)
+            data = sink.getvalue().to_pybytes()
+
+        def fs_open(url, *args, **kwargs):
+            if data is None:
+                raise FileNotFoundError(url)
+            return io.BytesIO(data)
+
+        fs = httpstore()
+        monkeypatch.setattr(fs, "download_url", lambda url, **kw: data)
+        monkeypatch.setattr(fs.fs, "open", fs_open)  # csv responses are streamed from the file handle
+        ds = fs.open_dataset("https://erddap.ifremer.fr/erddap/tabledap/ArgoFloats.%s?pres" % ext)
+        assert isinstance(ds, xr.Dataset)
+        assert list(ds.dims) == ["row"]
+        assert "pres" in ds and "time" in ds
+        assert ds["time"].dtype == "datetime64[ns]"
+        assert list(ds["data_mode"].values) == ["D", ""]
+        assert ds["psal_qc"].dtype == float
+
+        data = None
+        with pytest.raises(DataNotFound):
+            fs.open_dataset("https://erddap.ifremer.fr/erddap/tabledap/ArgoFloats.%s?pres" % ext)
+
+        data = b"Error {\n    code=404;\n    message=\"Not Found: Your query produced no matching results.\";\n}\n"
+        assert fs.open_table("https://erddap.ifremer.fr/erddap/tabledap/ArgoFloats.%s?pres" % ext, errors="silent") is None
+
     def test_open_json(self):
         uri = self._mockeduri("https://api.ifremer.fr/argopy/data/ARGO-FULL.json")
         assert isinstance(self.fs.open_json(uri), dict)
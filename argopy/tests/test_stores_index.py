@@ -28,9 +28,12 @@
 
 has_pyarrow = importlib.util.find_spec("pyarrow") is not None
 skip_nopyarrow = pytest.mark.skipif(not has_pyarrow, reason="Requires pyarrow")
+has_duckdb = has_pyarrow and importlib.util.find_spec("duckdb") is not None
+skip_noduckdb = pytest.mark.skipif(not has_duckdb, reason="Requires pyarrow and duckdb")
 
 skip_pandas = pytest.mark.skipif(0, reason="Skipped tests for Pandas backend")
 skip_pyarrow = pytest.mark.skipif(0, reason="Skipped tests for Pyarrow backend")
+skip_duckdb = pytest.mark.skipif(0, reason="Skipped tests for DuckDB backend")
 skip_CORE = pytest.mark.skipif(0, reason="Skipped tests for CORE index")
 skip_BGCs = pytest.mark.skipif(0, reason="Skipped tests for BGC synthetic index")
 skip_BGCb = pytest.mark.skipif(0, reason="Skipped tests for BGC bio index")
@@ -398,6 +401,17 @@ def test_to_dataframe_index(self):
         df = idx.to_dataframe(index=True, nrows=N)
         assert df.shape[0] == N
 
+    def test_to_dataframe_completed(self):
+        idx = self.new_idx()
+        df = idx.to_dataframe(index=True, completed=False)
+        assert "wmo" in df and "profiler" not in df
+        assert df["wmo"].tolist() == [int(f.split("/")[1]) for f in df["file"]]
+
+        df = idx.to_dataframe(index=True)
+        for col in ["institution_name", "dac", "profiler"]:
+            assert isinstance(df[col].dtype, pd.CategoricalDtype)
+        assert df["dac"].astype(str).tolist() == [f.split("/")[0] for f in df["file"]]
+
     def test_to_dataframe_search(self):
         idx = self.new_idx()
         wmo = [s["wmo"] for s in VALID_SEARCHES if "wmo" in s.keys()][0]
@@ -422,6 +436,53 @@ def test_caching_search(self):
         idx.query.wmo(wmo)
         self.assert_search(idx, cacheable=True)
 
+    @pytest.mark.parametrize(
+        "cache",
+        [False, True],
+        indirect=False,
+        ids=["cache=%s" % c for c in [False, True]],
+    )
+    def test_to_dataframe_columns(self, cache):
+        idx = self.new_idx(cache=cache)
+        df = idx.to_dataframe(index=True)
+        for _ in range(2):  # Compute, then possibly read from cache
+            dfc = idx.to_dataframe(index=True, columns=["wmo", "dac"])
+            assert dfc.columns.tolist() == ["wmo", "dac"]
+            assert dfc["wmo"].tolist() == df["wmo"].tolist()
+            assert isinstance(dfc["dac"].dtype, pd.CategoricalDtype)
+        with pytest.raises(ValueError):
+            idx.to_dataframe(index=True, columns=["dummy"])
+
+    @skip_nopyarrow
+    @pytest.mark.parametrize(
+        "cache",
+        [False, True],
+        indirect=False,
+        ids=["cache=%s" % c for c in [False, True]],
+    )
+    def test_to_dataframe_engine(self, cache):
+        import pyarrow as pa
+
+        idx = self.new_idx(cache=cache)
+        df = idx.to_dataframe(index=True)
+
+        dfa = idx.to_dataframe(index=True, engine="arrow")
+        assert dfa.shape == df.shape
+        assert all([isinstance(dtype, pd.ArrowDtype) for dtype in dfa.dtypes])
+
+        table = idx.to_dataframe(index=True, engine="pyarrow", columns=["wmo", "dac"])
+        assert isinstance(table, pa.Table)
+        assert table.column_names == ["wmo", "dac"]
+        assert table["wmo"].to_pylist() == df["wmo"].tolist()
+
+        # Same table whether it is computed or read from cache:
+        table = idx.to_dataframe(index=True, engine="pyarrow")
+        assert table.equals(self.new_idx(cache=not cache).to_dataframe(index=True, engine="pyarrow"))
+        assert table.schema.field("file").type == pa.string()
+
+        with pytest.raises(ValueError):
+            idx.to_dataframe(engine="dummy")
+
     @pytest.mark.parametrize(
         "index",
         [False, True],
@@ -628,3 +689,111 @@ class Test_IndexStore_pyarrow_BGC_synthetic(IndexStore_test_proto):
 
     indexstore = indexstore_pa
     index_file = "argo_synthetic-profile_index.txt"
+
+
+############################
+# TESTS FOR DUCKDB BACKEND #
+############################
+
+class IndexStore_duckdb_test_proto(IndexStore_test_proto):
+
+    @pytest.mark.parametrize(
+        "cache",
+        [False, True],
+        indirect=False,
+        ids=["cache=%s" % c for c in [False, True]],
+    )
+    def test_sql(self, cache):
+        idx = self.new_idx(cache=cache)
+        df = idx.sql("SELECT COUNT(*) AS n FROM argo_index")
+        assert df["n"].iloc[0] == idx.N_RECORDS
+
+        wmo = idx.read_wmo(index=True)[0]
+        idx.query.wmo(wmo)
+        df = idx.sql("SELECT * FROM argo_search WHERE file LIKE ?", params=["%%/%i/%%" % wmo])
+        assert len(df) == idx.N_MATCH
+
+        table = idx.sql("SELECT file FROM argo_search", engine="pyarrow")
+        assert table.column_names == ["file"]
+
+    def test_search_filter(self):
+        idx = self.new_idx()
+        dac, wmo = idx.read_dac_wmo(index=True)[0]
+        idx.query.compose({"dac": dac, "wmo": wmo})
+        assert isinstance(idx.search_filter, str)
+        assert idx.read_wmo() == [wmo]
+
+    def test_out_of_core(self):
+        wmo = self.new_idx(cache=True).load().read_wmo(index=True)[0]  # Load and save the index in cache
+        idx = self.new_idx(cache=True).load()
+        assert not idx.in_memory
+        assert idx.N_RECORDS > 0
+        assert "In memory: False" in idx.__repr__()
+
+        idx.query.wmo(wmo)
+        assert not idx.in_memory
+        assert idx.N_MATCH > 0
+
+        assert idx.to_dataframe(index=True).shape[0] == idx.N_RECORDS
+        assert wmo in idx.read_wmo(index=True)  # Read the full index in memory
+        assert idx.in_memory
+
+    def test_same_as_pyarrow(self):
+        from argopy.stores.index import indexstore_pa
+
+        fetcher_args, _ = self._setup_store(
+            {"param": {"host": self.host, "index_file": self.index_file, "convention": None}}
+        )
+        idx_pa = indexstore_pa(**fetcher_args).load()
+        idx_dk = self.indexstore(**fetcher_args).load()
+
+        dac, wmo = idx_pa.read_dac_wmo(index=True)[0]
+        searches = [{"wmo": [wmo]}, {"dac": dac}, {"box": [-180, 180, -90, 90, "1900-01-01", "2100-01-01"]}]
+        if self.network == "bgc":
+            param = idx_pa.read_params(index=True)[-1]
+            searches.append({"params": [param.lower()]})  # Case-insensitive match
+            searches.append({"params": [param[1:]]})  # Substring match
+        for search in searches:
+            idx_pa.query.compose(search)
+            idx_dk.query.compose(search)
+            assert idx_dk.N_MATCH == idx_pa.N_MATCH
+            assert sorted(idx_dk.read_files()) == sorted(idx_pa.read_files())
+
+    def test_backend(self):
+        idx = argopy.ArgoIndex(host=self.host, index_file=self.index_file, backend="duckdb")
+        assert isinstance(idx, self.indexstore)
+        with pytest.raises(OptionValueError):
+            argopy.ArgoIndex(host=self.host, index_file=self.index_file, backend="dummy")
+
+
+@skip_noduckdb
+@skip_duckdb
+@skip_CORE
+class Test_IndexStore_duckdb_CORE(IndexStore_duckdb_test_proto):
+    network = "core"
+    from argopy.stores.index import indexstore_duckdb
+
+    indexstore = indexstore_duckdb
+    index_file = "ar_index_global_prof.txt"
+
+
+@skip_noduckdb
+@skip_duckdb
+@skip_BGCb
+class Test_IndexStore_duckdb_BGC_bio(IndexStore_duckdb_test_proto):
+    network = "bgc"
+    from argopy.stores.index import indexstore_duckdb
+
+    indexstore = indexstore_duckdb
+    index_file = "argo_bio-profile_index.txt"
+
+
+@skip_noduckdb
+@skip_duckdb
+@skip_BGCs
+class Test_IndexStore_duckdb_BGC_synthetic(IndexStore_duckdb_test_proto):
+    network = "bgc"
+    from argopy.stores.index import indexstore_duckdb
+
+    indexstore = indexstore_duckdb
+    index_file = "argo_synthetic-profile_index.txt"
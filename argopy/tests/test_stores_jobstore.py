@@ -0,0 +1,51 @@
+import pytest
+import numpy as np
+import xarray as xr
+
+from argopy.stores import ArgoJobStore
+from argopy.errors import DataNotFound
+
+
+URLS = ["https://erddap.ifremer.fr/erddap/tabledap/ArgoFloats.nc?chunk=%i" % i for i in range(4)]
+
+
+def fake_chunk(url):
+    """Return a dataset with as many points as the chunk number, no data for chunk 0"""
+    i = int(url.split("=")[-1])
+    if i == 0:
+        raise DataNotFound(url)
+    return xr.Dataset({"TEMP": xr.DataArray(np.full(i, float(i)), dims="N_POINTS")})
+
+
+def test_jobstore(tmp_path):
+    job = ArgoJobStore("0123456789abcdef0123", cachedir=str(tmp_path))
+    assert job.missing(URLS) == URLS
+
+    def flaky(url):
+        if url == URLS[2]:
+            raise OSError("Network is down")
+        return fake_chunk(url)
+
+    failed = job.run(URLS, flaky, max_workers=2)
+    assert list(failed.keys()) == [URLS[2]]
+    assert job.missing(URLS) == [URLS[2]]
+    assert len(job.done) == 3
+
+    # Resume, only the missing chunk is processed:
+    processed = []
+
+    def task(url):
+        processed.append(url)
+        return fake_chunk(url)
+
+    assert job.run(URLS, task) == {}
+    assert processed == [URLS[2]]
+
+    ds = job.open_dataset(URLS, lazy=False)
+    assert np.array_equal(ds["TEMP"].values, [1, 2, 2, 3, 3, 3])
+    assert len(job.open_dataset(URLS, concat=False)) == 3
+
+    job.clear()
+    assert job.done == []
+    with pytest.raises(DataNotFound):
+        job.open_dataset(URLS)
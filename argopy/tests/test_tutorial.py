@@ -1,3 +1,4 @@
+import os
 import pytest
 import argopy
 from utils import requires_connection
@@ -25,3 +26,21 @@ def test_weekly_index_dataset():
 def test_global_index_dataset():
     rpath, txtfile = argopy.tutorial.open_dataset('global_index_prof')
     assert isinstance(txtfile, str)
+
+
+def test_synthetic_gdac(tmp_path):
+    gdac = argopy.tutorial.synthetic_gdac(path=str(tmp_path / "gdac"), n_floats=4, n_cycles=6, n_levels=20, bgc=0.5)
+    assert gdac.build() == str(tmp_path / "gdac")
+    assert isinstance(gdac.ls(), list)
+    assert gdac.table.shape[0] == gdac.floats["n_cycles"].sum()
+
+    n_bgc = gdac.table["bgc"].sum()
+    for index_file, n_records in {"core": gdac.table.shape[0], "bgc-s": n_bgc, "bgc-b": n_bgc, "meta": 4}.items():
+        if n_records > 0:
+            idx = argopy.ArgoIndex(host=gdac.rootpath, index_file=index_file)
+            assert idx.load().N_RECORDS == n_records
+            assert all([os.path.exists(f) for f in idx.uri_full_index])
+
+    wmo = gdac.wmo[0]
+    ds = argopy.DataFetcher(src="gdac", gdac=gdac.rootpath).float(wmo).to_xarray()
+    assert ds.argo.N_PROF == gdac.table[gdac.table["wmo"] == wmo].shape[0]
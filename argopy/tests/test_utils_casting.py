@@ -0,0 +1,91 @@
+import pytest
+import numpy as np
+import xarray as xr
+
+from argopy.utils.casting import cast_Argo_variable_type, cast_plan, parse_int_strings
+from utils import _importorskip
+
+
+has_dask, requires_dask = _importorskip("dask")
+
+
+def create_raw_dataset():
+    """Create a dataset with raw Argo variables types, as they come out of a netcdf file"""
+    N_PROF, N_LEVELS = 3, 4
+    ds = xr.Dataset()
+    ds["PLATFORM_NUMBER"] = xr.DataArray(
+        np.array(["6902746 ", "6902746 ", "nan"], dtype=object),
+        dims="N_PROF",
+        attrs={"conventions": "WMO float identifier : A9IIIII"},
+    )
+    ds["CYCLE_NUMBER"] = xr.DataArray(
+        np.array([1.0, 2.0, 3.0]),
+        dims="N_PROF",
+    )
+    ds["DATA_MODE"] = xr.DataArray(np.array(["R", "D", "A"], dtype=object), dims="N_PROF")
+    ds["TEMP_QC"] = xr.DataArray(
+        np.array([["1", "2", " ", ""]] * N_PROF, dtype=object),
+        dims=("N_PROF", "N_LEVELS"),
+    )
+    ds["PSAL_QC"] = xr.DataArray(
+        np.array([[1.0, np.nan, 4.0, 3.0]] * N_PROF),
+        dims=("N_PROF", "N_LEVELS"),
+    )
+    ds["HISTORY_DATE"] = xr.DataArray(
+        np.array([["20240101120000", "20240102120000", "              "]] * 2, dtype=object),
+        dims=("N_HISTORY", "N_PROF"),
+        attrs={"conventions": "YYYYMMDDHHMISS"},
+    )
+    ds["TEMP"] = xr.DataArray(np.linspace(10., 2., N_PROF * N_LEVELS).reshape(N_PROF, N_LEVELS), dims=("N_PROF", "N_LEVELS"))
+    return ds
+
+
+@pytest.mark.parametrize("data", [
+    (["12", " 345 ", "6789    "], None, [12, 345, 6789]),
+    (np.array([b"12", b"345"], dtype=object), None, [12, 345]),
+    (["12", "nan"], 999, [12, 999]),
+    (["12", "nan"], None, None),
+    (["1 2"], None, None),
+    (["-12"], None, None),
+    (["12.0"], None, None),
+], indirect=False)
+def test_parse_int_strings(data):
+    val, fillvalue, expected = data
+    result = parse_int_strings(np.array(val), fillvalue=fillvalue)
+    if expected is None:
+        assert result is None
+    else:
+        assert np.array_equal(result, expected)
+
+
+def test_cast_plan():
+    assert cast_plan("TEMP", "<f8") == ()
+    assert cast_plan("TEMP_QC", "|O") == ("qc",)
+    assert cast_plan("PLATFORM_NUMBER", "|O", "WMO float identifier : A9IIIII") == ("str", "int_fill")
+    assert cast_plan("HISTORY_DATE", "|O", "YYYYMMDDHHMISS") == ("datetime",)
+    cast_plan("TEMP_QC", "|O")
+    assert cast_plan.cache_info().hits > 0
+
+
+def test_cast_Argo_variable_type():
+    ds = cast_Argo_variable_type(create_raw_dataset())
+    assert np.array_equal(ds["PLATFORM_NUMBER"], [6902746, 6902746, 999])
+    assert ds["CYCLE_NUMBER"].dtype.kind == "i"
+    assert ds["DATA_MODE"].dtype == "<U1"
+    assert np.array_equal(ds["TEMP_QC"].values[0], [1, 2, 9, 9])
+    assert np.array_equal(ds["PSAL_QC"].values[0], [1, 9, 4, 3])
+    assert ds["HISTORY_DATE"].dtype == "datetime64[ns]"
+    assert ds["HISTORY_DATE"].shape == (2, 3)
+    assert np.isnat(ds["HISTORY_DATE"].values[0, 2])
+    assert ds["TEMP"].dtype == float
+    assert np.all([ds[v].attrs["casted"] == 1 for v in ds.data_vars])
+
+
+@requires_dask
+def test_cast_Argo_variable_type_lazy():
+    ds = cast_Argo_variable_type(create_raw_dataset())
+    ds_lazy = cast_Argo_variable_type(create_raw_dataset().chunk({"N_PROF": 1}))
+    assert np.all([ds_lazy[v].chunks is not None for v in ds_lazy.data_vars])
+    ds_lazy = ds_lazy.compute()
+    for v in ds.data_vars:
+        assert np.array_equal(ds[v].values, ds_lazy[v].values, equal_nan=ds[v].dtype.kind in "fmM")
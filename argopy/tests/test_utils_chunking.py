@@ -24,6 +24,15 @@ def create_data(self):
         self.BOX3d = [0, 20, 40, 60, 0, 1000]
         self.BOX4d = [0, 20, 40, 60, 0, 1000, "2001-01", "2001-6"]
 
+        # A synthetic index of profiles, with a dense cluster of profiles in a corner of the box:
+        N = 2000
+        self.index = pd.DataFrame({
+            "longitude": np.r_[np.linspace(0, 20, N // 2), np.linspace(1, 2, N // 2)],
+            "latitude": np.r_[np.linspace(40, 60, N // 2), np.linspace(41, 42, N // 2)],
+            "date": pd.date_range("2001-01-01", "2001-05-31", periods=N),
+            "wmo": np.repeat(self.WMO, N // len(self.WMO)),
+        })
+
     def test_InvalidFetcherAccessPoint(self):
         with pytest.raises(InvalidFetcherAccessPoint):
             Chunker({"invalid": self.WMO})
@@ -194,3 +203,39 @@ def test_chunk_box4d(self):
             C.this_chunker, types.MethodType
         )
 
+    def test_chunk_balanced(self):
+        with pytest.raises(ValueError):
+            Chunker({"box": self.BOX3d}, chunks="balanced")
+
+        for box in [self.BOX3d, self.BOX4d]:
+            C = Chunker({"box": box}, chunks="balanced", chunksize={"profiles": 300}, index=self.index)
+            chunks = C.fit_transform()
+            assert all([is_box(chunk) for chunk in chunks])
+            counts = [len(Chunker({"box": chunk}, chunks="balanced", index=self.index)._index_profiles())
+                      for chunk in chunks]
+            assert sum(counts) == self.index.shape[0]
+            assert max(counts) <= 300
+
+        C = Chunker({"box": self.BOX4d}, chunks="balanced", chunksize={"profiles": 300, "time": 5}, index=self.index)
+        chunks = C.fit_transform()
+        assert all([np.timedelta64(
+            pd.to_datetime(chunk[7]) - pd.to_datetime(chunk[6]), "D"
+        ) <= np.timedelta64(5, "D") for chunk in chunks])
+
+        # Profiles 1 second apart are not fetched twice with inclusive time bounds:
+        index = pd.DataFrame({
+            "longitude": np.full(10, 10.0),
+            "latitude": np.full(10, 50.0),
+            "date": pd.date_range("2001-01-01", periods=10, freq="1s"),
+            "wmo": np.full(10, self.WMO[0]),
+        })
+        C = Chunker({"box": self.BOX4d}, chunks="balanced", chunksize={"profiles": 5}, index=index)
+        chunks = C.fit_transform()
+        counts = [len(Chunker({"box": chunk}, chunks="balanced", index=index)._index_profiles()) for chunk in chunks]
+        assert counts == [5, 5]
+        assert chunks[0][7] < chunks[1][6]
+
+        C = Chunker({"wmo": self.WMO}, chunks="balanced", chunksize={"profiles": 500}, index=self.index)
+        chunks = C.fit_transform()
+        assert [len(chunk) for chunk in chunks] == [2, 2, 2, 2]
+        assert sum(chunks, []) == self.WMO
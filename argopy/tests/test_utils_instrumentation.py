@@ -0,0 +1,161 @@
+import json
+import threading
+import pytest
+import numpy as np
+import xarray as xr
+
+import argopy
+from argopy.stores import filestore, httpstore
+from argopy.utils import MonitoredThreadPoolExecutor
+from argopy.utils.instrumentation import instrument, global_instrument, span, profile_fetch, STAGES
+from argopy.utils.instrumentation import ContextThreadPoolExecutor
+from argopy.tutorial import synthetic_gdac
+
+
+@pytest.fixture(scope="module")
+def gdac(tmp_path_factory):
+    gdac = synthetic_gdac(tmp_path_factory.mktemp("data").joinpath("gdac"), n_floats=2, n_cycles=3, n_levels=10)
+    gdac.build()
+    return gdac
+
+
+@pytest.fixture(scope="module")
+def files(gdac):
+    return [f for f in gdac.ls() if f.endswith("_prof.nc")]
+
+
+def test_span():
+    with instrument() as report:
+        with span("download", "a") as s:
+            s.set(bytes=10, cache="miss", status=200)
+        with pytest.raises(ValueError):
+            with span("decode", "a"):
+                raise ValueError("bad data")
+    with span("download", "b"):  # Not recorded
+        pass
+
+    assert len(report) == 2
+    df = report.to_dataframe()
+    assert df["stage"].tolist() == ["download", "decode"]
+    assert df["bytes"].iloc[0] == 10
+    assert df["error"].iloc[1] == "ValueError: bad data"
+    assert np.all(df["wall"] >= 0)
+
+    summary = report.summary()
+    assert summary.index.tolist() == ["download", "decode"]
+    assert summary.loc["decode", "errors"] == 1
+
+    events = report.to_otel()
+    assert events[0]["name"] == "argopy.download"
+    assert events[0]["attributes"]["argopy.bytes"] == 10
+    assert events[0]["traceId"] == events[1]["traceId"]
+    assert events[1]["status"]["code"] == "STATUS_CODE_ERROR"
+
+
+def test_context():
+    barrier = threading.Barrier(2)
+    reports = {}
+
+    def work(name):
+        with instrument() as report:
+            barrier.wait()
+            with span("download", name):
+                pass
+            barrier.wait()
+        reports[name] = report
+
+    threads = [threading.Thread(target=work, args=(name,)) for name in ["a", "b"]]
+    [t.start() for t in threads]
+    [t.join() for t in threads]
+    assert reports["a"].to_dataframe()["name"].tolist() == ["a"]
+    assert reports["b"].to_dataframe()["name"].tolist() == ["b"]
+
+    def task(name):
+        with span("download", name):
+            pass
+
+    with instrument() as report:
+        with ContextThreadPoolExecutor(max_workers=2) as executor:
+            list(executor.map(task, ["c", "d"]))
+    assert sorted(report.to_dataframe()["name"].tolist()) == ["c", "d"]
+
+
+def test_maxlen():
+    with instrument(maxlen=2) as report:
+        for name in ["a", "b", "c"]:
+            with span("download", name):
+                pass
+    assert report.to_dataframe()["name"].tolist() == ["b", "c"]
+    assert global_instrument()._spans.maxlen is not None
+
+
+def test_open_mfdataset(files):
+    def preprocess(ds):
+        return argopy.utils.cast_Argo_variable_type(ds).isel(N_LEVELS=0)
+
+    with instrument() as report:
+        ds = filestore().open_mfdataset(
+            files, method="sequential", concat_dim="N_PROF", preprocess=preprocess
+        )
+    assert isinstance(ds, xr.Dataset)
+
+    df = report.to_dataframe()
+    assert set(df["stage"]) == set(STAGES) - {"task"}
+    downloads = df[df["stage"] == "download"]
+    assert len(downloads) == len(files)
+    assert downloads["bytes"].sum() > 0
+
+
+def test_option(files):
+    global_instrument().clear()
+    filestore().open_dataset(files[0])
+    assert len(global_instrument()) == 0
+
+    with argopy.set_options(instrument=True):
+        filestore().open_dataset(files[0])
+    assert global_instrument().to_dataframe()["stage"].tolist() == ["download", "decode"]
+    global_instrument().clear()
+
+
+def test_profile_fetch(files):
+    def task(url):
+        if url == "missing.nc":
+            return FileNotFoundError(url), False
+        return filestore().open_dataset(url), True
+
+    with profile_fetch() as report:
+        run = MonitoredThreadPoolExecutor(max_workers=2, task_fct=task, show=False)
+        run.execute(files + ["missing.nc"])
+
+    assert report.elapsed > 0
+    assert len(report.downloads) == len(files)
+    assert report.latency.sum() == len(files)
+    assert report.failed["name"].tolist() == ["missing.nc"]
+    assert report.failed["stage"].tolist() == ["task"]
+    assert report.bottleneck in ["server", "client"]
+    assert len(report.slowest(n=1)) == 1
+    assert "stages" in report.to_dict()
+    assert report.max_rss is None or report.to_dict()["max_rss"] > 0
+
+
+def test_profile_fetch_ignored(monkeypatch):
+    def cat_file(url, **kwargs):
+        raise FileNotFoundError(url)
+
+    fs = httpstore()
+    monkeypatch.setattr(fs.fs, "cat_file", cat_file)
+    with profile_fetch() as report:
+        assert fs.download_url("https://argopy.org/missing.nc", errors="ignore") is None
+    assert report.failed["name"].tolist() == ["https://argopy.org/missing.nc"]
+    assert report.failed["stage"].tolist() == ["download"]
+
+
+def test_fetcher_profile(gdac):
+    fetcher = argopy.DataFetcher(src="gdac", gdac=gdac.rootpath, profile=True).float(gdac.wmo[0])
+    ds = fetcher.to_xarray()
+    assert fetcher.fetch_profile is not None
+    assert len(fetcher.fetch_profile.downloads) == 1
+    assert json.loads(ds.attrs["Fetched_profile"])["urls"] == 1
+
+    with pytest.raises(argopy.errors.OptionValueError):
+        argopy.DataFetcher(src="gdac", gdac=gdac.rootpath, profile="yes")
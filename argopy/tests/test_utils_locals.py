@@ -41,3 +41,17 @@ def test_load_csv(self, asset):
 
         data = Asset.load(asset, header=None, sep="\t")
         assert isinstance(data, pd.DataFrame)
+
+    def test_bundle(self, tmp_path):
+        with argopy.set_options(cachedir=str(tmp_path)):
+            path = Asset.compile()
+            assert path.exists()
+            assert path.is_relative_to(tmp_path)
+            assert path.suffix == ".json"
+
+            data = Asset.load('data_types')
+            data['data'] = None
+            assert Asset.load('data_types')['data'] is not None
+
+            with pytest.raises(FileNotFoundError):
+                Asset.load('dummy_asset')
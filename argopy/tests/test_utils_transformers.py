@@ -9,6 +9,7 @@
 from argopy.utils.transformers import (
     fill_variables_not_in_all_datasets,
     drop_variables_not_in_all_datasets,
+    concat_datasets,
     merge_param_with_param_adjusted,
     filter_param_by_data_mode,
     split_data_mode,
@@ -59,6 +60,51 @@ def test_fill_variables_not_in_all_datasets():
         assert key in ds_list[1]
 
 
+def test_concat_datasets():
+    # Create a list of dummy datasets, with variables not in all datasets:
+    ds_list = []
+    for i in range(10):
+        names = ["PRES", "TEMP", "PSAL"] if i % 2 else ["PRES", "TEMP", "PSAL", "DOXY"]
+        ds = get_ds(names, 3, 1).stack({"N_POINTS": ["N_PROF", "N_LEVELS"]}).reset_index("N_POINTS")
+        ds["DATA_MODE"] = xr.DataArray(np.array(["R" * (i % 3 + 1)] * 3), dims="N_POINTS")  # Different widths
+        if i % 2:
+            ds["DOXY_QC"] = xr.DataArray(np.ones(3, dtype=int), dims="N_POINTS")
+        ds_list.append(ds)
+
+    expected = xr.concat(
+        fill_variables_not_in_all_datasets([ds.copy() for ds in ds_list], concat_dim="N_POINTS"),
+        dim="N_POINTS",
+        data_vars="minimal",
+        coords="all",
+        compat="override",
+    )
+    ds = concat_datasets(ds_list, concat_dim="N_POINTS")
+    assert ds.identical(expected)
+    assert ds["DOXY_QC"].values[0] == 99999
+
+    # Keep variables and dataset encoding, like xarray:
+    for ds in ds_list:
+        ds["PRES"].encoding = {"units": "decibar", "dtype": "float32", "_FillValue": 99999.0}
+        ds["TEMP"].encoding = {"zlib": True}
+        ds.encoding = {"source": "x"}
+    expected = xr.concat(
+        fill_variables_not_in_all_datasets([ds.copy() for ds in ds_list], concat_dim="N_POINTS"),
+        dim="N_POINTS",
+        data_vars="minimal",
+        coords="all",
+        compat="override",
+    )
+    ds = concat_datasets(ds_list, concat_dim="N_POINTS")
+    assert ds.encoding == expected.encoding == {"source": "x"}
+    for name in ["PRES", "TEMP"]:
+        assert ds[name].encoding == expected[name].encoding
+
+    # Fall back on xarray with datasets of different sizes along other dimensions:
+    ds_list = [get_ds(["PRES", "TEMP"], 3, 6), get_ds(["PRES", "TEMP"], 2, 4)]
+    ds = concat_datasets(ds_list, concat_dim="N_PROF")
+    assert ds.sizes == {"N_PROF": 5, "N_LEVELS": 6}
+
+
 class Test_merge_param_with_param_adjusted:
 
     def _create_ds(self):
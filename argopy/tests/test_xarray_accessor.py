@@ -13,6 +13,7 @@
 
 
 has_gsw, requires_gsw = _importorskip("gsw")
+has_dask, requires_dask = _importorskip("dask")
 has_nogsw, requires_nogsw = _connectskip(not has_gsw, "that GSW module is NOT installed")
 
 
@@ -45,6 +46,19 @@ def ds_pts(mocked_httpserver):
         return data
 
 
+def create_optic_dataset(N_PROF=20, N_LEVELS=50):
+    """Create a collection of synthetic PAR profiles"""
+    pres = np.tile(np.linspace(0.5, 200, N_LEVELS), (N_PROF, 1))
+    kd = np.linspace(0.02, 0.12, N_PROF)[:, np.newaxis]
+    par = 1500 * np.exp(-kd * pres)
+    par[0, :] = np.nan
+    par[1, ::3] = np.nan
+    return xr.Dataset({
+        "PRES": (("N_PROF", "N_LEVELS"), pres),
+        "DOWNWELLING_PAR": (("N_PROF", "N_LEVELS"), par),
+    })
+
+
 def test_point2profile(ds_pts):
     assert "N_PROF" in ds_pts['standard'].argo.point2profile().dims
 
@@ -239,3 +253,44 @@ def test_filecreate(self):
             with tempfile.TemporaryDirectory() as folder_output:
                 expert_ds.argo.create_float_source(path=folder_output)
                 assert len(os.listdir(folder_output)) == N_file
+
+    @pytest.mark.parametrize("parallel", ["thread", "process"], indirect=False)
+    def test_parallel(self, parallel):
+        with argopy.set_options(gdac=self.local_gdac):
+            expert_ds = ArgoDataFetcher(src="gdac", mode='expert').float([6901929, 2901623]).load().data
+
+            N_file = len(np.unique(expert_ds['PLATFORM_NUMBER']))
+            with tempfile.TemporaryDirectory() as folder_output:
+                output, failed = expert_ds.argo.create_float_source(
+                    path=folder_output, parallel=parallel, max_workers=2, list_failed=True
+                )
+                assert len(os.listdir(folder_output)) == N_file
+                assert len(output) == N_file
+                assert len(failed) == 0
+
+
+class Test_reduce_profile:
+
+    @pytest.mark.parametrize("method", ["percentage", "KdPAR"], indirect=False)
+    def test_Z_euphotic_numba(self, method):
+        from argopy.utils.optical_modeling import Z_euphotic, Z_euphotic_numba
+        ds = create_optic_dataset()
+        expected = ds.argo.reduce_profile(Z_euphotic, params=["PRES", "DOWNWELLING_PAR"], method=method)
+        result = Z_euphotic_numba(ds["PRES"].values, ds["DOWNWELLING_PAR"].values, method=method)
+        assert np.array_equal(expected.values, result, equal_nan=True)
+
+    def test_Z_iPAR_threshold_numba(self):
+        from argopy.utils.optical_modeling import Z_iPAR_threshold, Z_iPAR_threshold_numba
+        ds = create_optic_dataset()
+        expected = ds.argo.reduce_profile(Z_iPAR_threshold, params=["PRES", "DOWNWELLING_PAR"])
+        result = Z_iPAR_threshold_numba(ds["PRES"].values, ds["DOWNWELLING_PAR"].values)
+        assert np.array_equal(expected.values, result, equal_nan=True)
+
+    @requires_dask
+    @pytest.mark.parametrize("scheduler", [None, "threads", "processes"], indirect=False)
+    def test_chunks(self, scheduler):
+        ds = create_optic_dataset()
+        expected = ds.argo.optic.Zeu(inplace=False)
+        result = ds.argo.optic.Zeu(inplace=False, chunks=5, scheduler=scheduler)
+        assert (result.chunks is None) == (scheduler is not None)
+        assert np.array_equal(expected.values, result.values, equal_nan=True)
@@ -12,6 +12,9 @@
 
 # To force a new download of the data repo:
 argopy.tutorial.repodata().download(overwrite=True)
+
+# Create a synthetic GDAC folder of any size (no internet required):
+gdacroot = argopy.tutorial.synthetic_gdac(path='/tmp/gdac', n_floats=1000).build()
 ```
 """
 
@@ -19,13 +22,20 @@
 from zipfile import ZipFile
 from urllib.request import urlretrieve
 import shutil
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import xarray as xr
+import netCDF4
 
 
 _DEFAULT_CACHE_DIR = os.path.expanduser(os.path.sep.join(["~", ".argopy_tutorial_data"]))
+_DEFAULT_SYNTHETIC_DIR = os.path.expanduser(os.path.sep.join(["~", ".argopy_tutorial_data_synthetic"]))
 
 
 def open_dataset(name: str) -> tuple:
-    """ Open a dataset from the argopy online data repository (requires internet).
+    """ Open a dataset from the argopy online data repository (requires internet), or a synthetic dataset.
 
     If a local copy is found then always use that to avoid network traffic.
 
@@ -42,6 +52,7 @@ def open_dataset(name: str) -> tuple:
             - ``gdac``: A small subset of the GDAC ftp.
             - ``weekly_index_prof``: The weekly profile index file
             - ``global_index_prof``: The global profile index file
+            - ``synthetic_gdac``: A synthetic GDAC folder with 10 floats, created locally (no internet required)
 
     Returns
     -------
@@ -70,6 +81,11 @@ def open_dataset(name: str) -> tuple:
         ifile = [f for f in flist if 'ar_index_global_prof.txt' in f][0]
         return gdacftp.rootpath, ifile
 
+    elif name == 'synthetic_gdac':
+        gdac = synthetic_gdac()
+        gdac.build(overwrite=False)
+        return gdac.rootpath, gdac.ls()
+
     else:
         raise ValueError("Unknown tutorial dataset ('%s')" % name)
 
@@ -141,3 +157,646 @@ def ls(self):
         for (dirpath, dirnames, filenames) in os.walk(self.rootpath):
             listOfFiles += [os.path.join(dirpath, file) for file in filenames]
         return listOfFiles
+
+
+# Synthetic GDAC settings:
+_DACS = {'aoml': 'AO', 'bodc': 'BO', 'coriolis': 'IF', 'csiro': 'CS', 'incois': 'IN', 'jma': 'JA', 'kma': 'KM',
+         'meds': 'ME'}
+_PROFILERS = {'core': [844, 846, 851, 854, 869], 'bgc': [834, 836, 838, 863]}
+_CORE_PARAMETERS = ['PRES', 'TEMP', 'PSAL']
+_BGC_PARAMETERS = ['DOXY', 'CHLA', 'BBP700', 'NITRATE', 'PH_IN_SITU_TOTAL', 'DOWNWELLING_PAR']
+_UNITS = {'PRES': 'decibar', 'TEMP': 'degree_Celsius', 'PSAL': 'psu', 'DOXY': 'micromole/kg', 'CHLA': 'mg/m3',
+          'BBP700': 'm-1', 'NITRATE': 'micromole/kg', 'PH_IN_SITU_TOTAL': 'dimensionless',
+          'DOWNWELLING_PAR': 'microMoleQuanta/m^2/sec'}
+_SENSORS = {'PRES': 'CTD_PRES', 'TEMP': 'CTD_TEMP', 'PSAL': 'CTD_CNDC', 'DOXY': 'OPTODE_DOXY',
+            'CHLA': 'FLUOROMETER_CHLA', 'BBP700': 'BACKSCATTERINGMETER_BBP700', 'NITRATE': 'SPECTROPHOTOMETER_NITRATE',
+            'PH_IN_SITU_TOTAL': 'TRANSISTOR_PH', 'DOWNWELLING_PAR': 'RADIOMETER_PAR'}
+_INDEX_FILES = {
+    'core': ('ar_index_global_prof.txt', 'Profile', 'individual profile files', '2.0'),
+    'bgc-s': ('argo_synthetic-profile_index.txt', 'Synthetic-Profile', 'individual synthetic-profile files', '2.2'),
+    'bgc-b': ('argo_bio-profile_index.txt', 'Bio-Profile', 'individual bio-profile files', '2.2'),
+    'meta': ('ar_index_global_meta.txt', 'Metadata', 'metadata files', '2.0'),
+}
+_REFERENCE_DATE = np.datetime64('1950-01-01T00:00:00', 's')
+_LAST_DATE = np.datetime64('2025-01-01T00:00:00', 's')
+_DAY = np.timedelta64(86400, 's')
+
+
+def _chars(values, n: int) -> np.ndarray:
+    """Return strings as a netcdf array of characters, with a trailing dimension of length n"""
+    a = np.char.ljust(np.asarray(values).astype('S%i' % n), n)
+    return a.reshape(-1).view('S1').reshape(a.shape + (n,))
+
+
+def _strings(*columns) -> pd.Series:
+    """Concatenate columns of strings"""
+    out = pd.Series(columns[0]).astype(str)
+    for c in columns[1:]:
+        out = out + (pd.Series(c).astype(str).values if not isinstance(c, str) else c)
+    return out
+
+
+def _to_netcdf(ds: xr.Dataset, path: str):
+    """Write a dataset of raw netcdf variables, with characters arrays of dtype 'S1' as netcdf 'char' variables
+
+    Unlike :meth:`xarray.Dataset.to_netcdf`, no string dimension is added to 'S1' variables, like in GDAC files.
+    """
+    with netCDF4.Dataset(path, 'w', format='NETCDF3_CLASSIC') as nc:
+        nc.setncatts(ds.attrs)
+        for dim, size in ds.sizes.items():
+            nc.createDimension(dim, size)
+        for name, da in ds.data_vars.items():
+            fill_value = da.encoding.get('_FillValue', b' ' if da.dtype.kind == 'S' else None)
+            var = nc.createVariable(name, da.dtype, da.dims, fill_value=fill_value)
+            var.setncatts(da.attrs)
+            values = da.values
+            if fill_value is not None and da.dtype.kind == 'f':
+                values = np.where(np.isnan(values), fill_value, values)
+            var[:] = values
+
+
+def _datestr(dates) -> pd.Series:
+    """Format datetime64 values as YYYYMMDDHHMISS strings"""
+    return pd.Series(np.datetime_as_string(np.asarray(dates, dtype='datetime64[s]'))).str.replace(
+        r'[-T:]', '', regex=True)
+
+
+class synthetic_gdac():
+    """ Helper class to create a synthetic local GDAC folder
+
+    The synthetic GDAC folder is compliant with the GDAC structure and can be of any size. It is made of:
+
+    - index files for the ``core``, ``bgc-s``, ``bgc-b`` and ``meta`` conventions,
+    - for each float, a ``<WMO>_meta.nc`` meta-data file and a ``<WMO>_prof.nc`` multi-profile file, and a
+      ``<WMO>_Sprof.nc`` synthetic multi-profile file for BGC floats,
+    - mono-profile core, synthetic and bio files in the ``profiles`` folder of each float.
+
+    Floats have a random number of 10-day cycles, drift from a random launch position and profiles have a
+    random number of levels. Profiles older than 2 years are in delayed mode. BGC floats measure DOXY and a random
+    subset of other BGC parameters. Calibration and history variables are not written.
+
+    Content is deterministic for a given ``seed``, so that :class:`ArgoIndex`, :class:`stores.filestore` or the
+    ``gdac`` data fetcher can be benchmarked or tested offline and reproducibly.
+
+    Examples
+    --------
+    .. code-block:: python
+
+        from argopy.tutorial import synthetic_gdac
+        from argopy import ArgoIndex, DataFetcher
+
+        gdac = synthetic_gdac(path='/tmp/gdac', n_floats=1000, n_cycles=150, bgc=0.2)
+        gdac.build()
+
+        idx = ArgoIndex(host=gdac.rootpath, index_file='bgc-s')
+        ds = DataFetcher(src='gdac', gdac=gdac.rootpath).float(gdac.wmo[0]).to_xarray()
+
+        # Index files only, e.g. to benchmark a multi-million rows index:
+        synthetic_gdac(path='/tmp/gdac_index', n_floats=20000, n_cycles=300, files=False).build()
+
+    """
+    def __init__(self,
+                 path: str = _DEFAULT_SYNTHETIC_DIR,
+                 n_floats: int = 10,
+                 n_cycles: int = 50,
+                 n_levels: int = 100,
+                 bgc: float = 0.3,
+                 files: bool = True,
+                 profiles: bool = True,
+                 seed: int = 0):
+        """
+        Parameters
+        ----------
+        path: str
+            Local path where to create the GDAC folder
+        n_floats: int, default: 10
+            Number of floats
+        n_cycles: int, default: 50
+            Maximum number of cycles per float. Floats have between ``n_cycles // 2`` and ``n_cycles`` cycles.
+        n_levels: int, default: 100
+            Maximum number of vertical levels per profile. Profiles have between ``n_levels // 2`` and ``n_levels``
+            levels.
+        bgc: float, default: 0.3
+            Fraction of BGC floats
+        files: bool, default: True
+            Write netcdf files. If False, only index files are written.
+        profiles: bool, default: True
+            Write mono-profile netcdf files
+        seed: int, default: 0
+            Seed of the random generator
+        """
+        self.localpath = os.path.expanduser(path)
+        self.n_floats = n_floats
+        self.n_cycles = n_cycles
+        self.n_levels = n_levels
+        self.bgc = bgc
+        self.files = files
+        self.profiles = profiles
+        self.seed = seed
+        self._floats = None
+        self._table = None
+
+    def __repr__(self):
+        summary = ["<argopy.tutorial.synthetic_gdac>"]
+        summary.append("Path: %s" % self.localpath)
+        summary.append("Floats: %i (%i BGC)" % (self.n_floats, self.floats['bgc'].sum()))
+        summary.append("Profiles: %i" % self.table.shape[0])
+        summary.append("Built: %s" % os.path.isdir(self.localpath))
+        return "\n".join(summary)
+
+    @property
+    def rootpath(self):
+        if os.path.isdir(self.localpath):
+            return self.localpath
+        else:
+            raise FileNotFoundError("Synthetic GDAC not found at '%s'.\n "
+                                    "Try a: 'argopy.tutorial.synthetic_gdac().build()' first." % self.localpath)
+
+    def ls(self):
+        """ Return the list of files in the synthetic GDAC folder """
+        listOfFiles = list()
+        for (dirpath, dirnames, filenames) in os.walk(self.rootpath):
+            listOfFiles += [os.path.join(dirpath, file) for file in filenames]
+        return listOfFiles
+
+    @property
+    def wmo(self) -> list:
+        """ List of float WMOs """
+        return self.floats['wmo'].tolist()
+
+    @property
+    def floats(self) -> pd.DataFrame:
+        """ Table of floats, one row per float """
+        if self._floats is None:
+            rng = np.random.default_rng(self.seed)
+            n = self.n_floats
+            is_bgc = rng.random(n) < self.bgc
+            dac = np.array(list(_DACS.keys()))[rng.integers(0, len(_DACS), n)]
+            profiler = np.where(is_bgc,
+                                np.array(_PROFILERS['bgc'])[rng.integers(0, len(_PROFILERS['bgc']), n)],
+                                np.array(_PROFILERS['core'])[rng.integers(0, len(_PROFILERS['core']), n)])
+            # BGC floats always measure DOXY, other BGC parameters are measured by half of them:
+            bgc_params = (rng.random((n, len(_BGC_PARAMETERS))) < 0.5) | (np.arange(len(_BGC_PARAMETERS)) == 0)
+            bgc_params &= is_bgc[:, np.newaxis]
+            n_cyc = rng.integers(max(1, self.n_cycles // 2), self.n_cycles + 1, n)
+            launch = _LAST_DATE - (self.n_cycles * 10 + rng.integers(0, 15 * 365, n)) * _DAY
+            self._floats = pd.DataFrame({
+                'wmo': 7900000 + np.arange(n),
+                'dac': dac,
+                'institution': [_DACS[d] for d in dac],
+                'profiler_type': profiler,
+                'bgc': is_bgc,
+                'n_cycles': n_cyc,
+                'launch_date': launch,
+                'launch_longitude': rng.uniform(-180, 180, n),
+                'launch_latitude': rng.uniform(-60, 60, n),
+            })
+            for i, param in enumerate(_BGC_PARAMETERS):
+                self._floats[param] = bgc_params[:, i]
+        return self._floats
+
+    @property
+    def table(self) -> pd.DataFrame:
+        """ Table of profiles, one row per profile """
+        if self._table is None:
+            rng = np.random.default_rng([self.seed, 1])
+            flt = self.floats
+            n_cyc = flt['n_cycles'].values
+            N = n_cyc.sum()
+            ifloat = np.repeat(np.arange(len(flt)), n_cyc)
+            first = np.cumsum(n_cyc) - n_cyc
+            cyc = np.arange(N) - np.repeat(first, n_cyc) + 1
+
+            date = flt['launch_date'].values[ifloat].astype('datetime64[s]') + (cyc - 1) * 10 * _DAY
+            date += rng.integers(0, 86400, N).astype('timedelta64[s]')
+
+            # Random walk from the launch position:
+            def walk(x0, scale):
+                steps = np.cumsum(rng.normal(0, scale, N))
+                return x0[ifloat] + steps - np.repeat(steps[first], n_cyc)
+
+            lat = np.clip(walk(flt['launch_latitude'].values, 0.2), -75, 75)
+            lon = (walk(flt['launch_longitude'].values, 0.3) + 180) % 360 - 180
+
+            age = _LAST_DATE - date
+            data_mode = np.where(age > 2 * 365 * _DAY, 'D', np.where(rng.random(N) < 0.2, 'A', 'R'))
+            bgc_mode = np.where((age > 3 * 365 * _DAY)[:, np.newaxis] & (rng.random((N, len(_BGC_PARAMETERS))) < 0.5),
+                                'D', np.where(rng.random((N, len(_BGC_PARAMETERS))) < 0.4, 'A', 'R'))
+
+            self._table = pd.DataFrame({
+                'wmo': flt['wmo'].values[ifloat],
+                'cyc': cyc,
+                'dac': flt['dac'].values[ifloat],
+                'institution': flt['institution'].values[ifloat],
+                'profiler_type': flt['profiler_type'].values[ifloat],
+                'bgc': flt['bgc'].values[ifloat],
+                'date': date,
+                'latitude': lat.round(3),
+                'longitude': lon.round(3),
+                'ocean': np.where((lon > -70) & (lon < 20), 'A', np.where((lon >= 20) & (lon < 146), 'I', 'P')),
+                'data_mode': data_mode,
+                'n_levels': rng.integers(max(1, self.n_levels // 2), self.n_levels + 1, N),
+            })
+            for i, param in enumerate(_BGC_PARAMETERS):
+                self._table['%s_DATA_MODE' % param] = np.where(flt[param].values[ifloat], bgc_mode[:, i], '')
+        return self._table
+
+    def _bgc_columns(self, table: pd.DataFrame, convention: str):
+        """ Return the 'parameters' and 'parameter_data_mode' index columns of BGC profiles """
+        first = _CORE_PARAMETERS if convention == 'bgc-s' else ['PRES']
+        parameters = pd.Series(" ".join(first), index=table.index)
+        modes = pd.Series("", index=table.index)
+        for param in first:
+            modes = modes + table['data_mode']
+        for param in _BGC_PARAMETERS:
+            has = table['%s_DATA_MODE' % param] != ''
+            parameters = parameters + np.where(has, " %s" % param, "")
+            modes = modes + table['%s_DATA_MODE' % param]
+        return parameters, modes
+
+    def _files(self, table: pd.DataFrame, convention: str) -> np.ndarray:
+        """ Return paths to mono-profile files of a given index convention, relative to the dac folder
+
+        The file prefix is 'D' if at least one parameter is in delayed mode, 'R' otherwise.
+        """
+        if convention == 'core':
+            prefix = np.where(table['data_mode'] == 'D', 'D', 'R')
+        else:
+            _, modes = self._bgc_columns(table, convention)
+            letter = 'S' if convention == 'bgc-s' else 'B'
+            prefix = np.where(modes.str.contains('D'), letter + 'D', letter + 'R')
+        wmo = table['wmo'].astype(str)
+        return _strings(table['dac'], '/', wmo, '/profiles/', prefix, wmo, '_',
+                        table['cyc'].astype(str).str.zfill(3), '.nc').values
+
+    def index(self, convention: str = 'core') -> pd.DataFrame:
+        """ Return the index of a given convention, as written in the index file
+
+        Parameters
+        ----------
+        convention: str, default: 'core'
+            One of ``core``, ``bgc-s``, ``bgc-b`` or ``meta``
+
+        Returns
+        -------
+        :class:`pandas.DataFrame`
+        """
+        if convention == 'meta':
+            flt = self.floats
+            return pd.DataFrame({
+                'file': _strings(flt['dac'], '/', flt['wmo'], '/', flt['wmo'], '_meta.nc'),
+                'profiler_type': flt['profiler_type'],
+                'institution': flt['institution'],
+                'date_update': _datestr(_LAST_DATE).iloc[0],
+            })
+        if convention not in ['core', 'bgc-s', 'bgc-b']:
+            raise ValueError("Unknown index convention ('%s')" % convention)
+
+        table = self.table if convention == 'core' else self.table[self.table['bgc']]
+        df = pd.DataFrame({
+            'file': self._files(table, convention),
+            'date': _datestr(table['date']).values,
+            'latitude': table['latitude'].values,
+            'longitude': table['longitude'].values,
+            'ocean': table['ocean'].values,
+            'profiler_type': table['profiler_type'].values,
+            'institution': table['institution'].values,
+        })
+        if convention != 'core':
+            parameters, modes = self._bgc_columns(table, convention)
+            df['parameters'] = parameters.values
+            df['parameter_data_mode'] = modes.values
+        df['date_update'] = _datestr(np.minimum(table['date'].values + 30 * _DAY, _LAST_DATE)).values
+        return df
+
+    def write_index(self, convention: str = 'core') -> str:
+        """ Write an index file in the GDAC folder
+
+        Returns
+        -------
+        str
+            Path to the index file
+        """
+        fname, title, description, version = _INDEX_FILES[convention]
+        df = self.index(convention)
+        ifile = os.path.join(self.localpath, fname)
+        with open(ifile, 'w') as f:
+            f.write("# Title : %s directory file of the Argo Global Data Assembly Center\n" % title)
+            f.write("# Description : The directory file describes all %s of the argo GDAC ftp site.\n" % description)
+            f.write("# Project : ARGO\n")
+            f.write("# Format version : %s\n" % version)
+            f.write("# Date of update : %s\n" % _datestr(_LAST_DATE).iloc[0])
+            f.write("# FTP root number 1 : ftp://ftp.ifremer.fr/ifremer/argo/dac\n")
+            f.write("# FTP root number 2 : ftp://usgodae.org/pub/outgoing/argo/dac\n")
+            f.write("# GDAC node : CORIOLIS\n")
+            f.write(",".join(df.columns) + "\n")
+            df.to_csv(f, header=False, index=False)
+        return ifile
+
+    def _levels(self, table: pd.DataFrame, params: list, rng) -> dict:
+        """ Return synthetic measurements of profiles, as 2d arrays (N_PROF, N_LEVELS) padded with NaNs """
+        n_prof, n_lev = table.shape[0], table['n_levels'].max()
+        valid = np.arange(n_lev)[np.newaxis, :] < table['n_levels'].values[:, np.newaxis]
+        steps = np.cumsum(rng.uniform(0.5, 1.5, (n_prof, n_lev)), axis=1)
+        pres = 4 + 2000 * steps / steps[np.arange(n_prof), table['n_levels'].values - 1][:, np.newaxis]
+        lat = np.abs(table['latitude'].values)[:, np.newaxis]
+
+        def noise(scale):
+            return rng.normal(0, scale, (n_prof, n_lev))
+
+        models = {
+            'PRES': lambda: pres,
+            'TEMP': lambda: 2 + 26 * np.cos(np.deg2rad(lat)) * np.exp(-pres / 500) + noise(0.05),
+            'PSAL': lambda: 34.6 + 0.9 * np.exp(-pres / 300) + noise(0.01),
+            'DOXY': lambda: 170 + 90 * np.exp(-pres / 200) - 60 * np.exp(-((pres - 800) / 400) ** 2) + noise(1),
+            'CHLA': lambda: np.maximum(0, 1.5 * np.exp(-((pres - 60) / 40) ** 2) + noise(0.02)),
+            'BBP700': lambda: np.maximum(0, 2e-3 * np.exp(-pres / 100) + 2e-4 + noise(1e-5)),
+            'NITRATE': lambda: np.maximum(0, 35 * (1 - np.exp(-pres / 600)) + noise(0.2)),
+            'PH_IN_SITU_TOTAL': lambda: 7.7 + 0.35 * np.exp(-pres / 400) + noise(0.002),
+            'DOWNWELLING_PAR': lambda: np.where(pres < 250, 1500 * np.exp(-pres / 30), np.nan),
+        }
+        data = {}
+        for param in params:
+            values = models[param]()
+            if param in ['NITRATE', 'PH_IN_SITU_TOTAL']:  # Sampled at a lower vertical resolution
+                values[:, 1::2] = np.nan
+            data[param] = np.where(valid, values, np.nan).astype(np.float32)
+        return data
+
+    def _profile_dataset(self, table: pd.DataFrame, params: list, data: dict, kind: str) -> xr.Dataset:
+        """ Create a multi-profile dataset, with raw netcdf variables
+
+        Parameters
+        ----------
+        kind: str
+            ``core``, ``S`` (synthetic) or ``B`` (bio) profile dataset
+        """
+        n_prof, n_param = table.shape[0], len(params)
+        wmo = str(table['wmo'].iloc[0])
+        attrs = {'title': 'Argo float vertical profile',
+                 'institution': table['dac'].iloc[0].upper(),
+                 'source': 'Argo float',
+                 'history': '%s creation' % _datestr(_LAST_DATE).iloc[0],
+                 'references': 'http://www.argodatamgt.org/Documentation',
+                 'user_manual_version': '3.1',
+                 'Conventions': 'Argo-3.1 CF-1.6',
+                 'featureType': 'trajectoryProfile',
+                 'comment': 'Synthetic data created with argopy.tutorial.synthetic_gdac'}
+        data_type = {'core': 'Argo profile', 'S': 'B-Argo synthetic profile', 'B': 'B-Argo profile'}[kind]
+        string_param = 16 if kind == 'core' else 64
+        ds = xr.Dataset(attrs=attrs)
+
+        now = _datestr(_LAST_DATE).iloc[0]
+        ds['DATA_TYPE'] = xr.DataArray(_chars(data_type, 32 if kind != 'core' else 16),
+                                       dims=('STRING32' if kind != 'core' else 'STRING16',),
+                                       attrs={'long_name': 'Data type', 'conventions': 'Argo reference table 1'})
+        ds['FORMAT_VERSION'] = xr.DataArray(_chars('3.1', 4), dims=('STRING4',),
+                                            attrs={'long_name': 'File format version'})
+        ds['HANDBOOK_VERSION'] = xr.DataArray(_chars('1.2', 4), dims=('STRING4',),
+                                              attrs={'long_name': 'Data handbook version'})
+        for name, value, long_name in [('REFERENCE_DATE_TIME', '19500101000000', 'Date of reference for Julian days'),
+                                       ('DATE_CREATION', now, 'Date of file creation'),
+                                       ('DATE_UPDATE', now, 'Date of update of this file')]:
+            ds[name] = xr.DataArray(_chars(value, 14), dims=('DATE_TIME',),
+                                    attrs={'long_name': long_name, 'conventions': 'YYYYMMDDHHMISS'})
+
+        def per_prof(name, value, n, **attrs):
+            values = np.full(n_prof, value) if np.isscalar(value) else value
+            if n == 1:
+                ds[name] = xr.DataArray(np.asarray(values).astype('S1'), dims=('N_PROF',), attrs=attrs)
+            else:
+                ds[name] = xr.DataArray(_chars(values, n), dims=('N_PROF', 'STRING%i' % n), attrs=attrs)
+
+        per_prof('PLATFORM_NUMBER', wmo, 8, long_name='Float unique identifier',
+                 conventions='WMO float identifier : A9IIIII')
+        per_prof('PROJECT_NAME', 'ARGOPY SYNTHETIC', 64, long_name='Name of the project')
+        per_prof('PI_NAME', 'ARGOPY', 64, long_name='Name of the principal investigator')
+        ds['STATION_PARAMETERS'] = xr.DataArray(
+            _chars(np.broadcast_to(np.array(params), (n_prof, n_param)), string_param),
+            dims=('N_PROF', 'N_PARAM', 'STRING%i' % string_param),
+            attrs={'long_name': 'List of available parameters for the station',
+                   'conventions': 'Argo reference table 3'})
+        ds['CYCLE_NUMBER'] = xr.DataArray(table['cyc'].values.astype(np.int32), dims=('N_PROF',),
+                                          attrs={'long_name': 'Float cycle number',
+                                                 'conventions': '0...N, 0 : launch cycle (if exists), '
+                                                                '1 : first complete cycle'})
+        ds['CYCLE_NUMBER'].encoding['_FillValue'] = np.int32(99999)
+        per_prof('DIRECTION', 'A', 1, long_name='Direction of the station profiles',
+                 conventions='A: ascending profiles, D: descending profiles')
+        per_prof('DATA_CENTRE', table['institution'].values, 2,
+                 long_name='Data centre in charge of float data processing', conventions='Argo reference table 4')
+        if kind != 'S':
+            per_prof('DC_REFERENCE', ['%s/%i' % (wmo, c) for c in table['cyc']], 32,
+                     long_name='Station unique identifier in data centre', conventions='Data centre convention')
+            per_prof('DATA_STATE_INDICATOR', '2B', 4, long_name='Degree of processing the data have passed through',
+                     conventions='Argo reference table 6')
+        if kind != 'core':
+            modes = np.stack([table['data_mode'].values if p in _CORE_PARAMETERS
+                              else table['%s_DATA_MODE' % p].values for p in params], axis=1)
+            ds['PARAMETER_DATA_MODE'] = xr.DataArray(
+                modes.astype('S1'), dims=('N_PROF', 'N_PARAM'),
+                attrs={'long_name': 'Delayed mode or real time data',
+                       'conventions': 'R : real time; D : delayed mode; A : real time with adjustment'})
+        if kind != 'S':
+            per_prof('DATA_MODE', table['data_mode'].values, 1, long_name='Delayed mode or real time data',
+                     conventions='R : real time; D : delayed mode; A : real time with adjustment')
+        per_prof('PLATFORM_TYPE', 'ARVOR' if kind == 'core' else 'PROVOR_III', 32, long_name='Type of float',
+                 conventions='Argo reference table 23')
+        per_prof('FLOAT_SERIAL_NO', 'SYN%s' % wmo, 32, long_name='Serial number of the float')
+        per_prof('FIRMWARE_VERSION', '1.0', 32, long_name='Instrument firmware version')
+        per_prof('WMO_INST_TYPE', str(table['profiler_type'].iloc[0]), 4, long_name='Coded instrument type',
+                 conventions='Argo reference table 8')
+
+        juld = (table['date'].values.astype('datetime64[s]') - _REFERENCE_DATE) / _DAY
+        for name, long_name in [('JULD', 'Julian day (UTC) of the station relative to REFERENCE_DATE_TIME'),
+                                ('JULD_LOCATION', 'Julian day (UTC) of the location relative to REFERENCE_DATE_TIME')]:
+            ds[name] = xr.DataArray(juld, dims=('N_PROF',),
+                                    attrs={'long_name': long_name, 'standard_name': 'time',
+                                           'units': 'days since 1950-01-01 00:00:00 UTC',
+                                           'conventions': 'Relative julian days with decimal part (as parts of day)',
+                                           'resolution': 1e-05, 'axis': 'T'})
+            ds[name].encoding['_FillValue'] = 999999.0
+        per_prof('JULD_QC', '1', 1, long_name='Quality on date and time', conventions='Argo reference table 2')
+        ds['LATITUDE'] = xr.DataArray(table['latitude'].values, dims=('N_PROF',),
+                                      attrs={'long_name': 'Latitude of the station, best estimate',
+                                             'standard_name': 'latitude', 'units': 'degree_north', 'axis': 'Y'})
+        ds['LONGITUDE'] = xr.DataArray(table['longitude'].values, dims=('N_PROF',),
+                                       attrs={'long_name': 'Longitude of the station, best estimate',
+                                              'standard_name': 'longitude', 'units': 'degree_east', 'axis': 'X'})
+        for name in ['LATITUDE', 'LONGITUDE']:
+            ds[name].encoding['_FillValue'] = 99999.0
+        per_prof('POSITION_QC', '1', 1, long_name='Quality on position (latitude and longitude)',
+                 conventions='Argo reference table 2')
+        per_prof('POSITIONING_SYSTEM', 'GPS', 8, long_name='Positioning system')
+        if kind != 'S':
+            per_prof('VERTICAL_SAMPLING_SCHEME', 'Primary sampling: averaged', 256,
+                     long_name='Vertical sampling scheme', conventions='Argo reference table 16')
+        ds['CONFIG_MISSION_NUMBER'] = xr.DataArray(np.ones(n_prof, dtype=np.int32), dims=('N_PROF',),
+                                                   attrs={'long_name': 'Unique number denoting the missions '
+                                                                       'performed by the float',
+                                                          'conventions': '1...N, 1 : first complete mission'})
+
+        rng = np.random.default_rng([self.seed, int(wmo), len(kind)])
+        for param in params:
+            values = data[param]
+            valid = np.isfinite(values)
+            qc = np.where(rng.random(values.shape) < 0.95, '1', np.where(rng.random(values.shape) < 0.5, '3', '4'))
+            qc = np.where(valid, qc, ' ')
+            # Profile QC, 'A' if all levels are good:
+            good = np.sum(valid & (qc == '1'), axis=1) / np.maximum(1, np.sum(valid, axis=1))
+            per_prof('PROFILE_%s_QC' % param, np.where(good == 1, 'A', np.where(good >= 0.75, 'B', 'C')), 1,
+                     long_name='Global quality flag of %s profile' % param, conventions='Argo reference table 2a')
+
+            mode = ds['PARAMETER_DATA_MODE'].values[:, params.index(param)].astype(str) if kind != 'core' \
+                else table['data_mode'].values
+            adjusted = np.where((mode == 'R')[:, np.newaxis], np.nan, values + np.float32(0.001))
+            error = np.where(np.isfinite(adjusted), np.float32(0.01), np.nan)
+            fields = {param: (values, qc), '%s_ADJUSTED' % param: (adjusted, np.where(np.isfinite(adjusted), qc, ' '))}
+            if kind == 'B' and param == 'PRES':
+                fields = {param: (values, qc)}
+            for name, (v, q) in fields.items():
+                ds[name] = xr.DataArray(v.astype(np.float32), dims=('N_PROF', 'N_LEVELS'),
+                                        attrs={'long_name': param, 'units': _UNITS[param]})
+                ds[name].encoding['_FillValue'] = np.float32(99999.0)
+                ds['%s_QC' % name] = xr.DataArray(q.astype('S1'), dims=('N_PROF', 'N_LEVELS'),
+                                                  attrs={'long_name': 'quality flag',
+                                                         'conventions': 'Argo reference table 2'})
+                if kind == 'S' and param != 'PRES' and name == param:
+                    ds['%s_dPRES' % param] = xr.DataArray(np.where(valid, 0, np.nan).astype(np.float32),
+                                                          dims=('N_PROF', 'N_LEVELS'),
+                                                          attrs={'long_name': '%s pressure displacement from '
+                                                                              'original sampled value' % param,
+                                                                 'units': 'decibar'})
+                    ds['%s_dPRES' % param].encoding['_FillValue'] = np.float32(99999.0)
+            if '%s_ADJUSTED' % param in ds:
+                ds['%s_ADJUSTED_ERROR' % param] = xr.DataArray(
+                    error.astype(np.float32), dims=('N_PROF', 'N_LEVELS'),
+                    attrs={'long_name': 'Contains the error on the adjusted values as determined by the delayed '
+                                        'mode QC process', 'units': _UNITS[param]})
+                ds['%s_ADJUSTED_ERROR' % param].encoding['_FillValue'] = np.float32(99999.0)
+        return ds
+
+    def _meta_dataset(self, flt: pd.Series, params: list) -> xr.Dataset:
+        """ Create a float meta-data dataset, with raw netcdf variables """
+        ds = xr.Dataset(attrs={'title': 'Argo float metadata file',
+                               'institution': flt['dac'].upper(),
+                               'source': 'Argo float',
+                               'history': '%s creation' % _datestr(_LAST_DATE).iloc[0],
+                               'references': 'http://www.argodatamgt.org/Documentation',
+                               'user_manual_version': '3.1',
+                               'Conventions': 'Argo-3.1 CF-1.6',
+                               'comment': 'Synthetic data created with argopy.tutorial.synthetic_gdac'})
+
+        def char(name, value, n, **attrs):
+            ds[name] = xr.DataArray(_chars(value, n), dims=('STRING%i' % n,), attrs=attrs)
+
+        char('DATA_TYPE', 'Argo meta-data', 16, long_name='Data type', conventions='Argo reference table 1')
+        char('FORMAT_VERSION', '3.1', 4, long_name='File format version')
+        char('HANDBOOK_VERSION', '1.2', 4, long_name='Data handbook version')
+        ds['DATE_CREATION'] = xr.DataArray(_chars(_datestr(flt['launch_date']).iloc[0], 14), dims=('DATE_TIME',),
+                                           attrs={'long_name': 'Date of file creation',
+                                                  'conventions': 'YYYYMMDDHHMISS'})
+        ds['DATE_UPDATE'] = xr.DataArray(_chars(_datestr(_LAST_DATE).iloc[0], 14), dims=('DATE_TIME',),
+                                         attrs={'long_name': 'Date of update of this file',
+                                                'conventions': 'YYYYMMDDHHMISS'})
+        char('PLATFORM_NUMBER', str(flt['wmo']), 8, long_name='Float unique identifier',
+             conventions='WMO float identifier : A9IIIII')
+        char('PTT', 'n/a', 256, long_name='Transmission identifier (ARGOS, ORBCOMM, etc.)')
+        char('PLATFORM_FAMILY', 'FLOAT', 256, long_name='Category of instrument', conventions='Argo reference table 22')
+        char('PLATFORM_TYPE', 'PROVOR_III' if flt['bgc'] else 'ARVOR', 32, long_name='Type of float',
+             conventions='Argo reference table 23')
+        char('PLATFORM_MAKER', 'NKE', 256, long_name='Name of the manufacturer', conventions='Argo reference table 24')
+        char('FLOAT_SERIAL_NO', 'SYN%i' % flt['wmo'], 32, long_name='Serial number of the float')
+        char('WMO_INST_TYPE', str(flt['profiler_type']), 4, long_name='Coded instrument type',
+             conventions='Argo reference table 8')
+        char('PROJECT_NAME', 'ARGOPY SYNTHETIC', 64, long_name='Program under which the float was deployed')
+        char('DATA_CENTRE', flt['institution'], 2, long_name='Data centre in charge of float real-time processing',
+             conventions='Argo reference table 4')
+        char('PI_NAME', 'ARGOPY', 64, long_name='Name of the principal investigator')
+        ds['LAUNCH_DATE'] = xr.DataArray(_chars(_datestr(flt['launch_date']).iloc[0], 14), dims=('DATE_TIME',),
+                                         attrs={'long_name': 'Date (UTC) of the deployment',
+                                                'conventions': 'YYYYMMDDHHMISS'})
+        ds['LAUNCH_LATITUDE'] = xr.DataArray(flt['launch_latitude'], attrs={
+            'long_name': 'Latitude of the float when deployed', 'units': 'degree_north'})
+        ds['LAUNCH_LONGITUDE'] = xr.DataArray(flt['launch_longitude'], attrs={
+            'long_name': 'Longitude of the float when deployed', 'units': 'degree_east'})
+        ds['LAUNCH_QC'] = xr.DataArray(np.array('1', dtype='S1'), attrs={
+            'long_name': 'Quality on launch date, time and location', 'conventions': 'Argo reference table 2'})
+        ds['SENSOR'] = xr.DataArray(_chars([_SENSORS[p] for p in params], 32), dims=('N_SENSOR', 'STRING32'),
+                                    attrs={'long_name': 'Name of the sensor mounted on the float',
+                                           'conventions': 'Argo reference table 25'})
+        ds['SENSOR_MAKER'] = xr.DataArray(_chars(['SBE' if p in _CORE_PARAMETERS else 'ARGOPY' for p in params], 256),
+                                          dims=('N_SENSOR', 'STRING256'),
+                                          attrs={'long_name': 'Name of the sensor manufacturer',
+                                                 'conventions': 'Argo reference table 26'})
+        ds['PARAMETER'] = xr.DataArray(_chars(params, 64), dims=('N_PARAM', 'STRING64'), attrs={
+            'long_name': 'Name of parameter computed from float measurements',
+            'conventions': 'Argo reference table 3'})
+        ds['PARAMETER_UNITS'] = xr.DataArray(_chars([_UNITS[p] for p in params], 32), dims=('N_PARAM', 'STRING32'),
+                                             attrs={'long_name': 'Units of accuracy and resolution of the parameter'})
+        return ds
+
+    def write_float(self, wmo: int) -> list:
+        """ Write netcdf files of a float in the GDAC folder
+
+        Returns
+        -------
+        list(str)
+            List of paths to files written
+        """
+        flt = self.floats[self.floats['wmo'] == wmo].iloc[0]
+        table = self.table[self.table['wmo'] == wmo].reset_index(drop=True)
+        bgc_params = [p for p in _BGC_PARAMETERS if flt[p]]
+        rng = np.random.default_rng([self.seed, wmo])
+        data = self._levels(table, _CORE_PARAMETERS + bgc_params, rng)
+
+        folder = Path(self.localpath).joinpath('dac', flt['dac'], str(wmo))
+        folder.joinpath('profiles').mkdir(parents=True, exist_ok=True)
+        written = []
+
+        def write(ds, fname):
+            f = str(folder.joinpath(fname))
+            _to_netcdf(ds, f)
+            written.append(f)
+
+        write(self._meta_dataset(flt, _CORE_PARAMETERS + bgc_params), '%i_meta.nc' % wmo)
+
+        kinds = [('core', 'core', _CORE_PARAMETERS, '%i_prof.nc' % wmo)]
+        if flt['bgc']:
+            kinds.append(('S', 'bgc-s', _CORE_PARAMETERS + bgc_params, '%i_Sprof.nc' % wmo))
+            kinds.append(('B', 'bgc-b', ['PRES'] + bgc_params, None))
+        for kind, convention, params, fname in kinds:
+            ds = self._profile_dataset(table, params, data, kind)
+            if fname is not None:
+                write(ds, fname)
+            if self.profiles:
+                for i, f in enumerate(self._files(table, convention)):
+                    this = ds.isel(N_PROF=[i], N_LEVELS=slice(0, table['n_levels'].iloc[i]))
+                    write(this, 'profiles/%s' % os.path.basename(f))
+        return written
+
+    def build(self, overwrite: bool = False) -> str:
+        """ Create the synthetic GDAC folder
+
+        Parameters
+        ----------
+        overwrite: bool, default: False
+            Delete and create again an existing folder
+
+        Returns
+        -------
+        str
+            Path to the GDAC folder
+        """
+        if os.path.isdir(self.localpath):
+            if overwrite:
+                shutil.rmtree(self.localpath)
+            else:
+                return self.rootpath
+        os.makedirs(self.localpath)
+        for convention in _INDEX_FILES:
+            self.write_index(convention)
+        if self.files:
+            for wmo in self.wmo:
+                self.write_float(wmo)
+        return self.rootpath
@@ -37,6 +37,7 @@
 from .caching import clear_cache, lscache
 from .monitored_threadpool import MyThreadPoolExecutor as MonitoredThreadPoolExecutor
 from .chunking import Chunker
+from .instrumentation import instrument, global_instrument
 from .accessories import Registry, float_wmo, ListStrProperty
 from .locals import (  # noqa: F401
     show_versions,
@@ -59,6 +60,7 @@
 from .transformers import (
     fill_variables_not_in_all_datasets,
     drop_variables_not_in_all_datasets,
+    concat_datasets,
     merge_param_with_param_adjusted,
     filter_param_by_data_mode,
     split_data_mode,
@@ -119,6 +121,8 @@
     # Computation and performances:
     "MonitoredThreadPoolExecutor",
     "Chunker",
+    "instrument",
+    "global_instrument",
     # Accessories classes (specific objects):
     "Registry",
     "float_wmo",
@@ -144,6 +148,7 @@
     # Transform datasets:
     "fill_variables_not_in_all_datasets",
     "drop_variables_not_in_all_datasets",
+    "concat_datasets",
     "merge_param_with_param_adjusted",
     "filter_param_by_data_mode",
     "split_data_mode",
@@ -7,7 +7,10 @@
 import json
 import logging
 from copy import deepcopy
-from typing import Any
+from functools import lru_cache
+from typing import Any, Union
+
+from .instrumentation import span
 
 
 log = logging.getLogger("argopy.utils.casting")
@@ -20,9 +23,252 @@
     DATA_TYPES = json.load(f)
 
 
+CAST_INT_CONVENTIONS = frozenset(
+    [
+        "Argo reference table 19",
+        "Argo reference table 21",
+        "WMO float identifier : A9IIIII",
+        "1...N, 1 : first complete mission",
+    ]
+)
+"""Conventions of integer variables where missing values must be replaced before casting"""
+
+_STR_VARS = frozenset(DATA_TYPES["data"]["str"])
+_INT_VARS = frozenset(DATA_TYPES["data"]["int"])
+_DATETIME_VARS = frozenset(DATA_TYPES["data"]["datetime"])
+
+
+@lru_cache(maxsize=None)
+def cast_plan(v: str, dtype: str, conventions: str = None, convention: str = None) -> tuple:
+    """Return the sequence of casting steps to apply to an Argo variable
+
+    The plan only depends on the variable name, dtype and conventions attribute, so it is computed once and cached.
+
+    Parameters
+    ----------
+    v: str
+        Variable name
+    dtype: str
+        Variable dtype, as given by :attr:`numpy.dtype.str`
+    conventions: str, optional
+        Value of the variable ``conventions`` attribute
+    convention: str, optional
+        Value of the variable ``convention`` attribute
+
+    Returns
+    -------
+    tuple of str
+    """
+    is_object = dtype == np.dtype("O").str
+    steps = []
+
+    if v in _STR_VARS and is_object:
+        steps.append("str")
+
+    if v in _INT_VARS:
+        conv = conventions if conventions is not None else convention
+        steps.append("int_fill" if conv in CAST_INT_CONVENTIONS else "int")
+
+    if v in _DATETIME_VARS and is_object:
+        if conventions == "YYYYMMDDHHMISS":
+            steps.append("datetime")
+        elif conventions == "ISO8601":
+            steps.append("iso8601")
+        elif v == "SCIENTIFIC_CALIB_DATE":
+            steps.append("calib_date")
+
+    if "QC" in v and "PROFILE" not in v and "QCTEST" not in v:
+        steps.append("qc")
+
+    if "DATA_MODE" in v:
+        steps.append("data_mode")
+
+    return tuple(steps)
+
+
+def _str_codes(val: np.ndarray) -> np.ndarray:
+    """Return unicode code points of a fixed width string array, with a trailing dimension for characters"""
+    width = val.dtype.itemsize // 4
+    return val.view(np.uint32).reshape(val.shape + (width,))
+
+
+def _to_str(val: np.ndarray) -> np.ndarray:
+    """Convert an array of objects, str or bytes to a fixed width string array"""
+    if val.dtype.kind == "O" and val.size > 0 and isinstance(val.flat[0], bytes):
+        val = val.astype(bytes)
+    return val.astype(str)
+
+
+def parse_int_strings(val: np.ndarray, fillvalue: int = None) -> Union[np.ndarray, None]:
+    """Vectorized parsing of an array of strings with integer values
+
+    Characters are parsed from their unicode code points, without going through one Python ``int`` call per value.
+
+    Parameters
+    ----------
+    val: :class:`numpy.ndarray`
+        Array of strings, possibly with leading or trailing blanks
+    fillvalue: int, optional
+        Value to use for 'nan' strings
+
+    Returns
+    -------
+    :class:`numpy.ndarray` of int, or None if some values can't be parsed this way.
+    """
+    val = _to_str(np.asarray(val))
+    if val.size == 0 or val.dtype.itemsize == 0 or val.dtype.itemsize // 4 > 18:
+        return None
+
+    codes = _str_codes(val)
+    is_digit = (codes >= 48) & (codes <= 57)
+    is_blank = (codes == 0) | (codes == 32)
+    is_nan = val == "nan"
+
+    # Digits must make a single run, surrounded by blanks:
+    runs = is_digit[..., 0].astype(int) + np.sum(
+        is_digit[..., 1:] & ~is_digit[..., :-1], axis=-1
+    )
+    valid = np.all(is_digit | is_blank, axis=-1) & (runs == 1)
+    if fillvalue is not None:
+        valid |= is_nan
+    if not np.all(valid):
+        return None
+
+    exponents = np.cumsum(is_digit[..., ::-1], axis=-1)[..., ::-1] - 1
+    digits = np.where(is_digit, codes.astype(np.int64) - 48, 0)
+    result = np.sum(digits * 10 ** np.clip(exponents, 0, None), axis=-1)
+    if fillvalue is not None:
+        result[is_nan] = fillvalue
+    return result.astype(int)
+
+
+def _cast_str(val):
+    try:
+        return _to_str(val)
+    except UnicodeDecodeError:
+        return np.char.decode(val.astype(bytes), encoding="unicode_escape").astype(str)
+
+
+def _cast_str_objects(val):
+    # Lazy version of _cast_str: the width of strings is not known before compute, so we keep objects
+    return _cast_str(val).astype(object)
+
+
+def _cast_int_fill(val):
+    # Some values may be missing, and the _FillValue=" " cannot be casted as an integer.
+    # so, we replace missing values with a 999:
+    if val.dtype.kind == "f":
+        return np.where(np.isnan(val), 999, val).astype(int)
+    if val.dtype.kind in "OUS":
+        result = parse_int_strings(val, fillvalue=999)
+        if result is not None:
+            return result
+        val = _to_str(val)
+        val[val == "nan"] = "999"
+    return val.astype(float).astype(int)
+
+
+def _cast_int(val):
+    return val.astype(float).astype(int)
+
+
+def _cast_datetime(val):
+    if val.size == 0:
+        return val.astype("datetime64[ns]")
+    shape = val.shape
+    val = _to_str(val).astype("U14").ravel()
+    # This should not happen, but still ! That's real world data
+    val[val == "              "] = "nan"
+    val = pd.to_datetime(val, format="%Y%m%d%H%M%S")
+    return np.asarray(val, dtype="datetime64[ns]").reshape(shape)
+
+
+def _cast_iso8601(val):
+    shape = val.shape
+    val = pd.to_datetime(val.ravel(), utc=True).tz_localize(None)
+    return np.asarray(val, dtype="datetime64[ns]").reshape(shape)
+
+
+def _cast_calib_date(val):
+    shape = val.shape
+    val = pd.to_datetime(_to_str(val).ravel(), format="%Y%m%d%H%M%S")
+    return np.asarray(val, dtype="datetime64[ns]").reshape(shape)
+
+
+def _cast_qc(val):
+    # Address weird string values:
+    # (replace missing or nan values by fillvalue that will be cast as an integer later
+    fillvalue = "9"
+
+    if val.dtype.kind == "O":  # convert object to string
+        val = _to_str(val)
+
+    if val.dtype.kind == "f":
+        return np.where(np.isnan(val), int(fillvalue), val).astype(int)
+
+    if val.dtype == "<U3":  # string, len 3 because of a 'nan' somewhere
+        val = np.where((val == "   ") | (val == "nan"), fillvalue, val).astype("U1")
+
+    if val.dtype == "<U1":  # string
+        # Empty, blank or 'n' values should not happen, but still ! That's real world data
+        codes = _str_codes(val)[..., 0]
+        is_fill = (codes == 0) | (codes == 32) | (codes == 110)
+        is_digit = (codes >= 48) & (codes <= 57)
+        if np.all(is_digit | is_fill):
+            return np.where(is_fill, int(fillvalue), codes.astype(np.int64) - 48).astype(int)
+        val = np.where(is_fill, fillvalue, val)
+
+    # finally convert QC strings to integers:
+    try:
+        return val.astype(int)
+    except Exception:
+        return val
+
+
+def _cast_data_mode(val):
+    return val.astype("<U1")
+
+
+CAST_STEPS = {
+    "str": _cast_str,
+    "int_fill": _cast_int_fill,
+    "int": _cast_int,
+    "datetime": _cast_datetime,
+    "iso8601": _cast_iso8601,
+    "calib_date": _cast_calib_date,
+    "qc": _cast_qc,
+    "data_mode": _cast_data_mode,
+}
+"""Casting steps: functions applied on :class:`numpy.ndarray` values"""
+
+LAZY_CAST_STEPS = {
+    "str": (_cast_str_objects, object),
+    "int_fill": (_cast_int_fill, int),
+    "int": (_cast_int, int),
+    "datetime": (_cast_datetime, "datetime64[ns]"),
+    "iso8601": (_cast_iso8601, "datetime64[ns]"),
+    "calib_date": (_cast_calib_date, "datetime64[ns]"),
+    "qc": (_cast_qc, int),
+    "data_mode": (_cast_data_mode, "<U1"),
+}
+"""Casting steps for dask arrays: functions applied on each chunk, and output dtype"""
+
+
+def _cast_block(val, plan=()):
+    """Apply a casting plan to a chunk of values, used with :meth:`dask.array.Array.map_blocks`"""
+    for step in plan:
+        val = LAZY_CAST_STEPS[step][0](val)
+    return val
+
+
 def cast_Argo_variable_type(ds: xr.Dataset, overwrite=True) -> xr.Dataset:
     """Ensure that all dataset variables are of the appropriate types according to Argo references
 
+    Casting steps to apply on each variable are given by :meth:`cast_plan`.
+
+    For dask-backed variables, casting is applied lazily with :meth:`dask.array.Array.map_blocks`. In this case, errors
+    are raised on compute rather than ignored, and string variables are kept as arrays of :class:`str` objects.
+
     Parameter
     ---------
     :class:`xarray.DataSet`
@@ -34,174 +280,71 @@ def cast_Argo_variable_type(ds: xr.Dataset, overwrite=True) -> xr.Dataset:
     :class:`xarray.DataSet`
     """
 
-    def cast_this(da, type, exception_to_raise=None):
-        """Low-level casting of DataArray values"""
+    def cast_this(val, v, step):
+        """Low-level casting of values, return values unchanged if casting failed"""
         try:
-            da = da.astype(type)
-            da.attrs["casted"] = 1
-        except Exception as e:
-            if exception_to_raise is not None:
-                if isinstance(e, exception_to_raise):
-                    raise
-            else:
-                msg = ["Oops! %s occurred" % sys.exc_info()[0]]
-                msg.append(
-                    "Fail to cast %s[%s] from '%s' to %s"
-                    % (da.name, da.dims, da.dtype, type)
+            return CAST_STEPS[step](val), True
+        except Exception:
+            msg = ["Oops! %s occurred" % sys.exc_info()[0]]
+            msg.append(
+                "Fail to cast %s with '%s' from '%s'" % (v, step, val.dtype)
+            )
+            log.debug("\n".join(msg))
+            return val, False
+
+    def cast_this_var(var, v):
+        """Cast any Argo variable"""
+        plan = cast_plan(
+            v,
+            var.dtype.str,
+            var.attrs.get("conventions", None),
+            var.attrs.get("convention", None),
+        )
+        casted = False
+
+        if plan and var.chunks is not None:
+            dtype = LAZY_CAST_STEPS[plan[-1]][1]
+            var = var.copy(
+                data=var.data.map_blocks(_cast_block, plan=plan, dtype=dtype),
+                deep=False,
+            )
+            casted = True
+
+        elif plan:
+            val = var.values
+            for step in plan:
+                val, ok = cast_this(val, v, step)
+                casted = casted or ok
+            var = var.copy(data=val, deep=False)
+
+        var.attrs = deepcopy(var.attrs)
+        var.attrs["casted"] = int(casted or var.dtype != "O")
+        return var
+
+    with span("cast", ds.encoding.get("source", "")):
+        casted_vars = {}
+        for v, var in ds.variables.items():
+            if (
+                overwrite
+                or ("casted" in var.attrs and var.attrs["casted"] == 0)
+                or (
+                    not overwrite
+                    and "casted" in var.attrs
+                    and var.attrs["casted"] == 1
+                    and var.dtype == "O"
                 )
+            ):
                 try:
-                    msg.append("Unique values:", np.unique(da))
+                    casted_vars[v] = cast_this_var(var, v)
                 except Exception:
-                    msg.append("Can't read unique values !")
-                    pass
-                log.debug("\n".join(msg))
-        return da
-
-    def cast_this_da(da, v):
-        """Cast any Argo DataArray"""
-        # print("Casting %s ..." % da.name)
-        da.attrs["casted"] = 0
-
-        if v in DATA_TYPES["data"]["str"] and da.dtype == "O":  # Object
-            try:
-                da = cast_this(da, str, exception_to_raise=UnicodeDecodeError)
-            except UnicodeDecodeError:
-                da = da.str.decode(encoding="unicode_escape")
-                da = cast_this(da, str)
-
-        if v in DATA_TYPES["data"]["int"]:  # and da.dtype == 'O':  # Object
-            if "conventions" in da.attrs:
-                convname = "conventions"
-            elif "convention" in da.attrs:
-                convname = "convention"
-            else:
-                convname = None
-            if convname in da.attrs and da.attrs[convname] in [
-                "Argo reference table 19",
-                "Argo reference table 21",
-                "WMO float identifier : A9IIIII",
-                "1...N, 1 : first complete mission",
-            ]:
-                # Some values may be missing, and the _FillValue=" " cannot be casted as an integer.
-                # so, we replace missing values with a 999:
-                val = da.astype(str).values
-                # val[np.where(val == 'nan')] = '999'
-                val[val == "nan"] = "999"
-                da.values = val
-            da = cast_this(da, float)
-            da = cast_this(da, int)
-
-        if v in DATA_TYPES["data"]["datetime"] and da.dtype == "O":  # Object
-            if (
-                "conventions" in da.attrs
-                and da.attrs["conventions"] == "YYYYMMDDHHMISS"
-            ):
-                if da.size != 0:
-                    if len(da.dims) <= 1:
-                        val = da.astype(str).values.astype("U14")
-                        # This should not happen, but still ! That's real world data
-                        val[val == "              "] = "nan"
-                        da.values = pd.to_datetime(val, format="%Y%m%d%H%M%S")
-                    else:
-                        s = da.stack(dummy_index=da.dims)
-                        val = s.astype(str).values.astype("U14")
-                        # This should not happen, but still ! That's real world data
-                        val[val == "              "] = "nan"
-                        s.values = pd.to_datetime(val, format="%Y%m%d%H%M%S")
-                        da.values = s.unstack("dummy_index")
-                    da = cast_this(da, "datetime64[ns]")
-                else:
-                    da = cast_this(da, "datetime64[ns]")
-
-            elif "conventions" in da.attrs and da.attrs["conventions"] == "ISO8601":
-                da.values = pd.to_datetime(da.values, utc=True)
-                da = cast_this(da, "datetime64[ns]")
-
-            elif v == "SCIENTIFIC_CALIB_DATE":
-                da = cast_this(da, str)
-                s = da.stack(dummy_index=da.dims)
-                s.values = pd.to_datetime(s.values, format="%Y%m%d%H%M%S")
-                da.values = (s.unstack("dummy_index")).values
-                da = cast_this(da, "datetime64[ns]")
-
-        if "QC" in v and "PROFILE" not in v and "QCTEST" not in v:
-            if da.dtype == "O":  # convert object to string
-                da = cast_this(da, str)
-
-            # Address weird string values:
-            # (replace missing or nan values by fillvalue that will be cast as an integer later
-            fillvalue = "9"
-            if da.dtype == float:
-                val = da.astype(str).values
-                val[np.where(val == "nan")] = fillvalue
-                da.values = val
-                da = cast_this(da, float)
-
-            if da.dtype == "<U3":  # string, len 3 because of a 'nan' somewhere
-                ii = (
-                    da == "   "
-                )  # This should not happen, but still ! That's real world data
-                da = xr.where(ii, fillvalue, da)
-
-                ii = (
-                    da == "nan"
-                )  # This should not happen, but still ! That's real world data
-                da = xr.where(ii, fillvalue, da)
-
-                # Get back to regular U1 string
-                da = cast_this(da, np.dtype("U1"))
-
-            if da.dtype == "<U1":  # string
-                ii = (
-                    da == ""
-                )  # This should not happen, but still ! That's real world data
-                da = xr.where(ii, fillvalue, da)
-
-                ii = (
-                    da == " "
-                )  # This should not happen, but still ! That's real world data
-                da = xr.where(ii, fillvalue, da)
-
-                ii = (
-                    da == "n"
-                )  # This should not happen, but still ! That's real world data
-                da = xr.where(ii, fillvalue, da)
-
-            # finally convert QC strings to integers:
-            da = cast_this(da, int)
-
-        if "DATA_MODE" in v:
-            da = cast_this(da, "<U1")
-
-        if da.dtype != "O":
-            da.attrs["casted"] = 1
-
-        return da
-
-    for v in ds.variables:
-        if (
-            overwrite
-            or ("casted" in ds[v].attrs and ds[v].attrs["casted"] == 0)
-            or (
-                not overwrite
-                and "casted" in ds[v].attrs
-                and ds[v].attrs["casted"] == 1
-                and ds[v].dtype == "O"
-            )
-        ):
-            try:
-                attrs = deepcopy(ds[v].attrs)
-                encoding = deepcopy(ds[v].encoding)
-                ds[v] = cast_this_da(ds[v], v)
-                casted_result = ds[v].attrs["casted"]
-                ds[v].attrs = attrs
-                ds[v].attrs.update({"casted": casted_result})
-                ds[v].encoding = encoding
-            except Exception:
-                print("Oops!", sys.exc_info()[0], "occurred.")
-                print("Fail to cast: %s " % v)
-                print("Encountered unique values:", np.unique(ds[v]))
-                raise
+                    print("Oops!", sys.exc_info()[0], "occurred.")
+                    print("Fail to cast: %s " % v)
+                    print("Encountered unique values:", np.unique(var.values))
+                    raise
+
+        # Update the dataset in place, all at once:
+        if len(casted_vars) > 0:
+            ds.update(casted_vars)
 
     return ds
 
@@ -1,5 +1,6 @@
 import numpy as np
 import pandas as pd
+import warnings
 from functools import reduce
 from ..errors import InvalidFetcherAccessPoint
 from .checkers import is_box
@@ -26,7 +27,12 @@ class Chunker:
         "wmo": {"wmo": 5, "cyc": 100},  # Nb of floats
     }  # Nb of cycles
 
-    def __init__(self, request: dict, chunks: str = "auto", chunksize: dict = {}):
+    # Default target number of profiles per chunk, used with 'balanced' chunks
+    default_profiles = 2000
+
+    def __init__(
+        self, request: dict, chunks: str = "auto", chunksize: dict = {}, index=None
+    ):
         """Create a request Chunker
 
         Allow to easily split an access point request into chunks
@@ -39,18 +45,30 @@ def __init__(self, request: dict, chunks: str = "auto", chunksize: dict = {}):
             - {'box': [lon_min, lon_max, lat_min, lat_max, dpt_min, dpt_max, time_min, time_max]}
             - {'box': [lon_min, lon_max, lat_min, lat_max, dpt_min, dpt_max]}
             - {'wmo': [wmo1, wmo2, ...], 'cyc': [0,1, ...]}
-        chunks: 'auto' or dict
+        chunks: 'auto', 'balanced' or dict
             Dictionary with request access point as keys and number of chunks to create as values.
 
             Eg: {'wmo':10} will create a maximum of 10 chunks along WMOs.
+
+            With 'balanced', chunks are defined from the number of profiles in the request, as given by ``index``.
+            A box is split recursively, at the median position of its profiles along its longest dimension (k-d
+            tree style), and a list of WMOs is split into groups of consecutive floats, until each chunk holds
+            about ``chunksize['profiles']`` profiles.
         chunksize: dict, optional
             Dictionary with request access point as keys and chunk size as values (used as maximum values in
             'auto' chunking).
 
             Eg: {'wmo': 5} will create chunks with as many as 5 WMOs each.
 
+            With 'balanced' chunks, the ``profiles`` key sets the target number of profiles per chunk (2000 by
+            default), and other keys are only used if explicitly set, as maximum chunk sizes.
+        index: :class:`ArgoIndex` or :class:`pandas.DataFrame`, optional
+            Index of profiles to use with 'balanced' chunks. A :class:`pandas.DataFrame` must have the
+            ``longitude``, ``latitude``, ``date`` and ``wmo`` columns of :meth:`ArgoIndex.to_dataframe`.
+
         """
         self.request = request
+        self.index = index
 
         if "box" in self.request:
             is_box(self.request["box"])
@@ -66,16 +84,28 @@ def __init__(self, request: dict, chunks: str = "auto", chunksize: dict = {}):
             )
 
         default = self.default_chunksize[[k for k in self.request.keys()][0]]
+        explicit = []  # Chunk sizes explicitly set by users
         if len(chunksize) == 0:  # chunksize = {}
             chunksize = default
         if not isinstance(chunksize, collectionsAbc.Mapping):
             raise ValueError("chunksize must be mappable")
         else:  # merge with default:
+            chunksize = dict(chunksize)
+            self.max_profiles = chunksize.pop("profiles", self.default_profiles)
+            if len(chunksize) > 0 and chunksize != default:
+                explicit = list(chunksize.keys())
             chunksize = {**default, **chunksize}
         self.chunksize = collections.OrderedDict(sorted(chunksize.items()))
 
         default = {k: "auto" for k in self.chunksize.keys()}
-        if chunks == "auto":  # auto for all
+        if chunks == "balanced":
+            if self.index is None:
+                raise ValueError("'balanced' chunks require an index of profiles")
+            self.balanced_chunker = self.this_chunker
+            self.this_chunker = self._chunker_balanced
+            # Maximum chunk sizes are only applied if explicitly set:
+            chunks = {k: "auto" if k in explicit else 1 for k in default}
+        elif chunks == "auto":  # auto for all
             chunks = default
         elif len(chunks) == 0:  # chunks = {}, i.e. chunk=1 for all
             chunks = {k: 1 for k in self.request}
@@ -271,6 +301,128 @@ def _chunker_wmo(self, request, chunks, chunks_maxsize):
         n_chunks["wmo"] = len(wmo_grps)
         return {"chunks": sorted(n_chunks), "values": wmo_grps}
 
+    def _index_profiles(self) -> pd.DataFrame:
+        """Return a :class:`pandas.DataFrame` with profiles from the index matching the request"""
+        if isinstance(self.index, pd.DataFrame):
+            df = self.index
+        else:
+            from ..errors import DataNotFound
+
+            idx = self.index.copy(deep=True)
+            try:
+                if "box" in self.request:
+                    BOX = self.request["box"]
+                    if len(BOX) == 8:
+                        idx.query.box([BOX[ii] for ii in [0, 1, 2, 3, 6, 7]])
+                    else:
+                        idx.query.lon_lat(BOX[0:4])
+                else:
+                    idx.query.wmo(self.request["wmo"])
+                with warnings.catch_warnings():
+                    warnings.simplefilter("ignore", FutureWarning)
+                    df = idx.to_dataframe(completed=False)
+            except DataNotFound:
+                df = pd.DataFrame(columns=["date", "latitude", "longitude", "wmo"])
+
+        if "box" in self.request:
+            BOX = self.request["box"]
+            mask = (
+                (df["longitude"] >= BOX[0])
+                & (df["longitude"] <= BOX[1])
+                & (df["latitude"] >= BOX[2])
+                & (df["latitude"] <= BOX[3])
+            )
+            if len(BOX) == 8:
+                # Time bounds have a 1 second resolution:
+                dates = pd.to_datetime(df["date"]).dt.floor("s")
+                mask &= (dates >= pd.to_datetime(BOX[6])) & (dates <= pd.to_datetime(BOX[7]))
+            df = df[mask]
+        else:
+            df = df[df["wmo"].isin([int(wmo) for wmo in self.request["wmo"]])]
+        return df
+
+    def _split_kd(self, box, X: np.ndarray, scales: np.ndarray) -> list:
+        """Recursively split a box at the median position of profiles along its longest dimension
+
+        Parameters
+        ----------
+        box: list
+            Box to split
+        X: :class:`numpy.ndarray`
+            Array of shape (n_profiles, n_dims) with profiles coordinates along each dimension (lon, lat and
+            possibly time).
+        scales: :class:`numpy.ndarray`
+            Size of each dimension, used to compare extent of profiles along dimensions.
+        """
+        if X.shape[0] <= self.max_profiles:
+            return [box]
+
+        # Try dimensions from the longest to the shortest extent of profiles:
+        extent = (np.max(X, axis=0) - np.min(X, axis=0)) / scales
+        for d in np.argsort(-extent):
+            x = np.sort(X[:, d])
+            # Split between 2 distinct values around the median, so that no profile lands in 2 chunks:
+            gaps = np.flatnonzero(np.diff(x) > 0)
+            if len(gaps) == 0:
+                continue
+            i = gaps[np.argmin(np.abs(gaps - (len(x) // 2 - 1)))]
+            split = (x[i] + x[i + 1]) / 2
+
+            left, right = box.copy(), box.copy()
+            if d < 2:
+                i_left, i_right = [(0, 1), (2, 3)][d]
+                left[i_right], right[i_left] = float(split), float(split)
+            else:
+                # Time constraints are inclusive and at 1 second resolution, so bound chunks with the dates of
+                # their own profiles around the split, not with the split itself.
+                # Use the same format for all time bounds (as in _split_box):
+                left[6] = pd.to_datetime(box[6]).strftime("%Y%m%d%H%M%S")
+                right[7] = pd.to_datetime(box[7]).strftime("%Y%m%d%H%M%S")
+                left[7] = pd.to_datetime(x[i], unit="s").strftime("%Y%m%d%H%M%S")
+                right[6] = pd.to_datetime(x[i + 1], unit="s").strftime("%Y%m%d%H%M%S")
+            mask = X[:, d] < split
+            return self._split_kd(left, X[mask], scales) + self._split_kd(
+                right, X[~mask], scales
+            )
+
+        return [box]  # All profiles at the same position, can't split
+
+    def _chunker_balanced(self, request, chunks, chunks_maxsize):
+        df = self._index_profiles()
+
+        if "box" in request:
+            BOX = request["box"]
+            X = [df["longitude"].to_numpy(dtype=float), df["latitude"].to_numpy(dtype=float)]
+            scales = [self.chunksize["lon"], self.chunksize["lat"]]
+            if len(BOX) == 8:
+                X.append(pd.to_datetime(df["date"]).to_numpy().astype("datetime64[s]").astype(float))
+                scales.append(self.chunksize["time"] * 86400)
+            leaves = self._split_kd(list(BOX), np.array(X).T.reshape(-1, len(X)), np.array(scales))
+
+            # Possibly apply explicit maximum chunk sizes:
+            values = []
+            for leaf in leaves:
+                values += self.balanced_chunker({"box": leaf}, chunks.copy(), chunks_maxsize)["values"]
+
+        else:
+            WMO = request["wmo"]
+            counts = df.groupby("wmo").size()
+            groups, n = [[]], 0
+            for wmo in WMO:
+                c = int(counts.get(int(wmo), 0))
+                if len(groups[-1]) > 0 and n + c > self.max_profiles:
+                    groups.append([])
+                    n = 0
+                groups[-1].append(wmo)
+                n += c
+
+            # Possibly apply explicit maximum chunk sizes:
+            values = []
+            for grp in groups:
+                values += self.balanced_chunker({"wmo": grp}, chunks.copy(), chunks_maxsize)["values"]
+
+        return {"chunks": "balanced", "values": values}
+
     def fit_transform(self):
         """Chunk a fetcher request
 
@@ -14,7 +14,6 @@
 """
 
 import numpy as np
-from scipy import interpolate
 import xarray as xr
 from packaging import version
 import logging
@@ -48,6 +47,8 @@ def _regular_interp(x, y, target_values):
                 ~np.isnan(target_values), target_values, np.nanmax(x) + 1
             )
             # Interpolate with fill value parameter to extend min pressure toward 0
+            from scipy import interpolate
+
             interpolated = interpolate.interp1d(
                 x, y, bounds_error=False, fill_value=(y[0], y[-1])
             )(target_values)
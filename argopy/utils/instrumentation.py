@@ -0,0 +1,484 @@
+"""
+Opt-in instrumentation of data access stages
+
+When enabled, argopy stores record a :class:`Span` for every ``download``, ``decode``, ``preprocess``, ``concat``
+and ``cast`` stage they run, and monitored thread pools a ``task`` span for each of their tasks, with wall and CPU times, bytes transferred, cache hit or miss, retries and HTTP status.
+
+Spans are recorded by the :class:`instrument` context managers open in the current context, and globally when the
+``instrument`` option is set to True (see :func:`global_instrument`). Open recorders are tracked with a
+:class:`contextvars.ContextVar`, so that concurrent threads or tasks only record their own spans. Tasks submitted to
+a :class:`ContextThreadPoolExecutor`, as used by argopy stores and data fetchers, run in a copy of the submitting
+context and are recorded too. Spans of stages running in other processes, e.g. with ``parallel='process'`` or a Dask
+client, are not recorded.
+"""
+import os
+import sys
+import time
+import threading
+import contextlib
+import contextvars
+import collections
+import concurrent.futures
+import importlib
+import json
+import logging
+from typing import List, Union
+
+import numpy as np
+import pandas as pd
+
+try:
+    import resource
+
+    has_resource = True
+except ModuleNotFoundError:  # e.g. on Windows
+    has_resource = False
+
+from ..options import OPTIONS
+
+
+log = logging.getLogger("argopy.utils.instrumentation")
+
+STAGES = ["task", "download", "decode", "preprocess", "concat", "cast"]
+"""list: Name of the data access stages recorded"""
+
+GLOBAL_MAXLEN = 100000
+"""int: Maximum number of spans kept by the global recorder, older spans are dropped first"""
+
+_ACTIVE = contextvars.ContextVar("argopy_instruments", default=())
+
+
+class Span:
+    """One timed stage of a data access"""
+
+    __slots__ = (
+        "stage",
+        "name",
+        "start",
+        "wall",
+        "cpu",
+        "bytes",
+        "cache",
+        "retries",
+        "status",
+        "error",
+        "thread",
+        "pid",
+        "span_id",
+    )
+
+    def __init__(self, stage: str, name: str = ""):
+        self.stage = stage
+        self.name = str(name)
+        self.start = time.time()
+        self.wall = None
+        self.cpu = None
+        self.bytes = None
+        self.cache = None
+        self.retries = None
+        self.status = None
+        self.error = None
+        self.thread = threading.current_thread().name
+        self.pid = os.getpid()
+        self.span_id = os.urandom(8).hex()
+
+    def __repr__(self):
+        wall = "-" if self.wall is None else "%0.3fs" % self.wall
+        return "<argopy.Span %s %s '%s'>" % (self.stage, wall, self.name)
+
+    def set(self, **kwargs):
+        """Set span attributes: ``bytes``, ``cache``, ``retries``, ``status`` or ``error``"""
+        for key, value in kwargs.items():
+            setattr(self, key, value)
+        return self
+
+    def to_dict(self) -> dict:
+        return {k: getattr(self, k) for k in self.__slots__}
+
+
+class _NoSpan:
+    """Span returned when instrumentation is disabled, ignore all attributes"""
+
+    def set(self, **kwargs):
+        return self
+
+
+_NO_SPAN = _NoSpan()
+
+
+class instrument:
+    """Record spans of data access stages
+
+    Parameters
+    ----------
+    maxlen: int, optional
+        Maximum number of spans kept, older spans are dropped first. Unlimited by default.
+
+    Examples
+    --------
+    .. code-block:: python
+
+        with argopy.instrument() as report:
+            ds = DataFetcher(src='gdac', parallel=True).float(6902746).to_xarray()
+
+        report.to_dataframe()  # One row per span
+        report.summary()  # One row per stage
+        report.to_otel()  # OpenTelemetry events
+
+    """
+
+    def __init__(self, maxlen: int = None):
+        self._spans = collections.deque(maxlen=maxlen)
+        self._lock = threading.Lock()
+        self._tokens = []
+        self.trace_id = os.urandom(16).hex()
+
+    def __repr__(self):
+        summary = ["<argopy.instrument>"]
+        summary.append("Trace ID: %s" % self.trace_id)
+        summary.append("Spans: %i" % len(self))
+        for stage, n in self.to_dataframe()["stage"].value_counts().items():
+            summary.append("  - %s: %i" % (stage, n))
+        return "\n".join(summary)
+
+    def __len__(self):
+        return len(self._spans)
+
+    def __enter__(self):
+        self._tokens.append(_ACTIVE.set(_ACTIVE.get() + (self,)))
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        _ACTIVE.reset(self._tokens.pop())
+
+    def add(self, span: Span):
+        with self._lock:
+            self._spans.append(span)
+
+    @property
+    def spans(self) -> List[Span]:
+        """List of recorded spans"""
+        with self._lock:
+            return list(self._spans)
+
+    def clear(self):
+        """Remove all recorded spans"""
+        with self._lock:
+            self._spans.clear()
+        return self
+
+    def to_dataframe(self) -> pd.DataFrame:
+        """Return recorded spans as a :class:`pandas.DataFrame`, one row per span
+
+        Returns
+        -------
+        :class:`pandas.DataFrame`
+            With columns: ``stage``, ``name``, ``start`` (timestamp), ``wall`` and ``cpu`` (seconds), ``bytes``,
+            ``cache`` (``hit``, ``miss`` or None), ``retries``, ``status``, ``error``, ``thread``, ``pid`` and
+            ``span_id``.
+        """
+        df = pd.DataFrame([s.to_dict() for s in self.spans], columns=list(Span.__slots__))
+        df["start"] = pd.to_datetime(df["start"], unit="s")
+        return df
+
+    def summary(self) -> pd.DataFrame:
+        """Return statistics of recorded spans, one row per stage
+
+        Returns
+        -------
+        :class:`pandas.DataFrame`
+            With columns: ``count``, ``wall`` and ``cpu`` (total seconds), ``wall_max`` (seconds), ``bytes``
+            (total), ``cache_hits``, ``retries`` and ``errors``.
+        """
+        df = self.to_dataframe()
+        df["cache_hits"] = df["cache"] == "hit"
+        df["errors"] = df["error"].notna()
+        summary = df.groupby("stage").agg(
+            count=("name", "size"),
+            wall=("wall", "sum"),
+            cpu=("cpu", "sum"),
+            wall_max=("wall", "max"),
+            bytes=("bytes", "sum"),
+            cache_hits=("cache_hits", "sum"),
+            retries=("retries", "sum"),
+            errors=("errors", "sum"),
+        )
+        return summary.reindex([s for s in STAGES if s in summary.index])
+
+    def to_otel(self, tracer=None) -> Union[List[dict], None]:
+        """Export recorded spans as OpenTelemetry events
+
+        Parameters
+        ----------
+        tracer: :class:`opentelemetry.trace.Tracer`, optional
+            If provided, spans are emitted with this tracer and None is returned. Requires the
+            ``opentelemetry-api`` package.
+
+        Returns
+        -------
+        list(dict)
+            Spans following the OpenTelemetry (OTLP/JSON) span data model, with ``traceId``, ``spanId``, ``name``,
+            ``startTimeUnixNano``, ``endTimeUnixNano``, ``attributes`` and ``status`` keys.
+        """
+        events = []
+        for span in self.spans:
+            start = int(span.start * 1e9)
+            end = start + int((span.wall or 0) * 1e9)
+            attributes = {"argopy.stage": span.stage, "argopy.resource": span.name, "thread.name": span.thread,
+                          "process.pid": span.pid}
+            for key, value in [
+                ("argopy.cpu_time", span.cpu),
+                ("argopy.bytes", span.bytes),
+                ("argopy.cache", span.cache),
+                ("argopy.retries", span.retries),
+                ("http.response.status_code", span.status),
+            ]:
+                if value is not None:
+                    attributes[key] = value
+            if span.error is None:
+                status = {"code": "STATUS_CODE_OK"}
+            else:
+                status = {"code": "STATUS_CODE_ERROR", "message": span.error}
+            events.append(
+                {
+                    "traceId": self.trace_id,
+                    "spanId": span.span_id,
+                    "name": "argopy.%s" % span.stage,
+                    "kind": "SPAN_KIND_CLIENT" if span.stage == "download" else "SPAN_KIND_INTERNAL",
+                    "startTimeUnixNano": start,
+                    "endTimeUnixNano": end,
+                    "attributes": attributes,
+                    "status": status,
+                }
+            )
+
+        if tracer is None:
+            return events
+
+        trace = importlib.import_module("opentelemetry.trace")
+        for event in events:
+            otel_span = tracer.start_span(
+                event["name"], start_time=event["startTimeUnixNano"], attributes=event["attributes"]
+            )
+            if "message" in event["status"]:
+                otel_span.set_status(trace.Status(trace.StatusCode.ERROR, event["status"]["message"]))
+            otel_span.end(end_time=event["endTimeUnixNano"])
+
+
+_GLOBAL = instrument(maxlen=GLOBAL_MAXLEN)
+
+
+def global_instrument() -> instrument:
+    """Return the :class:`instrument` recording spans while the ``instrument`` option is True
+
+    It keeps the last :data:`GLOBAL_MAXLEN` spans recorded.
+    """
+    return _GLOBAL
+
+
+def _recorders() -> List[instrument]:
+    recorders = list(_ACTIVE.get())
+    if OPTIONS["instrument"]:
+        recorders.append(_GLOBAL)
+    return recorders
+
+
+def is_instrumented() -> bool:
+    """Return True if spans are currently recorded"""
+    return len(_ACTIVE.get()) > 0 or OPTIONS["instrument"]
+
+
+class ContextThreadPoolExecutor(concurrent.futures.ThreadPoolExecutor):
+    """A :class:`concurrent.futures.ThreadPoolExecutor` running each task in a copy of the submitting context
+
+    Spans of the tasks are thus recorded by the :class:`instrument` open where tasks are submitted.
+    """
+
+    def submit(self, fn, /, *args, **kwargs):
+        return super().submit(contextvars.copy_context().run, fn, *args, **kwargs)
+
+
+@contextlib.contextmanager
+def span(stage: str, name: str = ""):
+    """Time a data access stage and record it as a :class:`Span`
+
+    Exceptions raised in the context are recorded in the span ``error`` attribute and propagated.
+
+    Examples
+    --------
+    .. code-block:: python
+
+        with span("download", url) as s:
+            data = fs.cat_file(url)
+            s.set(bytes=len(data))
+
+    """
+    recorders = _recorders()
+    if len(recorders) == 0:
+        yield _NO_SPAN
+        return
+
+    this = Span(stage, name)
+    t0, c0 = time.perf_counter(), time.thread_time()
+    try:
+        yield this
+    except BaseException as e:
+        this.error = "%s: %s" % (type(e).__name__, str(e))
+        raise
+    finally:
+        this.wall = time.perf_counter() - t0
+        this.cpu = time.thread_time() - c0
+        for recorder in recorders:
+            recorder.add(this)
+
+
+def _max_rss() -> Union[int, None]:
+    """Return the maximum resident set size of the process since it started, in bytes, None if not available"""
+    if not has_resource:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return int(peak) if sys.platform == "darwin" else int(peak) * 1024
+
+
+class FetchProfile:
+    """Execution profile of a data fetch
+
+    This report is built from the spans recorded while fetching data, see :func:`profile_fetch`.
+
+    Attributes
+    ----------
+    elapsed: float
+        Wall time of the fetch, in seconds
+    cpu: float
+        CPU time of the process during the fetch, in seconds
+    max_rss: int
+        Maximum resident set size of the process since it started (``ru_maxrss``), read at the end of the fetch, in
+        bytes, None if not available. This is not specific to the fetch: it includes memory used before the fetch.
+    """
+
+    latency_bins = [0, 0.01, 0.05, 0.1, 0.5, 1, 5, 10, 30, 60, np.inf]
+    """Bins of the url latency histogram, in seconds"""
+
+    def __init__(self, spans: instrument):
+        self.spans = spans
+        self.elapsed = None
+        self.cpu = None
+        self.max_rss = None
+
+    def __repr__(self):
+        summary = ["<argopy.FetchProfile>"]
+        summary.append("Elapsed: %0.3fs (process CPU: %0.3fs)" % (self.elapsed, self.cpu))
+        summary.append("Urls: %i downloaded, %i failed" % (len(self.downloads), len(self.failed)))
+        summary.append(
+            "Throughput: %0.3f MB/s, %0.1f urls/s" % (self.throughput["bytes"] / 1e6, self.throughput["urls"])
+        )
+        summary.append(
+            "Time waiting for servers: %0.3fs, client CPU time: %0.3fs (bottleneck: %s)"
+            % (self.wait, self.cpu, self.bottleneck)
+        )
+        if self.max_rss is not None:
+            summary.append("Process max RSS: %0.1f MB" % (self.max_rss / 1e6))
+        summary.append("Stages:")
+        summary.append(self.stages[["count", "wall", "cpu", "bytes"]].to_string())
+        if len(self.downloads) > 0:
+            summary.append("Slowest urls:")
+            summary.append(self.slowest().to_string(index=False))
+        if len(self.failed) > 0:
+            summary.append("Failed urls:")
+            summary.append(self.failed.to_string(index=False))
+        return "\n".join(summary)
+
+    @property
+    def downloads(self) -> pd.DataFrame:
+        """Download spans, one row per url"""
+        df = self.spans.to_dataframe()
+        return df[df["stage"] == "download"]
+
+    @property
+    def stages(self) -> pd.DataFrame:
+        """Statistics of spans, one row per stage, see :meth:`instrument.summary`"""
+        return self.spans.summary()
+
+    @property
+    def latency(self) -> pd.Series:
+        """Histogram of url download times: number of urls per latency bin"""
+        counts, bins = np.histogram(self.downloads["wall"].astype(float), bins=self.latency_bins)
+        labels = ["%s-%ss" % (bins[i], bins[i + 1]) for i in range(len(counts))]
+        return pd.Series(counts, index=labels, name="urls")
+
+    @property
+    def throughput(self) -> dict:
+        """Number of bytes and of urls downloaded per second of fetch"""
+        elapsed = max(self.elapsed or 0, 1e-9)
+        return {
+            "bytes": float(self.downloads["bytes"].sum()) / elapsed,
+            "urls": len(self.downloads) / elapsed,
+        }
+
+    @property
+    def failed(self) -> pd.DataFrame:
+        """Urls that failed to be processed, with the stage and the reason of the failure"""
+        df = self.spans.to_dataframe()
+        df = df[df["error"].notna()]
+        return df[["name", "stage", "error"]].drop_duplicates("name").reset_index(drop=True)
+
+    @property
+    def wait(self) -> float:
+        """Total time spent waiting for servers or disks, i.e. download wall time not spent on the CPU"""
+        downloads = self.downloads
+        return float((downloads["wall"] - downloads["cpu"]).clip(lower=0).sum())
+
+    @property
+    def bottleneck(self) -> str:
+        """``server`` if more time is spent waiting for downloads than computing on the client, ``client`` otherwise"""
+        return "server" if self.wait > self.cpu else "client"
+
+    def slowest(self, n: int = 5) -> pd.DataFrame:
+        """Return the ``n`` slowest urls to download"""
+        cols = ["name", "wall", "bytes", "status", "retries", "cache"]
+        return self.downloads.sort_values("wall", ascending=False)[cols].head(n)
+
+    def to_dict(self) -> dict:
+        """Return the report as a dictionary of builtin types"""
+        stages = self.stages.astype(float).round(6)
+        return {
+            "elapsed": self.elapsed,
+            "cpu": self.cpu,
+            "max_rss": self.max_rss,
+            "urls": len(self.downloads),
+            "throughput": self.throughput,
+            "wait": self.wait,
+            "bottleneck": self.bottleneck,
+            "stages": stages.to_dict(orient="index"),
+            "latency": {k: int(v) for k, v in self.latency.items()},
+            "slowest": self.slowest().astype(object).where(self.slowest().notna(), None).to_dict(orient="records"),
+            "failed": self.failed.to_dict(orient="records"),
+        }
+
+    def to_json(self) -> str:
+        """Return the report as a json string"""
+        return json.dumps(self.to_dict(), default=str)
+
+
+@contextlib.contextmanager
+def profile_fetch():
+    """Record spans and resources used by a block of code, and return a :class:`FetchProfile` report
+
+    Examples
+    --------
+    .. code-block:: python
+
+        with profile_fetch() as report:
+            ds = DataFetcher(src='gdac').float(6902746).to_xarray()
+        print(report)
+
+    """
+    with instrument() as spans:
+        report = FetchProfile(spans)
+        t0, c0 = time.perf_counter(), time.process_time()
+        try:
+            yield report
+        finally:
+            report.elapsed = time.perf_counter() - t0
+            report.cpu = time.process_time() - c0
+            report.max_rss = _max_rss()
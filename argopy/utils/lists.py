@@ -1,15 +1,9 @@
 import sys
 import warnings
-import importlib
-import os
-import json
 from ..options import OPTIONS
+from .locals import Asset
 from typing import List, Union
 
-path2assets = importlib.util.find_spec(
-    "argopy.static.assets"
-).submodule_search_locations[0]
-
 
 def subsample_list(original_list, N):
     if len(original_list) <= N:
@@ -284,9 +278,7 @@ def list_bgc_s_variables() -> List[str]:
     :meth:`argopy.utils.list_radiometry_variables`
     :meth:`argopy.utils.list_radiometry_parameters`,
     """
-    with open(os.path.join(path2assets, "variables_bgc_synthetic.json"), "r") as f:
-        vlist = json.load(f)
-    return vlist["data"]["variables"]
+    return Asset.load("variables_bgc_synthetic")["data"]["variables"]
 
 
 def list_bgc_s_parameters() -> List[str]:
@@ -414,9 +406,7 @@ def list_gdac_servers() -> List[str]:
     :class:`argopy.gdacfs`, :meth:`argopy.utils.check_gdac_path`, :meth:`argopy.utils.shortcut2gdac`
 
     """
-    with open(os.path.join(path2assets, "gdac_servers.json"), "r") as f:
-        vlist = json.load(f)
-    return vlist["data"]["paths"]
+    return Asset.load("gdac_servers")["data"]["paths"]
 
 
 def shortcut2gdac(short: str = None) -> Union[str, dict]:
@@ -437,9 +427,7 @@ def shortcut2gdac(short: str = None) -> Union[str, dict]:
     :func:`argopy.utils.list_gdac_servers`, :class:`argopy.gdacfs`, :meth:`argopy.utils.check_gdac_path`
 
     """
-    with open(os.path.join(path2assets, "gdac_servers.json"), "r") as f:
-        vlist = json.load(f)
-    shortcuts = vlist["data"]["shortcuts"]
+    shortcuts = Asset.load("gdac_servers")["data"]["shortcuts"]
 
     if short is not None:
         if short.lower().strip() in shortcuts.keys():
@@ -9,7 +9,11 @@
 import copy
 import shutil
 import json
+import hashlib
+import threading
+import logging
 from typing import Any
+from functools import lru_cache
 import importlib
 from pathlib import Path
 import pandas as pd
@@ -18,15 +22,22 @@
 from argopy.utils.loggers import frame_info
 
 
-PIP_INSTALLED = {}
-try:
-    reqs = subprocess.check_output(
-        [sys.executable, "-m", "pip", "list", "--format", "json"]
-    )
-    reqs = json.loads(reqs.decode())
-    [PIP_INSTALLED.update({mod["name"]: mod["version"]}) for mod in reqs]
-except:  # noqa E722
-    pass
+log = logging.getLogger("argopy.utils.locals")
+
+
+@lru_cache
+def pip_installed() -> dict:
+    """Return versions of packages installed with pip, the pip command is run only once"""
+    installed = {}
+    try:
+        reqs = subprocess.check_output(
+            [sys.executable, "-m", "pip", "list", "--format", "json"]
+        )
+        reqs = json.loads(reqs.decode())
+        [installed.update({mod["name"]: mod["version"]}) for mod in reqs]
+    except:  # noqa E722
+        pass
+    return installed
 
 
 def get_sys_info():
@@ -111,8 +122,8 @@ def cli_version(cli_name):
 def pip_version(pip_name):
     version = "-"
     for name in [pip_name, pip_name.replace("_", "-"), pip_name.replace("-", "_")]:
-        if name in PIP_INSTALLED:
-            version = PIP_INSTALLED[name]
+        if name in pip_installed():
+            version = pip_installed()[name]
     return version
 
 
@@ -194,6 +205,7 @@ def show_versions(file=sys.stdout, conda=False):  # noqa: C901
             [
                 ("dask", get_version),
                 ("distributed", get_version),
+                ("duckdb", get_version),
                 ("joblib", get_version),
                 ("numba", get_version),
                 ("pyarrow", get_version),
@@ -327,12 +339,18 @@ def show_options(file=sys.stdout):  # noqa: C901
 class Asset:
     """Internal asset loader
 
-    Assets are loaded using an instance of :class:`argopy.stores.filestore`.
+    JSON assets are read from a compiled bundle, a single JSON file with the content of all JSON files in
+    ``argopy/static/assets``. The bundle is built on the first call, saved in the argopy cache folder for later
+    sessions, and loaded once per process. A bundle is only valid for the argopy version and install path it was
+    built from. Other assets, or assets loaded with arguments, are read with an instance of
+    :class:`argopy.stores.filestore`.
 
     Notes
     -----
     This is **single-instance** class, whereby a single instance will be created during a session, whatever the number of calls is made. This avoids to create too many, and unnecessary, instances of file stores.
 
+    Each call returns a new object, so that assets can be modified without side effects on later calls.
+
     Examples
     --------
     .. code-block:: python
@@ -347,6 +365,8 @@ class Asset:
     _fs: Any = None
     _instance: "Asset | None" = None
     _initialized: bool = False
+    _bundle: "dict | None" = None
+    _lock = threading.Lock()
 
     def __new__(cls, *args: Any, **kwargs: Any) -> "Asset":
         if cls._instance is None:
@@ -355,26 +375,87 @@ def __new__(cls, *args: Any, **kwargs: Any) -> "Asset":
 
     def __init__(self, *args, **kwargs) -> None:
         if not self._initialized:
-            from argopy.stores import filestore
-
-            self._fs = filestore(cache=True, cachedir=OPTIONS["cachedir"])
             path2assets = importlib.util.find_spec(
                 "argopy.static.assets"
             ).submodule_search_locations[0]
             self._path = Path(path2assets)
             self._initialized = True
 
+    @property
+    def fs(self):
+        if self._fs is None:
+            from argopy.stores import filestore
+
+            self._fs = filestore(cache=True, cachedir=OPTIONS["cachedir"])
+        return self._fs
+
+    @property
+    def bundle_path(self) -> Path:
+        """Path to the compiled asset bundle for this argopy version and install path"""
+        from argopy import __version__
+
+        # Several argopy installs may share a cache folder, so the key starts with a fingerprint of the install path:
+        key = "%s-%s" % (hashlib.sha1(str(self._path.resolve()).encode()).hexdigest()[0:8], __version__)  # nosec B324
+        if __version__ == "999" or "dev" in __version__ or "+" in __version__:
+            # Assets may change without a new version, so we add a fingerprint of asset files to the key:
+            stats = []
+            for root, _, _ in os.walk(self._path):
+                with os.scandir(root) as entries:
+                    for entry in entries:
+                        if entry.name.endswith(".json"):
+                            stat = entry.stat()
+                            stats.append((entry.path, stat.st_size, stat.st_mtime_ns))
+            key += "-" + hashlib.sha1(repr(sorted(stats)).encode()).hexdigest()[0:12]  # nosec B324
+        return Path(OPTIONS["cachedir"]).expanduser().joinpath("assets", f"bundle-{key}.json")
+
+    def _compile(self) -> dict:
+        """Return a dictionary with the compact JSON text of all assets, indexed by asset path"""
+        bundle = {}
+        for p in sorted(self._path.rglob("*.json")):
+            with open(p, "r") as f:
+                bundle[p.relative_to(self._path).as_posix()] = json.dumps(json.load(f), separators=(",", ":"))
+        return bundle
+
+    def _get_bundle(self) -> dict:
+        with self._lock:
+            if Asset._bundle is None:
+                bundle_path = self.bundle_path
+                try:
+                    with open(bundle_path, "r") as f:
+                        Asset._bundle = json.load(f)
+                except Exception:
+                    Asset._bundle = self._compile()
+                    try:
+                        bundle_path.parent.mkdir(parents=True, exist_ok=True)
+                        tmp = bundle_path.with_suffix(".tmp%i" % os.getpid())
+                        with open(tmp, "w") as f:
+                            json.dump(Asset._bundle, f)
+                        os.replace(tmp, bundle_path)
+                        # Remove bundles of previous versions from this install:
+                        install = bundle_path.name.split("-")[1]
+                        for old in bundle_path.parent.glob("bundle-%s-*.json" % install):
+                            if old != bundle_path:
+                                old.unlink(missing_ok=True)
+                    except OSError as e:
+                        log.debug("Cannot save the asset bundle: %s" % str(e))
+            return Asset._bundle
+
     def _load(self, name: str, **kwargs) -> dict | pd.DataFrame:
         suffix = Path(name).suffix
-        if suffix in [".csv", ".txt"]:
-            load = self._fs.read_csv
-        else:
-            load = self._fs.open_json
-            if suffix != ".json":  # eg: '.schema'
-                name = f"{name}.json"
+        is_json = suffix not in [".csv", ".txt"]
+        if is_json and suffix != ".json":  # eg: '.schema'
+            name = f"{name}.json"
 
         name = name.strip()
         name = name.split(":")
+
+        if is_json and len(kwargs) == 0:
+            bundle = self._get_bundle()
+            key = "/".join(name)
+            if key in bundle:
+                return json.loads(bundle[key])
+
+        load = self.fs.open_json if is_json else self.fs.read_csv
         return load(self._path.joinpath(*name), **kwargs)
 
     @classmethod
@@ -394,10 +475,25 @@ def load(cls, name: str = None, **kwargs) -> Any:
         -----
         If the asset `name` has a `.txt` or `.csv` suffix, the :meth:`argopy.stores.filestore.read_csv` is used.
 
-        For all other asset `name`, the :meth:`argopy.stores.filestore.load_json` is used by default.
+        For all other asset `name`, the JSON content is read from the compiled asset bundle. If arguments are
+        given, the :meth:`argopy.stores.filestore.open_json` is used instead.
         """
         return cls()._load(name=name, **kwargs)
 
+    @classmethod
+    def compile(cls) -> Path:
+        """Compile and save the asset bundle, and return its path
+
+        This is done automatically on the first call to :meth:`Asset.load`, but can be used to prepare the cache
+        folder of a deployment ahead of time.
+        """
+        with cls._lock:
+            cls._bundle = None
+            path = cls().bundle_path
+            path.unlink(missing_ok=True)
+        cls()._get_bundle()
+        return path
+
 
 def caller_function():
     """Return the name of the function calling wherever ``caller_function()`` is called"""
@@ -8,7 +8,6 @@
 from functools import lru_cache
 import os
 import sys
-from concurrent.futures import ThreadPoolExecutor
 from concurrent.futures import as_completed
 from threading import Lock
 import logging
@@ -16,6 +15,8 @@
 from abc import ABC, abstractmethod
 import importlib
 
+from .instrumentation import span, ContextThreadPoolExecutor
+
 try:
     from importlib.resources import files  # New in version 3.9
 except ImportError:
@@ -26,8 +27,6 @@
     )
 
 has_ipython = (spec := importlib.util.find_spec("IPython")) is not None
-if has_ipython:
-    from IPython.display import display, clear_output, HTML
 
 
 log = logging.getLogger("argopy.utils.compute")
@@ -106,14 +105,19 @@ def init_status(self, bucket):
             ]  # Each task goes by 4 status ('w', 'p', 'c', 'f'/'s')
 
     def task(self, obj_id, obj):
-        self.update_display_status(obj_id, "w")  # Working
-        data, state = self.task_fct(obj, **self.task_fct_kwargs)
+        with span("task", obj) as this:
+            self.update_display_status(obj_id, "w")  # Working
+            data, state = self.task_fct(obj, **self.task_fct_kwargs)
 
-        self.update_display_status(obj_id, "p")  # Post-processing
-        if self.postprocessing_fct is not None:
-            data, state = self.postprocessing_fct(
-                data, **self.postprocessing_fct_kwargs
-            )
+            self.update_display_status(obj_id, "p")  # Post-processing
+            if self.postprocessing_fct is not None:
+                with span("preprocess", obj):
+                    data, state = self.postprocessing_fct(
+                        data, **self.postprocessing_fct_kwargs
+                    )
+
+            if not state:
+                this.set(error=repr(data) if isinstance(data, Exception) else "Task failed")
 
         return obj_id, data, state
 
@@ -127,7 +131,8 @@ def callback(self, future):
 
     def finalize(self, results):
         self.update_display_status_final("w")  # Working
-        data, state = self.finalize_fct(results, **self.finalize_fct_kwargs)
+        with span("concat", "%i results" % len(results)):
+            data, state = self.finalize_fct(results, **self.finalize_fct_kwargs)
         self.update_display_status_final("s" if state else "f")
         return data
 
@@ -139,7 +144,7 @@ def execute(self, bucket: list = None, list_failed: bool = False):
         # Execute tasks and post-processing:
         self.lock = Lock()
         results = {}
-        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+        with ContextThreadPoolExecutor(max_workers=self.max_workers) as executor:
             futures = [
                 executor.submit(self.task, ii, obj) for ii, obj in enumerate(bucket)
             ]
@@ -319,11 +324,15 @@ def status_html(self):
             "</div>\n"
             f"{progress}\n"
         )
+        from IPython.display import HTML
+
         return HTML(html)
 
     def display_status(self):
         super().display_status()
         if self.show and self.runner == "notebook":
+            from IPython.display import display, clear_output
+
             clear_output(wait=True)
             display(self.status_html)
 
@@ -595,7 +604,7 @@ def pmap(obj, mapper: Callable, a_list: Iterable, kw: dict[Any] = {}) -> list[An
     """A method to execute some computation with multithreading"""
     results: list[Any] = []
 
-    with ThreadPoolExecutor() as executor:
+    with ContextThreadPoolExecutor() as executor:
         futures = {executor.submit(mapper, item, obj, **kw): item for item in a_list}
         for future in as_completed(futures):
             results.append(future.result())
@@ -10,9 +10,6 @@
 import numpy as np
 from typing import Tuple, Annotated, Literal, TypeVar
 
-from scipy.ndimage import median_filter
-from scipy.ndimage import uniform_filter1d
-
 import numpy.typing as npt
 
 DType = TypeVar("DType", bound=np.generic)
@@ -26,6 +23,20 @@
 except ModuleNotFoundError:
     with_gsw = False
 
+try:
+    from numba import jit
+
+    with_numba = True
+except ModuleNotFoundError:
+    with_numba = False
+
+    # Without numba, kernels below are still usable, as plain python loops
+    def jit(*args, **kwargs):
+        def decorator(func):
+            return func
+
+        return decorator
+
 
 def Z_euphotic(
     axis: np.ndarray,
@@ -176,6 +187,165 @@ def Z_iPAR_threshold(
         return np.array(result)
 
 
+@jit(nopython=True, nogil=True, cache=True, error_model="numpy")
+def _Z_euphotic_percentage_kernel(axis, par, max_surface, out):
+    for i in range(axis.shape[0]):
+        out[i] = np.nan
+
+        # Surface value, ignoring levels where axis or par is NaN:
+        found = False
+        surface_value = 0.0
+        for k in range(axis.shape[1]):
+            if np.isnan(axis[i, k]) or np.isnan(par[i, k]):
+                continue
+            if axis[i, k] <= max_surface and (not found or par[i, k] > surface_value):
+                surface_value = par[i, k]
+                found = True
+        if not found:
+            continue
+
+        # Closest level to 1% of the surface value:
+        target = surface_value / 100
+        above = False
+        best = np.inf
+        ibest = -1
+        for k in range(axis.shape[1]):
+            if np.isnan(axis[i, k]) or np.isnan(par[i, k]):
+                continue
+            if par[i, k] > target:
+                above = True
+            if np.abs(par[i, k] - target) < best:
+                best = np.abs(par[i, k] - target)
+                ibest = k
+        if above:
+            out[i] = axis[i, ibest]
+
+
+@jit(nopython=True, nogil=True, cache=True, error_model="numpy")
+def _Z_euphotic_KdPAR_kernel(axis, par, layer_min, layer_max, out):
+    for i in range(axis.shape[0]):
+        out[i] = np.nan
+
+        # First and last valid levels of the layer:
+        first = -1
+        last = -1
+        for k in range(axis.shape[1]):
+            if np.isnan(axis[i, k]) or np.isnan(par[i, k]):
+                continue
+            if axis[i, k] >= layer_min and axis[i, k] <= layer_max:
+                if first < 0:
+                    first = k
+                last = k
+        if first < 0:
+            continue
+
+        layer_size = axis[i, first] - axis[i, last]
+        Kd_layer = -1 / layer_size * (np.log(par[i, first]) - np.log(par[i, last]))
+        out[i] = -np.log(0.01) / Kd_layer
+
+
+@jit(nopython=True, nogil=True, cache=True, error_model="numpy")
+def _Z_iPAR_threshold_kernel(axis, par, threshold, tolerance, out):
+    for i in range(axis.shape[0]):
+        # Same as np.argmin, where the first NaN wins:
+        iz = 0
+        best = np.inf
+        for k in range(par.shape[1]):
+            d = np.abs(par[i, k] - threshold)
+            if np.isnan(d):
+                iz = k
+                break
+            if d < best:
+                best = d
+                iz = k
+        if np.abs(par[i, iz] - threshold) >= tolerance:
+            out[i] = np.nan
+        else:
+            out[i] = axis[i, iz]
+
+
+def _reduce_with_kernel(kernel, axis: np.ndarray, par: np.ndarray, *args) -> np.ndarray:
+    """Run a 2D kernel on arrays with N_LEVELS as last dimension, and any number of leading dimensions"""
+    axis, par = np.asarray(axis), np.asarray(par)
+    shape = axis.shape[:-1]
+    dtype = np.result_type(axis.dtype, par.dtype, np.float32)
+    out = np.empty((int(np.prod(shape)),), dtype=np.float64)
+    kernel(
+        np.ascontiguousarray(axis, dtype=np.float64).reshape(-1, axis.shape[-1]),
+        np.ascontiguousarray(par, dtype=np.float64).reshape(-1, par.shape[-1]),
+        *[float(a) for a in args],
+        out,
+    )
+    return out.reshape(shape).astype(dtype, copy=False)
+
+
+def Z_euphotic_numba(
+    axis: np.ndarray,
+    par: np.ndarray,
+    method: Literal["percentage", "KdPAR"] = "percentage",
+    max_surface: float = 5.0,
+    layer_min: float = 10.0,
+    layer_max: float = 50.0,
+) -> np.ndarray:
+    """Depth of the euphotic zone from unlabeled arrays of pressure and PAR, for a collection of profiles
+
+    This is the compiled counterpart of :meth:`Z_euphotic`, with the same arguments and results, but working on arrays
+    with the vertical axis as last dimension. All profiles are processed in a single call to a loop compiled
+    with numba (or to a plain python loop if numba is not available).
+
+    Parameters
+    ----------
+    axis: numpy.ndarray, N dimensional
+        Vertical axis values, with levels along the last dimension.
+    par: numpy.ndarray, N dimensional
+        Photosynthetically available radiation, with levels along the last dimension.
+
+    Returns
+    -------
+    :class:`numpy.ndarray`, N-1 dimensional
+
+    See Also
+    --------
+    :meth:`Z_euphotic`, :class:`xarray.Dataset.argo.optic.Zeu`
+    """
+    if method == "percentage":
+        return _reduce_with_kernel(
+            _Z_euphotic_percentage_kernel, axis, par, max_surface
+        )
+    elif method == "KdPAR":
+        return _reduce_with_kernel(
+            _Z_euphotic_KdPAR_kernel, axis, par, layer_min, layer_max
+        )
+    else:
+        raise ValueError("Unknown method '%s', must be 'percentage' or 'KdPAR'" % method)
+
+
+def Z_iPAR_threshold_numba(
+    axis: np.ndarray, par: np.ndarray, threshold: float = 15.0, tolerance: float = 5.0
+) -> np.ndarray:
+    """Depth where unlabelled arrays of PAR reach some threshold value (closest point), for a collection of profiles
+
+    This is the compiled counterpart of :meth:`Z_iPAR_threshold`, with the same arguments and results, but working
+    on arrays with the vertical axis as last dimension.
+
+    Parameters
+    ----------
+    axis: numpy.ndarray, N dimensional
+        Vertical axis values, with levels along the last dimension.
+    par: numpy.ndarray, N dimensional
+        Photosynthetically available radiation, with levels along the last dimension.
+
+    Returns
+    -------
+    :class:`numpy.ndarray`, N-1 dimensional
+
+    See Also
+    --------
+    :meth:`Z_iPAR_threshold`, :class:`xarray.Dataset.argo.optic.Z_iPAR_threshold`
+    """
+    return _reduce_with_kernel(_Z_iPAR_threshold_kernel, axis, par, threshold, tolerance)
+
+
 def DCM(
     CHLA: np.ndarray,
     CHLA_axis: np.ndarray,
@@ -237,6 +407,8 @@ def DCM(
     --------
     :class:`xarray.Dataset.argo.optic.DCM`
     """
+    from scipy.ndimage import median_filter, uniform_filter1d
+
     idx = ~np.logical_or(np.isnan(CHLA_axis), np.isnan(CHLA))
     CHLA_axis = CHLA_axis[idx]
     CHLA = CHLA[idx]
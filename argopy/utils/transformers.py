@@ -171,6 +171,145 @@ def fillvalue(da):
     return results
 
 
+def _fillvalue(dtype: np.dtype) -> Any:
+    """Return the fill value of a variable missing from a dataset, consistent with :func:`fill_variables_not_in_all_datasets`"""
+    if dtype.kind == "U":
+        return " "
+    elif dtype.kind == "S":
+        return b" "
+    elif dtype.kind == "i":
+        return 99999
+    elif dtype.kind == "b":
+        return False
+    elif dtype.kind in ["M", "m"]:
+        return np.array("NaT", dtype=dtype)
+    else:
+        return np.nan
+
+
+def _promote(dtype1: np.dtype, dtype2: np.dtype) -> np.dtype:
+    """Return the dtype able to hold values of two dtypes, object if there is none"""
+    try:
+        dtype = np.promote_types(dtype1, dtype2)
+    except TypeError:
+        return np.dtype(object)
+    if dtype.kind in ["U", "S"] and (dtype1.kind not in ["U", "S"] or dtype2.kind not in ["U", "S"]):
+        # Don't cast numbers to strings
+        return np.dtype(object)
+    return dtype
+
+
+def concat_datasets(
+    ds_collection: List[xr.Dataset], concat_dim: str = "rows"
+) -> xr.Dataset:
+    """Concatenate a collection of datasets along a dimension, filling variables not in all datasets
+
+    This is a fast equivalent of :func:`fill_variables_not_in_all_datasets` followed by :func:`xarray.concat`
+    with ``data_vars='minimal', coords='all', compat='override'``: the schema of the output dataset (union of
+    variables along ``concat_dim``, with dtypes, attributes and encoding of their first occurrence) is computed
+    once, output arrays are allocated at their final size and each dataset is copied into its slice. No alignment
+    is performed.
+
+    Variables without ``concat_dim``, dataset attributes and encoding are taken from the first dataset they appear
+    in. Variables missing from a dataset are filled as in :func:`fill_variables_not_in_all_datasets`.
+
+    If datasets can't be concatenated this way (Dask arrays, variables with different dimensions or sizes along
+    other dimensions, coordinates without ``concat_dim``), this falls back on :func:`fill_variables_not_in_all_datasets`
+    and :func:`xarray.concat`.
+
+    Parameters
+    ----------
+    ds_collection: List[xarray.Dataset]
+        A list of :class:`xarray.Dataset`
+    concat_dim: str, default='rows'
+        Name of the dimension to concatenate datasets along
+
+    Returns
+    -------
+    :class:`xarray.Dataset`
+
+    See Also
+    --------
+    :func:`argopy.utils.fill_variables_not_in_all_datasets`, :func:`argopy.utils.drop_variables_not_in_all_datasets`
+    """
+
+    def fallback():
+        return xr.concat(
+            fill_variables_not_in_all_datasets(ds_collection, concat_dim=concat_dim),
+            dim=concat_dim,
+            data_vars="minimal",
+            coords="all",
+            compat="override",
+        )
+
+    # Compute the output schema:
+    schema, others, sizes = {}, {}, []
+    for ds in ds_collection:
+        if concat_dim not in ds.dims:
+            return fallback()
+        sizes.append(ds.sizes[concat_dim])
+        for name, var in ds.variables.items():
+            if concat_dim in var.dims:
+                if var.chunks is not None:
+                    return fallback()
+                shape = tuple(n for d, n in zip(var.dims, var.shape) if d != concat_dim)
+                if name not in schema:
+                    schema[name] = {
+                        "dims": var.dims,
+                        "shape": shape,
+                        "dtype": var.dtype,
+                        "attrs": var.attrs,
+                        "encoding": var.encoding,
+                        "coord": name in ds.coords,
+                        "count": 1,
+                    }
+                else:
+                    this = schema[name]
+                    if var.dims != this["dims"] or shape != this["shape"]:
+                        return fallback()
+                    if var.dtype != this["dtype"]:
+                        this["dtype"] = _promote(this["dtype"], var.dtype)
+                    this["coord"] = this["coord"] or name in ds.coords
+                    this["count"] += 1
+            elif name in ds.coords and name not in ds.dims:
+                return fallback()
+            elif name not in others:
+                others[name] = (var, name in ds.coords)
+
+    # Allocate output arrays:
+    N = int(np.sum(sizes))
+    offsets = np.concatenate([[0], np.cumsum(sizes)])
+    out = {}
+    for name, this in schema.items():
+        axis = this["dims"].index(concat_dim)
+        shape = list(this["shape"])
+        shape.insert(axis, N)
+        if this["count"] < len(ds_collection):
+            out[name] = np.full(shape, _fillvalue(this["dtype"]), dtype=this["dtype"])
+        else:
+            out[name] = np.empty(shape, dtype=this["dtype"])
+        this["axis"] = axis
+
+    # Copy each dataset into its slice:
+    for ir, ds in enumerate(ds_collection):
+        for name, var in ds.variables.items():
+            if name in schema:
+                index = [slice(None)] * var.ndim
+                index[schema[name]["axis"]] = slice(offsets[ir], offsets[ir + 1])
+                out[name][tuple(index)] = var.values
+
+    data_vars, coords = {}, {}
+    for name, this in schema.items():
+        var = xr.Variable(this["dims"], out[name], attrs=this["attrs"], encoding=this["encoding"])
+        (coords if this["coord"] else data_vars)[name] = var
+    for name, (var, is_coord) in others.items():
+        (coords if is_coord else data_vars)[name] = var
+
+    ds = xr.Dataset(data_vars=data_vars, coords=coords, attrs=ds_collection[0].attrs)
+    ds.encoding = dict(ds_collection[0].encoding)
+    return ds
+
+
 def merge_param_with_param_adjusted(
     ds: xr.Dataset, param: str, errors: str = "raise"
 ) -> xr.Dataset:
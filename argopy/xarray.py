@@ -1,5 +1,6 @@
 import os
 import warnings
+import concurrent.futures
 
 import numpy as np
 import pandas as pd
@@ -25,7 +26,15 @@
     Delayed = lambda x: x  # noqa: E731
 
 
-from argopy.errors import InvalidDatasetStructure, OptionValueError, NoData, NoDataLeft
+from argopy.errors import (
+    InvalidDatasetStructure,
+    InvalidMethod,
+    OptionValueError,
+    NoData,
+    NoDataLeft,
+)
+from argopy.options import PARALLEL_SETUP
+from argopy.stores.filesystems import tqdm, has_distributed, distributed
 from argopy.utils.computers import (
     linear_interpolation_remap,
     groupby_remap,
@@ -39,9 +48,14 @@
 )
 from argopy.utils.lists import list_core_parameters
 from argopy.utils.geo import toYearFraction
+from argopy import _LazyArgoAccessor
 
 log = logging.getLogger("argopy.xarray")
 
+# Remove the placeholder set by ``import argopy`` before registering the accessor:
+if isinstance(vars(xr.Dataset).get("argo"), _LazyArgoAccessor):
+    del xr.Dataset.argo
+
 
 @xr.register_dataset_accessor("argo")
 class ArgoAccessor:
@@ -1568,6 +1582,11 @@ def create_float_source(
         format: str = "5",
         do_compression: bool = True,
         debug_output: bool = False,
+        parallel: Union[bool, str] = False,
+        max_workers: int = None,
+        progress: bool = False,
+        errors: str = "raise",
+        list_failed: bool = False,
     ):
         """Preprocess data for OWC software calibration
 
@@ -1639,12 +1658,30 @@ def create_float_source(
             Whether to compress matrices on write. Default is True.
         format: {'5', '4'}, string, optional
             Matlab file format version. '5' (the default) for MATLAB 5 and up (to 7.2). Use '4' for MATLAB 4 .mat files.
+        parallel: bool, str, :class:`distributed.Client`, default: False
+            Preprocess floats in parallel, and possibly which method to use. Possible values are the same as for the
+            ``parallel`` option of :class:`argopy.set_options`: ``False``, ``True``, ``thread``, ``process`` or a
+            :class:`distributed.Client`.
+
+            Data are split by float with index slices, so that no copy of the full dataset is made.
+        max_workers: int, optional
+            Maximum number of threads or processes to use with a parallel method.
+        progress: bool, default: False
+            Display a progress bar
+        errors: {'raise', 'ignore', 'silent'}, default: 'raise'
+            Define how to handle errors raised while preprocessing one float:
+                - ``raise`` (default): Raise any error encountered
+                - ``ignore``: Do not stop processing, simply issue a debug message in logging console
+                - ``silent``: Do not stop processing and do not issue log message
+        list_failed: bool, default: False
+            If True, also return a dictionary with the WMO of floats that failed as keys and the error message as values.
 
         Returns
         -------
-        :class:`xarray.Dataset`
-            The output dataset, or Matlab file, will have the following variables (``n`` is the number of profiles, ``m``
-            is the number of vertical levels):
+        dict
+            Dictionary with float WMOs as keys, and as values the path to the Matlab file if a ``path`` is provided,
+            or the :class:`xarray.Dataset` otherwise. The output dataset, or Matlab file, will have the following
+            variables (``n`` is the number of profiles, ``m`` is the number of vertical levels):
 
             - ``DATES`` (1xn): decimal year, e.g. 10 Dec 2000 = 2000.939726
             - ``LAT``   (1xn): decimal degrees, -ve means south of the equator, e.g. 20.5S = -20.5
@@ -1679,260 +1716,119 @@ def create_float_source(
             "===================== START create_float_source in '%s' mode" % force
         )
 
-        if len(np.unique(this["PLATFORM_NUMBER"])) > 1:
+        # Split data by float, with index slices rather than copies:
+        indexers = _float_source_indexers(this)
+        if len(indexers) > 1:
             log.debug(
                 "Found more than one 1 float in this dataset, will split processing"
             )
 
-        def ds2mat(this_dsp):
-            # Return a Matlab dictionary with dataset data to be used by savemat:
-            mdata = {}
-            mdata["PROFILE_NO"] = (
-                this_dsp["PROFILE_NO"].astype("uint16").values.T[np.newaxis, :]
-            )  # 1-based index in Matlab
-            mdata["DATES"] = this_dsp["DATES"].values.T[np.newaxis, :]
-            mdata["LAT"] = this_dsp["LAT"].values.T[np.newaxis, :]
-            mdata["LONG"] = this_dsp["LONG"].values.T[np.newaxis, :]
-            mdata["PRES"] = this_dsp["PRES"].values
-            mdata["TEMP"] = this_dsp["TEMP"].values
-            mdata["PTMP"] = this_dsp["PTMP"].values
-            mdata["SAL"] = this_dsp["SAL"].values
-            return mdata
-
-        def pretty_print_count(dd, txt):
-            # if dd.argo._type == "point":
-            #     np = len(dd['N_POINTS'].values)
-            #     nc = len(dd.argo.point2profile()['N_PROF'].values)
-            # else:
-            #     np = len(dd.argo.profile2point()['N_POINTS'].values)
-            #     nc = len(dd['N_PROF'].values)
-            out = []
-            np, nc = dd.argo.N_POINTS, dd.argo.N_PROF
-            out.append("%i points / %i profiles in dataset %s" % (np, nc, txt))
-            # np.unique(this['PSAL_QC'].values))
-            # out.append(pd.to_datetime(dd['TIME'][0].values).strftime('%Y/%m/%d %H:%M:%S'))
-            return "\n".join(out)
-
-        def getfilled_bins(pressure, bins):
-            ip = np.digitize(np.unique(pressure), bins, right=False)
-            ii, ij = np.unique(ip, return_index=True)
-            ii = ii[np.where(ii - 1 > 0)] - 1
-            return bins[ii]
-
-        def preprocess_one_float(
-            this_one: xr.Dataset,
-            this_path: str or os.PathLike = None,
-            select: str = "deep",
-            debug_output: bool = False,
-        ):
-            """Run the entire preprocessing on a given dataset with one float data"""
-
-            # Add potential temperature:
-            if "PTEMP" not in this_one:
-                this_one = this_one.argo.teos10(vlist=["PTEMP"], inplace=True)
-
-            # Only use Ascending profiles:
-            # https://github.com/euroargodev/dm_floats/blob/c580b15202facaa0848ebe109103abe508d0dd5b/src/ow_source/create_float_source.m#L143
-            this_one = this_one.argo._where(this_one["DIRECTION"] == "A", drop=True)
-            log.debug(pretty_print_count(this_one, "after direction selection"))
-
-            # Todo: ensure we load only the primary profile of cycles with multiple sampling schemes:
-            # https://github.com/euroargodev/dm_floats/blob/c580b15202facaa0848ebe109103abe508d0dd5b/src/ow_source/create_float_source.m#L194
-
-            # # Subsample and align vertical levels (max 1 level every 10db):
-            # https://github.com/euroargodev/dm_floats/blob/c580b15202facaa0848ebe109103abe508d0dd5b/src/ow_source/create_float_source.m#L208
-            # this_one = this_one.argo.align_std_bins(inplace=False)
-            # log.debug(pretty_print_count(this_one, "after vertical levels subsampling"))
-
-            # Filter variables according to OWC workflow
-            # (I don't understand why this_one come at the end of the Matlab routine ...)
-            # https://github.com/euroargodev/dm_floats/blob/c580b15202facaa0848ebe109103abe508d0dd5b/src/ow_source/create_float_source.m#L258
-            this_one = this_one.argo.filter_scalib_pres(force=force, inplace=False)
-            log.debug(pretty_print_count(this_one, "after pressure fields selection"))
-
-            # Filter along some QC:
-            # https://github.com/euroargodev/dm_floats/blob/c580b15202facaa0848ebe109103abe508d0dd5b/src/ow_source/create_float_source.m#L372
-            this_one = this_one.argo.filter_qc(
-                QC_list=[0, 1, 2], QC_fields=["TIME_QC"], drop=True
-            )  # Matlab says to reject > 3
-            # https://github.com/euroargodev/dm_floats/blob/c580b15202facaa0848ebe109103abe508d0dd5b/src/ow_source/create_float_source.m#L420
-            this_one = this_one.argo.filter_qc(
-                QC_list=[v for v in range(10) if v != 3],
-                QC_fields=["PRES_QC"],
-                drop=True,
-            )  # Matlab says to keep != 3
-            this_one = this_one.argo.filter_qc(
-                QC_list=[v for v in range(10) if v != 4],
-                QC_fields=["PRES_QC", "TEMP_QC", "PSAL_QC"],
-                drop=True,
-                mode="any",
-            )  # Matlab says to keep != 4
-            if len(this_one["N_POINTS"]) == 0:
-                raise NoDataLeft(
-                    "All data have been discarded because either PSAL_QC or TEMP_QC is filled with 4 or"
-                    " PRES_QC is filled with 3 or 4\n"
-                    "NO SOURCE FILE WILL BE GENERATED !!!"
-                )
-            log.debug(pretty_print_count(this_one, "after QC filter"))
-
-            # Exclude dummies
-            # https://github.com/euroargodev/dm_floats/blob/c580b15202facaa0848ebe109103abe508d0dd5b/src/ow_source/create_float_source.m#L427
-            this_one = (
-                this_one.argo._where(this_one["PSAL"] <= 50, drop=True)
-                .argo._where(this_one["PSAL"] >= 0, drop=True)
-                .argo._where(this_one["PTEMP"] <= 50, drop=True)
-                .argo._where(this_one["PTEMP"] >= -10, drop=True)
-                .argo._where(this_one["PRES"] <= 6000, drop=True)
-                .argo._where(this_one["PRES"] >= 0, drop=True)
-            )
-            if len(this_one["N_POINTS"]) == 0:
-                raise NoDataLeft(
-                    "All data have been discarded because they are filled with values out of range\n"
-                    "NO SOURCE FILE WILL BE GENERATED !!!"
+        if path is not None:
+            os.makedirs(path, exist_ok=True)  # Make path exists
+
+        def float_path(WMO):
+            if path is None:
+                return None
+            return os.path.join(path, "%s%i%s.mat" % (file_pref, WMO, file_suff))
+
+        opts = {
+            "force": force,
+            "select": select,
+            "format": format,
+            "do_compression": do_compression,
+            "debug_output": debug_output,
+        }
+
+        # Run pre-processing for each float data
+        results, failed = {}, {}
+
+        def handle_error(WMO, e):
+            failed[WMO] = "%s: %s" % (type(e).__name__, str(e))
+            if errors == "raise":
+                raise e
+            elif errors == "ignore":
+                log.debug(
+                    "Ignored error while preprocessing float %i: %s" % (WMO, failed[WMO])
                 )
-            log.debug(pretty_print_count(this_one, "after dummy values exclusion"))
 
-            # Transform measurements to a collection of profiles for Matlab-like formation:
-            this_one = this_one.argo.point2profile()
+        do_parallel, method = PARALLEL_SETUP(parallel)
+        if not do_parallel:
+            WMOs = list(indexers.keys())
+            if progress:
+                WMOs = tqdm(WMOs, total=len(WMOs), disable="disable" in [progress])
+            for WMO in WMOs:
+                log.debug("> Preprocessing data for float WMO %i" % WMO)
+                try:
+                    results[WMO] = _float_source_one(
+                        this.isel(indexers[WMO]), this_path=float_path(WMO), **opts
+                    )
+                except Exception as e:
+                    handle_error(WMO, e)
 
-            # Subsample and align vertical levels (max 1 level every 10db):
-            # https://github.com/euroargodev/dm_floats/blob/c580b15202facaa0848ebe109103abe508d0dd5b/src/ow_source/create_float_source.m#L208
-            # https://github.com/euroargodev/dm_floats/blob/c580b15202facaa0848ebe109103abe508d0dd5b/src/ow_source/create_float_source.m#L451
-            bins = np.arange(0.0, np.max(this_one["PRES"]) + 10.0, 10.0)
-            this_one = this_one.argo.groupby_pressure_bins(
-                bins=bins, select=select, axis="PRES"
-            )
-            log.debug(
-                pretty_print_count(
-                    this_one, "after vertical levels subsampling and re-alignment"
+        elif method in ["thread", "process"]:
+            if method == "thread":
+                ConcurrentExecutor = concurrent.futures.ThreadPoolExecutor(
+                    max_workers=max_workers
+                )
+            else:
+                ConcurrentExecutor = concurrent.futures.ProcessPoolExecutor(
+                    max_workers=max_workers
                 )
-            )
 
-            # Compute fractional year:
-            # https://github.com/euroargodev/dm_floats/blob/c580b15202facaa0848ebe109103abe508d0dd5b/src/ow_source/create_float_source.m#L334
-            DATES = np.array(
-                [toYearFraction(d) for d in pd.to_datetime(this_one[self._TNAME].values)]
-            )[np.newaxis, :]
-
-            # Read measurements:
-            PRES = this_one["PRES"].values.T  # (mxn)
-            TEMP = this_one["TEMP"].values.T  # (mxn)
-            PTMP = this_one["PTEMP"].values.T  # (mxn)
-            SAL = this_one["PSAL"].values.T  # (mxn)
-            LAT = this_one["LATITUDE"].values[np.newaxis, :]
-            LONG = this_one["LONGITUDE"].values[np.newaxis, :]
-            LONG[0][np.argwhere(LONG[0] < 0)] = LONG[0][np.argwhere(LONG[0] < 0)] + 360
-            PROFILE_NO = this_one["CYCLE_NUMBER"].values[np.newaxis, :]
-
-            # Create dataset with preprocessed data:
-            this_one_dsp_processed = xr.DataArray(
-                PRES,
-                dims=["m", "n"],
-                coords={
-                    "m": np.arange(0, PRES.shape[0]),
-                    "n": np.arange(0, PRES.shape[1]),
-                },
-                name="PRES",
-            ).to_dataset(promote_attrs=False)
-            this_one_dsp_processed["TEMP"] = xr.DataArray(
-                TEMP,
-                dims=["m", "n"],
-                coords={
-                    "m": np.arange(0, TEMP.shape[0]),
-                    "n": np.arange(0, TEMP.shape[1]),
-                },
-                name="TEMP",
-            )
-            this_one_dsp_processed["PTMP"] = xr.DataArray(
-                PTMP,
-                dims=["m", "n"],
-                coords={
-                    "m": np.arange(0, PTMP.shape[0]),
-                    "n": np.arange(0, PTMP.shape[1]),
-                },
-                name="PTMP",
-            )
-            this_one_dsp_processed["SAL"] = xr.DataArray(
-                SAL,
-                dims=["m", "n"],
-                coords={
-                    "m": np.arange(0, SAL.shape[0]),
-                    "n": np.arange(0, SAL.shape[1]),
-                },
-                name="SAL",
-            )
-            this_one_dsp_processed["PROFILE_NO"] = xr.DataArray(
-                PROFILE_NO[0, :],
-                dims=["n"],
-                coords={"n": np.arange(0, PROFILE_NO.shape[1])},
-                name="PROFILE_NO",
-            )
-            this_one_dsp_processed["DATES"] = xr.DataArray(
-                DATES[0, :],
-                dims=["n"],
-                coords={"n": np.arange(0, DATES.shape[1])},
-                name="DATES",
-            )
-            this_one_dsp_processed["LAT"] = xr.DataArray(
-                LAT[0, :],
-                dims=["n"],
-                coords={"n": np.arange(0, LAT.shape[1])},
-                name="LAT",
-            )
-            this_one_dsp_processed["LONG"] = xr.DataArray(
-                LONG[0, :],
-                dims=["n"],
-                coords={"n": np.arange(0, LONG.shape[1])},
-                name="LONG",
+            with ConcurrentExecutor as executor:
+                future_to_wmo = {
+                    executor.submit(
+                        _float_source_one,
+                        this.isel(indexers[WMO]),
+                        this_path=float_path(WMO),
+                        **opts,
+                    ): WMO
+                    for WMO in indexers
+                }
+                futures = concurrent.futures.as_completed(future_to_wmo)
+                if progress:
+                    futures = tqdm(
+                        futures, total=len(indexers), disable="disable" in [progress]
+                    )
+                for future in futures:
+                    WMO = future_to_wmo[future]
+                    try:
+                        results[WMO] = future.result()
+                    except Exception as e:
+                        handle_error(WMO, e)
+
+        elif has_distributed and isinstance(method, distributed.client.Client):
+            WMOs = list(indexers.keys())
+            futures = method.map(
+                _float_source_one,
+                [this.isel(indexers[WMO]) for WMO in WMOs],
+                [float_path(WMO) for WMO in WMOs],
+                **opts,
             )
-            this_one_dsp_processed["m"].attrs = {"long_name": "vertical levels"}
-            this_one_dsp_processed["n"].attrs = {"long_name": "profiles"}
+            for WMO, future in zip(WMOs, futures):
+                try:
+                    results[WMO] = future.result()
+                except Exception as e:
+                    handle_error(WMO, e)
 
-            # Create Matlab dictionary with preprocessed data (to be used by savemat):
-            mdata = ds2mat(this_one_dsp_processed)
+        else:
+            raise InvalidMethod(method)
 
-            # Output
-            log.debug("float source data saved in: %s" % this_path)
-            if this_path is None:
-                if debug_output:
-                    return mdata, this_one_dsp_processed, this_one  # For debug/devel
-                else:
-                    return this_one_dsp_processed
-            else:
-                from scipy.io import savemat
-
-                # Validity check of the path type is delegated to savemat
-                return savemat(
-                    this_path,
-                    mdata,
-                    appendmat=False,
-                    format=format,
-                    do_compression=do_compression,
-                )
+        if len(failed) > 0:
+            log.debug(
+                "create_float_source failed for %i/%i floats: %s"
+                % (len(failed), len(indexers), failed)
+            )
 
-        # Run pre-processing for each float data
+        # Output, sorted by WMO:
         output = {}
-        for WMO in np.unique(this["PLATFORM_NUMBER"]):
-            log.debug("> Preprocessing data for float WMO %i" % WMO)
-            this_float = this.argo._where(this["PLATFORM_NUMBER"] == WMO, drop=True)
-            if path is None:
-                output[WMO] = preprocess_one_float(
-                    this_float, this_path=path, select=select, debug_output=debug_output
-                )
-            else:
-                os.makedirs(path, exist_ok=True)  # Make path exists
-                float_path = os.path.join(
-                    path, "%s%i%s.mat" % (file_pref, WMO, file_suff)
-                )
-                preprocess_one_float(
-                    this_float,
-                    this_path=float_path,
-                    select=select,
-                    debug_output=debug_output,
-                )
-                output[WMO] = float_path
-        if path is None:
-            log.debug("===================== END create_float_source")
+        for WMO in sorted(results):
+            output[WMO] = results[WMO] if path is None else float_path(WMO)
+
+        log.debug("===================== END create_float_source")
+        if list_failed:
+            return output, failed
+        else:
             return output
 
     def list_N_PROF_variables(self, uid=False):
@@ -1986,7 +1882,7 @@ def to_zarr(self, *args, **kwargs) -> Union[ZarrStore, Delayed]:
         Before write operation is delegated to :class:`xarray.Dataset.to_zarr`, we perform the following:
 
         - Ensure all variables are appropriately cast.
-        - If the ``encoding`` argument is not specified, we automatically add a ``Blosc(cname="zstd", clevel=3, shuffle=2)`` compression to all variables. Set `encoding=None` for no compression.
+        - If the ``encoding`` argument is not specified, we automatically add a ``Blosc(cname="zstd", clevel=3, shuffle=2)`` compression to all variables (a :class:`zarr.codecs.BloscCodec` with zarr >= 3, unless ``zarr_format=2``). Set `encoding=None` for no compression.
 
         Parameters
         ----------
@@ -2008,17 +1904,31 @@ def to_zarr(self, *args, **kwargs) -> Union[ZarrStore, Delayed]:
 
         # Add zarr compression to encoding:
         if "encoding" not in kwargs:
-            from numcodecs import Blosc
-            compressor = Blosc(cname="zstd", clevel=3, shuffle=2)
+            import zarr
+
+            if int(zarr.__version__.split(".")[0]) >= 3 and kwargs.get("zarr_format", None) != 2:
+                compression = {"compressors": zarr.codecs.BloscCodec(cname="zstd", clevel=3, shuffle="bitshuffle")}
+            else:
+                from numcodecs import Blosc
+                compression = {"compressor": Blosc(cname="zstd", clevel=3, shuffle=2)}
             encoding = {}
             for v in self._obj:
-                encoding.update({v: {"compressor": compressor}})
+                encoding.update({v: compression})
             kwargs.update({'encoding': encoding})
 
         # Convert to a zarr file using compression:
         return self._obj.to_zarr(*args, **kwargs)
 
-    def reduce_profile(self, func, params=[], **kwargs) -> xr.DataArray:
+    def reduce_profile(
+        self,
+        func,
+        params=[],
+        vectorize: bool = True,
+        output_dtype=None,
+        chunks=None,
+        scheduler=None,
+        **kwargs,
+    ) -> xr.DataArray:
         """Apply a vectorized function for unlabeled arrays for each Argo profiles
 
         This method allows to execute a per profile diagnostic function very efficiently. Such a diagnostic function
@@ -2035,6 +1945,24 @@ def reduce_profile(self, func, params=[], **kwargs) -> xr.DataArray:
             Name, or list of names, of the dataset parameters expected by ``func``. All of these parameters
             must have ``N_LEVELS`` as a dimension.
 
+        vectorize: bool, optional, default: True
+            If True, ``func`` is called on each 1D profile. If False, ``func`` must handle arrays with any number
+            of leading dimensions and ``N_LEVELS`` as the last one, and is called once (or once per chunk).
+
+        output_dtype: optional, default: None
+            Data type of the ``func`` output. This is only used with dask arrays, to avoid inferring it by calling
+            ``func`` on dummy data. Note that with ``vectorize=True``, string outputs are truncated to 1 character,
+            use ``object`` instead.
+
+        chunks: int, str or tuple, optional, default: None
+            If set, parameters are chunked along ``N_PROF`` with this value before computation, so that ``func``
+            is applied in parallel by dask, one chunk at a time.
+
+        scheduler: str or :class:`distributed.Client`, optional, default: None
+            If set, compute the result with this dask scheduler (eg: 'threads', 'processes', 'synchronous' or a
+            :class:`distributed.Client`) and return an in-memory array. If not set, a lazy dask array is returned
+            for dask-backed inputs.
+
         **kwargs: dict, optional
             Keyword arguments to be passed to ``func``.
 
@@ -2093,6 +2021,12 @@ def max_salinity_depth(pres, psal):
             # Apply reduce function on all profiles:
             da = dsp.argo.reduce_profile(max_salinity_depth, params=['PRES', 'PSAL'])  # Return a dask array
             da.compute()
+
+        .. code-block:: python
+            :caption: Example 4: chunk an in-memory dataset and compute with a pool of processes
+
+            da = dsp.argo.reduce_profile(max_salinity_depth, params=['PRES', 'PSAL'],
+                                         chunks=1000, scheduler='processes')
         """
         if self._type != "profile":
             raise InvalidDatasetStructure(
@@ -2113,7 +2047,14 @@ def max_salinity_depth(pres, psal):
 
         # Create the reduce function list of arguments:
         ufunc_args = []
-        [ufunc_args.append(self._obj[param]) for param in plist]
+        for param in plist:
+            arg = self._obj[param]
+            if chunks is not None:
+                arg = arg.chunk({"N_PROF": chunks, "N_LEVELS": -1})
+            elif arg.chunks is not None:
+                # With dask, the core dimension must be a single chunk:
+                arg = arg.chunk({"N_LEVELS": -1})
+            ufunc_args.append(arg)
 
         # Create the xr.apply_ufunc list of keywords arguments:
         ufunc_kwargs = dict(
@@ -2124,20 +2065,276 @@ def max_salinity_depth(pres, psal):
             # must also appear in ``input_core_dims`` for at least one argument
             exclude_dims=set(("N_LEVELS",)),
 
-            vectorize=True,  # loop over non-core dims
+            vectorize=vectorize,  # loop over non-core dims
             dask="parallelized",
         )
+        if output_dtype is not None and any([arg.chunks is not None for arg in ufunc_args]):
+            ufunc_kwargs.update({"output_dtypes": [output_dtype]})
         reduced = xr.apply_ufunc(
             func,
             *ufunc_args,
             **ufunc_kwargs,
         )
+        if scheduler is not None and reduced.chunks is not None:
+            reduced = reduced.compute(scheduler=scheduler)
         return reduced
 
     def map_vars_to_dict(self, var_key: str, var_val:str, duplicate:bool=False) -> dict[Any, Any]:
         return map_vars_to_dict(self._obj, var_key=var_key, var_val=var_val, duplicate=duplicate)
 
 
+def _float_source_ds2mat(this_dsp):
+    # Return a Matlab dictionary with dataset data to be used by savemat:
+    mdata = {}
+    mdata["PROFILE_NO"] = (
+        this_dsp["PROFILE_NO"].astype("uint16").values.T[np.newaxis, :]
+    )  # 1-based index in Matlab
+    mdata["DATES"] = this_dsp["DATES"].values.T[np.newaxis, :]
+    mdata["LAT"] = this_dsp["LAT"].values.T[np.newaxis, :]
+    mdata["LONG"] = this_dsp["LONG"].values.T[np.newaxis, :]
+    mdata["PRES"] = this_dsp["PRES"].values
+    mdata["TEMP"] = this_dsp["TEMP"].values
+    mdata["PTMP"] = this_dsp["PTMP"].values
+    mdata["SAL"] = this_dsp["SAL"].values
+    return mdata
+
+
+def _float_source_count(dd, txt):
+    # if dd.argo._type == "point":
+    #     np = len(dd['N_POINTS'].values)
+    #     nc = len(dd.argo.point2profile()['N_PROF'].values)
+    # else:
+    #     np = len(dd.argo.profile2point()['N_POINTS'].values)
+    #     nc = len(dd['N_PROF'].values)
+    out = []
+    np, nc = dd.argo.N_POINTS, dd.argo.N_PROF
+    out.append("%i points / %i profiles in dataset %s" % (np, nc, txt))
+    # np.unique(this['PSAL_QC'].values))
+    # out.append(pd.to_datetime(dd['TIME'][0].values).strftime('%Y/%m/%d %H:%M:%S'))
+    return "\n".join(out)
+
+
+def _float_source_one(
+    this_one: xr.Dataset,
+    this_path: str or os.PathLike = None,
+    force: str = "default",
+    select: str = "deep",
+    format: str = "5",
+    do_compression: bool = True,
+    debug_output: bool = False,
+):
+    """Run the entire OWC float source preprocessing on a given dataset with one float data
+
+    This is a module level function, so that it can be pickled and sent to a pool of processes
+    by :meth:`ArgoAccessor.create_float_source`.
+    """
+
+    # Add potential temperature:
+    if "PTEMP" not in this_one:
+        this_one = this_one.argo.teos10(vlist=["PTEMP"], inplace=True)
+
+    # Only use Ascending profiles:
+    # https://github.com/euroargodev/dm_floats/blob/c580b15202facaa0848ebe109103abe508d0dd5b/src/ow_source/create_float_source.m#L143
+    this_one = this_one.argo._where(this_one["DIRECTION"] == "A", drop=True)
+    log.debug(_float_source_count(this_one, "after direction selection"))
+
+    # Todo: ensure we load only the primary profile of cycles with multiple sampling schemes:
+    # https://github.com/euroargodev/dm_floats/blob/c580b15202facaa0848ebe109103abe508d0dd5b/src/ow_source/create_float_source.m#L194
+
+    # # Subsample and align vertical levels (max 1 level every 10db):
+    # https://github.com/euroargodev/dm_floats/blob/c580b15202facaa0848ebe109103abe508d0dd5b/src/ow_source/create_float_source.m#L208
+    # this_one = this_one.argo.align_std_bins(inplace=False)
+    # log.debug(_float_source_count(this_one, "after vertical levels subsampling"))
+
+    # Filter variables according to OWC workflow
+    # (I don't understand why this_one come at the end of the Matlab routine ...)
+    # https://github.com/euroargodev/dm_floats/blob/c580b15202facaa0848ebe109103abe508d0dd5b/src/ow_source/create_float_source.m#L258
+    this_one = this_one.argo.filter_scalib_pres(force=force, inplace=False)
+    log.debug(_float_source_count(this_one, "after pressure fields selection"))
+
+    # Filter along some QC:
+    # https://github.com/euroargodev/dm_floats/blob/c580b15202facaa0848ebe109103abe508d0dd5b/src/ow_source/create_float_source.m#L372
+    this_one = this_one.argo.filter_qc(
+        QC_list=[0, 1, 2], QC_fields=["TIME_QC"], drop=True
+    )  # Matlab says to reject > 3
+    # https://github.com/euroargodev/dm_floats/blob/c580b15202facaa0848ebe109103abe508d0dd5b/src/ow_source/create_float_source.m#L420
+    this_one = this_one.argo.filter_qc(
+        QC_list=[v for v in range(10) if v != 3],
+        QC_fields=["PRES_QC"],
+        drop=True,
+    )  # Matlab says to keep != 3
+    this_one = this_one.argo.filter_qc(
+        QC_list=[v for v in range(10) if v != 4],
+        QC_fields=["PRES_QC", "TEMP_QC", "PSAL_QC"],
+        drop=True,
+        mode="any",
+    )  # Matlab says to keep != 4
+    if len(this_one["N_POINTS"]) == 0:
+        raise NoDataLeft(
+            "All data have been discarded because either PSAL_QC or TEMP_QC is filled with 4 or"
+            " PRES_QC is filled with 3 or 4\n"
+            "NO SOURCE FILE WILL BE GENERATED !!!"
+        )
+    log.debug(_float_source_count(this_one, "after QC filter"))
+
+    # Exclude dummies
+    # https://github.com/euroargodev/dm_floats/blob/c580b15202facaa0848ebe109103abe508d0dd5b/src/ow_source/create_float_source.m#L427
+    this_one = (
+        this_one.argo._where(this_one["PSAL"] <= 50, drop=True)
+        .argo._where(this_one["PSAL"] >= 0, drop=True)
+        .argo._where(this_one["PTEMP"] <= 50, drop=True)
+        .argo._where(this_one["PTEMP"] >= -10, drop=True)
+        .argo._where(this_one["PRES"] <= 6000, drop=True)
+        .argo._where(this_one["PRES"] >= 0, drop=True)
+    )
+    if len(this_one["N_POINTS"]) == 0:
+        raise NoDataLeft(
+            "All data have been discarded because they are filled with values out of range\n"
+            "NO SOURCE FILE WILL BE GENERATED !!!"
+        )
+    log.debug(_float_source_count(this_one, "after dummy values exclusion"))
+
+    # Transform measurements to a collection of profiles for Matlab-like formation:
+    this_one = this_one.argo.point2profile()
+
+    # Subsample and align vertical levels (max 1 level every 10db):
+    # https://github.com/euroargodev/dm_floats/blob/c580b15202facaa0848ebe109103abe508d0dd5b/src/ow_source/create_float_source.m#L208
+    # https://github.com/euroargodev/dm_floats/blob/c580b15202facaa0848ebe109103abe508d0dd5b/src/ow_source/create_float_source.m#L451
+    bins = np.arange(0.0, np.max(this_one["PRES"]) + 10.0, 10.0)
+    this_one = this_one.argo.groupby_pressure_bins(
+        bins=bins, select=select, axis="PRES"
+    )
+    log.debug(
+        _float_source_count(
+            this_one, "after vertical levels subsampling and re-alignment"
+        )
+    )
+
+    # Compute fractional year:
+    # https://github.com/euroargodev/dm_floats/blob/c580b15202facaa0848ebe109103abe508d0dd5b/src/ow_source/create_float_source.m#L334
+    DATES = np.array(
+        [toYearFraction(d) for d in pd.to_datetime(this_one[this_one.argo._TNAME].values)]
+    )[np.newaxis, :]
+
+    # Read measurements:
+    PRES = this_one["PRES"].values.T  # (mxn)
+    TEMP = this_one["TEMP"].values.T  # (mxn)
+    PTMP = this_one["PTEMP"].values.T  # (mxn)
+    SAL = this_one["PSAL"].values.T  # (mxn)
+    LAT = this_one["LATITUDE"].values[np.newaxis, :]
+    LONG = this_one["LONGITUDE"].values[np.newaxis, :]
+    LONG[0][np.argwhere(LONG[0] < 0)] = LONG[0][np.argwhere(LONG[0] < 0)] + 360
+    PROFILE_NO = this_one["CYCLE_NUMBER"].values[np.newaxis, :]
+
+    # Create dataset with preprocessed data:
+    this_one_dsp_processed = xr.DataArray(
+        PRES,
+        dims=["m", "n"],
+        coords={
+            "m": np.arange(0, PRES.shape[0]),
+            "n": np.arange(0, PRES.shape[1]),
+        },
+        name="PRES",
+    ).to_dataset(promote_attrs=False)
+    this_one_dsp_processed["TEMP"] = xr.DataArray(
+        TEMP,
+        dims=["m", "n"],
+        coords={
+            "m": np.arange(0, TEMP.shape[0]),
+            "n": np.arange(0, TEMP.shape[1]),
+        },
+        name="TEMP",
+    )
+    this_one_dsp_processed["PTMP"] = xr.DataArray(
+        PTMP,
+        dims=["m", "n"],
+        coords={
+            "m": np.arange(0, PTMP.shape[0]),
+            "n": np.arange(0, PTMP.shape[1]),
+        },
+        name="PTMP",
+    )
+    this_one_dsp_processed["SAL"] = xr.DataArray(
+        SAL,
+        dims=["m", "n"],
+        coords={
+            "m": np.arange(0, SAL.shape[0]),
+            "n": np.arange(0, SAL.shape[1]),
+        },
+        name="SAL",
+    )
+    this_one_dsp_processed["PROFILE_NO"] = xr.DataArray(
+        PROFILE_NO[0, :],
+        dims=["n"],
+        coords={"n": np.arange(0, PROFILE_NO.shape[1])},
+        name="PROFILE_NO",
+    )
+    this_one_dsp_processed["DATES"] = xr.DataArray(
+        DATES[0, :],
+        dims=["n"],
+        coords={"n": np.arange(0, DATES.shape[1])},
+        name="DATES",
+    )
+    this_one_dsp_processed["LAT"] = xr.DataArray(
+        LAT[0, :],
+        dims=["n"],
+        coords={"n": np.arange(0, LAT.shape[1])},
+        name="LAT",
+    )
+    this_one_dsp_processed["LONG"] = xr.DataArray(
+        LONG[0, :],
+        dims=["n"],
+        coords={"n": np.arange(0, LONG.shape[1])},
+        name="LONG",
+    )
+    this_one_dsp_processed["m"].attrs = {"long_name": "vertical levels"}
+    this_one_dsp_processed["n"].attrs = {"long_name": "profiles"}
+
+    # Create Matlab dictionary with preprocessed data (to be used by savemat):
+    mdata = _float_source_ds2mat(this_one_dsp_processed)
+
+    # Output
+    log.debug("float source data saved in: %s" % this_path)
+    if this_path is None:
+        if debug_output:
+            return mdata, this_one_dsp_processed, this_one  # For debug/devel
+        else:
+            return this_one_dsp_processed
+    else:
+        from scipy.io import savemat
+
+        # Validity check of the path type is delegated to savemat
+        return savemat(
+            this_path,
+            mdata,
+            appendmat=False,
+            format=format,
+            do_compression=do_compression,
+        )
+
+
+def _float_source_indexers(ds: xr.Dataset) -> dict:
+    """Return a dictionary mapping each float WMO to the indexer of its data along the dataset dimension
+
+    Indexers are slices if a float data are contiguous (in which case :meth:`xarray.Dataset.isel` returns views
+    and not copies), otherwise arrays of indices.
+    """
+    dim = ds["PLATFORM_NUMBER"].dims[0]
+    wmos = ds["PLATFORM_NUMBER"].values
+    order = np.argsort(wmos, kind="stable")
+    uwmos, starts = np.unique(wmos[order], return_index=True)
+    stops = np.append(starts[1:], len(order))
+
+    indexers = {}
+    for wmo, start, stop in zip(uwmos, starts, stops):
+        idx = order[start:stop]
+        if idx[-1] - idx[0] + 1 == len(idx):
+            indexers[wmo] = {dim: slice(int(idx[0]), int(idx[-1]) + 1)}
+        else:
+            indexers[wmo] = {dim: idx}
+    return indexers
+
+
 def open_Argo_dataset(filename_or_obj):
     time_coder = xr.coders.CFDatetimeCoder(use_cftime=False)
     ds = xr.open_dataset(filename_or_obj, decode_cf=1, decode_times=time_coder, mask_and_scale=1, decode_timedelta=True)
@@ -2187,3 +2384,7 @@ def guess_can_open(self, filename_or_obj):
             return "Conventions" in attrs and "Argo" in attrs["Conventions"]
         else:
             return False
+
+
+# Register accessor extensions, whatever the route used to import the accessor:
+from . import extensions  # noqa: E402, F401
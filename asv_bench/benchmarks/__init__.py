@@ -0,0 +1,281 @@
+"""
+argopy benchmarks
+
+Benchmarks are run with `airspeed velocity <https://asv.readthedocs.io>`_ from the ``asv_bench`` folder:
+
+```
+cd asv_bench
+asv run
+asv continuous main HEAD  # Compare the current branch against main
+asv run --bench index --quick  # Run once a subset of benchmarks
+```
+
+All benchmarks run offline, on synthetic Argo index files and datasets created by the helpers below.
+Scaling parameters are given to benchmark classes with the ``params`` and ``param_names`` attributes.
+"""
+import importlib
+import os
+from pathlib import Path
+from typing import List
+
+import numpy as np
+import pandas as pd
+import xarray as xr
+
+
+#: Mediterranean Sea box, so that CANYON-MED can make predictions on synthetic data
+BOX = [3.0, 20.0, 34.0, 42.0, "2010-01-01", "2020-01-01"]
+
+CORE_HEADER = "file,date,latitude,longitude,ocean,profiler_type,institution,date_update"
+BGC_HEADER = (
+    "file,date,latitude,longitude,ocean,profiler_type,institution,parameters,parameter_data_mode,date_update"
+)
+BGC_PARAMETERS = ["PRES", "TEMP", "PSAL", "DOXY"]
+
+
+def requires(*modules):
+    """Skip a benchmark if one of the modules is not available
+
+    Raising :class:`NotImplementedError` in a ``setup`` method is the asv way to skip a benchmark.
+    """
+    for module in modules:
+        if importlib.util.find_spec(module) is None:
+            raise NotImplementedError("'%s' is not available" % module)
+
+
+def randn(shape, seed=0):
+    """Return random floats from a standard normal distribution"""
+    return np.random.default_rng(seed).standard_normal(shape)
+
+
+def wmo_list(n_floats: int) -> List[int]:
+    """Return a list of synthetic WMOs"""
+    return [5900000 + i for i in range(n_floats)]
+
+
+def make_index(
+    path: str, n_rows: int, n_cycles: int = 100, convention: str = "core"
+) -> str:
+    """Write a synthetic profile index file
+
+    Parameters
+    ----------
+    path: str
+        Folder where to write the index file
+    n_rows: int
+        Number of profiles in the index
+    n_cycles: int, default: 100
+        Number of profiles per float
+    convention: str, default: ``core``
+        Index convention, ``core`` or ``bgc-s``
+
+    Returns
+    -------
+    str
+        Path to the index file
+    """
+    rng = np.random.default_rng(0)
+    i = np.arange(n_rows)
+    wmo = 5900000 + i // n_cycles
+    cyc = 1 + i % n_cycles
+    dac = np.array(["aoml", "coriolis", "csiro", "jma"])[(i // n_cycles) % 4]
+    institution = np.array(["AO", "IF", "CS", "JA"])[(i // n_cycles) % 4]
+    profiler = np.array([845, 846, 851, 869])[(i // n_cycles) % 4]
+    dates = np.datetime64(BOX[4], "s") + rng.integers(0, 3650 * 86400, n_rows).astype("timedelta64[s]")
+    lon = rng.uniform(BOX[0], BOX[1], n_rows).round(3)
+    lat = rng.uniform(BOX[2], BOX[3], n_rows).round(3)
+
+    df = pd.DataFrame(
+        {
+            "date": pd.Series(np.datetime_as_string(dates)).str.replace(r"[-T:]", "", regex=True),
+            "latitude": lat,
+            "longitude": lon,
+            "ocean": "A",
+            "profiler_type": profiler,
+            "institution": institution,
+        }
+    )
+    if convention == "core":
+        fname, header = "ar_index_global_prof.txt", CORE_HEADER
+        prefix = np.where(rng.random(n_rows) < 0.5, "D", "R")
+    else:
+        fname, header = "argo_synthetic-profile_index.txt", BGC_HEADER
+        prefix = np.where(rng.random(n_rows) < 0.5, "SD", "SR")
+        df["parameters"] = " ".join(BGC_PARAMETERS)
+        df["parameter_data_mode"] = [
+            "".join(m)
+            for m in np.array(["R", "A", "D"])[
+                rng.integers(0, 3, (n_rows, len(BGC_PARAMETERS)))
+            ]
+        ]
+    wmo = pd.Series(wmo).astype(str)
+    df.insert(
+        0,
+        "file",
+        dac + "/" + wmo + "/profiles/" + prefix + wmo + "_" + pd.Series(cyc).astype(str).str.zfill(3) + ".nc",
+    )
+    df["date_update"] = "20240101000000"
+
+    ifile = Path(path).joinpath(fname)
+    with open(ifile, "w") as f:
+        f.write("# Title : Profile directory file of the Argo Global Data Assembly Center\n")
+        f.write("# Description : Synthetic index for argopy benchmarks\n")
+        f.write("# Project : ARGO\n")
+        f.write("# Format version : 2.0\n")
+        f.write("# Date of update : 20240101000000\n")
+        f.write("# FTP root number 1 : ftp://ftp.ifremer.fr/ifremer/argo/dac\n")
+        f.write("# FTP root number 2 : ftp://usgodae.org/pub/outgoing/argo/dac\n")
+        f.write("# GDAC node : CORIOLIS\n")
+        f.write(header + "\n")
+        df.to_csv(f, header=False, index=False)
+    return str(ifile)
+
+
+def make_profiles(
+    n_prof: int, n_levels: int, mode: str = "standard", bgc: bool = False
+) -> xr.Dataset:
+    """Create a synthetic collection of Argo profiles, as returned by ``argo.point2profile``
+
+    Profiles have a random number of levels between ``n_levels // 2`` and ``n_levels``, and are spread
+    over floats with 100 profiles each.
+
+    Parameters
+    ----------
+    n_prof: int
+        Number of profiles
+    n_levels: int
+        Maximum number of vertical levels
+    mode: str, default: ``standard``
+        Dataset user mode. In ``expert`` mode, ``<PARAM>_ADJUSTED`` variables are added.
+    bgc: bool, default: False
+        Add a ``DOXY`` parameter
+
+    Returns
+    -------
+    :class:`xarray.Dataset`
+    """
+    rng = np.random.default_rng(1)
+    n_valid = rng.integers(max(1, n_levels // 2), n_levels + 1, n_prof)
+    valid = np.arange(n_levels)[np.newaxis, :] < n_valid[:, np.newaxis]
+
+    pres = np.cumsum(rng.uniform(5.0, 2000.0 * 2 / n_levels, (n_prof, n_levels)), axis=1)
+    profile = {
+        "PRES": pres,
+        "TEMP": 20.0 * np.exp(-pres / 800.0) + 0.1 * randn((n_prof, n_levels), seed=2),
+        "PSAL": 38.0 + 0.2 * np.exp(-pres / 500.0) + 0.01 * randn((n_prof, n_levels), seed=3),
+    }
+    if bgc:
+        profile["DOXY"] = 180.0 + 60.0 * np.exp(-pres / 300.0) + randn((n_prof, n_levels), seed=4)
+
+    ds = xr.Dataset()
+    i = np.arange(n_prof)
+    ds["PLATFORM_NUMBER"] = xr.DataArray(5900000 + i // 100, dims="N_PROF")
+    ds["CYCLE_NUMBER"] = xr.DataArray(1 + i % 100, dims="N_PROF")
+    ds["DIRECTION"] = xr.DataArray(np.full(n_prof, "A", dtype="<U1"), dims="N_PROF")
+    ds["DATA_MODE"] = xr.DataArray(
+        np.array(["R", "A", "D"], dtype="<U1")[rng.integers(0, 3, n_prof)], dims="N_PROF"
+    )
+    ds["POSITION_QC"] = xr.DataArray(np.ones(n_prof, dtype=int), dims="N_PROF")
+    ds["TIME_QC"] = xr.DataArray(np.ones(n_prof, dtype=int), dims="N_PROF")
+
+    suffixes = ["", "_ADJUSTED"] if mode == "expert" else [""]
+    for param, values in profile.items():
+        for suffix in suffixes:
+            ds["%s%s" % (param, suffix)] = xr.DataArray(
+                np.where(valid, values, np.nan).astype(np.float32),
+                dims=("N_PROF", "N_LEVELS"),
+            )
+            qc = np.where(rng.random((n_prof, n_levels)) < 0.9, 1, 4)
+            ds["%s%s_QC" % (param, suffix)] = xr.DataArray(
+                np.where(valid, qc, 0), dims=("N_PROF", "N_LEVELS")
+            )
+            ds["%s%s_ERROR" % (param, suffix)] = xr.DataArray(
+                np.where(valid, 0.01, np.nan).astype(np.float32),
+                dims=("N_PROF", "N_LEVELS"),
+            )
+
+    ds = ds.assign_coords(
+        {
+            "TIME": ("N_PROF", pd.to_datetime(BOX[4]) + pd.to_timedelta(10 * (i % 100), unit="D")),
+            "LATITUDE": ("N_PROF", rng.uniform(BOX[2], BOX[3], n_prof)),
+            "LONGITUDE": ("N_PROF", rng.uniform(BOX[0], BOX[1], n_prof)),
+            "N_PROF": i,
+            "N_LEVELS": np.arange(n_levels),
+        }
+    )
+    ds.attrs = {"DATA_ID": "ARGO", "Fetched_from": "benchmarks"}
+    return ds
+
+
+def make_points(
+    n_prof: int, n_levels: int, mode: str = "standard", bgc: bool = False
+) -> xr.Dataset:
+    """Create a synthetic collection of Argo points, as returned by a data fetcher
+
+    Points are the valid levels of profiles created with :func:`make_profiles`.
+
+    Returns
+    -------
+    :class:`xarray.Dataset`
+    """
+    dsp = make_profiles(n_prof, n_levels, mode=mode, bgc=bgc)
+    valid = np.isfinite(dsp["PRES"].values)
+    iprof = np.broadcast_to(np.arange(n_prof)[:, np.newaxis], valid.shape)[valid]
+
+    ds = xr.Dataset()
+    for v in dsp.variables:
+        if v in ["N_PROF", "N_LEVELS"]:
+            continue
+        if dsp[v].dims == ("N_PROF",):
+            ds[v] = xr.DataArray(dsp[v].values[iprof], dims="N_POINTS")
+        else:
+            ds[v] = xr.DataArray(dsp[v].values[valid], dims="N_POINTS")
+    ds = ds.set_coords(["TIME", "LATITUDE", "LONGITUDE"])
+    ds = ds.assign_coords(N_POINTS=np.arange(ds.sizes["N_POINTS"]))
+    ds.attrs = dsp.attrs
+    return ds
+
+
+def make_raw_profiles(n_prof: int, n_levels: int) -> xr.Dataset:
+    """Create a synthetic collection of profiles with raw variable types, as they come out of a netcdf file"""
+    dsp = make_profiles(n_prof, n_levels)
+    ds = xr.Dataset()
+    ds["PLATFORM_NUMBER"] = xr.DataArray(
+        np.array(["%i    " % w for w in dsp["PLATFORM_NUMBER"].values], dtype=object),
+        dims="N_PROF",
+        attrs={"conventions": "WMO float identifier : A9IIIII"},
+    )
+    ds["CYCLE_NUMBER"] = dsp["CYCLE_NUMBER"].astype(float)
+    ds["DATA_MODE"] = dsp["DATA_MODE"].astype(object)
+    ds["DIRECTION"] = dsp["DIRECTION"].astype(object)
+    for param in ["PRES", "TEMP", "PSAL"]:
+        ds[param] = dsp[param]
+        qc = dsp["%s_QC" % param].values.astype(str).astype(object)
+        qc[qc == "0"] = " "
+        ds["%s_QC" % param] = xr.DataArray(qc, dims=("N_PROF", "N_LEVELS"))
+    ds["DATE_CREATION"] = xr.DataArray(
+        np.array(["20240101120000"] * n_prof, dtype=object),
+        dims="N_PROF",
+        attrs={"conventions": "YYYYMMDDHHMISS"},
+    )
+    return ds.drop_vars(["N_PROF", "N_LEVELS"])
+
+
+def make_files(path: str, n_files: int, n_prof: int = 10, n_levels: int = 100) -> List[str]:
+    """Write synthetic collections of Argo points in netcdf files, one per float
+
+    Files are written in the netcdf-3 format, like GDAC files.
+
+    Returns
+    -------
+    list(str)
+        List of netcdf file paths
+    """
+    ds = make_points(n_prof, n_levels)
+    files = []
+    for i, wmo in enumerate(wmo_list(n_files)):
+        ds["PLATFORM_NUMBER"].values[:] = wmo
+        f = os.path.join(path, "%i.nc" % wmo)
+        ds.to_netcdf(f, format="NETCDF3_64BIT")
+        files.append(f)
+    return files
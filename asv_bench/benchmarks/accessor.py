@@ -0,0 +1,39 @@
+import numpy as np
+
+import argopy  # noqa: F401, register the argo accessor
+
+from . import make_points, make_profiles
+
+
+SIZES = [(100, 100), (1_000, 100), (1_000, 500)]
+
+
+class Transforms:
+    """Argo accessor transformations of collections of points and profiles"""
+
+    params = (SIZES, ["standard", "expert"])
+    param_names = ["size", "mode"]
+    timeout = 600
+
+    def setup(self, size, mode):
+        n_prof, n_levels = size
+        self.ds_points = make_points(n_prof, n_levels, mode=mode)
+        self.ds_profiles = make_profiles(n_prof, n_levels, mode=mode)
+
+    def time_point2profile(self, *args):
+        self.ds_points.argo.point2profile()
+
+    def peakmem_point2profile(self, *args):
+        self.ds_points.argo.point2profile()
+
+    def time_profile2point(self, *args):
+        self.ds_profiles.argo.profile2point()
+
+    def time_filter_qc(self, *args):
+        self.ds_points.argo.filter_qc(QC_list=[1, 2], QC_fields="all")
+
+    def time_interp_std_levels(self, *args):
+        self.ds_profiles.argo.interp_std_levels(np.arange(0, 900, 10))
+
+    def time_groupby_pressure_bins(self, *args):
+        self.ds_points.argo.groupby_pressure_bins(np.arange(0, 1000, 100), select="deep")
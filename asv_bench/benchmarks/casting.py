@@ -0,0 +1,33 @@
+from argopy.utils import cast_Argo_variable_type
+
+from . import make_raw_profiles, requires
+
+
+class CastArgoVariableType:
+    """Cast raw netcdf variables to Argo types"""
+
+    params = [(100, 1_000, 10_000), (100, 500)]
+    param_names = ["n_prof", "n_levels"]
+
+    def setup(self, n_prof, n_levels):
+        self.ds = make_raw_profiles(n_prof, n_levels)
+
+    def time_cast(self, *args):
+        cast_Argo_variable_type(self.ds.copy())
+
+    def peakmem_cast(self, *args):
+        cast_Argo_variable_type(self.ds.copy())
+
+
+class CastArgoVariableTypeLazy(CastArgoVariableType):
+    """Cast raw netcdf variables to Argo types with dask arrays"""
+
+    def setup(self, n_prof, n_levels):
+        requires("dask")
+        self.ds = make_raw_profiles(n_prof, n_levels).chunk({"N_PROF": 100})
+
+    def time_cast(self, *args):
+        cast_Argo_variable_type(self.ds.copy()).compute()
+
+    def peakmem_cast(self, *args):
+        cast_Argo_variable_type(self.ds.copy()).compute()
@@ -0,0 +1,61 @@
+import tempfile
+
+import argopy  # noqa: F401, register the argo accessor
+from argopy.stores.index import indexstore_pd
+
+from . import make_index, make_points, requires
+
+
+class DataMode:
+    """Compute <PARAM>_DATA_MODE variables from a BGC index"""
+
+    params = [(100, 1_000, 10_000)]
+    param_names = ["n_prof"]
+    timeout = 300
+
+    def setup(self, n_prof):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        make_index(self.tmpdir.name, 10 * n_prof, convention="bgc-s")
+        self.idx = indexstore_pd(host=self.tmpdir.name, index_file="bgc-s", cache=False).load()
+        self.ds = make_points(n_prof, 100, mode="expert", bgc=True)
+
+    def teardown(self, *args):
+        self.tmpdir.cleanup()
+
+    def time_compute(self, *args):
+        self.ds.copy().argo.datamode.compute(self.idx)
+
+
+class CanyonMED:
+    """CANYON-MED predictions"""
+
+    params = [(1_000, 10_000, 100_000), ("PO4", "DIC")]
+    param_names = ["n_points", "param"]
+    timeout = 300
+
+    def setup(self, n_points, param):
+        self.ds = make_points(n_points // 10, 10, bgc=True)
+        # Cache coefficients, so that only predictions are measured:
+        self.ds.isel(N_POINTS=slice(0, 2)).argo.canyon_med.predict(param)
+
+    def time_predict(self, n_points, param):
+        self.ds.argo.canyon_med.predict(param)
+
+
+class CanyonB:
+    """CANYON-B predictions"""
+
+    params = [(1_000, 10_000, 100_000), ("PO4", "DIC")]
+    param_names = ["n_points", "param"]
+    timeout = 600
+
+    def setup(self, n_points, param):
+        requires("PyCO2SYS", "numba", "joblib")
+        self.ds = make_points(n_points // 10, 10, bgc=True)
+        self.ds.argo.canyon_b.warmup(param)
+
+    def time_predict(self, n_points, param):
+        self.ds.argo.canyon_b.predict(param, n_jobs=1)
+
+    def time_predict_chunks(self, n_points, param):
+        self.ds.argo.canyon_b.predict(param, chunksize=n_points // 4)
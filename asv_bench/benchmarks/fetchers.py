@@ -0,0 +1,27 @@
+import os
+
+import argopy
+from argopy.tutorial import synthetic_gdac
+
+
+class GdacFetch:
+    """Fetch data from a synthetic local GDAC folder"""
+
+    params = ([False, "thread"], [False, True])
+    param_names = ["parallel", "pipeline"]
+    timeout = 600
+
+    def setup_cache(self):
+        gdac = synthetic_gdac(path=os.path.abspath("gdac"), n_floats=50, n_cycles=100, n_levels=200, bgc=0.0)
+        gdac.build()
+        return gdac.rootpath, gdac.wmo
+
+    def setup(self, cache, parallel, pipeline):
+        self.root, self.wmo = cache
+        self.opts = dict(src="gdac", gdac=self.root, parallel=parallel, pipeline=pipeline, cache=False)
+
+    def time_float(self, cache, *args):
+        argopy.DataFetcher(**self.opts).float(self.wmo[0:5]).to_xarray()
+
+    def time_region(self, cache, *args):
+        argopy.DataFetcher(**self.opts).region([-180, 180, -90, 90, 0, 500, "2020-01", "2021-01"]).to_xarray()
@@ -0,0 +1,114 @@
+import os
+
+from argopy.stores.index import indexstore_pa, indexstore_pd
+
+from . import BOX, make_index, wmo_list
+
+
+STORES = {"pandas": indexstore_pd, "pyarrow": indexstore_pa}
+
+
+class Base:
+    """Load a synthetic index file with one of the index store backends
+
+    Index files are written once for all parameters by ``setup_cache``, and their root folder is given to
+    benchmarks as first argument.
+    """
+
+    convention = "core"
+
+    def setup_cache(self):
+        root = os.path.abspath("indexes")
+        for n_rows in self.params[1]:
+            path = os.path.join(root, "%s-%i" % (self.convention, n_rows))
+            os.makedirs(path)
+            make_index(path, n_rows, convention=self.convention)
+        return root
+
+    def setup(self, root, backend, n_rows):
+        self.indexstore = STORES[backend]
+        self.host = os.path.join(root, "%s-%i" % (self.convention, n_rows))
+        self.idx = self.create().load()
+
+    def create(self):
+        return self.indexstore(
+            host=self.host,
+            index_file="core" if self.convention == "core" else "bgc-s",
+            cache=False,
+        )
+
+
+class IndexLoad(Base):
+    params = (list(STORES.keys()), [10_000, 100_000, 1_000_000])
+    param_names = ["backend", "n_rows"]
+    timeout = 300
+
+    def time_load(self, *args):
+        self.create().load()
+
+    def peakmem_load(self, *args):
+        self.create().load()
+
+    def time_to_dataframe(self, *args):
+        self.idx.to_dataframe()
+
+    def time_uri_full_index(self, *args):
+        self.idx.uri_full_index
+
+
+class IndexQuery(Base):
+    params = (list(STORES.keys()), [10_000, 100_000, 1_000_000])
+    param_names = ["backend", "n_rows"]
+    timeout = 300
+
+    def time_wmo(self, *args):
+        self.idx.query.wmo(wmo_list(10))
+
+    def time_cyc(self, *args):
+        self.idx.query.cyc([1, 12])
+
+    def time_wmo_cyc(self, *args):
+        self.idx.query.wmo_cyc(wmo_list(10), [1, 12])
+
+    def time_lon(self, *args):
+        self.idx.query.lon([5, 10, 35, 40, "2012-01-01", "2014-01-01"])
+
+    def time_lat(self, *args):
+        self.idx.query.lat([5, 10, 35, 40, "2012-01-01", "2014-01-01"])
+
+    def time_date(self, *args):
+        self.idx.query.date([5, 10, 35, 40, "2012-01-01", "2014-01-01"])
+
+    def time_lon_lat(self, *args):
+        self.idx.query.lon_lat([5, 10, 35, 40, "2012-01-01", "2014-01-01"])
+
+    def time_box(self, *args):
+        self.idx.query.box([5, 10, 35, 40, "2012-01-01", "2014-01-01"])
+
+    def time_profiler_type(self, *args):
+        self.idx.query.profiler_type([845, 869])
+
+    def time_institution_code(self, *args):
+        self.idx.query.institution_code(["IF", "JA"])
+
+    def time_dac(self, *args):
+        self.idx.query.dac("coriolis")
+
+    def time_compose(self, *args):
+        self.idx.query.compose({"box": BOX, "wmo": wmo_list(10)})
+
+
+class IndexQueryBGC(Base):
+    params = (list(STORES.keys()), [10_000, 100_000])
+    param_names = ["backend", "n_rows"]
+    convention = "bgc-s"
+    timeout = 300
+
+    def time_params(self, *args):
+        self.idx.query.params(["DOXY", "TEMP"], logical="and")
+
+    def time_params_or(self, *args):
+        self.idx.query.params(["DOXY", "TEMP"], logical="or")
+
+    def time_parameter_data_mode(self, *args):
+        self.idx.query.parameter_data_mode({"DOXY": ["A", "D"]})
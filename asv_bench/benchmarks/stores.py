@@ -0,0 +1,51 @@
+import http.server
+import os
+import tempfile
+import threading
+
+from argopy.stores import filestore, httpstore
+
+from . import make_files
+
+
+class QuietHandler(http.server.SimpleHTTPRequestHandler):
+    def log_message(self, *args):
+        pass
+
+
+class OpenMfdataset:
+    """Open and merge a collection of netcdf files with each parallel method
+
+    Files are read from a local folder, or from a local http server for the ``http`` store.
+    """
+
+    params = (["local", "http"], ["sequential", "thread", "process"], [10, 100])
+    param_names = ["store", "method", "n_files"]
+    timeout = 300
+
+    def setup(self, store, method, n_files):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        files = make_files(self.tmpdir.name, n_files)
+        if store == "local":
+            self.fs = filestore()
+            self.urls = files
+        else:
+            self.server = http.server.ThreadingHTTPServer(
+                ("127.0.0.1", 0),
+                lambda *args: QuietHandler(*args, directory=self.tmpdir.name),
+            )
+            threading.Thread(target=self.server.serve_forever, daemon=True).start()
+            root = "http://127.0.0.1:%i" % self.server.server_address[1]
+            self.fs = httpstore(cache=False)
+            self.urls = ["%s/%s" % (root, os.path.basename(f)) for f in files]
+
+    def teardown(self, store, *args):
+        if store == "http":
+            self.server.shutdown()
+            self.server.server_close()
+        self.tmpdir.cleanup()
+
+    def time_open_mfdataset(self, store, method, n_files):
+        self.fs.open_mfdataset(
+            self.urls, method=method, concat_dim="N_POINTS", errors="raise"
+        )